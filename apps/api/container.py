@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable
+
+from packages.application.config import AppConfig, load_config, read_env_file
+
+
+@dataclass(frozen=True)
+class AdapterSet:
+    """Adapters built from one ``AppConfig`` and shared by every request until a reload."""
+
+    cfg: AppConfig
+    keyword_search: Any
+    vector_search: Any
+    embedding_adapter: Any
+    embedding_key: str
+    llm: Any
+    reranker: Any
+    vision_adapter: Any
+    ocr_adapter: Any
+    pdf_parser: Any
+    table_extractor: Any
+    retrieval_trace_logger: Any
+    answer_trace_logger: Any
+    planner: Any
+    tool_executor: Any
+    state_graph_runner: Any
+    agent_trace_logger: Any
+
+
+def config_fingerprint(cfg: AppConfig) -> str:
+    payload = json.dumps(asdict(cfg), sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def resolve_config() -> AppConfig:
+    """Environment config with ``CONFIG_FILE`` (if set) layered on top, re-read each call."""
+    cfg = load_config()
+    if not cfg.config_file:
+        return cfg
+    return load_config(read_env_file(Path(cfg.config_file)))
+
+
+class AppContainer:
+    """Caches an ``AdapterSet`` and rebuilds it only when the resolved config changes.
+
+    The config is re-resolved at most every ``CONFIG_CHECK_INTERVAL_SECONDS``;
+    ``reload`` skips that wait. A failed rebuild keeps serving the previous
+    adapters and is reported through ``status``.
+    """
+
+    def __init__(
+        self,
+        builder: Callable[[AppConfig], AdapterSet],
+        *,
+        resolver: Callable[[], AppConfig] = resolve_config,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._builder = builder
+        self._resolver = resolver
+        self._clock = clock
+        self._lock = Lock()
+        self._adapters: AdapterSet | None = None
+        self._checked_at = 0.0
+        self._build_count = 0
+        self._last_error: str | None = None
+        self._built_at: float | None = None
+
+    def current(self) -> AdapterSet:
+        adapters = self._adapters
+        if adapters is not None:
+            interval = max(0.0, adapters.cfg.config_check_interval_seconds)
+            if self._clock() - self._checked_at < interval:
+                return adapters
+        return self._refresh(force=False)
+
+    def reload(self) -> dict[str, object]:
+        self._refresh(force=True)
+        return self.status()
+
+    def status(self) -> dict[str, object]:
+        adapters = self._adapters
+        return {
+            'config_fingerprint': config_fingerprint(adapters.cfg) if adapters else None,
+            'config_file': adapters.cfg.config_file if adapters else None,
+            'build_count': self._build_count,
+            'built_at': self._built_at,
+            'last_error': self._last_error,
+        }
+
+    def _refresh(self, *, force: bool) -> AdapterSet:
+        with self._lock:
+            current = self._adapters
+            now = self._clock()
+            if (
+                not force
+                and current is not None
+                and now - self._checked_at < max(0.0, current.cfg.config_check_interval_seconds)
+            ):
+                return current
+            cfg = self._resolver()
+            self._checked_at = now
+            if current is not None and not force and cfg == current.cfg:
+                return current
+            try:
+                adapters = self._builder(cfg)
+            except Exception as exc:
+                if current is None:
+                    raise
+                self._last_error = f'{type(exc).__name__}: {exc}'
+                return current
+            self._adapters = adapters
+            self._build_count += 1
+            self._built_at = time.time()
+            self._last_error = None
+            return adapters
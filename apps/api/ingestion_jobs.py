@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from threading import Lock
+from threading import Condition, Lock
 from typing import Any, Callable
+import time
 import traceback
 import uuid
 
@@ -24,18 +26,29 @@ class IngestionJob:
     total_pages: int
     error: str | None
     result: dict[str, Any] | None
+    eta_seconds: float | None = None
 
 
 def _now_iso() -> str:
     return datetime.now(UTC).isoformat()
 
 
+TERMINAL_JOB_STATUSES = frozenset({'completed', 'failed'})
+
+
 class IngestionJobManager:
     def __init__(self, max_workers: int = 2, max_jobs: int = 200) -> None:
         self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
         self._max_jobs = max(20, max_jobs)
         self._lock = Lock()
         self._jobs: dict[str, IngestionJob] = {}
+        # Every change bumps ``_version``; ``_job_versions`` records the version
+        # of each job's last change so waiters can ask for what is newer.
+        self._changed = Condition(self._lock)
+        self._version = 0
+        self._job_versions: dict[str, int] = {}
+        # Event-loop waiters, woken from job threads without blocking a thread of their own.
+        self._async_waiters: set[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
 
     def submit(
         self,
@@ -66,6 +79,7 @@ class IngestionJobManager:
         with self._lock:
             self._jobs[job_id] = job
             self._trim_jobs_locked()
+            self._mark_changed_locked(job_id)
 
         self._executor.submit(self._run_job, job_id, task)
         return self.get(job_id)
@@ -82,6 +96,13 @@ class IngestionJobManager:
             jobs = sorted(self._jobs.values(), key=lambda row: row.created_at, reverse=True)
             return [IngestionJob(**row.__dict__) for row in jobs[: max(1, limit)]]
 
+    def status_counts(self) -> dict[str, int]:
+        counts = {'queued': 0, 'running': 0, 'completed': 0, 'failed': 0}
+        with self._lock:
+            for job in self._jobs.values():
+                counts[job.status] = counts.get(job.status, 0) + 1
+        return counts
+
     def _update_job(self, job_id: str, **updates: Any) -> None:
         with self._lock:
             job = self._jobs.get(job_id)
@@ -90,6 +111,71 @@ class IngestionJobManager:
             for key, value in updates.items():
                 setattr(job, key, value)
             job.updated_at = _now_iso()
+            self._mark_changed_locked(job_id)
+
+    def _mark_changed_locked(self, job_id: str) -> None:
+        self._version += 1
+        self._job_versions[job_id] = self._version
+        self._changed.notify_all()
+        for loop, event in self._async_waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # The waiter's loop already closed.
+                pass
+
+    def version(self) -> int:
+        with self._lock:
+            return self._version
+
+    def wait_for_changes(
+        self, *, since: int, job_id: str | None = None, timeout: float = 15.0
+    ) -> tuple[int, list[IngestionJob]]:
+        """Block until a job (or ``job_id`` only) changes after version ``since``.
+
+        Returns the current version and snapshots of the jobs changed since
+        then, oldest change first; the list is empty when ``timeout`` expires.
+        Raises ``KeyError`` for an unknown ``job_id``.
+        """
+        deadline = time.monotonic() + max(0.0, timeout)
+        with self._changed:
+            while True:
+                if job_id is not None and job_id not in self._jobs:
+                    raise KeyError(job_id)
+                changed = sorted(
+                    (version, key)
+                    for key, version in self._job_versions.items()
+                    if version > since and (job_id is None or key == job_id)
+                )
+                remaining = deadline - time.monotonic()
+                if changed or remaining <= 0:
+                    return self._version, [IngestionJob(**self._jobs[key].__dict__) for _, key in changed]
+                self._changed.wait(remaining)
+
+    async def wait_for_changes_async(
+        self, *, since: int, job_id: str | None = None, timeout: float = 15.0
+    ) -> tuple[int, list[IngestionJob]]:
+        """``wait_for_changes`` for the event loop: awaits an ``asyncio.Event`` instead of holding a thread."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max(0.0, timeout)
+        waiter = (loop, asyncio.Event())
+        with self._lock:
+            self._async_waiters.add(waiter)
+        try:
+            while True:
+                # Cleared before checking, so a change landing in between still wakes the wait.
+                waiter[1].clear()
+                version, jobs = self.wait_for_changes(since=since, job_id=job_id, timeout=0)
+                remaining = deadline - loop.time()
+                if jobs or remaining <= 0:
+                    return version, jobs
+                try:
+                    await asyncio.wait_for(waiter[1].wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            with self._lock:
+                self._async_waiters.discard(waiter)
 
     def _run_job(
         self,
@@ -105,6 +191,7 @@ class IngestionJobManager:
                 message=str(payload.get('message') or ''),
                 processed_pages=int(payload.get('processed_pages') or 0),
                 total_pages=int(payload.get('total_pages') or 0),
+                eta_seconds=payload.get('eta_seconds'),
             )
 
         try:
@@ -114,6 +201,7 @@ class IngestionJobManager:
                 status='completed',
                 stage='completed',
                 message='Completed',
+                eta_seconds=None,
                 result=result,
                 error=None,
             )
@@ -123,6 +211,7 @@ class IngestionJobManager:
                 status='failed',
                 stage='failed',
                 message='Failed',
+                eta_seconds=None,
                 error=f'{exc}\n{traceback.format_exc()}',
                 result=None,
             )
@@ -135,3 +224,4 @@ class IngestionJobManager:
         for job_id in list(self._jobs.keys()):
             if job_id not in keep:
                 del self._jobs[job_id]
+                self._job_versions.pop(job_id, None)
@@ -1,16 +1,26 @@
 ﻿from __future__ import annotations
 
-import hashlib
+import hmac
 import json
 import re
 import shutil
+import time
+from concurrent.futures import Executor
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import AsyncIterator
 
-from fastapi import FastAPI, File, Form, HTTPException, Query, UploadFile
-from fastapi.responses import FileResponse
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse, StreamingResponse
+from python_multipart.exceptions import MultipartParseError
+from python_multipart.multipart import MultipartParser, parse_options_header
 
-from apps.api.ingestion_jobs import IngestionJob, IngestionJobManager
+from apps.api.container import AdapterSet, AppContainer, resolve_config
+from apps.api.ingestion_jobs import TERMINAL_JOB_STATUSES, IngestionJob, IngestionJobManager
+from apps.api.metrics import MetricsRegistry, record_stage_timings
 from packages.adapters.answering.answer_trace_logger import AnswerTraceLogger
 from packages.adapters.agentic.factory import (
     create_agent_trace_logger,
@@ -21,32 +31,60 @@ from packages.adapters.agentic.factory import (
 from packages.adapters.agentic.langchain_tool_executor_adapter import LangChainToolDefinition
 from packages.adapters.data_contracts.yaml_catalog_adapter import YamlDocumentCatalogAdapter
 from packages.adapters.data_contracts.visual_artifact_generation import (
-    build_visual_artifacts_from_chunks,
-    load_chunk_rows,
-    write_visual_artifacts,
+    generate_visual_artifacts_for_doc as generate_doc_visual_artifacts,
 )
 from packages.adapters.data_contracts.visual_artifacts import validate_visual_artifacts_for_doc
 from packages.adapters.embeddings.factory import create_embedding_adapter
 from packages.adapters.llm.factory import create_llm_adapter
 from packages.adapters.ocr.factory import create_ocr_adapter
-from packages.adapters.pdf.pypdf_parser_adapter import PypdfParserAdapter
+from packages.adapters.pdf.factory import create_pdf_parser
+from packages.adapters.retrieval.cached_chunk_query_adapter import CachedChunkQueryAdapter
 from packages.adapters.retrieval.filesystem_chunk_query_adapter import FilesystemChunkQueryAdapter
 from packages.adapters.retrieval.hash_vector_search_adapter import HashVectorSearchAdapter
 from packages.adapters.retrieval.metadata_vector_search_adapter import MetadataVectorSearchAdapter
 from packages.adapters.retrieval.retrieval_trace_logger import RetrievalTraceLogger
 from packages.adapters.retrieval.simple_keyword_search_adapter import SimpleKeywordSearchAdapter
 from packages.adapters.reranker.factory import create_reranker_adapter
+from packages.adapters.reranker.ollama_reranker_adapter import RerankScoreCache
 from packages.adapters.storage.filesystem_chunk_store_adapter import FilesystemChunkStoreAdapter
+from packages.adapters.storage.doc_generations import artifact_path
+from packages.adapters.storage.embedding_model_registry import EmbeddingModelRegistry
+from packages.adapters.storage.ingested_doc_index import IngestedDocIndex, summaries_etag
+from packages.adapters.storage.ingestion_run_log import (
+    IngestionRunLog,
+    build_ingestion_run_row,
+    ingestion_config_snapshot,
+    sha256_file,
+)
+from packages.adapters.storage.upload_store import (
+    UPLOAD_CHUNK_BYTES,
+    StagedUpload,
+    UploadStore,
+    UploadTooLargeError,
+)
 from packages.adapters.tables.simple_table_extractor_adapter import SimpleTableExtractorAdapter
+from packages.adapters.tracing.factory import create_trace_writer, trace_writer_stats
 from packages.adapters.vision.factory import create_vision_adapter
-from packages.application.config import load_config
 from packages.application.use_cases.answer_question import (
     AnswerQuestionInput,
     answer_question_use_case,
 )
+from packages.application.use_cases.ingest_batch import (
+    BatchDocument,
+    IngestBatchInput,
+    ingest_batch_use_case,
+)
 from packages.application.use_cases.ingest_document import (
     IngestDocumentInput,
+    IngestDocumentOutput,
+    ReembedDocumentInput,
     ingest_document_use_case,
+    reembed_document_use_case,
+)
+from packages.application.use_cases.migrate_embeddings import (
+    MigrateEmbeddingsInput,
+    MigratedDocument,
+    migrate_embeddings_use_case,
 )
 from packages.application.use_cases.run_golden_evaluation import (
     RunGoldenEvaluationInput,
@@ -61,6 +99,9 @@ from packages.application.use_cases.validate_data_contracts import (
     ValidateDataContractsInput,
     validate_data_contracts_use_case,
 )
+from packages.domain.deadline import Deadline
+from packages.domain.embeddings import embedding_model_key
+from packages.domain.tokenization import KEYWORD_TERM_COUNTS, WORD_COUNTS, word_set, word_tokens
 
 
 DATA_DIR = Path('.context/project/data')
@@ -68,11 +109,122 @@ CATALOG_PATH = DATA_DIR / 'document_catalog.yaml'
 GOLDEN_PATH = DATA_DIR / 'golden_questions.yaml'
 ASSETS_DIR = Path('data/assets')
 UPLOADS_DIR = Path('data/uploads')
-_BOOT_CONFIG = load_config()
+_BOOT_CONFIG = resolve_config()
 JOB_MANAGER = IngestionJobManager(max_workers=_BOOT_CONFIG.ingest_concurrency)
+# Process-wide so rerank scores survive adapter rebuilds on config reload.
+RERANK_SCORE_CACHE = RerankScoreCache(max_entries=_BOOT_CONFIG.reranker_cache_size)
+
+METRICS = MetricsRegistry()
 
 app = FastAPI(title='Equipment Manuals Chatbot API', version='0.7.0')
-INGESTION_RUNS_FILE = 'ingestion_runs.jsonl'
+_RUN_LOGS: dict[Path, IngestionRunLog] = {}
+_EMBEDDING_REGISTRIES: dict[Path, EmbeddingModelRegistry] = {}
+_UPLOAD_STORES: dict[Path, UploadStore] = {}
+_DOC_INDEXES: dict[Path, IngestedDocIndex] = {}
+_CATALOGS: dict[Path, YamlDocumentCatalogAdapter] = {}
+_INGEST_TOP_LEVEL_STAGES = ('parse', 'triage', 'extract_pages', 'chunk', 'embedding', 'embedding_retry', 'persist')
+
+
+def _collect_runtime_metrics(registry: MetricsRegistry) -> None:
+    for status, count in JOB_MANAGER.status_counts().items():
+        registry.set_gauge(
+            'manuals_ingestion_jobs',
+            count,
+            help_text='Ingestion jobs tracked by the job manager, by status.',
+            status=status,
+        )
+    registry.set_gauge(
+        'manuals_cache_entries',
+        len(RERANK_SCORE_CACHE),
+        help_text='Entries held by in-process caches.',
+        cache='rerank_scores',
+    )
+    registry.set_counter('manuals_cache_hits_total', RERANK_SCORE_CACHE.hits, cache='rerank_scores')
+    registry.set_counter('manuals_cache_misses_total', RERANK_SCORE_CACHE.misses, cache='rerank_scores')
+    for cache_name, cached in (('word_tokens', word_tokens), ('word_set', word_set)):
+        info = cached.cache_info()
+        registry.set_gauge('manuals_cache_entries', info.currsize, cache=cache_name)
+        registry.set_counter(
+            'manuals_cache_hits_total',
+            info.hits,
+            help_text='Cache lookups served from memory.',
+            cache=cache_name,
+        )
+        registry.set_counter(
+            'manuals_cache_misses_total',
+            info.misses,
+            help_text='Cache lookups that had to compute or fetch.',
+            cache=cache_name,
+        )
+    for cache_name, term_cache in (('keyword_term_counts', KEYWORD_TERM_COUNTS), ('word_counts', WORD_COUNTS)):
+        registry.set_gauge('manuals_cache_entries', len(term_cache), cache=cache_name)
+        registry.set_counter('manuals_cache_hits_total', term_cache.hits, cache=cache_name)
+        registry.set_counter('manuals_cache_misses_total', term_cache.misses, cache=cache_name)
+    for trace_name, stats in trace_writer_stats().items():
+        registry.set_counter(
+            'manuals_trace_records_total',
+            stats.get('written', 0),
+            help_text='Trace records written to disk.',
+            file=trace_name,
+        )
+        registry.set_counter(
+            'manuals_trace_dropped_total',
+            stats.get('dropped', 0),
+            help_text='Trace records dropped because the writer queue was full.',
+            file=trace_name,
+        )
+        registry.set_gauge(
+            'manuals_trace_queue_depth',
+            stats.get('queued', 0),
+            help_text='Trace records waiting for the background writer.',
+            file=trace_name,
+        )
+    registry.set_counter(
+        'manuals_adapter_builds_total',
+        int(CONTAINER.status()['build_count'] or 0),
+        help_text='Adapter sets built by the API container (initial build plus config reloads).',
+    )
+
+
+METRICS.add_collector(_collect_runtime_metrics)
+
+
+@app.middleware('http')
+async def _observe_request_latency(request: Request, call_next):
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get('route')
+        METRICS.observe(
+            'manuals_http_request_duration_seconds',
+            time.perf_counter() - started,
+            help_text='API request latency by route template.',
+            route=getattr(route, 'path', 'unmatched'),
+            method=request.method,
+            status=status,
+        )
+
+
+def _record_ingest_metrics(timings: object) -> None:
+    if not isinstance(timings, dict) or not timings:
+        return
+    record_stage_timings(METRICS, timings)
+    pages = float((timings.get('parse') or {}).get('items', 0) or 0)
+    seconds = sum(
+        float((timings.get(stage) or {}).get('ms', 0.0)) for stage in _INGEST_TOP_LEVEL_STAGES
+    ) / 1000.0
+    METRICS.inc('manuals_ingest_pages_total', pages, help_text='PDF pages ingested.')
+    METRICS.inc('manuals_ingest_seconds_total', seconds, help_text='Wall time spent ingesting PDFs.')
+    if pages and seconds > 0:
+        METRICS.set_gauge(
+            'manuals_ingest_pages_per_second',
+            pages / seconds,
+            help_text='Throughput of the most recent ingestion run.',
+        )
 
 
 def _slugify(value: str) -> str:
@@ -81,69 +233,41 @@ def _slugify(value: str) -> str:
     return slug or 'uploaded_manual'
 
 
-def _sha256_file(path: Path) -> str:
-    digest = hashlib.sha256()
-    with path.open('rb') as fh:
-        for chunk in iter(lambda: fh.read(1024 * 1024), b''):
-            if not chunk:
-                break
-            digest.update(chunk)
-    return digest.hexdigest()
+def _run_log() -> IngestionRunLog:
+    log = _RUN_LOGS.get(ASSETS_DIR)
+    if log is None:
+        log = _RUN_LOGS.setdefault(ASSETS_DIR, IngestionRunLog(ASSETS_DIR))
+    return log
 
 
-def _ingestion_config_snapshot(cfg) -> dict[str, object]:
-    return {
-        'ocr_engine': cfg.ocr_engine,
-        'ocr_fallback_engine': cfg.ocr_fallback_engine,
-        'embedding_provider': cfg.embedding_provider,
-        'embedding_model': cfg.embedding_model,
-        'embedding_timeout_seconds': cfg.embedding_timeout_seconds,
-        'embedding_max_retries': cfg.embedding_max_retries,
-        'embedding_retry_backoff_seconds': cfg.embedding_retry_backoff_seconds,
-        'embedding_min_coverage': cfg.embedding_min_coverage,
-        'embedding_fail_fast': cfg.embedding_fail_fast,
-        'embedding_second_pass_max_chars': cfg.embedding_second_pass_max_chars,
-        'vision_enabled': cfg.use_vision_ingestion,
-        'vision_provider': cfg.vision_provider,
-        'vision_model': cfg.vision_model,
-        'vision_max_pages': cfg.vision_max_pages,
-        'ingest_page_workers': cfg.ingest_page_workers,
-        'use_agentic_mode': cfg.use_agentic_mode,
-        'agentic_provider': cfg.agentic_provider,
-    }
+def _embedding_registry() -> EmbeddingModelRegistry:
+    registry = _EMBEDDING_REGISTRIES.get(ASSETS_DIR)
+    if registry is None:
+        registry = _EMBEDDING_REGISTRIES.setdefault(ASSETS_DIR, EmbeddingModelRegistry(ASSETS_DIR))
+    return registry
 
 
-def _append_ingestion_run(doc_id: str, row: dict[str, object]) -> None:
-    doc_dir = ASSETS_DIR / doc_id
-    doc_dir.mkdir(parents=True, exist_ok=True)
-    out_path = doc_dir / INGESTION_RUNS_FILE
-    with out_path.open('a', encoding='utf-8') as fh:
-        fh.write(json.dumps(row, ensure_ascii=True))
-        fh.write('\n')
+def _upload_store() -> UploadStore:
+    store = _UPLOAD_STORES.get(UPLOADS_DIR)
+    if store is None:
+        store = _UPLOAD_STORES.setdefault(UPLOADS_DIR, UploadStore(UPLOADS_DIR))
+    return store
 
 
-def _load_ingestion_runs(doc_id: str, limit: int = 20) -> list[dict[str, object]]:
-    path = ASSETS_DIR / doc_id / INGESTION_RUNS_FILE
-    if not path.exists():
-        return []
+def _doc_index() -> IngestedDocIndex:
+    # Keyed by ASSETS_DIR so tests and benchmarks that repoint it get their own index.
+    index = _DOC_INDEXES.get(ASSETS_DIR)
+    if index is None:
+        index = _DOC_INDEXES.setdefault(ASSETS_DIR, IngestedDocIndex(ASSETS_DIR))
+    return index
 
-    rows: list[dict[str, object]] = []
-    for raw in path.read_text(encoding='utf-8').splitlines():
-        text = raw.strip()
-        if not text:
-            continue
-        try:
-            payload = json.loads(text)
-        except json.JSONDecodeError:
-            continue
-        if isinstance(payload, dict):
-            rows.append(payload)
-    rows.reverse()
-    return rows[: max(1, limit)]
+
+def _load_ingestion_runs(doc_id: str, limit: int = 20) -> list[dict[str, object]]:
+    return _run_log().list_runs(doc_id, limit=limit)
 
 
 def _read_visual_chunks(doc_id: str, limit: int = 200) -> tuple[int, list[dict[str, object]]]:
-    path = ASSETS_DIR / doc_id / 'visual_chunks.jsonl'
+    path = artifact_path(ASSETS_DIR / doc_id, 'visual_chunks.jsonl')
     if not path.exists():
         return 0, []
 
@@ -165,34 +289,8 @@ def _read_visual_chunks(doc_id: str, limit: int = 200) -> tuple[int, list[dict[s
     return total, rows
 
 
-def _run_visual_artifact_pipeline(doc_id: str) -> dict[str, object]:
-    doc_dir = ASSETS_DIR / doc_id
-    chunks_path = doc_dir / 'chunks.jsonl'
-    if not chunks_path.exists():
-        return {
-            'generated': False,
-            'error': f'chunks file missing: {chunks_path}',
-            'validation': {
-                'valid': False,
-                'errors': [f'chunks file missing: {chunks_path}'],
-                'warnings': [],
-            },
-        }
-
-    chunk_rows = load_chunk_rows(chunks_path)
-    visual_rows, embedding_rows, manifest = build_visual_artifacts_from_chunks(doc_id, chunk_rows)
-    write_visual_artifacts(doc_dir, visual_rows, embedding_rows, manifest)
-    validation = validate_visual_artifacts_for_doc(doc_dir, strict=True)
-    return {
-        'generated': True,
-        'visual_chunk_count': len(visual_rows),
-        'embedding_count': len(embedding_rows),
-        'validation': {
-            'valid': validation.is_valid(),
-            'errors': validation.errors,
-            'warnings': validation.warnings,
-        },
-    }
+def _run_visual_artifact_pipeline(doc_id: str, *, force: bool = False) -> dict[str, object]:
+    return generate_doc_visual_artifacts(ASSETS_DIR / doc_id, doc_id, force=force)
 
 
 def _build_embedding_adapter(cfg):
@@ -206,9 +304,34 @@ def _build_embedding_adapter(cfg):
     )
 
 
+def _with_active_embedding_model(cfg):
+    # A completed embedding migration overrides EMBEDDING_PROVIDER/EMBEDDING_MODEL
+    # for search and for new ingests, so both use the same vectors.
+    active = _embedding_registry().active()
+    if active is None:
+        return cfg
+    return replace(cfg, embedding_provider=str(active['provider']), embedding_model=str(active['model']))
+
+
+def _ingestion_config_snapshot(cfg) -> dict[str, object]:
+    # Record the model ingests actually embed with, so reingest plans follow activations.
+    return ingestion_config_snapshot(_with_active_embedding_model(cfg))
+
+
+def _writes_legacy_embedding(adapters: AdapterSet) -> bool:
+    # Only vectors of EMBEDDING_PROVIDER/EMBEDDING_MODEL go in the legacy field.
+    cfg = adapters.cfg
+    return adapters.embedding_key == embedding_model_key(cfg.embedding_provider, cfg.embedding_model)
+
+
 def _build_vector_search(cfg):
+    active = _embedding_registry().active()
+    cfg = _with_active_embedding_model(cfg)
     if cfg.embedding_provider.strip().lower() in {'ollama', 'local'}:
-        return MetadataVectorSearchAdapter(_build_embedding_adapter(cfg))
+        return MetadataVectorSearchAdapter(
+            _build_embedding_adapter(cfg),
+            embedding_key=str(active['key']) if active is not None else None,
+        )
     return HashVectorSearchAdapter()
 
 
@@ -225,10 +348,17 @@ def _build_llm(cfg):
 def _build_reranker(cfg):
     if not cfg.use_reranker:
         return None
+    # Like vector search, an embedding reranker compares against the active model's vectors.
+    active = _embedding_registry().active()
     return create_reranker_adapter(
         provider=cfg.reranker_provider,
         base_url=cfg.reranker_base_url,
         model=cfg.reranker_model,
+        batch_size=cfg.reranker_batch_size,
+        max_concurrency=cfg.reranker_max_concurrency,
+        score_cache=RERANK_SCORE_CACHE,
+        embedding_adapter=_build_embedding_adapter(_with_active_embedding_model(cfg)),
+        embedding_key=str(active['key']) if active is not None else None,
     )
 
 
@@ -242,6 +372,42 @@ def _build_vision(cfg):
     )
 
 
+def _trace_writer(cfg, trace_file: str):
+    return create_trace_writer(
+        Path(trace_file),
+        buffered=cfg.trace_buffered,
+        queue_size=cfg.trace_queue_size,
+        batch_size=cfg.trace_batch_size,
+        flush_interval_seconds=cfg.trace_flush_interval_seconds,
+        max_bytes=cfg.trace_max_bytes,
+        rotate_interval_seconds=cfg.trace_rotate_interval_seconds,
+        gzip_rotated=cfg.trace_gzip_rotated,
+        max_files=cfg.trace_max_files,
+    )
+
+
+def _retrieval_trace_logger(cfg) -> RetrievalTraceLogger:
+    return RetrievalTraceLogger(
+        Path(cfg.retrieval_trace_file),
+        writer=_trace_writer(cfg, cfg.retrieval_trace_file),
+        sample_rate=cfg.retrieval_trace_sample_rate,
+    )
+
+
+def _answer_trace_logger(cfg) -> AnswerTraceLogger:
+    return AnswerTraceLogger(
+        Path(cfg.answer_trace_file),
+        writer=_trace_writer(cfg, cfg.answer_trace_file),
+        sample_rate=cfg.answer_trace_sample_rate,
+    )
+
+
+def _request_deadline(cfg) -> Deadline | None:
+    if cfg.request_deadline_seconds <= 0:
+        return None
+    return Deadline.after(cfg.request_deadline_seconds)
+
+
 def _serialize_hit(hit: EvidenceHit) -> dict[str, object]:
     return {
         'chunk_id': hit.chunk_id,
@@ -260,11 +426,214 @@ def _serialize_hit(hit: EvidenceHit) -> dict[str, object]:
     }
 
 
+@dataclass(frozen=True)
+class _StoredUpload:
+    doc_id: str
+    filename: str
+    pdf_path: Path
+    sha256: str
+    size_bytes: int
+    deduplicated: bool
+
+
+# Slack over UPLOAD_MAX_MB allowed in Content-Length for boundaries, part headers and form fields.
+_MULTIPART_OVERHEAD_BYTES = 64 * 1024
+_MAX_FORM_FIELD_BYTES = 4096
+_UPLOAD_OPENAPI = {
+    'requestBody': {
+        'required': True,
+        'content': {
+            'multipart/form-data': {
+                'schema': {
+                    'type': 'object',
+                    'required': ['file'],
+                    'properties': {
+                        'file': {'type': 'string', 'format': 'binary'},
+                        'doc_id': {'type': 'string'},
+                    },
+                }
+            }
+        },
+    }
+}
+
+
+class _MultipartUpload:
+    """Incremental parser for a multipart upload with one ``file`` part and small form fields.
+
+    ``feed`` parses a chunk of the request body and returns the file bytes it
+    contained, so the caller can write them out without the body being
+    spooled anywhere first.
+    """
+
+    def __init__(self, content_type: str) -> None:
+        media_type, params = parse_options_header(content_type)
+        boundary = params.get(b'boundary')
+        if media_type != b'multipart/form-data' or not boundary:
+            raise HTTPException(status_code=400, detail='Expected a multipart/form-data upload')
+        self.filename: str | None = None
+        self.fields: dict[str, str] = {}
+        self._file_data = bytearray()
+        self._header_field = b''
+        self._header_value = b''
+        self._disposition = b''
+        self._field_name: str | None = None
+        self._field_value = bytearray()
+        self._in_file = False
+        self._parser = MultipartParser(
+            boundary,
+            {
+                'on_part_begin': self._on_part_begin,
+                'on_header_field': self._on_header_field,
+                'on_header_value': self._on_header_value,
+                'on_header_end': self._on_header_end,
+                'on_headers_finished': self._on_headers_finished,
+                'on_part_data': self._on_part_data,
+                'on_part_end': self._on_part_end,
+            },
+        )
+
+    def feed(self, chunk: bytes) -> bytes:
+        try:
+            self._parser.write(chunk)
+        except MultipartParseError as exc:
+            raise HTTPException(status_code=400, detail=f'Malformed multipart upload: {exc}') from exc
+        data = bytes(self._file_data)
+        self._file_data.clear()
+        return data
+
+    def _on_part_begin(self) -> None:
+        self._disposition = b''
+        self._field_name = None
+        self._field_value.clear()
+        self._in_file = False
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        if self._header_field.lower() == b'content-disposition':
+            self._disposition = self._header_value
+        self._header_field = b''
+        self._header_value = b''
+
+    def _on_headers_finished(self) -> None:
+        _, params = parse_options_header(self._disposition)
+        name = params.get(b'name', b'').decode('utf-8', 'replace')
+        if name == 'file' and b'filename' in params:
+            if self.filename is not None:
+                raise HTTPException(status_code=400, detail='Only one file per upload is supported')
+            self.filename = params[b'filename'].decode('utf-8', 'replace')
+            if not self.filename:
+                raise HTTPException(status_code=400, detail='Uploaded file name is required')
+            if not self.filename.lower().endswith('.pdf'):
+                raise HTTPException(status_code=400, detail='Only PDF files are supported')
+            self._in_file = True
+        else:
+            self._field_name = name
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._in_file:
+            self._file_data += data[start:end]
+        elif self._field_name is not None:
+            self._field_value += data[start:end]
+            if len(self._field_value) > _MAX_FORM_FIELD_BYTES:
+                raise HTTPException(status_code=413, detail=f'Form field {self._field_name} is too large')
+
+    def _on_part_end(self) -> None:
+        if self._field_name is not None:
+            self.fields[self._field_name] = self._field_value.decode('utf-8', 'replace')
+        self._in_file = False
+
+
+async def _store_upload(request: Request) -> _StoredUpload:
+    """Stream an uploaded PDF from the request body to disk, hashing it on the way.
+
+    ``UPLOAD_MAX_MB`` is checked against ``Content-Length`` before reading and
+    again while the body arrives, so oversized uploads get 413 without being
+    received in full. Disk writes and hashing run in the threadpool. Bytes
+    identical to an earlier upload reuse that upload's doc.
+    """
+    max_mb = CONTAINER.current().cfg.upload_max_mb
+    max_bytes = max(0, max_mb) * 1024 * 1024
+    too_large = HTTPException(status_code=413, detail=f'PDF exceeds UPLOAD_MAX_MB ({max_mb} MB)')
+    try:
+        declared = int(request.headers.get('content-length', ''))
+    except ValueError:
+        declared = None
+    if max_bytes and declared is not None and declared > max_bytes + _MULTIPART_OVERHEAD_BYTES:
+        raise too_large
+
+    form = _MultipartUpload(request.headers.get('content-type', ''))
+    store = _upload_store()
+    staged: StagedUpload = await run_in_threadpool(store.stage, max_bytes=max_bytes)
+    pending = bytearray()
+    try:
+        async for chunk in request.stream():
+            pending += form.feed(chunk)
+            if len(pending) >= UPLOAD_CHUNK_BYTES:
+                await run_in_threadpool(staged.write, bytes(pending))
+                pending.clear()
+        if pending:
+            await run_in_threadpool(staged.write, bytes(pending))
+        if form.filename is None:
+            raise HTTPException(status_code=400, detail='Uploaded file is required')
+    except UploadTooLargeError as exc:
+        await run_in_threadpool(staged.discard)
+        raise too_large from exc
+    except BaseException:
+        await run_in_threadpool(staged.discard)
+        raise
+    await run_in_threadpool(staged.close)
+
+    existing = await run_in_threadpool(store.find, staged.sha256)
+    if existing is not None:
+        await run_in_threadpool(staged.discard)
+        existing_doc_id = str(existing['doc_id'])
+        return _StoredUpload(
+            doc_id=existing_doc_id,
+            filename=form.filename,
+            pdf_path=store.pdf_path(existing_doc_id),
+            sha256=staged.sha256,
+            size_bytes=staged.size,
+            deduplicated=True,
+        )
+
+    resolved_doc_id = _slugify(form.fields.get('doc_id') or Path(form.filename).stem)
+    ts = datetime.now(UTC).strftime('%Y%m%d%H%M%S')
+    target_doc_id = f'{resolved_doc_id}_{ts}'
+    pdf_path = await run_in_threadpool(store.commit, staged, doc_id=target_doc_id, filename=form.filename)
+    return _StoredUpload(
+        doc_id=target_doc_id,
+        filename=form.filename,
+        pdf_path=pdf_path,
+        sha256=staged.sha256,
+        size_bytes=staged.size,
+        deduplicated=False,
+    )
+
+
+@dataclass(frozen=True)
+class _AgentRequestScope:
+    chunk_query: object
+    deadline: Deadline | None = None
+
+
+# The agentic tools are built once per adapter set; the request-specific parts they need
+# (doc-scoped chunk query, deadline) are bound here by the endpoint running the agent.
+_AGENT_SCOPE: ContextVar[_AgentRequestScope | None] = ContextVar('agent_request_scope', default=None)
+
+
 def _build_agentic_stack(
     *,
     cfg,
-    chunk_query,
+    keyword_search,
+    vector_search,
     reranker,
+    retrieval_trace_logger,
 ):
     if not cfg.use_agentic_mode:
         return None, None, None, None
@@ -280,6 +649,9 @@ def _build_agentic_stack(
         top_k_keyword = int(arguments.get('top_k_keyword') or 20)
         top_k_vector = int(arguments.get('top_k_vector') or 20)
         rerank_pool_size = int(arguments.get('rerank_pool_size') or cfg.reranker_pool_size)
+        scope = _AGENT_SCOPE.get()
+        if scope is None:
+            scope = _AgentRequestScope(chunk_query=FilesystemChunkQueryAdapter(ASSETS_DIR))
 
         output = search_evidence_use_case(
             SearchEvidenceInput(
@@ -290,11 +662,12 @@ def _build_agentic_stack(
                 top_k_vector=top_k_vector,
                 rerank_pool_size=rerank_pool_size,
             ),
-            chunk_query=chunk_query,
-            keyword_search=SimpleKeywordSearchAdapter(),
-            vector_search=_build_vector_search(cfg),
-            trace_logger=RetrievalTraceLogger(Path(cfg.retrieval_trace_file)),
+            chunk_query=scope.chunk_query,
+            keyword_search=keyword_search,
+            vector_search=vector_search,
+            trace_logger=retrieval_trace_logger,
             reranker=reranker,
+            deadline=scope.deadline,
         )
         return {
             'query': output.query,
@@ -329,10 +702,59 @@ def _build_agentic_stack(
     )
     tool_executor = create_tool_executor_adapter(provider=cfg.agentic_provider, tools=tool_defs)
     state_graph_runner = create_state_graph_runner_adapter(provider=cfg.agentic_provider)
-    agent_trace_logger = create_agent_trace_logger(Path(cfg.agentic_trace_file))
+    agent_trace_logger = create_agent_trace_logger(
+        Path(cfg.agentic_trace_file),
+        writer=_trace_writer(cfg, cfg.agentic_trace_file),
+        sample_rate=cfg.agentic_trace_sample_rate,
+    )
     return planner, tool_executor, state_graph_runner, agent_trace_logger
 
 
+def _build_adapters(cfg) -> AdapterSet:
+    embedding_cfg = _with_active_embedding_model(cfg)
+    keyword_search = SimpleKeywordSearchAdapter()
+    vector_search = _build_vector_search(cfg)
+    reranker = _build_reranker(cfg)
+    retrieval_trace_logger = _retrieval_trace_logger(cfg)
+    planner, tool_executor, state_graph_runner, agent_trace_logger = _build_agentic_stack(
+        cfg=cfg,
+        keyword_search=keyword_search,
+        vector_search=vector_search,
+        reranker=reranker,
+        retrieval_trace_logger=retrieval_trace_logger,
+    )
+    return AdapterSet(
+        cfg=cfg,
+        keyword_search=keyword_search,
+        vector_search=vector_search,
+        embedding_adapter=_build_embedding_adapter(embedding_cfg),
+        embedding_key=embedding_model_key(embedding_cfg.embedding_provider, embedding_cfg.embedding_model),
+        llm=_build_llm(cfg),
+        reranker=reranker,
+        vision_adapter=_build_vision(cfg),
+        ocr_adapter=create_ocr_adapter(cfg.ocr_engine, cfg.ocr_fallback_engine),
+        pdf_parser=create_pdf_parser(cfg.pdf_parser),
+        table_extractor=SimpleTableExtractorAdapter(),
+        retrieval_trace_logger=retrieval_trace_logger,
+        answer_trace_logger=_answer_trace_logger(cfg),
+        planner=planner,
+        tool_executor=tool_executor,
+        state_graph_runner=state_graph_runner,
+        agent_trace_logger=agent_trace_logger,
+    )
+
+
+# Adapters are built once and rebuilt only when the env / CONFIG_FILE values change.
+CONTAINER = AppContainer(_build_adapters)
+
+
+def _catalog() -> YamlDocumentCatalogAdapter:
+    catalog = _CATALOGS.get(CATALOG_PATH)
+    if catalog is None:
+        catalog = _CATALOGS.setdefault(CATALOG_PATH, YamlDocumentCatalogAdapter(CATALOG_PATH))
+    return catalog
+
+
 def _parse_doc_ids_csv(doc_ids: str | None) -> list[str]:
     if not doc_ids:
         return []
@@ -360,8 +782,7 @@ def _scoped_chunk_query(selected_doc_ids: list[str] | None):
 
 
 def _resolve_pdf_path(doc_id: str) -> Path | None:
-    catalog = YamlDocumentCatalogAdapter(CATALOG_PATH)
-    record = catalog.get(doc_id)
+    record = _catalog().get(doc_id)
     if record and record.filename:
         catalog_pdf = CATALOG_PATH.parent / record.filename
         if catalog_pdf.exists():
@@ -386,6 +807,7 @@ def _serialize_job(job: IngestionJob) -> dict[str, object]:
         'message': job.message,
         'processed_pages': job.processed_pages,
         'total_pages': job.total_pages,
+        'eta_seconds': job.eta_seconds,
         'error': job.error,
         'result': job.result,
     }
@@ -400,7 +822,10 @@ def _finalize_ingestion_outputs(
     filename: str | None,
     progress_callback,
     ingestion_result: dict[str, object],
+    mode: str = 'full',
+    pdf_sha256: str | None = None,
 ) -> dict[str, object]:
+    _record_ingest_metrics(ingestion_result.get('timings'))
     progress_callback(
         {
             'stage': 'visual_artifacts',
@@ -409,7 +834,8 @@ def _finalize_ingestion_outputs(
             'message': 'Generating visual chunk and embedding artifacts',
         }
     )
-    visual_artifacts = _run_visual_artifact_pipeline(doc_id)
+    # The visual_artifacts reingest mode is picked because they failed validation, so rebuild them.
+    visual_artifacts = _run_visual_artifact_pipeline(doc_id, force=mode == 'visual_artifacts')
 
     progress_callback(
         {
@@ -420,45 +846,25 @@ def _finalize_ingestion_outputs(
         }
     )
 
-    try:
-        pdf_sha256 = _sha256_file(pdf_path)
-    except Exception:
-        pdf_sha256 = ''
+    if pdf_sha256 is None:
+        try:
+            pdf_sha256 = sha256_file(pdf_path)
+        except OSError:
+            pdf_sha256 = ''
 
-    run_row = {
-        'run_id': datetime.now(UTC).strftime('%Y%m%d%H%M%S'),
-        'ts': datetime.now(UTC).isoformat(),
-        'source': source,
-        'doc_id': doc_id,
-        'filename': filename or pdf_path.name,
-        'pdf_path': str(pdf_path),
-        'pdf_sha256': pdf_sha256,
-        'config': _ingestion_config_snapshot(cfg),
-        'result': {
-            'total_chunks': int(ingestion_result.get('total_chunks') or 0),
-            'by_type': ingestion_result.get('by_type') or {},
-            'embedding_attempted': bool(ingestion_result.get('embedding_attempted', False)),
-            'embedding_success_count': int(ingestion_result.get('embedding_success_count') or 0),
-            'embedding_failed_count': int(ingestion_result.get('embedding_failed_count') or 0),
-            'embedding_coverage': float(ingestion_result.get('embedding_coverage') or 0.0),
-            'embedding_second_pass_attempted': bool(
-                ingestion_result.get('embedding_second_pass_attempted', False)
-            ),
-            'embedding_second_pass_recovered': int(
-                ingestion_result.get('embedding_second_pass_recovered') or 0
-            ),
-            'embedding_failure_reason_count': len(
-                ingestion_result.get('embedding_failure_reasons') or {}
-            ),
-            'embedding_warning_count': int(ingestion_result.get('embedding_warning_count') or 0),
-            'visual_chunk_count': int(visual_artifacts.get('visual_chunk_count') or 0),
-            'embedding_count': int(visual_artifacts.get('embedding_count') or 0),
-            'validation_valid': bool(
-                (visual_artifacts.get('validation') or {}).get('valid', False)
-            ),
-        },
-    }
-    _append_ingestion_run(doc_id, run_row)
+    run_row = build_ingestion_run_row(
+        doc_id=doc_id,
+        pdf_path=pdf_path,
+        source=source,
+        filename=filename,
+        pdf_sha256=pdf_sha256,
+        config_snapshot=_ingestion_config_snapshot(cfg),
+        ingestion_result=ingestion_result,
+        visual_artifacts=visual_artifacts,
+        mode=mode,
+    )
+    _run_log().append(doc_id, run_row)
+    _doc_index().refresh(doc_id)
 
     merged = dict(ingestion_result)
     merged['visual_artifacts'] = visual_artifacts
@@ -466,49 +872,158 @@ def _finalize_ingestion_outputs(
     return merged
 
 
+def _ingest_pdf(
+    adapters: AdapterSet,
+    *,
+    doc_id: str,
+    pdf_path: Path,
+    progress_callback,
+    page_executor: Executor | None = None,
+) -> dict[str, object]:
+    cfg = adapters.cfg
+    ingest_output = ingest_document_use_case(
+        IngestDocumentInput(doc_id=doc_id, pdf_path=pdf_path),
+        pdf_parser=adapters.pdf_parser,
+        ocr_adapter=adapters.ocr_adapter,
+        table_extractor=adapters.table_extractor,
+        chunk_store=FilesystemChunkStoreAdapter(ASSETS_DIR),
+        embedding_adapter=adapters.embedding_adapter,
+        vision_adapter=adapters.vision_adapter,
+        vision_max_pages=cfg.vision_max_pages,
+        page_workers=cfg.ingest_page_workers,
+        embedding_min_coverage=cfg.embedding_min_coverage,
+        embedding_fail_fast=cfg.embedding_fail_fast,
+        embedding_second_pass_max_chars=cfg.embedding_second_pass_max_chars,
+        progress_callback=progress_callback,
+        page_executor=page_executor,
+        chunk_max_tokens=cfg.chunk_max_tokens,
+        chunk_overlap_tokens=cfg.chunk_overlap_tokens,
+        embedding_key=adapters.embedding_key,
+        legacy_embedding=_writes_legacy_embedding(adapters),
+    )
+    return _ingest_output_payload(ingest_output)
+
+
+def _reembed_pdf(adapters: AdapterSet, *, doc_id: str, progress_callback) -> dict[str, object]:
+    cfg = adapters.cfg
+    chunk_store = FilesystemChunkStoreAdapter(ASSETS_DIR)
+    ingest_output = reembed_document_use_case(
+        ReembedDocumentInput(doc_id=doc_id, chunks=chunk_store.load(doc_id)),
+        chunk_store=chunk_store,
+        embedding_adapter=adapters.embedding_adapter,
+        embedding_min_coverage=cfg.embedding_min_coverage,
+        embedding_fail_fast=cfg.embedding_fail_fast,
+        embedding_second_pass_max_chars=cfg.embedding_second_pass_max_chars,
+        progress_callback=progress_callback,
+        embedding_key=adapters.embedding_key,
+        legacy_embedding=_writes_legacy_embedding(adapters),
+    )
+    return _ingest_output_payload(ingest_output)
+
+
+def _ingest_output_payload(ingest_output: IngestDocumentOutput) -> dict[str, object]:
+    return {
+        'doc_id': ingest_output.doc_id,
+        'asset_ref': ingest_output.asset_ref,
+        'total_pages': ingest_output.total_pages,
+        'total_chunks': ingest_output.total_chunks,
+        'by_type': ingest_output.by_type,
+        'embedding_attempted': ingest_output.embedding_attempted,
+        'embedding_success_count': ingest_output.embedding_success_count,
+        'embedding_failed_count': ingest_output.embedding_failed_count,
+        'embedding_coverage': ingest_output.embedding_coverage,
+        'embedding_second_pass_attempted': ingest_output.embedding_second_pass_attempted,
+        'embedding_second_pass_recovered': ingest_output.embedding_second_pass_recovered,
+        'embedding_failure_reasons': ingest_output.embedding_failure_reasons,
+        'embedding_warning_count': len(ingest_output.warnings),
+        'warnings': ingest_output.warnings,
+        'timings': ingest_output.timings,
+        'page_kinds': ingest_output.page_kinds,
+    }
+
+
+def _reingest_plan(cfg, doc_id: str, pdf_path: Path, pdf_sha256: str | None = None) -> str:
+    if pdf_sha256 is None:
+        try:
+            pdf_sha256 = sha256_file(pdf_path)
+        except OSError:
+            return 'full'
+    return _run_log().plan(
+        doc_id,
+        pdf_sha256=pdf_sha256,
+        config_snapshot=_ingestion_config_snapshot(cfg),
+    )
+
+
+def _skipped_ingestion_result(doc_id: str) -> dict[str, object]:
+    return {
+        'doc_id': doc_id,
+        'reingest_mode': 'skip',
+        'skipped': True,
+        'ingestion_run': _run_log().latest(doc_id),
+    }
+
+
+def _run_planned_ingestion(
+    adapters: AdapterSet,
+    *,
+    doc_id: str,
+    pdf_path: Path,
+    mode: str,
+    source: str,
+    progress_callback,
+    page_executor: Executor | None = None,
+    pdf_sha256: str | None = None,
+) -> dict[str, object]:
+    """Run the ``mode`` picked by ``_reingest_plan`` (anything but ``skip``) and record the run."""
+    if mode == 'visual_artifacts':
+        latest = _run_log().latest(doc_id) or {}
+        result_payload = {'doc_id': doc_id, **dict(latest.get('result') or {})}
+    elif mode == 'embeddings':
+        result_payload = _reembed_pdf(adapters, doc_id=doc_id, progress_callback=progress_callback)
+    else:
+        result_payload = _ingest_pdf(
+            adapters,
+            doc_id=doc_id,
+            pdf_path=pdf_path,
+            progress_callback=progress_callback,
+            page_executor=page_executor,
+        )
+    merged = _finalize_ingestion_outputs(
+        cfg=adapters.cfg,
+        doc_id=doc_id,
+        pdf_path=pdf_path,
+        source=source,
+        filename=pdf_path.name,
+        progress_callback=progress_callback,
+        ingestion_result=result_payload,
+        mode=mode,
+        pdf_sha256=pdf_sha256,
+    )
+    merged['reingest_mode'] = mode
+    return merged
+
+
 def _ingest_uploaded_pdf_task(
     *,
-    cfg,
+    adapters: AdapterSet,
     target_doc_id: str,
     target_path: Path,
     original_filename: str,
+    pdf_sha256: str | None = None,
 ):
-    ocr_adapter = create_ocr_adapter(cfg.ocr_engine, cfg.ocr_fallback_engine)
-    embedding_adapter = _build_embedding_adapter(cfg)
-    vision_adapter = _build_vision(cfg)
+    cfg = adapters.cfg
 
     def _task(progress_callback):
-        ingest_output = ingest_document_use_case(
-            IngestDocumentInput(doc_id=target_doc_id, pdf_path=target_path),
-            pdf_parser=PypdfParserAdapter(),
-            ocr_adapter=ocr_adapter,
-            table_extractor=SimpleTableExtractorAdapter(),
-            chunk_store=FilesystemChunkStoreAdapter(ASSETS_DIR),
-            embedding_adapter=embedding_adapter,
-            vision_adapter=vision_adapter,
-            vision_max_pages=cfg.vision_max_pages,
-            page_workers=cfg.ingest_page_workers,
-            embedding_min_coverage=cfg.embedding_min_coverage,
-            embedding_fail_fast=cfg.embedding_fail_fast,
-            embedding_second_pass_max_chars=cfg.embedding_second_pass_max_chars,
-            progress_callback=progress_callback,
-        )
         result_payload = {
-            'doc_id': ingest_output.doc_id,
             'filename': original_filename,
             'stored_path': str(target_path),
-            'asset_ref': ingest_output.asset_ref,
-            'total_chunks': ingest_output.total_chunks,
-            'by_type': ingest_output.by_type,
-            'embedding_attempted': ingest_output.embedding_attempted,
-            'embedding_success_count': ingest_output.embedding_success_count,
-            'embedding_failed_count': ingest_output.embedding_failed_count,
-            'embedding_coverage': ingest_output.embedding_coverage,
-            'embedding_second_pass_attempted': ingest_output.embedding_second_pass_attempted,
-            'embedding_second_pass_recovered': ingest_output.embedding_second_pass_recovered,
-            'embedding_failure_reasons': ingest_output.embedding_failure_reasons,
-            'embedding_warning_count': len(ingest_output.warnings),
-            'warnings': ingest_output.warnings,
+            **_ingest_pdf(
+                adapters,
+                doc_id=target_doc_id,
+                pdf_path=target_path,
+                progress_callback=progress_callback,
+            ),
         }
         return _finalize_ingestion_outputs(
             cfg=cfg,
@@ -518,69 +1033,229 @@ def _ingest_uploaded_pdf_task(
             filename=original_filename,
             progress_callback=progress_callback,
             ingestion_result=result_payload,
+            pdf_sha256=pdf_sha256,
         )
 
     return _task
 
 
+def _deduplicated_upload_task(
+    *,
+    adapters: AdapterSet,
+    upload: _StoredUpload,
+    original_filename: str,
+):
+    # Same bytes as an earlier upload: reuse its doc, which the reingest plan skips when current.
+    planned = _ingest_catalog_pdf_task(
+        adapters=adapters,
+        doc_id=upload.doc_id,
+        pdf_path=upload.pdf_path,
+        source='upload',
+        pdf_sha256=upload.sha256,
+    )
+
+    def _task(progress_callback):
+        return {
+            'filename': original_filename,
+            'stored_path': str(upload.pdf_path),
+            'deduplicated': True,
+            **planned(progress_callback),
+        }
+
+    return _task
+
+
 def _ingest_catalog_pdf_task(
     *,
-    cfg,
+    adapters: AdapterSet,
     doc_id: str,
     pdf_path: Path,
     source: str = 'catalog',
+    force: bool = False,
+    pdf_sha256: str | None = None,
 ):
-    ocr_adapter = create_ocr_adapter(cfg.ocr_engine, cfg.ocr_fallback_engine)
-    embedding_adapter = _build_embedding_adapter(cfg)
-    vision_adapter = _build_vision(cfg)
+    def _task(progress_callback):
+        mode = 'full' if force else _reingest_plan(adapters.cfg, doc_id, pdf_path, pdf_sha256)
+        if mode == 'skip':
+            progress_callback(
+                {
+                    'stage': 'skipped',
+                    'processed_pages': 0,
+                    'total_pages': 0,
+                    'message': 'PDF and ingestion config unchanged since the latest run',
+                }
+            )
+            return _skipped_ingestion_result(doc_id)
+        return _run_planned_ingestion(
+            adapters,
+            doc_id=doc_id,
+            pdf_path=pdf_path,
+            mode=mode,
+            source=source,
+            progress_callback=progress_callback,
+            pdf_sha256=pdf_sha256,
+        )
+
+    return _task
+
+
+def _ingest_batch_task(
+    *,
+    adapters: AdapterSet,
+    documents: list[BatchDocument],
+    force: bool,
+    rejected: list[dict[str, str]],
+):
+    cfg = adapters.cfg
+    plans: dict[str, str] = {}
+
+    def _is_current(document: BatchDocument) -> bool:
+        plans[document.doc_id] = _reingest_plan(cfg, document.doc_id, document.pdf_path)
+        return plans[document.doc_id] == 'skip'
+
+    def _ingest_one(document: BatchDocument, page_executor: Executor) -> dict[str, object]:
+        return _run_planned_ingestion(
+            adapters,
+            doc_id=document.doc_id,
+            pdf_path=document.pdf_path,
+            mode='full' if force else plans.get(document.doc_id, 'full'),
+            source='batch',
+            progress_callback=lambda _payload: None,
+            page_executor=page_executor,
+        )
 
     def _task(progress_callback):
-        ingest_output = ingest_document_use_case(
-            IngestDocumentInput(doc_id=doc_id, pdf_path=pdf_path),
-            pdf_parser=PypdfParserAdapter(),
-            ocr_adapter=ocr_adapter,
-            table_extractor=SimpleTableExtractorAdapter(),
-            chunk_store=FilesystemChunkStoreAdapter(ASSETS_DIR),
-            embedding_adapter=embedding_adapter,
-            vision_adapter=vision_adapter,
-            vision_max_pages=cfg.vision_max_pages,
-            page_workers=cfg.ingest_page_workers,
-            embedding_min_coverage=cfg.embedding_min_coverage,
-            embedding_fail_fast=cfg.embedding_fail_fast,
-            embedding_second_pass_max_chars=cfg.embedding_second_pass_max_chars,
+        output = ingest_batch_use_case(
+            IngestBatchInput(
+                documents=documents,
+                doc_concurrency=cfg.ingest_batch_doc_concurrency,
+                page_worker_budget=cfg.ingest_batch_page_workers,
+                force=force,
+            ),
+            ingest_one=_ingest_one,
+            is_current=_is_current,
             progress_callback=progress_callback,
         )
-        result_payload = {
-            'doc_id': ingest_output.doc_id,
-            'asset_ref': ingest_output.asset_ref,
-            'total_chunks': ingest_output.total_chunks,
-            'by_type': ingest_output.by_type,
-            'embedding_attempted': ingest_output.embedding_attempted,
-            'embedding_success_count': ingest_output.embedding_success_count,
-            'embedding_failed_count': ingest_output.embedding_failed_count,
-            'embedding_coverage': ingest_output.embedding_coverage,
-            'embedding_second_pass_attempted': ingest_output.embedding_second_pass_attempted,
-            'embedding_second_pass_recovered': ingest_output.embedding_second_pass_recovered,
-            'embedding_failure_reasons': ingest_output.embedding_failure_reasons,
-            'embedding_warning_count': len(ingest_output.warnings),
-            'warnings': ingest_output.warnings,
+        return {
+            'ingested': output.ingested,
+            'skipped': output.skipped,
+            'failed': output.failed,
+            'total_pages': output.total_pages,
+            'duration_seconds': output.duration_seconds,
+            'pages_per_second': output.pages_per_second,
+            'doc_concurrency': cfg.ingest_batch_doc_concurrency,
+            'page_worker_budget': cfg.ingest_batch_page_workers,
+            'rejected': rejected,
+            'documents': [
+                {
+                    'doc_id': row.doc_id,
+                    'status': row.status,
+                    'pages': row.pages,
+                    'seconds': row.seconds,
+                    'pages_per_second': row.pages_per_second,
+                    'total_chunks': int((row.result or {}).get('total_chunks') or 0),
+                    'reingest_mode': (row.result or {}).get('reingest_mode', row.status),
+                    'error': row.error,
+                }
+                for row in output.documents
+            ],
         }
-        return _finalize_ingestion_outputs(
-            cfg=cfg,
-            doc_id=doc_id,
-            pdf_path=pdf_path,
-            source=source,
-            filename=pdf_path.name,
+
+    return _task
+
+
+def _ingested_doc_ids() -> list[str]:
+    if not ASSETS_DIR.exists():
+        return []
+    return sorted(path.name for path in ASSETS_DIR.iterdir() if artifact_path(path, 'chunks.jsonl').exists())
+
+
+def _reembed_migration_task(
+    *,
+    adapters: AdapterSet,
+    doc_ids: list[str],
+    provider: str,
+    model: str,
+    batch_size: int,
+    activate: bool,
+):
+    cfg = replace(adapters.cfg, embedding_provider=provider, embedding_model=model)
+    key = embedding_model_key(provider, model)
+    registry = _embedding_registry()
+
+    def _document_done(row: MigratedDocument) -> None:
+        _run_visual_artifact_pipeline(row.doc_id)
+        _doc_index().refresh(row.doc_id)
+        previous = registry.migration(key) or {}
+        documents = {**dict(previous.get('documents') or {}), row.doc_id: row.embedded_chunks}
+        registry.record_migration(
+            key,
+            {
+                'provider': provider,
+                'model': model,
+                'status': 'running',
+                'documents': documents,
+            },
+        )
+
+    def _activate(coverage: float) -> None:
+        registry.activate(key, provider=provider, model=model)
+        CONTAINER.reload()
+
+    def _task(progress_callback):
+        output = migrate_embeddings_use_case(
+            MigrateEmbeddingsInput(
+                doc_ids=doc_ids,
+                embedding_key=key,
+                batch_size=batch_size,
+                min_coverage=cfg.embedding_min_coverage,
+            ),
+            chunk_store=FilesystemChunkStoreAdapter(ASSETS_DIR),
+            embedding_adapter=_build_embedding_adapter(cfg),
+            on_document_done=_document_done,
+            activate=_activate if activate else None,
+            coverage_doc_ids=_ingested_doc_ids,
             progress_callback=progress_callback,
-            ingestion_result=result_payload,
         )
+        registry.record_migration(
+            key,
+            {
+                'provider': provider,
+                'model': model,
+                'status': 'completed',
+                'total_chunks': output.total_chunks,
+                'embedded_chunks': output.embedded_chunks,
+                'coverage': output.coverage,
+            },
+        )
+        return {
+            'embedding_key': key,
+            'total_chunks': output.total_chunks,
+            'embedded_chunks': output.embedded_chunks,
+            'newly_embedded': output.newly_embedded,
+            'failed_chunks': output.failed_chunks,
+            'coverage': output.coverage,
+            'min_coverage': cfg.embedding_min_coverage,
+            'activated': output.activated,
+            'active': registry.active(),
+            'documents': [
+                {
+                    'doc_id': row.doc_id,
+                    'total_chunks': row.total_chunks,
+                    'embedded_chunks': row.embedded_chunks,
+                    'newly_embedded': row.newly_embedded,
+                    'failed_chunks': row.failed_chunks,
+                }
+                for row in output.documents
+            ],
+        }
 
     return _task
 
 
 @app.get('/health')
 def health() -> dict[str, object]:
-    cfg = load_config()
+    cfg = CONTAINER.current().cfg
     validation = validate_data_contracts_use_case(
         ValidateDataContractsInput(
             catalog_path=CATALOG_PATH,
@@ -613,6 +1288,7 @@ def health() -> dict[str, object]:
         'agentic_provider': cfg.agentic_provider,
         'agentic_max_iterations': cfg.agentic_max_iterations,
         'agentic_max_tool_calls': cfg.agentic_max_tool_calls,
+        'agentic_max_parallel_tool_calls': cfg.agentic_max_parallel_tool_calls,
         'ocr_engine': cfg.ocr_engine,
         'ocr_fallback_engine': cfg.ocr_fallback_engine,
         'contract_errors': len(validation.errors),
@@ -620,6 +1296,62 @@ def health() -> dict[str, object]:
     }
 
 
+@app.get('/metrics', response_class=PlainTextResponse)
+def metrics() -> PlainTextResponse:
+    return PlainTextResponse(METRICS.render(), media_type='text/plain; version=0.0.4')
+
+
+def _require_admin(x_admin_token: str = Header(default='')) -> None:
+    """Admin endpoints need ``X-Admin-Token`` to match ``ADMIN_TOKEN`` and are disabled while it is unset."""
+    expected = CONTAINER.current().cfg.admin_token
+    if not expected:
+        raise HTTPException(status_code=403, detail='Admin endpoints are disabled; set ADMIN_TOKEN to enable them')
+    if not hmac.compare_digest(x_admin_token.encode('utf-8'), expected.encode('utf-8')):
+        raise HTTPException(status_code=401, detail='Invalid admin token')
+
+
+@app.post('/admin/reload', dependencies=[Depends(_require_admin)])
+def reload_config() -> dict[str, object]:
+    try:
+        status = CONTAINER.reload()
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f'Config reload failed: {exc}') from exc
+    if status['last_error']:
+        raise HTTPException(status_code=500, detail=f'Config reload failed: {status["last_error"]}')
+    return status
+
+
+@app.get('/admin/embedding-models', dependencies=[Depends(_require_admin)])
+def list_embedding_models() -> dict[str, object]:
+    cfg = CONTAINER.current().cfg
+    return {
+        'configured_key': embedding_model_key(cfg.embedding_provider, cfg.embedding_model),
+        **_embedding_registry().snapshot(),
+    }
+
+
+@app.post('/admin/embedding-models/activate', dependencies=[Depends(_require_admin)])
+def activate_embedding_model(key: str = '') -> dict[str, object]:
+    """Point search at a migrated model's vectors; an empty ``key`` reverts to the legacy ``embedding`` field."""
+    cfg = CONTAINER.current().cfg
+    registry = _embedding_registry()
+    if not key:
+        registry.deactivate()
+    else:
+        migration = registry.migration(key)
+        if migration is None or migration.get('status') != 'completed':
+            raise HTTPException(status_code=400, detail=f'No completed embedding migration for {key}')
+        coverage = float(migration.get('coverage') or 0.0)
+        if coverage < cfg.embedding_min_coverage:
+            raise HTTPException(
+                status_code=400,
+                detail=f'Coverage {coverage:.2%} for {key} is below EMBEDDING_MIN_COVERAGE',
+            )
+        registry.activate(key, provider=str(migration['provider']), model=str(migration['model']))
+    CONTAINER.reload()
+    return list_embedding_models()
+
+
 @app.get('/health/contracts')
 def contract_health() -> dict[str, object]:
     validation = validate_data_contracts_use_case(
@@ -639,75 +1371,33 @@ def contract_health() -> dict[str, object]:
 
 @app.get('/catalog')
 def list_catalog() -> dict[str, object]:
-    catalog = YamlDocumentCatalogAdapter(CATALOG_PATH)
-    docs = [doc.__dict__ for doc in catalog.list_documents()]
+    docs = [doc.__dict__ for doc in _catalog().list_documents()]
     return {'documents': docs}
 
 
 @app.get('/ingested/docs')
-def list_ingested_docs() -> dict[str, object]:
-    catalog = YamlDocumentCatalogAdapter(CATALOG_PATH)
-    catalog_by_id = {row.doc_id: row for row in catalog.list_documents()}
+def list_ingested_docs(request: Request) -> Response:
+    catalog_by_id = {row.doc_id: row for row in _catalog().list_documents()}
     docs: list[dict[str, object]] = []
-
-    if not ASSETS_DIR.exists():
-        return {'documents': docs, 'total': 0}
-
-    for doc_path in sorted([p for p in ASSETS_DIR.iterdir() if p.is_dir()], key=lambda p: p.name):
-        chunks_path = doc_path / 'chunks.jsonl'
-        total_chunks = 0
-        by_type: dict[str, int] = {}
-        if chunks_path.exists():
-            with chunks_path.open('r', encoding='utf-8') as fh:
-                for line in fh:
-                    if not line.strip():
-                        continue
-                    total_chunks += 1
-                    try:
-                        row = json.loads(line)
-                        content_type = str(row.get('content_type') or 'unknown')
-                        by_type[content_type] = by_type.get(content_type, 0) + 1
-                    except json.JSONDecodeError:
-                        by_type['invalid'] = by_type.get('invalid', 0) + 1
-
-        visual_manifest_path = doc_path / 'visual_manifest.json'
-        visual_chunk_count = 0
-        visual_embedding_count = 0
-        if visual_manifest_path.exists():
-            try:
-                manifest_payload = json.loads(visual_manifest_path.read_text(encoding='utf-8'))
-                visual_chunk_count = int(manifest_payload.get('visual_chunk_count') or 0)
-                visual_embedding_count = int(manifest_payload.get('embedding_count') or 0)
-            except (json.JSONDecodeError, ValueError, TypeError):
-                visual_chunk_count = 0
-                visual_embedding_count = 0
-
-        visual_validation = validate_visual_artifacts_for_doc(doc_path, strict=False)
-        run_history = _load_ingestion_runs(doc_path.name, limit=20)
-        mtime = datetime.fromtimestamp(doc_path.stat().st_mtime, tz=UTC).isoformat()
-        catalog_row = catalog_by_id.get(doc_path.name)
-        docs.append(
+    for summary in _doc_index().list_summaries():
+        row = {key: value for key, value in summary.items() if key != 'fingerprint'}
+        catalog_row = catalog_by_id.get(str(row['doc_id']))
+        row.update(
             {
-                'doc_id': doc_path.name,
-                'total_chunks': total_chunks,
-                'by_type': by_type,
-                'asset_path': str(chunks_path) if chunks_path.exists() else None,
-                'updated_at': mtime,
                 'in_catalog': catalog_row is not None,
                 'catalog_status': catalog_row.status if catalog_row else None,
                 'catalog_filename': catalog_row.filename if catalog_row else None,
                 'catalog_title': catalog_row.title if catalog_row else None,
-                'visual_chunk_count': visual_chunk_count,
-                'visual_embedding_count': visual_embedding_count,
-                'visual_contract_valid': visual_validation.is_valid(),
-                'visual_contract_error_count': len(visual_validation.errors),
-                'visual_contract_warning_count': len(visual_validation.warnings),
-                'ingestion_run_count': len(run_history),
-                'latest_ingestion_run': run_history[0] if run_history else None,
             }
         )
+        docs.append(row)
 
-    return {'documents': docs, 'total': len(docs)}
+    payload = {'documents': docs, 'total': len(docs)}
+    etag = summaries_etag(payload)
+    headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
+    if etag in {tag.strip() for tag in request.headers.get('if-none-match', '').split(',')}:
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(payload, headers=headers)
 
 
 @app.delete('/ingested/{doc_id}')
@@ -717,6 +1407,7 @@ def delete_ingested_doc(doc_id: str) -> dict[str, object]:
         raise HTTPException(status_code=404, detail=f'Ingested doc not found: {doc_id}')
 
     shutil.rmtree(target)
+    _doc_index().remove(doc_id)
     return {'deleted': True, 'doc_id': doc_id}
 
 
@@ -731,7 +1422,7 @@ def get_ingested_doc_validation(doc_id: str) -> dict[str, object]:
     total_visual_rows, _ = _read_visual_chunks(doc_id, limit=1)
     run_history = _load_ingestion_runs(doc_id, limit=25)
 
-    visual_manifest_path = doc_dir / 'visual_manifest.json'
+    visual_manifest_path = artifact_path(doc_dir, 'visual_manifest.json')
     visual_manifest: dict[str, object] | None = None
     if visual_manifest_path.exists():
         try:
@@ -776,8 +1467,8 @@ def generate_visual_artifacts_for_doc(doc_id: str) -> dict[str, object]:
     if not doc_dir.exists() or not doc_dir.is_dir():
         raise HTTPException(status_code=404, detail=f'Ingested doc not found: {doc_id}')
 
-    cfg = load_config()
-    result = _run_visual_artifact_pipeline(doc_id)
+    cfg = CONTAINER.current().cfg
+    result = _run_visual_artifact_pipeline(doc_id, force=True)
     pdf_path = _resolve_pdf_path(doc_id)
     run_row = {
         'run_id': datetime.now(UTC).strftime('%Y%m%d%H%M%S'),
@@ -794,7 +1485,8 @@ def generate_visual_artifacts_for_doc(doc_id: str) -> dict[str, object]:
             'validation_valid': bool((result.get('validation') or {}).get('valid', False)),
         },
     }
-    _append_ingestion_run(doc_id, run_row)
+    _run_log().append(doc_id, run_row)
+    _doc_index().refresh(doc_id)
 
     return {'doc_id': doc_id, 'result': result, 'ingestion_run': run_row}
 
@@ -821,6 +1513,89 @@ def list_jobs(limit: int = Query(50, ge=1, le=200)) -> dict[str, object]:
     return {'jobs': [_serialize_job(row) for row in rows], 'total': len(rows)}
 
 
+# SSE comment sent when no job changed for this long, so proxies keep the stream open.
+_JOB_EVENTS_KEEPALIVE_SECONDS = 15.0
+
+
+def _last_event_id(request: Request) -> int | None:
+    try:
+        return int(request.headers.get('last-event-id', ''))
+    except ValueError:
+        return None
+
+
+async def _job_event_stream(*, job_id: str | None, since: int, max_seconds: float) -> AsyncIterator[str]:
+    """SSE frames for job changes after version ``since``; each frame's ``id`` is the version.
+
+    A single-job stream ends once the job completes or fails. Every stream ends
+    after ``max_seconds``; EventSource clients reconnect with ``Last-Event-ID``.
+    Waiting happens on the event loop, so open streams hold no worker threads.
+    """
+    deadline = time.monotonic() + max_seconds
+    yield 'retry: 2000\n\n'
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        try:
+            version, jobs = await JOB_MANAGER.wait_for_changes_async(
+                since=since, job_id=job_id, timeout=min(_JOB_EVENTS_KEEPALIVE_SECONDS, remaining)
+            )
+        except KeyError:
+            return
+        if not jobs:
+            yield ': keep-alive\n\n'
+            continue
+        since = version
+        for job in jobs:
+            yield f'id: {version}\nevent: job\ndata: {json.dumps(_serialize_job(job))}\n\n'
+        if job_id is not None and jobs[-1].status in TERMINAL_JOB_STATUSES:
+            return
+
+
+def _sse_response(frames: AsyncIterator[str]) -> StreamingResponse:
+    return StreamingResponse(
+        frames,
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+
+
+@app.get('/jobs/events')
+def stream_jobs(
+    request: Request,
+    since: int | None = Query(None, ge=0),
+    max_seconds: float = Query(300.0, gt=0, le=3600),
+) -> StreamingResponse:
+    # Without ``since`` (or ``Last-Event-ID``) only changes from now on are sent;
+    # ``since=0`` replays the latest state of every job first.
+    start = since if since is not None else _last_event_id(request)
+    if start is None:
+        start = JOB_MANAGER.version()
+    return _sse_response(_job_event_stream(job_id=None, since=start, max_seconds=max_seconds))
+
+
+@app.get('/jobs/{job_id}/events')
+def stream_job(
+    job_id: str,
+    request: Request,
+    since: int | None = Query(None, ge=0),
+    max_seconds: float = Query(300.0, gt=0, le=3600),
+) -> Response:
+    try:
+        job = JOB_MANAGER.get(job_id)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=f'Unknown job id: {job_id}') from exc
+    start = since if since is not None else _last_event_id(request)
+    if start and job.status in TERMINAL_JOB_STATUSES and not JOB_MANAGER.wait_for_changes(
+        since=start, job_id=job_id, timeout=0
+    )[1]:
+        # The client already has the final state; 204 stops EventSource reconnecting.
+        return Response(status_code=204)
+    # The first frame is the job's current state unless resuming.
+    return _sse_response(_job_event_stream(job_id=job_id, since=start or 0, max_seconds=max_seconds))
+
+
 @app.get('/jobs/{job_id}')
 def get_job(job_id: str) -> dict[str, object]:
     try:
@@ -829,44 +1604,28 @@ def get_job(job_id: str) -> dict[str, object]:
         raise HTTPException(status_code=404, detail=f'Unknown job id: {job_id}') from exc
 
 
-@app.post('/jobs/upload')
-async def upload_manual_job(
-    file: UploadFile = File(...),
-    doc_id: str | None = Form(default=None),
-) -> dict[str, object]:
-    if not file.filename:
-        raise HTTPException(status_code=400, detail='Uploaded file name is required')
-    if not file.filename.lower().endswith('.pdf'):
-        raise HTTPException(status_code=400, detail='Only PDF files are supported')
-
-    resolved_doc_id = _slugify(doc_id or Path(file.filename).stem)
-    ts = datetime.now(UTC).strftime('%Y%m%d%H%M%S')
-    target_doc_id = f'{resolved_doc_id}_{ts}'
-
-    UPLOADS_DIR.mkdir(parents=True, exist_ok=True)
-    target_path = UPLOADS_DIR / f'{target_doc_id}.pdf'
-    target_path.write_bytes(await file.read())
-
-    cfg = load_config()
-    job = JOB_MANAGER.submit(
-        kind='upload',
-        doc_id=target_doc_id,
-        filename=file.filename,
-        task=_ingest_uploaded_pdf_task(
-            cfg=cfg,
-            target_doc_id=target_doc_id,
-            target_path=target_path,
-            original_filename=file.filename,
-        ),
-    )
+@app.post('/jobs/upload', openapi_extra=_UPLOAD_OPENAPI)
+async def upload_manual_job(request: Request) -> dict[str, object]:
+    upload = await _store_upload(request)
+    adapters = CONTAINER.current()
+    if upload.deduplicated:
+        task = _deduplicated_upload_task(adapters=adapters, upload=upload, original_filename=upload.filename)
+    else:
+        task = _ingest_uploaded_pdf_task(
+            adapters=adapters,
+            target_doc_id=upload.doc_id,
+            target_path=upload.pdf_path,
+            original_filename=upload.filename,
+            pdf_sha256=upload.sha256,
+        )
+    job = JOB_MANAGER.submit(kind='upload', doc_id=upload.doc_id, filename=upload.filename, task=task)
     return _serialize_job(job)
 
 
 @app.post('/jobs/ingest/{doc_id}')
-def ingest_catalog_job(doc_id: str) -> dict[str, object]:
-    cfg = load_config()
-    catalog = YamlDocumentCatalogAdapter(CATALOG_PATH)
-    record = catalog.get(doc_id)
+def ingest_catalog_job(doc_id: str, force: bool = False) -> dict[str, object]:
+    adapters = CONTAINER.current()
+    record = _catalog().get(doc_id)
 
     if record is None:
         raise HTTPException(status_code=404, detail=f'Unknown doc id: {doc_id}')
@@ -886,17 +1645,18 @@ def ingest_catalog_job(doc_id: str) -> dict[str, object]:
         doc_id=doc_id,
         filename=record.filename,
         task=_ingest_catalog_pdf_task(
-            cfg=cfg,
+            adapters=adapters,
             doc_id=doc_id,
             pdf_path=pdf_path,
+            force=force,
         ),
     )
     return _serialize_job(job)
 
 
 @app.post('/jobs/reingest/{doc_id}')
-def reingest_doc_job(doc_id: str) -> dict[str, object]:
-    cfg = load_config()
+def reingest_doc_job(doc_id: str, force: bool = False) -> dict[str, object]:
+    adapters = CONTAINER.current()
     pdf_path = _resolve_pdf_path(doc_id)
     if pdf_path is None or not pdf_path.exists():
         raise HTTPException(status_code=404, detail=f'PDF not found for reingest doc_id: {doc_id}')
@@ -906,54 +1666,128 @@ def reingest_doc_job(doc_id: str) -> dict[str, object]:
         doc_id=doc_id,
         filename=pdf_path.name,
         task=_ingest_catalog_pdf_task(
-            cfg=cfg,
+            adapters=adapters,
             doc_id=doc_id,
             pdf_path=pdf_path,
             source='reingest',
+            force=force,
         ),
     )
     return _serialize_job(job)
 
 
-@app.post('/upload')
-async def upload_manual(
-    file: UploadFile = File(...),
-    doc_id: str | None = Form(default=None),
+@app.post('/jobs/ingest-batch')
+def ingest_batch_job(
+    doc_ids: str | None = None,
+    all_present: bool = False,
+    force: bool = False,
 ) -> dict[str, object]:
-    if not file.filename:
-        raise HTTPException(status_code=400, detail='Uploaded file name is required')
-    if not file.filename.lower().endswith('.pdf'):
-        raise HTTPException(status_code=400, detail='Only PDF files are supported')
+    adapters = CONTAINER.current()
+    requested = _parse_doc_ids_csv(doc_ids)
+    if all_present:
+        requested.extend(
+            record.doc_id for record in _catalog().list_documents() if record.status == 'present'
+        )
+    if not requested:
+        raise HTTPException(status_code=400, detail='Provide doc_ids or set all_present=true')
+
+    documents: list[BatchDocument] = []
+    rejected: list[dict[str, str]] = []
+    for doc_id in dict.fromkeys(requested):
+        pdf_path = _resolve_pdf_path(doc_id)
+        if pdf_path is None:
+            rejected.append({'doc_id': doc_id, 'reason': 'PDF not found'})
+            continue
+        documents.append(BatchDocument(doc_id=doc_id, pdf_path=pdf_path))
+    if not documents:
+        raise HTTPException(status_code=400, detail={'message': 'No ingestable documents', 'rejected': rejected})
 
-    resolved_doc_id = _slugify(doc_id or Path(file.filename).stem)
-    ts = datetime.now(UTC).strftime('%Y%m%d%H%M%S')
-    target_doc_id = f'{resolved_doc_id}_{ts}'
+    job = JOB_MANAGER.submit(
+        kind='batch',
+        doc_id=None,
+        filename=None,
+        task=_ingest_batch_task(
+            adapters=adapters,
+            documents=documents,
+            force=force,
+            rejected=rejected,
+        ),
+    )
+    return _serialize_job(job)
+
+
+@app.post('/jobs/reembed')
+def reembed_migration_job(
+    embedding_model: str,
+    embedding_provider: str | None = None,
+    doc_ids: str | None = None,
+    batch_size: int | None = Query(None, ge=1, le=1024),
+    activate: bool = True,
+) -> dict[str, object]:
+    adapters = CONTAINER.current()
+    provider = (embedding_provider or adapters.cfg.embedding_provider).strip()
+    if not embedding_model.strip():
+        raise HTTPException(status_code=400, detail='embedding_model is required')
+
+    selected = _parse_doc_ids_csv(doc_ids)
+    if not selected:
+        selected = _ingested_doc_ids()
+    missing = [
+        doc_id for doc_id in selected if not artifact_path(ASSETS_DIR / doc_id, 'chunks.jsonl').exists()
+    ]
+    if missing:
+        raise HTTPException(status_code=404, detail=f'No ingested chunks for: {", ".join(missing)}')
+    if not selected:
+        raise HTTPException(status_code=400, detail='No ingested documents to re-embed')
+
+    job = JOB_MANAGER.submit(
+        kind='reembed',
+        doc_id=None,
+        filename=None,
+        task=_reembed_migration_task(
+            adapters=adapters,
+            doc_ids=selected,
+            provider=provider,
+            model=embedding_model.strip(),
+            batch_size=batch_size or adapters.cfg.embedding_migration_batch_size,
+            activate=activate,
+        ),
+    )
+    return _serialize_job(job)
 
-    UPLOADS_DIR.mkdir(parents=True, exist_ok=True)
-    target_path = UPLOADS_DIR / f'{target_doc_id}.pdf'
-    target_path.write_bytes(await file.read())
 
-    cfg = load_config()
-    ocr_adapter = create_ocr_adapter(cfg.ocr_engine, cfg.ocr_fallback_engine)
-    embedding_adapter = _build_embedding_adapter(cfg)
-    vision_adapter = _build_vision(cfg)
+@app.post('/upload', openapi_extra=_UPLOAD_OPENAPI)
+async def upload_manual(request: Request) -> dict[str, object]:
+    upload = await _store_upload(request)
+    adapters = CONTAINER.current()
+    if upload.deduplicated:
+        task = _deduplicated_upload_task(adapters=adapters, upload=upload, original_filename=upload.filename)
+        return task(lambda _payload: None)
+
+    target_doc_id = upload.doc_id
+    target_path = upload.pdf_path
+    cfg = adapters.cfg
     ingest_output = ingest_document_use_case(
         IngestDocumentInput(doc_id=target_doc_id, pdf_path=target_path),
-        pdf_parser=PypdfParserAdapter(),
-        ocr_adapter=ocr_adapter,
-        table_extractor=SimpleTableExtractorAdapter(),
+        pdf_parser=adapters.pdf_parser,
+        ocr_adapter=adapters.ocr_adapter,
+        table_extractor=adapters.table_extractor,
         chunk_store=FilesystemChunkStoreAdapter(ASSETS_DIR),
-        embedding_adapter=embedding_adapter,
-        vision_adapter=vision_adapter,
+        embedding_adapter=adapters.embedding_adapter,
+        vision_adapter=adapters.vision_adapter,
         vision_max_pages=cfg.vision_max_pages,
         page_workers=cfg.ingest_page_workers,
         embedding_min_coverage=cfg.embedding_min_coverage,
         embedding_fail_fast=cfg.embedding_fail_fast,
         embedding_second_pass_max_chars=cfg.embedding_second_pass_max_chars,
+        chunk_max_tokens=cfg.chunk_max_tokens,
+        chunk_overlap_tokens=cfg.chunk_overlap_tokens,
+        embedding_key=adapters.embedding_key,
+        legacy_embedding=_writes_legacy_embedding(adapters),
     )
     result_payload = {
         'doc_id': ingest_output.doc_id,
-        'filename': file.filename,
+        'filename': upload.filename,
         'stored_path': str(target_path),
         'asset_ref': ingest_output.asset_ref,
         'total_chunks': ingest_output.total_chunks,
@@ -967,23 +1801,25 @@ async def upload_manual(
         'embedding_failure_reasons': ingest_output.embedding_failure_reasons,
         'embedding_warning_count': len(ingest_output.warnings),
         'warnings': ingest_output.warnings,
+        'timings': ingest_output.timings,
     }
     return _finalize_ingestion_outputs(
         cfg=cfg,
         doc_id=target_doc_id,
         pdf_path=target_path,
         source='upload_sync',
-        filename=file.filename,
+        filename=upload.filename,
         progress_callback=lambda _payload: None,
         ingestion_result=result_payload,
+        pdf_sha256=upload.sha256,
     )
 
 
 @app.post('/ingest/{doc_id}')
 def ingest_document(doc_id: str) -> dict[str, object]:
-    cfg = load_config()
-    catalog = YamlDocumentCatalogAdapter(CATALOG_PATH)
-    record = catalog.get(doc_id)
+    adapters = CONTAINER.current()
+    cfg = adapters.cfg
+    record = _catalog().get(doc_id)
 
     if record is None:
         raise HTTPException(status_code=404, detail=f'Unknown doc id: {doc_id}')
@@ -998,23 +1834,23 @@ def ingest_document(doc_id: str) -> dict[str, object]:
     if not pdf_path.exists():
         raise HTTPException(status_code=400, detail=f'PDF file missing for {doc_id}: {pdf_path}')
 
-    ocr_adapter = create_ocr_adapter(cfg.ocr_engine, cfg.ocr_fallback_engine)
-    embedding_adapter = _build_embedding_adapter(cfg)
-    vision_adapter = _build_vision(cfg)
-
     ingest_output = ingest_document_use_case(
         IngestDocumentInput(doc_id=doc_id, pdf_path=pdf_path),
-        pdf_parser=PypdfParserAdapter(),
-        ocr_adapter=ocr_adapter,
-        table_extractor=SimpleTableExtractorAdapter(),
+        pdf_parser=adapters.pdf_parser,
+        ocr_adapter=adapters.ocr_adapter,
+        table_extractor=adapters.table_extractor,
         chunk_store=FilesystemChunkStoreAdapter(ASSETS_DIR),
-        embedding_adapter=embedding_adapter,
-        vision_adapter=vision_adapter,
+        embedding_adapter=adapters.embedding_adapter,
+        vision_adapter=adapters.vision_adapter,
         vision_max_pages=cfg.vision_max_pages,
         page_workers=cfg.ingest_page_workers,
         embedding_min_coverage=cfg.embedding_min_coverage,
         embedding_fail_fast=cfg.embedding_fail_fast,
         embedding_second_pass_max_chars=cfg.embedding_second_pass_max_chars,
+        chunk_max_tokens=cfg.chunk_max_tokens,
+        chunk_overlap_tokens=cfg.chunk_overlap_tokens,
+        embedding_key=adapters.embedding_key,
+        legacy_embedding=_writes_legacy_embedding(adapters),
     )
     result_payload = {
         'doc_id': ingest_output.doc_id,
@@ -1030,6 +1866,7 @@ def ingest_document(doc_id: str) -> dict[str, object]:
         'embedding_failure_reasons': ingest_output.embedding_failure_reasons,
         'embedding_warning_count': len(ingest_output.warnings),
         'warnings': ingest_output.warnings,
+        'timings': ingest_output.timings,
     }
     return _finalize_ingestion_outputs(
         cfg=cfg,
@@ -1049,10 +1886,11 @@ def search(
     doc_ids: str | None = None,
     top_n: int = Query(8, ge=1, le=50),
     rerank_pool_size: int | None = Query(None, ge=0, le=100),
+    include_timings: bool = False,
 ) -> dict[str, object]:
-    cfg = load_config()
+    adapters = CONTAINER.current()
+    cfg = adapters.cfg
     selected_doc_ids = _parse_doc_ids_csv(doc_ids)
-    reranker = _build_reranker(cfg)
     output = search_evidence_use_case(
         SearchEvidenceInput(
             query=q,
@@ -1061,16 +1899,18 @@ def search(
             rerank_pool_size=rerank_pool_size or cfg.reranker_pool_size,
         ),
         chunk_query=_scoped_chunk_query(selected_doc_ids),
-        keyword_search=SimpleKeywordSearchAdapter(),
-        vector_search=_build_vector_search(cfg),
-        trace_logger=RetrievalTraceLogger(Path(cfg.retrieval_trace_file)),
-        reranker=reranker,
+        keyword_search=adapters.keyword_search,
+        vector_search=adapters.vector_search,
+        trace_logger=adapters.retrieval_trace_logger,
+        reranker=adapters.reranker,
+        deadline=_request_deadline(cfg),
     )
 
-    return {
+    response: dict[str, object] = {
         'query': output.query,
         'intent': output.intent,
         'total_chunks_scanned': output.total_chunks_scanned,
+        'degradations': output.degradations,
         'hits': [
             {
                 'chunk_id': hit.chunk_id,
@@ -1090,6 +1930,10 @@ def search(
             for hit in output.hits
         ],
     }
+    record_stage_timings(METRICS, output.timings)
+    if include_timings:
+        response['timings'] = output.timings
+    return response
 
 
 @app.get('/answer')
@@ -1099,38 +1943,42 @@ def answer(
     doc_ids: str | None = None,
     top_n: int = Query(6, ge=1, le=20),
     rerank_pool_size: int | None = Query(None, ge=0, le=100),
+    include_timings: bool = False,
 ) -> dict[str, object]:
-    cfg = load_config()
+    adapters = CONTAINER.current()
+    cfg = adapters.cfg
+    deadline = _request_deadline(cfg)
     selected_doc_ids = _parse_doc_ids_csv(doc_ids)
     scoped_chunk_query = _scoped_chunk_query(selected_doc_ids)
-    reranker = _build_reranker(cfg)
-    planner, tool_executor, state_graph_runner, agent_trace_logger = _build_agentic_stack(
-        cfg=cfg,
-        chunk_query=scoped_chunk_query,
-        reranker=reranker,
-    )
-    output = answer_question_use_case(
-        AnswerQuestionInput(
-            query=q,
-            doc_id=doc_id,
-            top_n=top_n,
-            rerank_pool_size=rerank_pool_size or cfg.reranker_pool_size,
-        ),
-        chunk_query=scoped_chunk_query,
-        keyword_search=SimpleKeywordSearchAdapter(),
-        vector_search=_build_vector_search(cfg),
-        trace_logger=AnswerTraceLogger(Path(cfg.answer_trace_file)),
-        llm=_build_llm(cfg),
-        reranker=reranker,
-        use_agentic_mode=cfg.use_agentic_mode,
-        planner=planner,
-        tool_executor=tool_executor,
-        state_graph_runner=state_graph_runner,
-        agent_trace_logger=agent_trace_logger,
-        agent_max_iterations=cfg.agentic_max_iterations,
-        agent_max_tool_calls=cfg.agentic_max_tool_calls,
-        agent_timeout_seconds=cfg.agentic_timeout_seconds,
-    )
+    scope_token = _AGENT_SCOPE.set(_AgentRequestScope(chunk_query=scoped_chunk_query, deadline=deadline))
+    try:
+        output = answer_question_use_case(
+            AnswerQuestionInput(
+                query=q,
+                doc_id=doc_id,
+                doc_ids=tuple(selected_doc_ids),
+                top_n=top_n,
+                rerank_pool_size=rerank_pool_size or cfg.reranker_pool_size,
+            ),
+            chunk_query=scoped_chunk_query,
+            keyword_search=adapters.keyword_search,
+            vector_search=adapters.vector_search,
+            trace_logger=adapters.answer_trace_logger,
+            llm=adapters.llm,
+            reranker=adapters.reranker,
+            use_agentic_mode=cfg.use_agentic_mode,
+            planner=adapters.planner,
+            tool_executor=adapters.tool_executor,
+            state_graph_runner=adapters.state_graph_runner,
+            agent_trace_logger=adapters.agent_trace_logger,
+            agent_max_iterations=cfg.agentic_max_iterations,
+            agent_max_tool_calls=cfg.agentic_max_tool_calls,
+            agent_max_parallel_tool_calls=cfg.agentic_max_parallel_tool_calls,
+            agent_timeout_seconds=cfg.agentic_timeout_seconds,
+            deadline=deadline,
+        )
+    finally:
+        _AGENT_SCOPE.reset(scope_token)
 
     response: dict[str, object] = {
         'query': output.query,
@@ -1140,6 +1988,7 @@ def answer(
         'answer': output.answer,
         'follow_up_question': output.follow_up_question,
         'warnings': output.warnings,
+        'degradations': output.degradations,
         'total_chunks_scanned': output.total_chunks_scanned,
         'retrieved_chunk_ids': output.retrieved_chunk_ids,
         'citations': [
@@ -1156,6 +2005,9 @@ def answer(
     }
     if cfg.include_reasoning_summary:
         response['reasoning_summary'] = output.reasoning_summary
+    record_stage_timings(METRICS, output.timings)
+    if include_timings:
+        response['timings'] = output.timings
     return response
 
 
@@ -1164,38 +2016,40 @@ def evaluate_golden(
     doc_id: str | None = None,
     top_n: int = Query(6, ge=1, le=20),
     limit: int = Query(0, ge=0, le=200),
+    max_workers: int = Query(1, ge=1, le=16),
 ) -> dict[str, object]:
-    cfg = load_config()
-    chunk_query = FilesystemChunkQueryAdapter(ASSETS_DIR)
-    reranker = _build_reranker(cfg)
-    planner, tool_executor, state_graph_runner, agent_trace_logger = _build_agentic_stack(
-        cfg=cfg,
-        chunk_query=chunk_query,
-        reranker=reranker,
-    )
-    output = run_golden_evaluation_use_case(
-        RunGoldenEvaluationInput(
-            catalog_path=CATALOG_PATH,
-            golden_questions_path=GOLDEN_PATH,
-            top_n=top_n,
-            doc_id_filter=doc_id,
-            limit=limit if limit > 0 else None,
-        ),
-        chunk_query=chunk_query,
-        keyword_search=SimpleKeywordSearchAdapter(),
-        vector_search=_build_vector_search(cfg),
-        trace_logger=AnswerTraceLogger(Path(cfg.answer_trace_file)),
-        llm=_build_llm(cfg),
-        reranker=reranker,
-        use_agentic_mode=cfg.use_agentic_mode,
-        planner=planner,
-        tool_executor=tool_executor,
-        state_graph_runner=state_graph_runner,
-        agent_trace_logger=agent_trace_logger,
-        agent_max_iterations=cfg.agentic_max_iterations,
-        agent_max_tool_calls=cfg.agentic_max_tool_calls,
-        agent_timeout_seconds=cfg.agentic_timeout_seconds,
-    )
+    adapters = CONTAINER.current()
+    cfg = adapters.cfg
+    chunk_query = CachedChunkQueryAdapter(FilesystemChunkQueryAdapter(ASSETS_DIR))
+    scope_token = _AGENT_SCOPE.set(_AgentRequestScope(chunk_query=chunk_query))
+    try:
+        output = run_golden_evaluation_use_case(
+            RunGoldenEvaluationInput(
+                catalog_path=CATALOG_PATH,
+                golden_questions_path=GOLDEN_PATH,
+                top_n=top_n,
+                doc_id_filter=doc_id,
+                limit=limit if limit > 0 else None,
+                max_workers=max_workers,
+            ),
+            chunk_query=chunk_query,
+            keyword_search=adapters.keyword_search,
+            vector_search=adapters.vector_search,
+            trace_logger=adapters.answer_trace_logger,
+            llm=adapters.llm,
+            reranker=adapters.reranker,
+            use_agentic_mode=cfg.use_agentic_mode,
+            planner=adapters.planner,
+            tool_executor=adapters.tool_executor,
+            state_graph_runner=adapters.state_graph_runner,
+            agent_trace_logger=adapters.agent_trace_logger,
+            agent_max_iterations=cfg.agentic_max_iterations,
+            agent_max_tool_calls=cfg.agentic_max_tool_calls,
+            agent_max_parallel_tool_calls=cfg.agentic_max_parallel_tool_calls,
+            agent_timeout_seconds=cfg.agentic_timeout_seconds,
+        )
+    finally:
+        _AGENT_SCOPE.reset(scope_token)
 
     return {
         'total_questions': output.total_questions,
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Callable
+
+# Latency buckets in seconds: sub-10ms lexical stages up to multi-minute LLM calls.
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0,
+)
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+@dataclass
+class _Histogram:
+    buckets: tuple[float, ...]
+    counts: list[int] = field(default_factory=list)
+    total: float = 0.0
+    count: int = 0
+
+    def observe(self, value: float) -> None:
+        if not self.counts:
+            self.counts = [0] * len(self.buckets)
+        for idx, upper in enumerate(self.buckets):
+            if value <= upper:
+                self.counts[idx] += 1
+        self.total += value
+        self.count += 1
+
+
+@dataclass
+class _Family:
+    kind: str
+    help_text: str
+    values: dict[LabelKey, float | _Histogram] = field(default_factory=dict)
+
+
+def _label_key(labels: dict[str, object]) -> LabelKey:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: tuple[tuple[str, str], ...] = ()) -> str:
+    pairs = key + extra
+    if not pairs:
+        return ''
+    body = ','.join(
+        '{}="{}"'.format(name, value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for name, value in pairs
+    )
+    return '{' + body + '}'
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class MetricsRegistry:
+    """In-process counters, gauges and histograms rendered in Prometheus text format.
+
+    Collectors registered with ``add_collector`` run at scrape time to refresh
+    gauges that mirror other components (job queue, caches).
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self._buckets = tuple(sorted(buckets))
+        self._lock = Lock()
+        self._families: dict[str, _Family] = {}
+        self._collectors: list[Callable[[MetricsRegistry], None]] = []
+
+    def _family(self, name: str, kind: str, help_text: str) -> _Family:
+        family = self._families.get(name)
+        if family is None:
+            family = _Family(kind=kind, help_text=help_text)
+            self._families[name] = family
+        elif help_text and not family.help_text:
+            family.help_text = help_text
+        return family
+
+    def inc(self, name: str, value: float = 1.0, *, help_text: str = '', **labels: object) -> None:
+        with self._lock:
+            family = self._family(name, 'counter', help_text)
+            key = _label_key(labels)
+            family.values[key] = float(family.values.get(key, 0.0)) + value
+
+    def set_gauge(self, name: str, value: float, *, help_text: str = '', **labels: object) -> None:
+        with self._lock:
+            self._family(name, 'gauge', help_text).values[_label_key(labels)] = float(value)
+
+    def set_counter(self, name: str, value: float, *, help_text: str = '', **labels: object) -> None:
+        """Mirror a monotonic count owned elsewhere (e.g. cache hit totals)."""
+        with self._lock:
+            self._family(name, 'counter', help_text).values[_label_key(labels)] = float(value)
+
+    def observe(self, name: str, value: float, *, help_text: str = '', **labels: object) -> None:
+        with self._lock:
+            family = self._family(name, 'histogram', help_text)
+            key = _label_key(labels)
+            histogram = family.values.get(key)
+            if not isinstance(histogram, _Histogram):
+                histogram = _Histogram(buckets=self._buckets)
+                family.values[key] = histogram
+            histogram.observe(max(0.0, value))
+
+    def add_collector(self, collector: Callable[[MetricsRegistry], None]) -> None:
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        for collector in list(self._collectors):
+            collector(self)
+
+        lines: list[str] = []
+        with self._lock:
+            for name in sorted(self._families):
+                family = self._families[name]
+                if family.help_text:
+                    lines.append(f'# HELP {name} {family.help_text}')
+                lines.append(f'# TYPE {name} {family.kind}')
+                for key in sorted(family.values):
+                    value = family.values[key]
+                    if isinstance(value, _Histogram):
+                        counts = value.counts or [0] * len(value.buckets)
+                        for upper, count in zip(value.buckets, counts):
+                            le = (('le', _format_value(upper)),)
+                            lines.append(f'{name}_bucket{_format_labels(key, le)} {count}')
+                        inf = (('le', '+Inf'),)
+                        lines.append(f'{name}_bucket{_format_labels(key, inf)} {value.count}')
+                        lines.append(f'{name}_sum{_format_labels(key)} {_format_value(value.total)}')
+                        lines.append(f'{name}_count{_format_labels(key)} {value.count}')
+                    else:
+                        lines.append(f'{name}{_format_labels(key)} {_format_value(value)}')
+        return '\n'.join(lines) + '\n'
+
+
+def record_stage_timings(registry: MetricsRegistry, timings: dict[str, dict[str, float]] | None) -> None:
+    """Fold one request's StageTimings snapshot into stage histograms and Ollama counters."""
+    for stage, row in (timings or {}).items():
+        registry.observe(
+            'manuals_stage_duration_seconds',
+            float(row.get('ms', 0.0)) / 1000.0,
+            help_text='Per-request time spent in each retrieval, LLM, embedding or ingestion stage.',
+            stage=stage,
+        )
+        errors = float(row.get('errors', 0) or 0)
+        if stage.startswith('ollama.'):
+            registry.inc(
+                'manuals_ollama_calls_total',
+                float(row.get('calls', 0)),
+                help_text='Ollama HTTP calls.',
+                stage=stage,
+            )
+            if errors:
+                registry.inc(
+                    'manuals_ollama_errors_total',
+                    errors,
+                    help_text='Failed Ollama HTTP calls.',
+                    stage=stage,
+                )
+            retries = float(row.get('retries', 0) or 0)
+            if retries:
+                registry.inc(
+                    'manuals_ollama_retries_total',
+                    retries,
+                    help_text='Ollama request retries.',
+                    stage=stage,
+                )
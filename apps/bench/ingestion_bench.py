@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from apps.bench.synthetic_corpus import synthetic_embedding
+from apps.bench.synthetic_pdf import SyntheticPdfSpec, write_synthetic_pdf
+from packages.adapters.pdf.pypdf_parser_adapter import PypdfParserAdapter
+from packages.adapters.storage.filesystem_chunk_store_adapter import FilesystemChunkStoreAdapter
+from packages.adapters.tables.simple_table_extractor_adapter import SimpleTableExtractorAdapter
+from packages.application.use_cases.ingest_document import (
+    IngestDocumentInput,
+    ingest_document_use_case,
+)
+from packages.domain.timing import StageTimings
+from packages.ports.embedding_port import EmbeddingPort
+from packages.ports.ocr_port import OcrPort
+from packages.ports.vision_port import VisionPort
+
+
+class LatencyOcrAdapter(OcrPort):
+    """OCR stand-in that sleeps like a remote/native engine and returns fixed text."""
+
+    def __init__(self, latency_seconds: float) -> None:
+        self._latency_seconds = max(0.0, latency_seconds)
+
+    def extract_text(self, source_path: str, page_number: int) -> str:
+        _ = source_path
+        time.sleep(self._latency_seconds)
+        return f'Scanned page {page_number} terminal wiring label torque 12 Nm clearance 50 mm'
+
+
+class LatencyVisionAdapter(VisionPort):
+    def __init__(self, latency_seconds: float) -> None:
+        self._latency_seconds = max(0.0, latency_seconds)
+
+    def extract_page_insights(self, *, pdf_path: str, page_number: int) -> str:
+        _ = pdf_path
+        time.sleep(self._latency_seconds)
+        return f'Page {page_number} shows a wiring diagram of the control terminals.'
+
+
+class LatencyEmbeddingAdapter(EmbeddingPort):
+    def __init__(self, latency_seconds: float, dim: int = 64) -> None:
+        self._latency_seconds = max(0.0, latency_seconds)
+        self._dim = dim
+
+    def embed_text(self, text: str) -> list[float]:
+        time.sleep(self._latency_seconds)
+        return synthetic_embedding(text, self._dim)
+
+
+@dataclass(frozen=True)
+class IngestionBenchConfig:
+    """One grid point: ``doc_concurrency`` documents at once, each with ``page_workers``.
+
+    These mirror ``INGEST_CONCURRENCY`` and ``INGEST_PAGE_WORKERS``; latencies
+    are per call of the fake OCR, vision and embedding ports.
+    """
+
+    page_workers: int = 1
+    doc_concurrency: int = 1
+    docs: int = 2
+    ocr_latency_seconds: float = 0.05
+    vision_latency_seconds: float = 0.2
+    embedding_latency_seconds: float = 0.01
+    use_vision: bool = True
+    vision_max_pages: int = 40
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return round(peak / divisor, 1)
+
+
+def run_ingestion_config(config: IngestionBenchConfig, pdf_path: Path, work_dir: Path) -> dict[str, object]:
+    """Ingest ``config.docs`` copies of ``pdf_path`` and report throughput and stage totals."""
+    parser = PypdfParserAdapter()
+    tables = SimpleTableExtractorAdapter()
+    ocr = LatencyOcrAdapter(config.ocr_latency_seconds)
+    vision = LatencyVisionAdapter(config.vision_latency_seconds) if config.use_vision else None
+    embedding = LatencyEmbeddingAdapter(config.embedding_latency_seconds)
+    store = FilesystemChunkStoreAdapter(work_dir)
+    per_doc = [StageTimings() for _ in range(config.docs)]
+
+    def _ingest(idx: int):
+        return ingest_document_use_case(
+            IngestDocumentInput(doc_id=f'bench_doc_{idx:03d}', pdf_path=pdf_path),
+            pdf_parser=parser,
+            ocr_adapter=ocr,
+            table_extractor=tables,
+            chunk_store=store,
+            embedding_adapter=embedding,
+            vision_adapter=vision,
+            vision_max_pages=config.vision_max_pages,
+            page_workers=config.page_workers,
+            timings=per_doc[idx],
+        )
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, config.doc_concurrency)) as executor:
+        outputs = list(executor.map(_ingest, range(config.docs)))
+    wall = time.perf_counter() - started
+
+    stages: dict[str, dict[str, float]] = {}
+    for timings in per_doc:
+        for stage, row in timings.as_dict().items():
+            total = stages.setdefault(stage, {'ms': 0.0, 'calls': 0})
+            total['ms'] = round(total['ms'] + row.get('ms', 0.0), 3)
+            total['calls'] += row.get('calls', 0)
+
+    pages = sum(int(per_doc[idx].as_dict().get('parse', {}).get('items', 0)) for idx in range(config.docs))
+    return {
+        'config': asdict(config),
+        'pages': pages,
+        'chunks': sum(output.total_chunks for output in outputs),
+        'wall_seconds': round(wall, 3),
+        'pages_per_second': round(pages / wall, 3) if wall > 0 else 0.0,
+        'stages': stages,
+        'peak_rss_mb': _peak_rss_mb(),
+    }
+
+
+def _run_isolated(config: IngestionBenchConfig, pdf_path: str) -> dict[str, object]:
+    with tempfile.TemporaryDirectory(prefix='bench_ingest_') as tmp:
+        return run_ingestion_config(config, Path(pdf_path), Path(tmp))
+
+
+def run_ingestion_grid(
+    pdf_spec: SyntheticPdfSpec,
+    configs: list[IngestionBenchConfig],
+    *,
+    isolate: bool = True,
+) -> list[dict[str, object]]:
+    """Run every grid point over one synthetic PDF.
+
+    With ``isolate`` each point runs in a fresh spawned process so
+    ``peak_rss_mb`` is that configuration's own high-water mark.
+    """
+    rows: list[dict[str, object]] = []
+    with tempfile.TemporaryDirectory(prefix='bench_pdf_') as tmp:
+        pdf_path = Path(tmp) / 'synthetic_manual.pdf'
+        kinds = write_synthetic_pdf(pdf_spec, pdf_path)
+        for config in configs:
+            if isolate:
+                context = multiprocessing.get_context('spawn')
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                    row = executor.submit(_run_isolated, config, str(pdf_path)).result()
+            else:
+                row = _run_isolated(config, str(pdf_path))
+            row['page_kinds'] = {kind: kinds.count(kind) for kind in sorted(set(kinds))}
+            rows.append(row)
+    return rows
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+
+from apps.bench.stats import summarize_ms
+from apps.bench.synthetic_corpus import BENCHMARK_QUERIES, SyntheticCorpusSpec, write_corpus
+from packages.adapters.tracing.factory import flush_trace_writers
+
+# (path, query params) -> HTTP status code; raises only on transport failure.
+Sender = Callable[[str, dict[str, object]], int]
+
+# Model-backed features are switched off so the app serves from the hash
+# vector adapter and the extractive answerer; the run needs no Ollama.
+OFFLINE_ENV = {
+    'USE_LLM_ANSWERING': 'false',
+    'USE_RERANKER': 'false',
+    'USE_AGENTIC_MODE': 'false',
+    'EMBEDDING_PROVIDER': 'hash',
+}
+
+
+@contextmanager
+def _patched_env(values: dict[str, str]) -> Iterator[None]:
+    previous = {key: os.environ.get(key) for key in values}
+    os.environ.update(values)
+    try:
+        yield
+    finally:
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+@contextmanager
+def in_process_app(assets_dir: Path, trace_dir: Path) -> Iterator[Callable[[], Sender]]:
+    """Serve the FastAPI app in-process over ``assets_dir`` with offline adapters.
+
+    Yields a factory of senders; call it once per client thread so each
+    thread drives its own ``TestClient``.
+    """
+    from fastapi.testclient import TestClient
+
+    import apps.api.main as api_main
+
+    env = {
+        **OFFLINE_ENV,
+        'RETRIEVAL_TRACE_FILE': str(trace_dir / 'retrieval_traces.jsonl'),
+        'ANSWER_TRACE_FILE': str(trace_dir / 'answer_traces.jsonl'),
+        'AGENTIC_TRACE_FILE': str(trace_dir / 'agent_traces.jsonl'),
+    }
+    previous_assets = api_main.ASSETS_DIR
+    clients: list[TestClient] = []
+    lock = threading.Lock()
+
+    def _factory() -> Sender:
+        client = TestClient(api_main.app)
+        with lock:
+            clients.append(client)
+
+        def _send(path: str, params: dict[str, object]) -> int:
+            return client.get(path, params=params).status_code
+
+        return _send
+
+    with _patched_env(env):
+        api_main.ASSETS_DIR = assets_dir
+        # The API caches adapters per config; pick up the offline env now rather than after the check interval.
+        api_main.CONTAINER.reload()
+        try:
+            yield _factory
+        finally:
+            api_main.ASSETS_DIR = previous_assets
+            flush_trace_writers()
+            for client in clients:
+                client.close()
+    api_main.CONTAINER.reload()
+
+
+def http_sender_factory(base_url: str, timeout_seconds: float = 120.0) -> Callable[[], Sender]:
+    """Senders that call a running API at ``base_url`` over plain HTTP."""
+    root = base_url.rstrip('/')
+
+    def _factory() -> Sender:
+        def _send(path: str, params: dict[str, object]) -> int:
+            url = f'{root}{path}?{urllib.parse.urlencode(params)}'
+            try:
+                with urllib.request.urlopen(url, timeout=timeout_seconds) as response:
+                    response.read()
+                    return int(response.status)
+            except urllib.error.HTTPError as exc:
+                return int(exc.code)
+
+        return _send
+
+    return _factory
+
+
+def run_load(
+    sender_factory: Callable[[], Sender],
+    requests: list[tuple[str, dict[str, object]]],
+    *,
+    concurrency: int,
+) -> dict[str, float]:
+    """Issue ``requests`` from ``concurrency`` client threads; latency percentiles and throughput."""
+    workers = max(1, int(concurrency))
+    local = threading.local()
+    latencies: list[float] = []
+    errors = 0
+    lock = threading.Lock()
+
+    def _one(request: tuple[str, dict[str, object]]) -> None:
+        nonlocal errors
+        sender = getattr(local, 'sender', None)
+        if sender is None:
+            sender = local.sender = sender_factory()
+        path, params = request
+        started = time.perf_counter()
+        try:
+            ok = sender(path, params) < 400
+        except (OSError, urllib.error.URLError):
+            ok = False
+        elapsed = time.perf_counter() - started
+        with lock:
+            latencies.append(elapsed)
+            errors += int(not ok)
+
+    wall_started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(_one, requests))
+    wall = time.perf_counter() - wall_started
+
+    row = summarize_ms(latencies)
+    row.update(
+        {
+            'concurrency': workers,
+            'errors': errors,
+            'wall_seconds': round(wall, 3),
+            'throughput_rps': round(len(requests) / wall, 3) if wall > 0 else 0.0,
+        }
+    )
+    return row
+
+
+def _request_mix(endpoints: list[str], total: int) -> list[tuple[str, dict[str, object]]]:
+    out: list[tuple[str, dict[str, object]]] = []
+    for idx in range(total):
+        endpoint = endpoints[idx % len(endpoints)]
+        query = BENCHMARK_QUERIES[idx % len(BENCHMARK_QUERIES)]
+        out.append((f'/{endpoint}', {'q': query, 'top_n': 6}))
+    return out
+
+
+def run_api_load_benchmark(
+    spec: SyntheticCorpusSpec,
+    *,
+    concurrency_levels: list[int],
+    requests_per_level: int = 40,
+    endpoints: tuple[str, ...] = ('search', 'answer'),
+    base_url: str | None = None,
+) -> dict[str, dict[str, float]]:
+    """Load-test ``/search`` and ``/answer`` at each concurrency level.
+
+    Without ``base_url`` the app runs in-process over a synthetic corpus built
+    from ``spec``; with it, requests go to a server that already holds a corpus.
+    Keys are ``api_<endpoint>@c<concurrency>``.
+    """
+    results: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory(prefix='bench_api_') as tmp:
+        root = Path(tmp)
+        if base_url:
+            factory_cm = nullcontext(http_sender_factory(base_url))
+        else:
+            write_corpus(spec, root / 'assets')
+            factory_cm = in_process_app(root / 'assets', root / 'traces')
+        with factory_cm as sender_factory:
+            for endpoint in endpoints:
+                # One untimed pass warms token caches and imports.
+                run_load(
+                    sender_factory, _request_mix([endpoint], len(BENCHMARK_QUERIES)), concurrency=1
+                )
+                for level in concurrency_levels:
+                    results[f'api_{endpoint}@c{level}'] = run_load(
+                        sender_factory,
+                        _request_mix([endpoint], requests_per_level),
+                        concurrency=level,
+                    )
+    return results
+
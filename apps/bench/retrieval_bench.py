@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+
+from apps.bench.stats import summarize_ms, time_callable
+from apps.bench.synthetic_corpus import (
+    BENCHMARK_QUERIES,
+    SyntheticCorpusSpec,
+    SyntheticEmbeddingAdapter,
+    write_corpus,
+)
+from packages.adapters.retrieval.filesystem_chunk_query_adapter import FilesystemChunkQueryAdapter
+from packages.adapters.retrieval.hash_vector_search_adapter import HashVectorSearchAdapter
+from packages.adapters.retrieval.metadata_vector_search_adapter import MetadataVectorSearchAdapter
+from packages.adapters.retrieval.simple_keyword_search_adapter import SimpleKeywordSearchAdapter
+from packages.application.use_cases.search_evidence import (
+    SearchEvidenceInput,
+    search_evidence_use_case,
+)
+from packages.domain.models import Chunk
+from packages.domain.timing import StageTimings
+from packages.ports.chunk_query_port import ChunkQueryPort
+
+
+class _InMemoryChunkQuery(ChunkQueryPort):
+    def __init__(self, chunks: list[Chunk]) -> None:
+        self._chunks = chunks
+
+    def list_chunks(self, doc_id: str | None = None) -> list[Chunk]:
+        if doc_id is None:
+            return list(self._chunks)
+        return [chunk for chunk in self._chunks if chunk.doc_id == doc_id]
+
+
+def _bench_corpus(
+    spec: SyntheticCorpusSpec,
+    assets_dir: Path,
+    *,
+    repeat: int,
+    top_k: int,
+) -> dict[str, dict[str, float]]:
+    chunks = write_corpus(spec, assets_dir)
+    queries = BENCHMARK_QUERIES
+    keyword = SimpleKeywordSearchAdapter()
+    hash_vector = HashVectorSearchAdapter()
+    metadata_vector = MetadataVectorSearchAdapter(SyntheticEmbeddingAdapter(spec.embedding_dim))
+    filesystem = FilesystemChunkQueryAdapter(assets_dir)
+    in_memory = _InMemoryChunkQuery(chunks)
+
+    def _each_query(fn):
+        return lambda: [fn(query) for query in queries]
+
+    cases = {
+        'filesystem_load': lambda: filesystem.list_chunks(),
+        'keyword_search': _each_query(lambda q: keyword.search(q, chunks, top_k)),
+        'hash_vector_search': _each_query(lambda q: hash_vector.search(q, chunks, top_k)),
+        'metadata_vector_search': _each_query(lambda q: metadata_vector.search(q, chunks, top_k)),
+    }
+    out = {name: summarize_ms(time_callable(fn, repeat=repeat)) for name, fn in cases.items()}
+
+    # Fusion is timed inside search_evidence (stage ``fusion``) so the figure
+    # excludes the keyword and vector passes that feed it.
+    fusion_samples: list[float] = []
+    search_samples: list[float] = []
+    for run in range(repeat + 1):
+        for query in queries:
+            timings = StageTimings()
+            search_evidence_use_case(
+                SearchEvidenceInput(query=query, top_k_keyword=top_k, top_k_vector=top_k),
+                chunk_query=in_memory,
+                keyword_search=keyword,
+                vector_search=metadata_vector,
+                timings=timings,
+            )
+            if run == 0:
+                continue
+            stages = timings.as_dict()
+            fusion_samples.append(stages.get('fusion', {}).get('ms', 0.0) / 1000.0)
+            search_samples.append(sum(row.get('ms', 0.0) for row in stages.values()) / 1000.0)
+    out['fusion'] = summarize_ms(fusion_samples)
+    out['search_evidence'] = summarize_ms(search_samples)
+    return out
+
+
+def run_retrieval_benchmarks(
+    sizes: list[tuple[int, int]],
+    *,
+    repeat: int = 5,
+    top_k: int = 20,
+    seed: int = 7,
+    work_dir: Path | None = None,
+) -> dict[str, dict[str, float]]:
+    """Microbenchmark retrieval adapters at each ``(docs, chunks_per_doc)`` corpus size.
+
+    Keys are ``<case>@<total_chunks>``; per-query cases time one pass over
+    ``BENCHMARK_QUERIES`` except ``fusion``/``search_evidence``, which are per query.
+    """
+    results: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory(prefix='bench_corpus_') as tmp:
+        root = work_dir or Path(tmp)
+        for docs, chunks_per_doc in sizes:
+            spec = SyntheticCorpusSpec(docs=docs, chunks_per_doc=chunks_per_doc, seed=seed)
+            rows = _bench_corpus(
+                spec,
+                root / f'corpus_{spec.total_chunks}',
+                repeat=repeat,
+                top_k=top_k,
+            )
+            for name, row in rows.items():
+                results[f'{name}@{spec.total_chunks}'] = row
+    return results
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import hashlib
+import statistics
+import time
+from typing import Callable
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile; ``0.0`` for an empty sample."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def summarize_ms(samples: list[float]) -> dict[str, float]:
+    """p50/p95/p99/mean/min/max of seconds samples, reported in milliseconds."""
+    if not samples:
+        return {'runs': 0, 'mean_ms': 0.0, 'p50_ms': 0.0, 'p95_ms': 0.0, 'p99_ms': 0.0}
+    return {
+        'runs': len(samples),
+        'mean_ms': round(statistics.mean(samples) * 1000.0, 3),
+        'min_ms': round(min(samples) * 1000.0, 3),
+        'p50_ms': round(percentile(samples, 50) * 1000.0, 3),
+        'p95_ms': round(percentile(samples, 95) * 1000.0, 3),
+        'p99_ms': round(percentile(samples, 99) * 1000.0, 3),
+        'max_ms': round(max(samples) * 1000.0, 3),
+    }
+
+
+def time_callable(fn: Callable[[], object], *, repeat: int, warmup: int = 1) -> list[float]:
+    """Run ``fn`` ``warmup`` times untimed, then ``repeat`` times; returns seconds per run."""
+    for _ in range(max(0, warmup)):
+        fn()
+    samples: list[float] = []
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+CALIBRATION_CASE = 'calibration'
+
+
+def _calibration_workload() -> int:
+    rows = [f'calibration row {idx} {idx * 7919 % 104729}' for idx in range(20000)]
+    tokens = sorted(set(' '.join(rows).split()))
+    digest = hashlib.sha256('\n'.join(rows).encode('utf-8')).hexdigest()
+    return len(tokens) + len(digest)
+
+
+def run_calibration(*, repeat: int) -> dict[str, dict[str, float]]:
+    """Time a fixed pure-Python workload that no repo code touches, as the in-run speed reference."""
+    return {CALIBRATION_CASE: summarize_ms(time_callable(_calibration_workload, repeat=max(11, repeat)))}
+
+
+def compare_to_baseline(
+    current: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    *,
+    metric: str = 'p50_ms',
+    max_regression_pct: float = 25.0,
+    min_delta_ms: float = 1.0,
+    reference: str | None = None,
+) -> list[dict[str, object]]:
+    """Return the cases whose ``metric`` grew by more than ``max_regression_pct``.
+
+    With ``reference``, baseline values are first scaled by how much slower
+    that case ran in ``current``, so reports from machines of different speed
+    compare as ratios. Deltas under ``min_delta_ms`` are ignored so
+    sub-millisecond cases do not flap on scheduler noise. Cases missing from
+    either side are skipped.
+    """
+    scale = 1.0
+    if reference is not None:
+        before_ref = baseline.get(reference, {}).get(metric)
+        after_ref = current.get(reference, {}).get(metric)
+        if not before_ref or not after_ref or before_ref <= 0 or after_ref <= 0:
+            raise ValueError(f'Reference case {reference!r} is missing {metric} in the report or baseline')
+        scale = after_ref / before_ref
+    regressions: list[dict[str, object]] = []
+    for name, row in current.items():
+        if name == reference:
+            continue
+        before = baseline.get(name, {}).get(metric)
+        after = row.get(metric)
+        if before is None or after is None or before <= 0:
+            continue
+        before *= scale
+        delta = after - before
+        pct = delta / before * 100.0
+        if pct > max_regression_pct and delta >= min_delta_ms:
+            regressions.append(
+                {'case': name, 'metric': metric, 'baseline': round(before, 3), 'current': after, 'pct': round(pct, 1)}
+            )
+    return regressions
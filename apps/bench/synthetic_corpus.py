@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import random
+import shutil
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from packages.domain.models import Chunk
+from packages.domain.tokenization import word_tokens
+from packages.ports.embedding_port import EmbeddingPort
+
+_EQUIPMENT = [
+    'drive', 'inverter', 'motor', 'pump', 'compressor', 'conveyor', 'controller',
+    'contactor', 'relay', 'encoder', 'spindle', 'valve', 'actuator', 'gearbox',
+]
+_COMPONENTS = [
+    'terminal block', 'control board', 'fan assembly', 'brake resistor', 'DC bus',
+    'input fuse', 'cooling fins', 'keypad', 'safety interlock', 'analog input',
+    'digital output', 'ground lug', 'heat sink', 'bearing housing',
+]
+_ACTIONS = [
+    'inspect', 'tighten', 'replace', 'verify', 'disconnect', 'measure', 'clean',
+    'calibrate', 'reset', 'configure', 'lubricate', 'torque',
+]
+_CONDITIONS = [
+    'before applying power', 'after a fault trip', 'during commissioning',
+    'at every scheduled interval', 'when the ambient temperature exceeds 40 C',
+    'if the display shows an overcurrent fault', 'with the supply isolated',
+]
+_UNITS = ['Nm', 'mm', 'V', 'A', 'Hz', 'kW', 'rpm', 'bar', 'C']
+_SECTIONS = [
+    'Safety', 'Installation', 'Wiring', 'Start-Up', 'Programming', 'Troubleshooting',
+    'Maintenance', 'Specifications', 'Parameters', 'Fault Codes',
+]
+_MODALITIES = ['diagram', 'image', 'table']
+
+BENCHMARK_QUERIES = [
+    'What is the tightening torque for the terminal block?',
+    'How do I reset an overcurrent fault on the drive?',
+    'Show the wiring diagram for the analog input.',
+    'What clearance is required around the heat sink?',
+    'Which parameter sets the motor rated current?',
+    'Maintenance interval for the fan assembly',
+    'Explain the brake resistor connection sequence.',
+    'What does fault code F005 mean?',
+]
+
+
+@dataclass(frozen=True)
+class SyntheticCorpusSpec:
+    """Shape of a generated library: ``docs`` manuals of ``chunks_per_doc`` chunks each.
+
+    ``table_ratio`` and ``visual_ratio`` are the shares of table and visual
+    chunks; the remainder is page text. Output is fully determined by ``seed``.
+    """
+
+    docs: int = 4
+    chunks_per_doc: int = 250
+    table_ratio: float = 0.2
+    visual_ratio: float = 0.1
+    embedding_dim: int = 64
+    seed: int = 7
+
+    @property
+    def total_chunks(self) -> int:
+        return self.docs * self.chunks_per_doc
+
+
+def synthetic_embedding(text: str, dim: int) -> list[float]:
+    """Process-stable hashed bag-of-words embedding (unlike ``hash()``, not salted per run)."""
+    vec = [0.0] * dim
+    for token in word_tokens(text):
+        digest = hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest()
+        vec[int.from_bytes(digest, 'little') % dim] += 1.0
+    norm = math.sqrt(sum(v * v for v in vec))
+    if norm == 0:
+        return vec
+    return [round(v / norm, 6) for v in vec]
+
+
+class SyntheticEmbeddingAdapter(EmbeddingPort):
+    """Offline embedding port that matches the vectors written by ``write_corpus``."""
+
+    def __init__(self, dim: int = 64) -> None:
+        self._dim = dim
+
+    def embed_text(self, text: str) -> list[float]:
+        return synthetic_embedding(text, self._dim)
+
+
+def _sentence(rng: random.Random) -> str:
+    return (
+        f'{rng.choice(_ACTIONS).capitalize()} the {rng.choice(_COMPONENTS)} of the '
+        f'{rng.choice(_EQUIPMENT)} {rng.choice(_CONDITIONS)}; rated '
+        f'{rng.randint(1, 480)} {rng.choice(_UNITS)}.'
+    )
+
+
+def _text_body(rng: random.Random) -> str:
+    parts = [_sentence(rng) for _ in range(rng.randint(6, 18))]
+    if rng.random() < 0.3:
+        parts.append(f'Fault code F{rng.randint(1, 120):03d} indicates {rng.choice(_COMPONENTS)} failure.')
+    return ' '.join(parts)
+
+
+def _table_body(rng: random.Random) -> str:
+    header = 'Parameter | Description | Value | Unit'
+    rows = [
+        f'P{rng.randint(1, 199):03d} | {rng.choice(_COMPONENTS)} {rng.choice(_ACTIONS)} limit | '
+        f'{rng.randint(1, 500)} | {rng.choice(_UNITS)}'
+        for _ in range(rng.randint(4, 14))
+    ]
+    return '\n'.join([header, *rows])
+
+
+def _visual_caption(rng: random.Random, modality: str) -> str:
+    return (
+        f'Figure {rng.randint(1, 90)}: {modality} of the {rng.choice(_COMPONENTS)} '
+        f'for the {rng.choice(_EQUIPMENT)}'
+    )
+
+
+def generate_chunks(spec: SyntheticCorpusSpec) -> list[Chunk]:
+    """Build the text, table and visual chunks of ``spec`` in memory."""
+    rng = random.Random(spec.seed)
+    chunks: list[Chunk] = []
+    for doc_idx in range(spec.docs):
+        doc_id = f'synthetic_manual_{doc_idx:03d}'
+        for idx in range(spec.chunks_per_doc):
+            page = idx // 3 + 1
+            section = _SECTIONS[min(len(_SECTIONS) - 1, idx * len(_SECTIONS) // spec.chunks_per_doc)]
+            roll = rng.random()
+            if roll < spec.visual_ratio:
+                modality = rng.choice(_MODALITIES)
+                caption = _visual_caption(rng, modality)
+                chunk = Chunk(
+                    chunk_id=f'{doc_id}:visual:{idx:05d}',
+                    doc_id=doc_id,
+                    content_type=f'visual_{modality}',
+                    page_start=page,
+                    page_end=page,
+                    content_text=caption,
+                    figure_id=f'fig-{idx}',
+                    caption=caption,
+                    metadata={'modality': modality},
+                )
+            elif roll < spec.visual_ratio + spec.table_ratio:
+                chunk = Chunk(
+                    chunk_id=f'{doc_id}:table:{idx:05d}',
+                    doc_id=doc_id,
+                    content_type='table',
+                    page_start=page,
+                    page_end=page,
+                    content_text=_table_body(rng),
+                    section_path=section,
+                    table_id=f'tbl-{idx}',
+                )
+            else:
+                chunk = Chunk(
+                    chunk_id=f'{doc_id}:text:{idx:05d}',
+                    doc_id=doc_id,
+                    content_type='text',
+                    page_start=page,
+                    page_end=page,
+                    content_text=_text_body(rng),
+                    section_path=section,
+                )
+            chunk.metadata['embedding'] = synthetic_embedding(chunk.content_text, spec.embedding_dim)
+            chunks.append(chunk)
+    return chunks
+
+
+def write_corpus(spec: SyntheticCorpusSpec, assets_dir: Path) -> list[Chunk]:
+    """Write ``spec`` under ``assets_dir`` in the layout the filesystem adapters read."""
+    if assets_dir.exists():
+        shutil.rmtree(assets_dir)
+    chunks = generate_chunks(spec)
+    by_doc: dict[str, list[Chunk]] = {}
+    for chunk in chunks:
+        by_doc.setdefault(chunk.doc_id, []).append(chunk)
+
+    for doc_id, rows in by_doc.items():
+        doc_dir = assets_dir / doc_id
+        doc_dir.mkdir(parents=True, exist_ok=True)
+        with (
+            (doc_dir / 'chunks.jsonl').open('w', encoding='utf-8') as text_fh,
+            (doc_dir / 'visual_chunks.jsonl').open('w', encoding='utf-8') as visual_fh,
+            (doc_dir / 'visual_embeddings.jsonl').open('w', encoding='utf-8') as embed_fh,
+        ):
+            for chunk in rows:
+                if not chunk.content_type.startswith('visual_'):
+                    text_fh.write(json.dumps(asdict(chunk), ensure_ascii=True) + '\n')
+                    continue
+                row = {
+                    'chunk_id': chunk.chunk_id,
+                    'doc_id': doc_id,
+                    'page': chunk.page_start,
+                    'modality': chunk.metadata['modality'],
+                    'figure_id': chunk.figure_id,
+                    'caption_text': chunk.caption,
+                }
+                visual_fh.write(json.dumps(row, ensure_ascii=True) + '\n')
+                embed_fh.write(
+                    json.dumps({'chunk_id': chunk.chunk_id, 'embedding': chunk.metadata['embedding']}) + '\n'
+                )
+    return chunks
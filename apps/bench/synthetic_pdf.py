@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from pathlib import Path
+
+import fitz
+
+_PAGE_WIDTH = 595
+_PAGE_HEIGHT = 842
+_MARGIN = 48
+_LINE_HEIGHT = 13
+
+_WORDS = [
+    'inspect', 'terminal', 'torque', 'drive', 'motor', 'encoder', 'fault', 'parameter',
+    'voltage', 'current', 'clearance', 'ground', 'bearing', 'supply', 'isolate', 'verify',
+    'controller', 'module', 'interlock', 'ambient', 'cooling', 'fan', 'relay', 'output',
+]
+_UNITS = ['Nm', 'mm', 'V', 'A', 'Hz', 'kW', 'rpm']
+
+
+@dataclass(frozen=True)
+class SyntheticPdfSpec:
+    """Page mix of a generated manual; the shares of the remaining kinds go to text pages.
+
+    Scanned pages carry an image and no text layer, so ingestion routes them
+    to OCR (and vision); table pages are pipe/key-value rows; text pages
+    occasionally carry a figure caption.
+    """
+
+    pages: int = 40
+    scanned_ratio: float = 0.2
+    table_ratio: float = 0.25
+    figure_caption_ratio: float = 0.15
+    seed: int = 11
+
+
+def _paragraph_lines(rng: random.Random, count: int) -> list[str]:
+    return [
+        ' '.join(rng.choice(_WORDS) for _ in range(rng.randint(9, 14))).capitalize() + '.'
+        for _ in range(count)
+    ]
+
+
+def _table_lines(rng: random.Random, count: int) -> list[str]:
+    lines = ['Parameter | Description | Value | Unit']
+    for _ in range(count):
+        if rng.random() < 0.3:
+            lines.append(f'{rng.choice(_WORDS).capitalize()} limit: {rng.randint(1, 480)} {rng.choice(_UNITS)}')
+        else:
+            lines.append(
+                f'P{rng.randint(1, 199):03d} | {rng.choice(_WORDS)} {rng.choice(_WORDS)} | '
+                f'{rng.randint(1, 500)} | {rng.choice(_UNITS)}'
+            )
+    return lines
+
+
+def _write_lines(page: fitz.Page, lines: list[str]) -> None:
+    y = _MARGIN
+    for line in lines:
+        if y > _PAGE_HEIGHT - _MARGIN:
+            break
+        page.insert_text((_MARGIN, y), line, fontsize=9)
+        y += _LINE_HEIGHT
+
+
+def _scanned_image(rng: random.Random) -> fitz.Pixmap:
+    pix = fitz.Pixmap(fitz.csGRAY, fitz.IRect(0, 0, 96, 128), False)
+    pix.clear_with(rng.randint(160, 240))
+    return pix
+
+
+def page_kinds(spec: SyntheticPdfSpec) -> list[str]:
+    """Kind of each page (``text``, ``scanned`` or ``table``) in page order."""
+    rng = random.Random(spec.seed)
+    kinds: list[str] = []
+    for _ in range(spec.pages):
+        roll = rng.random()
+        if roll < spec.scanned_ratio:
+            kinds.append('scanned')
+        elif roll < spec.scanned_ratio + spec.table_ratio:
+            kinds.append('table')
+        else:
+            kinds.append('text')
+    return kinds
+
+
+def write_synthetic_pdf(spec: SyntheticPdfSpec, path: Path) -> list[str]:
+    """Render ``spec`` to ``path``; returns the page kinds."""
+    rng = random.Random(spec.seed + 1)
+    kinds = page_kinds(spec)
+    doc = fitz.open()
+    try:
+        for number, kind in enumerate(kinds, start=1):
+            page = doc.new_page(width=_PAGE_WIDTH, height=_PAGE_HEIGHT)
+            if kind == 'scanned':
+                page.insert_image(page.rect, pixmap=_scanned_image(rng))
+                continue
+            lines = [f'Section {number}']
+            if kind == 'table':
+                lines.extend(_paragraph_lines(rng, 3))
+                lines.extend(_table_lines(rng, rng.randint(12, 30)))
+            else:
+                lines.extend(_paragraph_lines(rng, rng.randint(25, 55)))
+            if rng.random() < spec.figure_caption_ratio:
+                lines.append(f'Figure {number}: {rng.choice(_WORDS)} {rng.choice(_WORDS)} wiring')
+            _write_lines(page, lines)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        doc.save(str(path))
+    finally:
+        doc.close()
+    return kinds
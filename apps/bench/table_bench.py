@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import random
+
+from apps.bench.stats import summarize_ms, time_callable
+from packages.adapters.tables.simple_table_extractor_adapter import SimpleTableExtractorAdapter
+
+_WORDS = [
+    'inspect', 'terminal', 'torque', 'drive', 'motor', 'encoder', 'fault', 'parameter',
+    'voltage', 'current', 'clearance', 'ground', 'bearing', 'supply', 'isolate', 'verify',
+    'controller', 'module', 'interlock', 'ambient', 'cooling', 'fan', 'relay', 'output',
+]
+_UNITS = ['Nm', 'mm', 'V', 'A', 'Hz', 'kW', 'rpm', '%']
+
+
+def _prose(rng: random.Random) -> str:
+    return ' '.join(rng.choice(_WORDS) for _ in range(rng.randint(10, 18))).capitalize() + '.'
+
+
+def _spec_table(rng: random.Random) -> list[str]:
+    style = rng.random()
+    rows: list[str] = []
+    for _ in range(rng.randint(4, 14)):
+        name = f'{rng.choice(_WORDS).capitalize()} {rng.choice(_WORDS)}'
+        value = f'{rng.randint(1, 600)}.{rng.randint(0, 9)}'
+        unit = rng.choice(_UNITS)
+        if style < 0.5:
+            rows.append(f'P{rng.randint(1, 999):03d}    {name}    {value}    {unit}')
+        elif style < 0.8:
+            rows.append(f'{name}: {value} {unit}')
+        else:
+            rows.append(f'P{rng.randint(1, 999):03d} | {name} | {value} | {unit}')
+    return rows
+
+
+def table_heavy_pages(pages: int, *, seed: int = 13) -> list[str]:
+    """Page texts shaped like drive spec manuals: spec tables between short prose runs."""
+    rng = random.Random(seed)
+    out: list[str] = []
+    for _ in range(pages):
+        lines: list[str] = []
+        while len(lines) < 50:
+            lines.extend(_prose(rng) for _ in range(rng.randint(1, 4)))
+            lines.extend(_spec_table(rng))
+        out.append('\n'.join(lines))
+    return out
+
+
+def run_table_benchmarks(
+    page_counts: list[int],
+    *,
+    repeat: int = 5,
+    seed: int = 13,
+) -> dict[str, dict[str, float]]:
+    """Time ``SimpleTableExtractorAdapter`` over every page of table-heavy manuals.
+
+    Keys are ``table_extract@<pages>``; each run extracts all pages once, and
+    ``tables`` records how many tables were found as a sanity check.
+    """
+    extractor = SimpleTableExtractorAdapter()
+    results: dict[str, dict[str, float]] = {}
+    for pages in page_counts:
+        texts = table_heavy_pages(pages, seed=seed)
+
+        def _extract_all() -> int:
+            return sum(len(extractor.extract(text, idx)) for idx, text in enumerate(texts, start=1))
+
+        row = summarize_ms(time_callable(_extract_all, repeat=repeat))
+        row['tables'] = _extract_all()
+        results[f'table_extract@{pages}'] = row
+    return results
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
 import os
-import time
 import urllib.error
 import urllib.parse
 
 import streamlit as st
 
-from common import build_multipart_payload, request_json
+from common import build_multipart_payload, iter_sse_json, request_json, request_json_cached
 
 
 st.set_page_config(page_title='Admin - Equipment Manuals', layout='wide')
@@ -15,7 +14,6 @@ st.set_page_config(page_title='Admin - Equipment Manuals', layout='wide')
 default_api_base_url = os.getenv('API_BASE_URL', 'http://api:8000')
 api_base_url = st.sidebar.text_input('API Base URL', value=default_api_base_url)
 ingest_timeout_seconds = int(os.getenv('INGEST_TIMEOUT_SECONDS', '1800'))
-status_poll_seconds = int(os.getenv('JOB_POLL_SECONDS', '2'))
 
 st.sidebar.markdown('### Navigation')
 st.sidebar.markdown('- [Chat](/)')
@@ -109,10 +107,13 @@ def _render_job_status(job_payload: dict[str, object]) -> None:
     st.subheader('Active Job')
     st.caption(f"Job ID: {job_payload.get('job_id')}")
 
-    m1, m2, m3 = st.columns(3)
+    eta_seconds = job_payload.get('eta_seconds')
+
+    m1, m2, m3, m4 = st.columns(4)
     m1.metric('Status', status)
     m2.metric('Stage', stage)
     m3.metric('Progress', f'{processed}/{total}' if total > 0 else str(processed))
+    m4.metric('ETA', f'{float(eta_seconds):.0f}s' if eta_seconds is not None else '-')
     _render_stage_timeline(stage, status)
 
     if total > 0:
@@ -131,13 +132,13 @@ def _render_job_status(job_payload: dict[str, object]) -> None:
 
 job_payload: dict[str, object] | None = None
 active_job_id = str(st.session_state.get('active_job_id') or '')
+# Filled here and, while the job runs, updated from its event stream at the end of the script.
+job_placeholder = st.empty()
 if active_job_id:
     try:
         job_payload = request_json(f'{api_base_url}/jobs/{active_job_id}', timeout=30)
-        _render_job_status(job_payload)
-        if str(job_payload.get('status') or '') in {'queued', 'running'}:
-            time.sleep(max(status_poll_seconds, 1))
-            st.rerun()
+        with job_placeholder.container():
+            _render_job_status(job_payload)
     except urllib.error.HTTPError as exc:
         st.error(f'Failed to fetch job status: HTTP {exc.code}')
     except urllib.error.URLError as exc:
@@ -230,7 +231,7 @@ with col_a:
 with col_b:
     st.subheader('Ingested Documents')
     try:
-        ingested = request_json(f'{api_base_url}/ingested/docs', timeout=30)
+        ingested = request_json_cached(f'{api_base_url}/ingested/docs', timeout=30)
         rows = ingested.get('documents') or []
         rows = [row for row in rows if isinstance(row, dict)]
     except urllib.error.URLError as exc:
@@ -462,3 +463,17 @@ try:
         st.dataframe(table_rows, use_container_width=True)
 except urllib.error.URLError as exc:
     st.info(f'Jobs API unavailable: {exc}')
+
+
+if job_payload is not None and str(job_payload.get('status') or '') in {'queued', 'running'}:
+    # Follow the job's server-sent events instead of polling; the page's listings
+    # above are fetched once and refreshed by a single rerun when the job ends.
+    try:
+        for event in iter_sse_json(f'{api_base_url}/jobs/{active_job_id}/events', timeout=60):
+            job_payload = event
+            with job_placeholder.container():
+                _render_job_status(job_payload)
+    except (urllib.error.URLError, OSError) as exc:
+        st.warning(f'Job event stream interrupted: {exc}')
+    else:
+        st.rerun()
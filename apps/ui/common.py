@@ -1,8 +1,13 @@
 from __future__ import annotations
 
 import json
+import urllib.error
 import urllib.request
 import uuid
+from typing import Iterator
+
+# url -> (etag, payload); module state survives Streamlit reruns.
+_ETAG_CACHE: dict[str, tuple[str, dict[str, object]]] = {}
 
 
 def build_multipart_payload(
@@ -53,3 +58,39 @@ def request_json(
 
     with urllib.request.urlopen(req, timeout=timeout) as response:
         return json.loads(response.read().decode('utf-8'))
+
+
+def request_json_cached(url: str, *, timeout: int = 60) -> dict[str, object]:
+    """GET ``url`` with ``If-None-Match``; a 304 reuses the last payload for that URL."""
+    req = urllib.request.Request(url, method='GET')
+    cached = _ETAG_CACHE.get(url)
+    if cached is not None:
+        req.add_header('If-None-Match', cached[0])
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as response:
+            payload = json.loads(response.read().decode('utf-8'))
+            etag = response.headers.get('ETag')
+    except urllib.error.HTTPError as exc:
+        if exc.code == 304 and cached is not None:
+            return cached[1]
+        raise
+    if etag:
+        _ETAG_CACHE[url] = (etag, payload)
+    return payload
+
+
+def iter_sse_json(url: str, *, timeout: int = 60) -> Iterator[dict[str, object]]:
+    """Yield the JSON ``data`` of each server-sent event from ``url`` until the stream ends.
+
+    ``timeout`` bounds each read, so it must exceed the server's keep-alive interval.
+    """
+    req = urllib.request.Request(url, method='GET', headers={'Accept': 'text/event-stream'})
+    with urllib.request.urlopen(req, timeout=timeout) as response:
+        data: list[str] = []
+        for raw in response:
+            line = raw.decode('utf-8').rstrip('\r\n')
+            if line.startswith('data:'):
+                data.append(line[5:].lstrip(' '))
+            elif not line and data:
+                yield json.loads('\n'.join(data))
+                data = []
@@ -6,7 +6,7 @@ import urllib.parse
 
 import streamlit as st
 
-from common import request_json
+from common import request_json, request_json_cached
 
 
 st.set_page_config(page_title='Equipment Manuals Assistant', layout='wide')
@@ -56,7 +56,7 @@ if 'chat_messages' not in st.session_state:
 doc_rows: list[dict[str, object]] = []
 doc_error: str | None = None
 try:
-    doc_payload = request_json(f'{api_base_url}/ingested/docs', timeout=15)
+    doc_payload = request_json_cached(f'{api_base_url}/ingested/docs', timeout=15)
     raw_docs = doc_payload.get('documents') or []
     if isinstance(raw_docs, list):
         doc_rows = [row for row in raw_docs if isinstance(row, dict)]
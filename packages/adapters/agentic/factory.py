@@ -10,6 +10,7 @@ from packages.adapters.agentic.langchain_tool_executor_adapter import (
 )
 from packages.adapters.agentic.langgraph_runner_adapter import LangGraphRunnerAdapter
 from packages.adapters.agentic.noop_planner_adapter import NoopPlannerAdapter
+from packages.adapters.tracing.jsonl_trace_writer import TraceWriter
 from packages.ports.agent_trace_port import AgentTracePort
 from packages.ports.planner_port import PlannerPort
 from packages.ports.state_graph_runner_port import StateGraphRunnerPort
@@ -47,5 +48,10 @@ def create_state_graph_runner_adapter(
     return LangGraphRunnerAdapter()
 
 
-def create_agent_trace_logger(trace_file: Path) -> AgentTracePort:
-    return JsonlAgentTraceLoggerAdapter(trace_file=trace_file)
+def create_agent_trace_logger(
+    trace_file: Path,
+    *,
+    writer: TraceWriter | None = None,
+    sample_rate: float = 1.0,
+) -> AgentTracePort:
+    return JsonlAgentTraceLoggerAdapter(trace_file=trace_file, writer=writer, sample_rate=sample_rate)
@@ -1,18 +1,8 @@
 from __future__ import annotations
 
-import json
-from pathlib import Path
-from typing import Any
-
+from packages.adapters.tracing.sampled_trace_logger import SampledJsonlTraceLogger
 from packages.ports.agent_trace_port import AgentTracePort
 
 
-class JsonlAgentTraceLoggerAdapter(AgentTracePort):
-    def __init__(self, trace_file: Path) -> None:
-        self._trace_file = trace_file
-
-    def log(self, payload: dict[str, Any]) -> None:
-        self._trace_file.parent.mkdir(parents=True, exist_ok=True)
-        with self._trace_file.open('a', encoding='utf-8') as fh:
-            fh.write(json.dumps(payload, ensure_ascii=True))
-            fh.write('\n')
+class JsonlAgentTraceLoggerAdapter(SampledJsonlTraceLogger, AgentTracePort):
+    """JSONL sink for agentic plan/tool/finalize events."""
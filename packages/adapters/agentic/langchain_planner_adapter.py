@@ -59,7 +59,17 @@ class LangChainPlannerAdapter(PlannerPort):
                 continue
             objective = str(row.get('objective') or '').strip() or f'Run {tool_name}'
             step_id = str(row.get('step_id') or f'step_{idx}')
-            out.append(PlanStep(step_id=step_id, tool_name=tool_name, objective=objective))
+            query = str(row.get('query') or '').strip() or None
+            doc_id = str(row.get('doc_id') or '').strip() or None
+            out.append(
+                PlanStep(
+                    step_id=step_id,
+                    tool_name=tool_name,
+                    objective=objective,
+                    query=query,
+                    doc_id=doc_id,
+                )
+            )
             if len(out) >= max_steps:
                 break
         return out
@@ -86,6 +96,8 @@ class LangChainPlannerAdapter(PlannerPort):
             'Return ONLY a JSON array of steps.\n'
             'Each step object must have: step_id, tool_name, objective.\n'
             'Allowed tool_name values: search_evidence, draft_answer.\n'
+            'A search_evidence step may add "query" (a focused sub-question) and "doc_id"; '
+            'comparisons should use one search_evidence step per side.\n'
             'If the query requests figures/diagrams/images/tables, include a focused retrieval step before drafting.\n'
             f'Max steps: {budget}.\n'
             f'Intent: {intent}.\n'
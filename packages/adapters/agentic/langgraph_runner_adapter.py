@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextvars import copy_context
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from threading import Lock
 from typing import Any
 
+from packages.domain.timing import record_stage, timed_stage
 from packages.ports.agent_trace_port import AgentTracePort
 from packages.ports.llm_port import LlmEvidence, LlmPort
 from packages.ports.planner_port import PlanStep, PlannerPort
@@ -11,7 +16,36 @@ from packages.ports.state_graph_runner_port import GraphRunLimits, GraphRunOutpu
 from packages.ports.tool_executor_port import ToolExecutionResult, ToolExecutorPort
 
 
+# Tools whose steps only read and can therefore run side by side; drafting waits for them.
+_PARALLEL_SAFE_TOOLS = frozenset({'search_evidence'})
+
+
+@dataclass
+class _GraphRun:
+    """Per-run dependencies handed to the compiled graph's nodes through the run config."""
+
+    limits: GraphRunLimits
+    planner: PlannerPort
+    tool_executor: ToolExecutorPort
+    llm: LlmPort | None
+    trace_logger: AgentTracePort | None
+    execution_start: float
+
+
 class LangGraphRunnerAdapter(StateGraphRunnerPort):
+    """Runs the plan -> execute* -> finalize loop on a LangGraph compiled once per runner.
+
+    Nodes take their planner, tools, LLM and limits from the ``configurable``
+    run config, so one compiled graph serves every request. Without LangGraph
+    (or if a graph run fails) the same loop runs sequentially in-process.
+    """
+
+    def __init__(self) -> None:
+        self._compiled: Any = None
+        self._compile_lock = Lock()
+        self._graph_unavailable = False
+        self.compile_seconds: float | None = None
+
     def run(
         self,
         *,
@@ -23,34 +57,127 @@ class LangGraphRunnerAdapter(StateGraphRunnerPort):
         trace_logger: AgentTracePort | None = None,
     ) -> GraphRunOutput:
         prepared = self._prepare_state(initial_state)
-        start_monotonic = time.monotonic()
+        run = _GraphRun(
+            limits=limits,
+            planner=planner,
+            tool_executor=tool_executor,
+            llm=llm,
+            trace_logger=trace_logger,
+            execution_start=time.monotonic(),
+        )
 
+        compiled = self._compiled_graph()
+        started = time.perf_counter()
+        fallback_reason: str | None = None
         try:
-            return self._run_with_langgraph(
+            if compiled is not None:
+                try:
+                    return self._as_output(
+                        dict(
+                            compiled.invoke(
+                                prepared,
+                                config={
+                                    'configurable': {'graph_run': run},
+                                    'recursion_limit': max(25, limits.max_iterations + 4),
+                                },
+                            )
+                        )
+                    )
+                except Exception as exc:
+                    fallback_reason = type(exc).__name__
+            output = self._run_without_langgraph(
                 initial_state=prepared,
                 limits=limits,
                 planner=planner,
                 tool_executor=tool_executor,
                 llm=llm,
                 trace_logger=trace_logger,
-                start_monotonic=start_monotonic,
+                start_monotonic=run.execution_start,
             )
-        except Exception:
-            return self._run_without_langgraph(
-                initial_state=prepared,
-                limits=limits,
-                planner=planner,
-                tool_executor=tool_executor,
-                llm=llm,
-                trace_logger=trace_logger,
-                start_monotonic=start_monotonic,
+            if fallback_reason is not None:
+                warnings = list(output.state.get('warnings') or [])
+                warnings.append(f'LangGraph run failed ({fallback_reason}); used sequential runner')
+                output.state['warnings'] = warnings
+            return output
+        finally:
+            record_stage(
+                'agent_graph.run',
+                time.perf_counter() - started,
+                fallback=int(compiled is None or fallback_reason is not None),
+            )
+
+    def _compiled_graph(self) -> Any:
+        if self._compiled is not None or self._graph_unavailable:
+            return self._compiled
+        with self._compile_lock:
+            if self._compiled is None and not self._graph_unavailable:
+                started = time.perf_counter()
+                try:
+                    self._compiled = self._compile_graph()
+                except Exception:
+                    # LangGraph missing or incompatible; the topology is fixed, so don't retry.
+                    self._graph_unavailable = True
+                    return None
+                self.compile_seconds = time.perf_counter() - started
+                record_stage('agent_graph.compile', self.compile_seconds)
+        return self._compiled
+
+    def _compile_graph(self) -> Any:
+        from langgraph.graph import END, StateGraph  # type: ignore
+
+        # ``config`` stays unannotated: LangGraph injects it by parameter name.
+        def plan_node(state: dict[str, Any], config) -> dict[str, Any]:
+            run: _GraphRun = config['configurable']['graph_run']
+            planned = self._apply_plan(
+                state=state,
+                planner=run.planner,
+                limits=run.limits,
+                trace_logger=run.trace_logger,
             )
+            # Timeout budget applies to execution loop; planner latency should not force instant timeout.
+            run.execution_start = time.monotonic()
+            return planned
+
+        def execute_node(state: dict[str, Any], config) -> dict[str, Any]:
+            run: _GraphRun = config['configurable']['graph_run']
+            return self._execute_step(
+                state=state,
+                limits=run.limits,
+                tool_executor=run.tool_executor,
+                trace_logger=run.trace_logger,
+                start_monotonic=run.execution_start,
+            )
+
+        def route_after_execute(state: dict[str, Any]) -> str:
+            return 'finalize' if bool(state.get('_done')) else 'execute'
+
+        def finalize_node(state: dict[str, Any], config) -> dict[str, Any]:
+            run: _GraphRun = config['configurable']['graph_run']
+            return self._finalize_state(state=state, llm=run.llm, trace_logger=run.trace_logger)
+
+        graph = StateGraph(dict)
+        graph.add_node('plan', plan_node)
+        graph.add_node('execute', execute_node)
+        graph.add_node('finalize', finalize_node)
+        graph.set_entry_point('plan')
+        graph.add_edge('plan', 'execute')
+        graph.add_conditional_edges(
+            'execute',
+            route_after_execute,
+            {
+                'execute': 'execute',
+                'finalize': 'finalize',
+            },
+        )
+        graph.add_edge('finalize', END)
+        return graph.compile()
 
     @staticmethod
     def _prepare_state(payload: dict[str, Any]) -> dict[str, Any]:
         state = dict(payload)
         state.setdefault('query', '')
         state.setdefault('doc_id', None)
+        state.setdefault('doc_ids', [])
         state.setdefault('intent', 'general')
         state.setdefault('top_n', 6)
         state.setdefault('top_k_keyword', 20)
@@ -94,66 +221,6 @@ class LangGraphRunnerAdapter(StateGraphRunnerPort):
             }
         )
 
-    def _run_with_langgraph(
-        self,
-        *,
-        initial_state: dict[str, Any],
-        limits: GraphRunLimits,
-        planner: PlannerPort,
-        tool_executor: ToolExecutorPort,
-        llm: LlmPort | None,
-        trace_logger: AgentTracePort | None,
-        start_monotonic: float,
-    ) -> GraphRunOutput:
-        from langgraph.graph import END, StateGraph  # type: ignore
-        timer = {'start': start_monotonic}
-
-        def plan_node(state: dict[str, Any]) -> dict[str, Any]:
-            planned = self._apply_plan(
-                state=state,
-                planner=planner,
-                limits=limits,
-                trace_logger=trace_logger,
-            )
-            # Timeout budget applies to execution loop; planner latency should not force instant timeout.
-            timer['start'] = time.monotonic()
-            return planned
-
-        def execute_node(state: dict[str, Any]) -> dict[str, Any]:
-            return self._execute_step(
-                state=state,
-                limits=limits,
-                tool_executor=tool_executor,
-                trace_logger=trace_logger,
-                start_monotonic=timer['start'],
-            )
-
-        def route_after_execute(state: dict[str, Any]) -> str:
-            return 'finalize' if bool(state.get('_done')) else 'execute'
-
-        def finalize_node(state: dict[str, Any]) -> dict[str, Any]:
-            return self._finalize_state(state=state, llm=llm, trace_logger=trace_logger)
-
-        graph = StateGraph(dict)
-        graph.add_node('plan', plan_node)
-        graph.add_node('execute', execute_node)
-        graph.add_node('finalize', finalize_node)
-        graph.set_entry_point('plan')
-        graph.add_edge('plan', 'execute')
-        graph.add_conditional_edges(
-            'execute',
-            route_after_execute,
-            {
-                'execute': 'execute',
-                'finalize': 'finalize',
-            },
-        )
-        graph.add_edge('finalize', END)
-
-        compiled = graph.compile()
-        final_state = dict(compiled.invoke(initial_state))
-        return self._as_output(final_state)
-
     def _run_without_langgraph(
         self,
         *,
@@ -217,6 +284,8 @@ class LangGraphRunnerAdapter(StateGraphRunnerPort):
                 'step_id': row.step_id,
                 'tool_name': row.tool_name,
                 'objective': row.objective,
+                **({'query': row.query} if row.query else {}),
+                **({'doc_id': row.doc_id} if row.doc_id else {}),
             }
             for row in plan
         ]
@@ -241,10 +310,22 @@ class LangGraphRunnerAdapter(StateGraphRunnerPort):
         elapsed = time.monotonic() - start_monotonic
         return limits.timeout_seconds - elapsed
 
-    def _build_tool_args(self, state: dict[str, Any]) -> dict[str, Any]:
+    @staticmethod
+    def _scoped_doc_id(state: dict[str, Any], step_doc_id: Any) -> str | None:
+        """Doc a tool call searches: a planner step may narrow the request's scope, never leave it."""
+        requested = state.get('doc_id')
+        if requested:
+            return str(requested)
+        if not step_doc_id:
+            return None
+        allowed = state.get('doc_ids') or []
+        return str(step_doc_id) if not allowed or step_doc_id in allowed else None
+
+    def _build_tool_args(self, state: dict[str, Any], step: dict[str, Any] | None = None) -> dict[str, Any]:
+        step = step or {}
         return {
-            'query': state.get('query'),
-            'doc_id': state.get('doc_id'),
+            'query': step.get('query') or state.get('query'),
+            'doc_id': self._scoped_doc_id(state, step.get('doc_id')),
             'top_n': state.get('top_n'),
             'top_k_keyword': state.get('top_k_keyword'),
             'top_k_vector': state.get('top_k_vector'),
@@ -370,7 +451,24 @@ class LangGraphRunnerAdapter(StateGraphRunnerPort):
             out['_iterations'] = iterations + 1
             return out
 
-        args = self._build_tool_args(out)
+        batch = self._parallel_batch(
+            plan_steps=plan_steps,
+            plan_index=plan_index,
+            limits=limits,
+            iterations=iterations,
+            tool_calls=tool_calls,
+        )
+        if len(batch) > 1:
+            return self._execute_batch(
+                state=out,
+                batch=batch,
+                limits=limits,
+                tool_executor=tool_executor,
+                trace_logger=trace_logger,
+                start_monotonic=start_monotonic,
+            )
+
+        args = self._build_tool_args(out, step)
         result = tool_executor.execute(tool_name=tool_name, arguments=args)
         out = self._handle_tool_result(state=out, result=result)
 
@@ -396,6 +494,109 @@ class LangGraphRunnerAdapter(StateGraphRunnerPort):
         )
         return out
 
+    @staticmethod
+    def _parallel_batch(
+        *,
+        plan_steps: list[dict[str, Any]],
+        plan_index: int,
+        limits: GraphRunLimits,
+        iterations: int,
+        tool_calls: int,
+    ) -> list[dict[str, Any]]:
+        """Consecutive parallel-safe steps from ``plan_index``, capped by the remaining budgets."""
+        budget = min(
+            max(1, limits.max_parallel_tool_calls),
+            limits.max_tool_calls - tool_calls,
+            limits.max_iterations - iterations,
+        )
+        batch: list[dict[str, Any]] = []
+        for step in plan_steps[plan_index:]:
+            if len(batch) >= budget or str(step.get('tool_name') or '').strip() not in _PARALLEL_SAFE_TOOLS:
+                break
+            batch.append(step)
+        return batch
+
+    def _execute_batch(
+        self,
+        *,
+        state: dict[str, Any],
+        batch: list[dict[str, Any]],
+        limits: GraphRunLimits,
+        tool_executor: ToolExecutorPort,
+        trace_logger: AgentTracePort | None,
+        start_monotonic: float,
+    ) -> dict[str, Any]:
+        out = dict(state)
+        iterations = int(out.get('_iterations') or 0)
+        tool_calls = int(out.get('_tool_calls') or 0)
+        plan_index = int(out.get('_plan_index') or 0)
+        plan_steps = list(out.get('plan_steps') or [])
+        arguments = [self._build_tool_args(out, step) for step in batch]
+        remaining = max(0.0, self._remaining_seconds(limits=limits, start_monotonic=start_monotonic))
+
+        with timed_stage('agent_graph.tool_batch', steps=len(batch)):
+            executor = ThreadPoolExecutor(max_workers=len(batch), thread_name_prefix='agent-tool')
+            # Copy the caller's context per call so request-scoped state and timings follow the work.
+            futures = [
+                executor.submit(
+                    copy_context().run,
+                    tool_executor.execute,
+                    tool_name=str(step.get('tool_name') or '').strip(),
+                    arguments=args,
+                )
+                for step, args in zip(batch, arguments)
+            ]
+            done, _ = wait(futures, timeout=remaining)
+            # Steps still running at the deadline are abandoned rather than awaited.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        timed_out = False
+        for step, args, future in zip(batch, arguments, futures):
+            tool_name = str(step.get('tool_name') or '').strip()
+            if future not in done:
+                timed_out = True
+                result = ToolExecutionResult(
+                    tool_name=tool_name,
+                    success=False,
+                    error='did not finish before the agent timeout',
+                )
+            else:
+                try:
+                    result = future.result()
+                except Exception as exc:
+                    result = ToolExecutionResult(
+                        tool_name=tool_name,
+                        success=False,
+                        error=f'{type(exc).__name__}: {exc}',
+                    )
+            out = self._handle_tool_result(state=out, result=result)
+            self._log_trace(
+                trace_logger=trace_logger,
+                event='tool_executed',
+                payload={
+                    'query': out.get('query'),
+                    'step': step,
+                    'argument_keys': sorted(args.keys()),
+                    'success': result.success,
+                    'error': result.error,
+                    'parallel_batch_size': len(batch),
+                    'tool_calls': tool_calls + len(batch),
+                    'iterations': iterations + len(batch),
+                },
+            )
+
+        out['_plan_index'] = plan_index + len(batch)
+        out['_iterations'] = iterations + len(batch)
+        out['_tool_calls'] = tool_calls + len(batch)
+        if timed_out:
+            out['_done'] = True
+            out['_terminated_reason'] = 'timeout'
+        else:
+            out['_done'] = int(out['_plan_index']) >= len(plan_steps)
+            if out['_done']:
+                out['_terminated_reason'] = 'completed'
+        return out
+
     @staticmethod
     def _compose_from_hits(hits: list[dict[str, Any]]) -> str:
         points: list[str] = []
@@ -4,6 +4,16 @@ import json
 from pathlib import Path
 from typing import Any
 
+from packages.adapters.data_contracts.visual_artifacts import validate_visual_artifacts_for_doc
+from packages.adapters.storage.doc_generations import (
+    GenerationConflictError,
+    artifact_dir,
+    current_generation,
+    publish_generation,
+)
+
+VISUAL_FILES = ('visual_chunks.jsonl', 'visual_embeddings.jsonl', 'visual_manifest.json')
+
 
 def _is_numeric_list(value: object) -> bool:
     if not isinstance(value, list) or not value:
@@ -95,16 +105,19 @@ def build_visual_artifacts_from_chunks(
         metadata = row.get('metadata') or {}
         embedding = metadata.get('embedding') if isinstance(metadata, dict) else None
         if _is_numeric_list(embedding):
-            embedding_rows.append(
-                {
-                    'chunk_id': visual_chunk_id,
-                    'doc_id': doc_id,
-                    'provider': str(metadata.get('embedding_provider') or 'derived'),
-                    'model': str(metadata.get('embedding_model') or 'chunk-metadata'),
-                    'dim': len(embedding),
-                    'embedding': embedding,
-                }
-            )
+            embedding_row = {
+                'chunk_id': visual_chunk_id,
+                'doc_id': doc_id,
+                'provider': str(metadata.get('embedding_provider') or 'derived'),
+                'model': str(metadata.get('embedding_model') or 'chunk-metadata'),
+                'dim': len(embedding),
+                'embedding': embedding,
+            }
+            versioned = metadata.get('embeddings')
+            if isinstance(versioned, dict) and versioned:
+                # Model-keyed vectors ride along so search can use a migrated model.
+                embedding_row['embeddings'] = versioned
+            embedding_rows.append(embedding_row)
 
     dims = sorted({int(row['dim']) for row in embedding_rows})
     manifest: dict[str, Any] = {
@@ -127,25 +140,88 @@ def build_visual_artifacts_from_chunks(
     return visual_rows, embedding_rows, manifest
 
 
-def write_visual_artifacts(
-    doc_assets_dir: Path,
+def _write_visual_files(
+    out_dir: Path,
     visual_rows: list[dict[str, Any]],
     embedding_rows: list[dict[str, Any]],
     manifest: dict[str, Any],
 ) -> None:
-    doc_assets_dir.mkdir(parents=True, exist_ok=True)
-
-    chunks_path = doc_assets_dir / 'visual_chunks.jsonl'
-    with chunks_path.open('w', encoding='utf-8') as fh:
+    with (out_dir / 'visual_chunks.jsonl').open('w', encoding='utf-8') as fh:
         for row in visual_rows:
             fh.write(json.dumps(row, ensure_ascii=True))
             fh.write('\n')
 
-    embed_path = doc_assets_dir / 'visual_embeddings.jsonl'
-    with embed_path.open('w', encoding='utf-8') as fh:
+    with (out_dir / 'visual_embeddings.jsonl').open('w', encoding='utf-8') as fh:
         for row in embedding_rows:
             fh.write(json.dumps(row, ensure_ascii=True))
             fh.write('\n')
 
-    manifest_path = doc_assets_dir / 'visual_manifest.json'
-    manifest_path.write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+    (out_dir / 'visual_manifest.json').write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+
+
+def stage_visual_artifacts(out_dir: Path, doc_id: str, chunk_rows: list[dict[str, Any]]) -> None:
+    """Write the visual files derived from ``chunk_rows`` into a generation being staged."""
+    _write_visual_files(out_dir, *build_visual_artifacts_from_chunks(doc_id, chunk_rows))
+
+
+def write_visual_artifacts(
+    doc_assets_dir: Path,
+    visual_rows: list[dict[str, Any]],
+    embedding_rows: list[dict[str, Any]],
+    manifest: dict[str, Any],
+    *,
+    expected: str | None | bool = False,
+) -> None:
+    """Publish the three visual files, with the current ``chunks.jsonl``, as one new generation."""
+
+    def _write(out_dir: Path) -> None:
+        _write_visual_files(out_dir, visual_rows, embedding_rows, manifest)
+
+    publish_generation(doc_assets_dir, _write, carry_over=['chunks.jsonl'], expected=expected)
+
+
+def generate_visual_artifacts_for_doc(doc_assets_dir: Path, doc_id: str, *, force: bool = False) -> dict[str, Any]:
+    """Strictly validate a doc's visual artifacts, rebuilding them from ``chunks.jsonl`` when needed.
+
+    Generations published by the chunk store already carry their visual
+    files, so they are only rebuilt when missing, invalid, or with ``force``.
+    ``generated`` reports whether a new generation was published.
+    """
+    generation = current_generation(doc_assets_dir)
+    source = artifact_dir(doc_assets_dir)
+    chunks_path = source / 'chunks.jsonl'
+    if not chunks_path.exists():
+        return {
+            'generated': False,
+            'error': f'chunks file missing: {chunks_path}',
+            'validation': {
+                'valid': False,
+                'errors': [f'chunks file missing: {chunks_path}'],
+                'warnings': [],
+            },
+        }
+
+    chunk_rows = load_chunk_rows(chunks_path)
+    visual_rows, embedding_rows, manifest = build_visual_artifacts_from_chunks(doc_id, chunk_rows)
+    validation = None
+    if not force and all((source / name).exists() for name in VISUAL_FILES):
+        validation = validate_visual_artifacts_for_doc(doc_assets_dir, strict=True)
+    generated = False
+    if validation is None or not validation.is_valid():
+        try:
+            write_visual_artifacts(doc_assets_dir, visual_rows, embedding_rows, manifest, expected=generation)
+            generated = True
+        except GenerationConflictError:
+            # A newer persist published its own chunks and visuals together; validate that one.
+            pass
+        validation = validate_visual_artifacts_for_doc(doc_assets_dir, strict=True)
+    return {
+        'generated': generated,
+        'visual_chunk_count': len(visual_rows),
+        'embedding_count': len(embedding_rows),
+        'validation': {
+            'valid': validation.is_valid(),
+            'errors': validation.errors,
+            'warnings': validation.warnings,
+        },
+    }
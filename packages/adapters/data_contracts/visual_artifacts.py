@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Any
 
 from packages.adapters.data_contracts.contracts import ValidationResult
+from packages.adapters.storage.doc_generations import artifact_dir, artifact_path
 
 _CHUNK_FILE = 'visual_chunks.jsonl'
 _EMBED_FILE = 'visual_embeddings.jsonl'
@@ -81,10 +82,11 @@ def _load_manifest(path: Path, result: ValidationResult) -> dict[str, Any]:
 def validate_visual_artifacts_for_doc(doc_assets_dir: Path, strict: bool = False) -> ValidationResult:
     result = ValidationResult()
     doc_id = doc_assets_dir.name
+    artifacts = artifact_dir(doc_assets_dir)
 
-    chunk_path = doc_assets_dir / _CHUNK_FILE
-    embed_path = doc_assets_dir / _EMBED_FILE
-    manifest_path = doc_assets_dir / _MANIFEST_FILE
+    chunk_path = artifacts / _CHUNK_FILE
+    embed_path = artifacts / _EMBED_FILE
+    manifest_path = artifacts / _MANIFEST_FILE
 
     required_files = (
         (_CHUNK_FILE, chunk_path),
@@ -265,7 +267,7 @@ def validate_visual_artifacts(
         selected = sorted(
             path.name
             for path in assets_dir.iterdir()
-            if path.is_dir() and (path / 'chunks.jsonl').exists()
+            if path.is_dir() and artifact_path(path, 'chunks.jsonl').exists()
         )
 
     return {
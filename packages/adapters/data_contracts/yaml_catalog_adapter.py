@@ -9,10 +9,23 @@ from packages.ports.document_catalog_port import DocumentCatalogPort, DocumentCa
 class YamlDocumentCatalogAdapter(DocumentCatalogPort):
     def __init__(self, catalog_path: Path) -> None:
         self._catalog_path = catalog_path
+        self._cached_stamp: tuple[int, int] | None = None
+        self._cached_rows: list[DocumentCatalogRecord] = []
+
+    def _stamp(self) -> tuple[int, int] | None:
+        try:
+            stat = self._catalog_path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
 
     def list_documents(self) -> list[DocumentCatalogRecord]:
+        # Re-parse only when the YAML changed on disk; long-lived instances are cheap to query.
+        stamp = self._stamp()
+        if stamp is not None and stamp == self._cached_stamp:
+            return list(self._cached_rows)
         rows = load_catalog(self._catalog_path)
-        return [
+        records = [
             DocumentCatalogRecord(
                 doc_id=row.doc_id,
                 title=row.title,
@@ -21,6 +34,9 @@ class YamlDocumentCatalogAdapter(DocumentCatalogPort):
             )
             for row in rows
         ]
+        self._cached_stamp = stamp
+        self._cached_rows = records
+        return list(records)
 
     def get(self, doc_id: str) -> DocumentCatalogRecord | None:
         for row in self.list_documents():
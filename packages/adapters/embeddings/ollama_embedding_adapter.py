@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import copy
 import json
 import time
 import urllib.error
 import urllib.request
 
+from packages.domain.timing import record_stage
 from packages.ports.embedding_port import EmbeddingPort
 
 
@@ -14,7 +16,7 @@ class OllamaEmbeddingAdapter(EmbeddingPort):
         *,
         base_url: str,
         model: str,
-        timeout_seconds: int = 90,
+        timeout_seconds: float = 90,
         max_retries: int = 2,
         retry_backoff_seconds: float = 1.0,
     ) -> None:
@@ -24,12 +26,25 @@ class OllamaEmbeddingAdapter(EmbeddingPort):
         self._max_retries = max(0, int(max_retries))
         self._retry_backoff_seconds = max(0.0, float(retry_backoff_seconds))
         self._last_error: str | None = None
+        self._budget_seconds: float | None = None
 
     @property
     def last_error(self) -> str | None:
         return self._last_error
 
-    def _post_json(self, endpoint: str, payload: dict[str, object]) -> dict[str, object]:
+    def bounded(self, timeout_seconds: float) -> OllamaEmbeddingAdapter:
+        clone = copy.copy(self)
+        clone._budget_seconds = max(0.1, float(timeout_seconds))
+        clone._last_error = None
+        return clone
+
+    def _post_json(
+        self,
+        endpoint: str,
+        payload: dict[str, object],
+        timeout_seconds: float | None = None,
+        retries: int = 0,
+    ) -> dict[str, object]:
         data = json.dumps(payload).encode('utf-8')
         req = urllib.request.Request(
             f'{self._base_url}{endpoint}',
@@ -37,22 +52,66 @@ class OllamaEmbeddingAdapter(EmbeddingPort):
             method='POST',
             headers={'Content-Type': 'application/json'},
         )
-        with urllib.request.urlopen(req, timeout=self._timeout_seconds) as response:
-            return json.loads(response.read().decode('utf-8'))
+        timeout = self._timeout_seconds if timeout_seconds is None else timeout_seconds
+        started = time.perf_counter()
+        raw = b''
+        failed = False
+        try:
+            with urllib.request.urlopen(req, timeout=timeout) as response:
+                raw = response.read()
+            return json.loads(raw.decode('utf-8'))
+        except (OSError, ValueError):
+            # HTTP, connection and timeout errors are OSErrors; undecodable bodies are ValueErrors.
+            failed = True
+            raise
+        finally:
+            record_stage(
+                'ollama.embed',
+                time.perf_counter() - started,
+                bytes_out=len(data),
+                bytes_in=len(raw),
+                errors=int(failed),
+                retries=retries,
+            )
+
+    def _expires_at(self) -> float | None:
+        """Monotonic deadline of a bounded clone's call; ``None`` when unbounded."""
+        return time.monotonic() + self._budget_seconds if self._budget_seconds is not None else None
+
+    def _call_timeout(self, expires_at: float | None) -> float | None:
+        if expires_at is None:
+            return None
+        return min(float(self._timeout_seconds), expires_at - time.monotonic())
 
     def embed_text(self, text: str) -> list[float]:
+        return self._embed_one(text, self._expires_at())
+
+    def _embed_one(self, text: str, expires_at: float | None) -> list[float]:
         value = (text or '').strip()
         if not value:
             self._last_error = 'empty-input'
             return []
 
         self._last_error = None
+
+        def _call_timeout() -> float | None:
+            return self._call_timeout(expires_at)
+
         attempts = self._max_retries + 1
         for attempt in range(attempts):
             legacy_error: str | None = None
             try:
+                timeout = _call_timeout()
+                if timeout is not None and timeout <= 0:
+                    self._last_error = self._last_error or 'deadline-exceeded'
+                    return []
                 # Backward-compatible endpoint.
-                body = self._post_json('/api/embeddings', {'model': self._model, 'prompt': value})
+                body = self._post_json(
+                    '/api/embeddings',
+                    {'model': self._model, 'prompt': value},
+                    timeout_seconds=timeout,
+                    retries=int(attempt > 0),
+                )
                 embedding = body.get('embedding', [])
                 if isinstance(embedding, list):
                     parsed = [float(x) for x in embedding]
@@ -60,13 +119,21 @@ class OllamaEmbeddingAdapter(EmbeddingPort):
                         self._last_error = None
                         return parsed
                 legacy_error = 'legacy-endpoint-empty-embedding'
-            except (urllib.error.URLError, TimeoutError, json.JSONDecodeError, ValueError) as exc:
+            except (OSError, ValueError) as exc:
                 legacy_error = f'legacy-endpoint-error: {exc}'
 
             current_error: str | None = None
             try:
+                timeout = _call_timeout()
+                if timeout is not None and timeout <= 0:
+                    self._last_error = f'{legacy_error}; deadline-exceeded'
+                    return []
                 # Newer endpoint.
-                body = self._post_json('/api/embed', {'model': self._model, 'input': value})
+                body = self._post_json(
+                    '/api/embed',
+                    {'model': self._model, 'input': value},
+                    timeout_seconds=timeout,
+                )
                 embeddings = body.get('embeddings', [])
                 if isinstance(embeddings, list) and embeddings:
                     first = embeddings[0]
@@ -76,7 +143,7 @@ class OllamaEmbeddingAdapter(EmbeddingPort):
                             self._last_error = None
                             return parsed
                 current_error = 'current-endpoint-empty-embedding'
-            except (urllib.error.URLError, TimeoutError, json.JSONDecodeError, ValueError) as exc:
+            except (OSError, ValueError) as exc:
                 current_error = f'current-endpoint-error: {exc}'
 
             if current_error and legacy_error:
@@ -85,6 +152,41 @@ class OllamaEmbeddingAdapter(EmbeddingPort):
                 self._last_error = current_error or legacy_error or 'unknown-embedding-error'
 
             if attempt < attempts - 1 and self._retry_backoff_seconds > 0:
-                time.sleep(self._retry_backoff_seconds * (2 ** attempt))
+                backoff = self._retry_backoff_seconds * (2 ** attempt)
+                if expires_at is not None and time.monotonic() + backoff >= expires_at:
+                    break
+                time.sleep(backoff)
 
         return []
+
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """One ``/api/embed`` call for the whole batch, falling back to per-item calls.
+
+        A bounded clone's budget covers the whole batch: the batch call and
+        the fallback share one deadline, and items left when it passes get ``[]``.
+        """
+        expires_at = self._expires_at()
+        values = [(text or '').strip() for text in texts]
+        if values and all(values):
+            timeout = self._call_timeout(expires_at)
+            try:
+                if timeout is not None and timeout <= 0:
+                    raise TimeoutError('deadline-exceeded')
+                body = self._post_json('/api/embed', {'model': self._model, 'input': values}, timeout_seconds=timeout)
+                embeddings = body.get('embeddings', [])
+                if isinstance(embeddings, list) and len(embeddings) == len(values):
+                    parsed = [[float(x) for x in row] for row in embeddings if isinstance(row, list)]
+                    if len(parsed) == len(values) and all(parsed):
+                        self._last_error = None
+                        return parsed
+            except (OSError, ValueError, TypeError) as exc:
+                self._last_error = f'batch-endpoint-error: {exc}'
+
+        out: list[list[float]] = []
+        for text in texts:
+            if expires_at is not None and time.monotonic() >= expires_at:
+                self._last_error = 'deadline-exceeded'
+                out.append([])
+                continue
+            out.append(self._embed_one(text, expires_at))
+        return out
@@ -1,18 +1,26 @@
 from __future__ import annotations
 
+import copy
 import json
+import time
 import urllib.error
 import urllib.request
 
+from packages.domain.timing import record_stage
 from packages.ports.llm_port import LlmEvidence, LlmPort
 
 
 class OllamaLlmAdapter(LlmPort):
-    def __init__(self, *, base_url: str, model: str, timeout_seconds: int = 60) -> None:
+    def __init__(self, *, base_url: str, model: str, timeout_seconds: float = 60) -> None:
         self._base_url = base_url.rstrip('/')
         self._model = model
         self._timeout_seconds = timeout_seconds
 
+    def bounded(self, timeout_seconds: float) -> OllamaLlmAdapter:
+        clone = copy.copy(self)
+        clone._timeout_seconds = max(0.1, min(float(self._timeout_seconds), float(timeout_seconds)))
+        return clone
+
     def _prompt(self, query: str, intent: str, evidence: list[LlmEvidence]) -> str:
         lines: list[str] = [
             'You are a grounded industrial manuals assistant.',
@@ -78,11 +86,24 @@ class OllamaLlmAdapter(LlmPort):
             headers={'Content-Type': 'application/json'},
         )
 
+        started = time.perf_counter()
+        raw = b''
+        failed = False
         try:
             with urllib.request.urlopen(req, timeout=self._timeout_seconds) as response:
-                body = json.loads(response.read().decode('utf-8'))
+                raw = response.read()
+            body = json.loads(raw.decode('utf-8'))
             message = body.get('message', {})
             text = message.get('content', '') if isinstance(message, dict) else ''
             return str(text).strip()
         except (urllib.error.URLError, TimeoutError, json.JSONDecodeError):
+            failed = True
             return ''
+        finally:
+            record_stage(
+                'ollama.llm',
+                time.perf_counter() - started,
+                bytes_out=len(data),
+                bytes_in=len(raw),
+                errors=int(failed),
+            )
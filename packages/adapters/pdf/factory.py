@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import logging
+
+from packages.adapters.pdf.pymupdf_parser_adapter import PymupdfParserAdapter
+from packages.adapters.pdf.pypdf_parser_adapter import PypdfParserAdapter
+from packages.ports.pdf_parser_port import PdfParserPort
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_pdf_parser(engine: str) -> str:
+    """Engine ``create_pdf_parser`` builds for ``engine``; pymupdf needs PyMuPDF installed."""
+    normalized = (engine or '').strip().lower()
+    if normalized == 'pymupdf':
+        try:
+            import fitz  # type: ignore  # noqa: F401
+        except ImportError:
+            return 'pypdf'
+        return 'pymupdf'
+    if normalized == 'pypdf':
+        return 'pypdf'
+    raise ValueError(f'Unsupported PDF parser: {engine}')
+
+
+def create_pdf_parser(engine: str) -> PdfParserPort:
+    resolved = resolve_pdf_parser(engine)
+    if resolved == 'pymupdf':
+        return PymupdfParserAdapter()
+    if (engine or '').strip().lower() != resolved:
+        logger.warning('PyMuPDF is not installed; parsing PDFs with pypdf instead of %s', engine)
+    return PypdfParserAdapter()
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from packages.ports.pdf_parser_port import PdfBlock, PdfParserPort, PdfTextLine, ParsedPdfPage
+
+
+class PymupdfParserAdapter(PdfParserPort):
+    """Page text plus text/image block bboxes from one PyMuPDF pass per page."""
+
+    def parse(self, pdf_path: str) -> list[ParsedPdfPage]:
+        try:
+            import fitz  # type: ignore
+        except Exception as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError('PyMuPDF is not installed') from exc
+
+        pages: list[ParsedPdfPage] = []
+        with fitz.open(pdf_path) as doc:
+            for idx, page in enumerate(doc, start=1):
+                payload = page.get_text('dict', flags=fitz.TEXTFLAGS_TEXT, sort=True)
+                blocks: list[PdfBlock] = []
+                for block in payload.get('blocks', []):
+                    lines = tuple(
+                        PdfTextLine(text=text, bbox=tuple(line['bbox']))
+                        for line in block.get('lines', [])
+                        if (text := ''.join(span.get('text', '') for span in line.get('spans', [])).strip())
+                    )
+                    if lines:
+                        blocks.append(PdfBlock(kind='text', bbox=tuple(block['bbox']), lines=lines))
+                for image in page.get_image_info():
+                    blocks.append(PdfBlock(kind='image', bbox=tuple(image['bbox'])))
+                text = '\n'.join(block.text for block in blocks if block.kind == 'text')
+                pages.append(ParsedPdfPage(page_number=idx, text=text.strip(), blocks=tuple(blocks)))
+
+        return pages
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import copy
+import math
+from collections import OrderedDict
+from threading import Lock
+
+from packages.domain.tokenization import KEYWORD_TERM_COUNTS, keyword_terms
+from packages.ports.embedding_port import EmbeddingPort
+from packages.ports.reranker_port import RankedCandidate, RerankCandidate, RerankerPort
+
+
+def _normalize(vec: list[float]) -> list[float]:
+    if not vec:
+        return []
+    norm = math.sqrt(sum(v * v for v in vec))
+    if norm <= 0:
+        return []
+    return [v / norm for v in vec]
+
+
+def _cosine(a: list[float], b: list[float]) -> float:
+    if not a or not b or len(a) != len(b):
+        return 0.0
+    return sum(x * y for x, y in zip(a, b))
+
+
+class EmbeddingRerankerAdapter(RerankerPort):
+    """CPU-friendly reranker that scores (query, passage) pairs without a chat LLM.
+
+    Blends embedding cosine similarity, BM25 computed over the candidate pool
+    and the fused retrieval score. Candidate embeddings come from the chunk
+    store when available, read under ``embedding_key`` so they match the
+    model ``embedding_adapter`` embeds queries with; otherwise passages are
+    embedded once and memoized.
+    With a noop embedding adapter the score degrades to BM25 plus base score.
+    """
+
+    def __init__(
+        self,
+        *,
+        embedding_adapter: EmbeddingPort | None = None,
+        embedding_key: str | None = None,
+        semantic_weight: float = 0.55,
+        lexical_weight: float = 0.30,
+        base_weight: float = 0.15,
+        k1: float = 1.2,
+        b: float = 0.75,
+        memo_size: int = 4096,
+    ) -> None:
+        self._embedding_adapter = embedding_adapter
+        self.embedding_key = embedding_key
+        self._semantic_weight = max(0.0, semantic_weight)
+        self._lexical_weight = max(0.0, lexical_weight)
+        self._base_weight = max(0.0, base_weight)
+        self._k1 = k1
+        self._b = b
+        self._memo_size = max(0, int(memo_size))
+        self._memo: OrderedDict[tuple[str, str, int], list[float]] = OrderedDict()
+        self._memo_lock = Lock()
+
+    def bounded(self, timeout_seconds: float) -> EmbeddingRerankerAdapter:
+        if self._embedding_adapter is None:
+            return self
+        clone = copy.copy(self)
+        clone._embedding_adapter = self._embedding_adapter.bounded(timeout_seconds)
+        return clone
+
+    def _memo_get(self, memo_key: tuple[str, str, int]) -> list[float] | None:
+        with self._memo_lock:
+            cached = self._memo.get(memo_key)
+            if cached is not None:
+                self._memo.move_to_end(memo_key)
+            return cached
+
+    def _memo_put(self, memo_key: tuple[str, str, int], vec: list[float]) -> None:
+        if not vec or self._memo_size <= 0:
+            return
+        with self._memo_lock:
+            self._memo[memo_key] = vec
+            while len(self._memo) > self._memo_size:
+                self._memo.popitem(last=False)
+
+    def _embed_many(self, kind: str, items: list[tuple[str, str]]) -> list[list[float]]:
+        """Vectors for ``(key, text)`` pairs; memo misses are embedded in one ``embed_texts`` call.
+
+        Memo entries are keyed by the text's hash as well, so a reingested
+        chunk that keeps its id is embedded again.
+        """
+        out: list[list[float]] = [[] for _ in items]
+        if self._embedding_adapter is None:
+            return out
+        missing: list[int] = []
+        for idx, (key, text) in enumerate(items):
+            if not text.strip():
+                continue
+            cached = self._memo_get((kind, key, hash(text)))
+            if cached is not None:
+                out[idx] = cached
+            else:
+                missing.append(idx)
+        if not missing:
+            return out
+
+        vectors = self._embedding_adapter.embed_texts([items[idx][1] for idx in missing])
+        for idx, raw in zip(missing, vectors):
+            vec = _normalize(raw)
+            out[idx] = vec
+            key, text = items[idx]
+            self._memo_put((kind, key, hash(text)), vec)
+        return out
+
+    def _bm25_scores(self, query: str, candidates: list[RerankCandidate]) -> list[float]:
+        q_terms = keyword_terms(query)
+        if not q_terms:
+            return [0.0] * len(candidates)
+
+        stats = KEYWORD_TERM_COUNTS.counts((row.chunk_id, row.text) for row in candidates)
+        docs_counts = [tf for tf, _ in stats]
+        doc_lens = [length for _, length in stats]
+        avg_len = sum(doc_lens) / max(len(doc_lens), 1)
+        # Only query terms need a document frequency.
+        df = {term: sum(1 for tf in docs_counts if term in tf) for term in set(q_terms)}
+
+        n_docs = len(candidates)
+        raw: list[float] = []
+        for tf, doc_len in zip(docs_counts, doc_lens):
+            score = 0.0
+            for term in q_terms:
+                if term not in tf:
+                    continue
+                idf = math.log(1 + (n_docs - df[term] + 0.5) / (df[term] + 0.5))
+                num = tf[term] * (self._k1 + 1)
+                den = tf[term] + self._k1 * (1 - self._b + self._b * (doc_len / max(avg_len, 1e-9)))
+                score += idf * (num / max(den, 1e-9))
+            raw.append(score)
+
+        hi = max(raw, default=0.0)
+        if hi <= 0:
+            return [0.0] * len(candidates)
+        return [value / hi for value in raw]
+
+    def _semantic_scores(self, query: str, candidates: list[RerankCandidate]) -> list[float | None]:
+        q_vec = self._embed_many('q', [(' '.join(query.lower().split()), query)])[0]
+        if not q_vec:
+            return [None] * len(candidates)
+
+        c_vecs: list[list[float]] = []
+        for row in candidates:
+            c_vec: list[float] = []
+            if row.embedding:
+                try:
+                    c_vec = _normalize([float(x) for x in row.embedding])
+                except (TypeError, ValueError):
+                    c_vec = []
+            c_vecs.append(c_vec)
+        missing = [idx for idx, vec in enumerate(c_vecs) if not vec]
+        if missing:
+            embedded = self._embed_many('c', [(candidates[idx].chunk_id, candidates[idx].text) for idx in missing])
+            for idx, vec in zip(missing, embedded):
+                c_vecs[idx] = vec
+
+        out: list[float | None] = []
+        for c_vec in c_vecs:
+            if not c_vec or len(c_vec) != len(q_vec):
+                out.append(None)
+                continue
+            out.append(max(0.0, min(1.0, _cosine(q_vec, c_vec))))
+        return out
+
+    def rerank(
+        self,
+        *,
+        query: str,
+        candidates: list[RerankCandidate],
+        top_k: int,
+    ) -> list[RankedCandidate]:
+        if not query.strip() or not candidates or top_k <= 0:
+            return []
+
+        lexical = self._bm25_scores(query, candidates)
+        semantic = self._semantic_scores(query, candidates)
+
+        out: list[RankedCandidate] = []
+        for row, lex, sem in zip(candidates, lexical, semantic):
+            base = max(0.0, min(1.0, row.base_score))
+            if sem is None:
+                # Re-normalize over the features that are available for this pair.
+                weight = self._lexical_weight + self._base_weight
+                score = (self._lexical_weight * lex + self._base_weight * base) / max(weight, 1e-9)
+            else:
+                weight = self._semantic_weight + self._lexical_weight + self._base_weight
+                score = (
+                    self._semantic_weight * sem
+                    + self._lexical_weight * lex
+                    + self._base_weight * base
+                ) / max(weight, 1e-9)
+            out.append(RankedCandidate(chunk_id=row.chunk_id, score=round(score, 6)))
+
+        out.sort(key=lambda item: item.score, reverse=True)
+        return out[:top_k]
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from packages.adapters.reranker.embedding_reranker_adapter import EmbeddingRerankerAdapter
 from packages.adapters.reranker.noop_reranker_adapter import NoopRerankerAdapter
-from packages.adapters.reranker.ollama_reranker_adapter import OllamaRerankerAdapter
+from packages.adapters.reranker.ollama_reranker_adapter import OllamaRerankerAdapter, RerankScoreCache
+from packages.ports.embedding_port import EmbeddingPort
 from packages.ports.reranker_port import RerankerPort
 
 
@@ -10,8 +12,21 @@ def create_reranker_adapter(
     provider: str,
     base_url: str,
     model: str,
+    batch_size: int = 0,
+    max_concurrency: int = 2,
+    score_cache: RerankScoreCache | None = None,
+    embedding_adapter: EmbeddingPort | None = None,
+    embedding_key: str | None = None,
 ) -> RerankerPort:
     normalized = provider.strip().lower()
+    if normalized in {'embedding', 'cross_encoder'}:
+        return EmbeddingRerankerAdapter(embedding_adapter=embedding_adapter, embedding_key=embedding_key)
     if normalized in {'ollama', 'local'} and model.strip():
-        return OllamaRerankerAdapter(base_url=base_url, model=model)
+        return OllamaRerankerAdapter(
+            base_url=base_url,
+            model=model,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
+            score_cache=score_cache,
+        )
     return NoopRerankerAdapter()
@@ -1,28 +1,117 @@
 from __future__ import annotations
 
+import copy
 import json
-import re
+import time
 import urllib.error
 import urllib.request
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from threading import Lock
 
+from packages.domain.timing import record_stage
+from packages.domain.tokenization import word_set
 from packages.ports.reranker_port import RankedCandidate, RerankCandidate, RerankerPort
 
-_WORD_RE = re.compile(r'[a-z0-9]+')
-
 
 def _overlap_score(query: str, text: str) -> float:
-    q = set(_WORD_RE.findall(query.lower()))
-    t = set(_WORD_RE.findall(text.lower()))
+    q = word_set(query)
+    t = word_set(text)
     if not q or not t:
         return 0.0
     return len(q.intersection(t)) / max(len(q), 1)
 
 
+def _fallback_score(query: str, row: RerankCandidate) -> float:
+    return round(0.6 * _overlap_score(query, row.text) + 0.4 * row.base_score, 6)
+
+
+def _normalize_query(query: str) -> str:
+    return ' '.join(query.lower().split())
+
+
+class RerankScoreCache:
+    """Thread-safe LRU of rerank scores keyed by (query, chunk_id, text hash, model).
+
+    Shared across requests so repeated and overlapping candidate pools only
+    send unseen chunks to the model. The text hash keeps a reingested chunk
+    that reuses its id from being served its old score. ``max_entries <= 0``
+    disables caching.
+    """
+
+    def __init__(self, max_entries: int = 2048) -> None:
+        self._max_entries = max(0, int(max_entries))
+        self._lock = Lock()
+        self._rows: OrderedDict[tuple[str, str, int, str], float] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._rows)
+
+    def get_many(self, *, query: str, model: str, candidates: list[RerankCandidate]) -> dict[str, float]:
+        normalized = _normalize_query(query)
+        out: dict[str, float] = {}
+        with self._lock:
+            for row in candidates:
+                key = (normalized, row.chunk_id, hash(row.text), model)
+                score = self._rows.get(key)
+                if score is None:
+                    self.misses += 1
+                    continue
+                self._rows.move_to_end(key)
+                out[row.chunk_id] = score
+                self.hits += 1
+        return out
+
+    def put_many(
+        self,
+        *,
+        query: str,
+        model: str,
+        candidates: list[RerankCandidate],
+        scores: dict[str, float],
+    ) -> None:
+        if self._max_entries <= 0 or not scores:
+            return
+        normalized = _normalize_query(query)
+        with self._lock:
+            for row in candidates:
+                score = scores.get(row.chunk_id)
+                if score is None:
+                    continue
+                key = (normalized, row.chunk_id, hash(row.text), model)
+                self._rows[key] = score
+                self._rows.move_to_end(key)
+            while len(self._rows) > self._max_entries:
+                self._rows.popitem(last=False)
+
+
 class OllamaRerankerAdapter(RerankerPort):
-    def __init__(self, *, base_url: str, model: str, timeout_seconds: int = 90) -> None:
+    def __init__(
+        self,
+        *,
+        base_url: str,
+        model: str,
+        timeout_seconds: float = 90,
+        batch_size: int = 0,
+        max_concurrency: int = 2,
+        score_cache: RerankScoreCache | None = None,
+    ) -> None:
         self._base_url = base_url.rstrip('/')
         self._model = model
         self._timeout_seconds = timeout_seconds
+        self._batch_size = max(0, int(batch_size))
+        self._max_concurrency = max(1, int(max_concurrency))
+        self._score_cache = score_cache if score_cache is not None else RerankScoreCache()
+
+    def bounded(self, timeout_seconds: float) -> OllamaRerankerAdapter:
+        # The clone shares the score cache so bounded calls still populate it.
+        clone = copy.copy(self)
+        clone._timeout_seconds = max(0.1, min(float(self._timeout_seconds), float(timeout_seconds)))
+        return clone
 
     def _prompt(self, query: str, candidates: list[RerankCandidate]) -> str:
         lines: list[str] = [
@@ -41,61 +130,144 @@ class OllamaRerankerAdapter(RerankerPort):
             )
         return '\n'.join(lines)
 
-    def rerank(
-        self,
-        *,
-        query: str,
-        candidates: list[RerankCandidate],
-        top_k: int,
-    ) -> list[RankedCandidate]:
-        if not query.strip() or not candidates or top_k <= 0:
-            return []
-
+    def _chat(self, prompt: str) -> str:
         payload = {
             'model': self._model,
             'stream': False,
             'messages': [
                 {'role': 'system', 'content': 'You are a strict ranking engine. Output JSON only.'},
-                {'role': 'user', 'content': self._prompt(query, candidates)},
+                {'role': 'user', 'content': prompt},
             ],
         }
 
+        data = json.dumps(payload).encode('utf-8')
         req = urllib.request.Request(
             f'{self._base_url}/api/chat',
-            data=json.dumps(payload).encode('utf-8'),
+            data=data,
             method='POST',
             headers={'Content-Type': 'application/json'},
         )
-
+        started = time.perf_counter()
+        raw = b''
+        failed = False
         try:
             with urllib.request.urlopen(req, timeout=self._timeout_seconds) as response:
-                body = json.loads(response.read().decode('utf-8'))
-            message = body.get('message', {})
-            content = message.get('content', '') if isinstance(message, dict) else ''
-            parsed = json.loads(content)
+                raw = response.read()
+            body = json.loads(raw.decode('utf-8'))
+        except (OSError, ValueError):
+            failed = True
+            raise
+        finally:
+            record_stage(
+                'ollama.rerank',
+                time.perf_counter() - started,
+                bytes_out=len(data),
+                bytes_in=len(raw),
+                errors=int(failed),
+            )
+        message = body.get('message', {})
+        return message.get('content', '') if isinstance(message, dict) else ''
+
+    def _score_batch(self, query: str, batch: list[RerankCandidate]) -> dict[str, float] | None:
+        try:
+            parsed = json.loads(self._chat(self._prompt(query, batch)))
             rows = parsed.get('scores') if isinstance(parsed, dict) else None
             if not isinstance(rows, list):
                 raise ValueError('missing scores')
-
-            out: list[RankedCandidate] = []
-            valid_ids = {row.chunk_id for row in candidates}
-            for row in rows:
-                if not isinstance(row, dict):
-                    continue
-                cid = str(row.get('chunk_id') or '')
-                if cid not in valid_ids:
-                    continue
-                try:
-                    score = float(row.get('score', 0.0))
-                except (TypeError, ValueError):
-                    score = 0.0
-                out.append(RankedCandidate(chunk_id=cid, score=max(0.0, min(1.0, score))))
-
-            if out:
-                out.sort(key=lambda item: item.score, reverse=True)
-                return out[:top_k]
         except (urllib.error.URLError, TimeoutError, json.JSONDecodeError, ValueError):
-            pass
+            return None
+
+        out: dict[str, float] = {}
+        valid_ids = {row.chunk_id for row in batch}
+        for row in rows:
+            if not isinstance(row, dict):
+                continue
+            cid = str(row.get('chunk_id') or '')
+            if cid not in valid_ids:
+                continue
+            try:
+                score = float(row.get('score', 0.0))
+            except (TypeError, ValueError):
+                score = 0.0
+            out[cid] = max(0.0, min(1.0, score))
+        return out or None
+
+    def _batches(self, candidates: list[RerankCandidate]) -> list[list[RerankCandidate]]:
+        if self._batch_size <= 0 or len(candidates) <= self._batch_size:
+            return [candidates]
+        return [
+            candidates[idx : idx + self._batch_size]
+            for idx in range(0, len(candidates), self._batch_size)
+        ]
+
+    def _score_pending(
+        self,
+        query: str,
+        pending: list[RerankCandidate],
+    ) -> tuple[dict[str, float], set[str]]:
+        batches = self._batches(pending)
+        if len(batches) == 1:
+            results = [self._score_batch(query, batches[0])]
+        else:
+            workers = min(self._max_concurrency, len(batches))
+            # Each batch runs in a copy of the caller's context so stage timings propagate.
+            contexts = [copy_context() for _ in batches]
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(
+                        lambda ctx, batch: ctx.run(self._score_batch, query, batch),
+                        contexts,
+                        batches,
+                    )
+                )
+
+        scores: dict[str, float] = {}
+        failed_ids: set[str] = set()
+        for batch, result in zip(batches, results):
+            if result is None:
+                failed_ids.update(row.chunk_id for row in batch)
+                continue
+            scores.update(result)
+        return scores, failed_ids
+
+    def rerank(
+        self,
+        *,
+        query: str,
+        candidates: list[RerankCandidate],
+        top_k: int,
+    ) -> list[RankedCandidate]:
+        if not query.strip() or not candidates or top_k <= 0:
+            return []
+
+        scores = self._score_cache.get_many(query=query, model=self._model, candidates=candidates)
+        pending = [row for row in candidates if row.chunk_id not in scores]
+        failed_ids: set[str] = set()
+        if pending:
+            fresh, failed_ids = self._score_pending(query, pending)
+            self._score_cache.put_many(query=query, model=self._model, candidates=pending, scores=fresh)
+            scores.update(fresh)
+
+        if scores:
+            # Batches that failed are scored lexically so one slow sub-prompt
+            # does not drop its candidates from the pool; those scores are not
+            # cached. Lexical scores are not on the model's scale, so they rank
+            # after every model-scored candidate, scaled below the lowest one.
+            out = [
+                RankedCandidate(chunk_id=row.chunk_id, score=scores[row.chunk_id])
+                for row in candidates
+                if row.chunk_id in scores
+            ]
+            out.sort(key=lambda item: item.score, reverse=True)
+            floor = out[-1].score
+            fallback = [
+                RankedCandidate(chunk_id=row.chunk_id, score=_fallback_score(query, row))
+                for row in candidates
+                if row.chunk_id in failed_ids
+            ]
+            fallback.sort(key=lambda item: item.score, reverse=True)
+            out.extend(RankedCandidate(chunk_id=row.chunk_id, score=round(floor * row.score, 6)) for row in fallback)
+            return out[:top_k]
 
         # Fallback to lexical overlap ranking if LLM rerank is unavailable.
         fallback = sorted(
@@ -104,9 +276,6 @@ class OllamaRerankerAdapter(RerankerPort):
             reverse=True,
         )
         return [
-            RankedCandidate(
-                chunk_id=row.chunk_id,
-                score=round(0.6 * _overlap_score(query, row.text) + 0.4 * row.base_score, 6),
-            )
+            RankedCandidate(chunk_id=row.chunk_id, score=_fallback_score(query, row))
             for row in fallback[:top_k]
         ]
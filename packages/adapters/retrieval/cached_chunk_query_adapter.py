@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from threading import Lock
+
+from packages.domain.models import Chunk
+from packages.ports.chunk_query_port import ChunkQueryPort
+
+
+class CachedChunkQueryAdapter(ChunkQueryPort):
+    """Snapshot cache over another chunk query, safe to share across threads.
+
+    Each ``doc_id`` (or the full corpus for ``None``) is loaded from the inner
+    adapter once; a per-doc request is served from the full-corpus snapshot
+    when that was loaded first. Intended for batch runs such as golden
+    evaluation where the chunk store does not change underneath the run.
+    """
+
+    def __init__(self, inner: ChunkQueryPort) -> None:
+        self._inner = inner
+        self._lock = Lock()
+        self._rows: dict[str | None, list[Chunk]] = {}
+
+    def list_chunks(self, doc_id: str | None = None) -> list[Chunk]:
+        with self._lock:
+            cached = self._rows.get(doc_id)
+            if cached is None and doc_id is not None and None in self._rows:
+                cached = [chunk for chunk in self._rows[None] if chunk.doc_id == doc_id]
+                self._rows[doc_id] = cached
+            if cached is None:
+                # Loading under the lock keeps concurrent workers from reading
+                # the same JSONL files in parallel on a cold cache.
+                cached = self._inner.list_chunks(doc_id=doc_id)
+                self._rows[doc_id] = cached
+        return list(cached)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._rows.clear()
@@ -4,6 +4,7 @@ import json
 from dataclasses import fields
 from pathlib import Path
 
+from packages.adapters.storage.doc_generations import artifact_dir
 from packages.domain.models import Chunk
 from packages.ports.chunk_query_port import ChunkQueryPort
 
@@ -26,8 +27,10 @@ class FilesystemChunkQueryAdapter(ChunkQueryPort):
         valid_keys = {f.name for f in fields(Chunk)}
 
         for doc_path in docs:
-            chunks.extend(self._load_text_chunks(doc_path, valid_keys))
-            chunks.extend(self._load_visual_chunks(doc_path))
+            # Resolve the generation once so text and visual chunks come from the same write.
+            artifacts = artifact_dir(doc_path)
+            chunks.extend(self._load_text_chunks(artifacts, valid_keys))
+            chunks.extend(self._load_visual_chunks(artifacts, doc_path.name))
 
         return chunks
 
@@ -46,13 +49,14 @@ class FilesystemChunkQueryAdapter(ChunkQueryPort):
                 out.append(Chunk(**payload))
         return out
 
-    def _load_visual_chunks(self, doc_path: Path) -> list[Chunk]:
+    def _load_visual_chunks(self, doc_path: Path, doc_id: str) -> list[Chunk]:
         visual_path = doc_path / 'visual_chunks.jsonl'
         if not visual_path.exists():
             return []
 
         embedding_path = doc_path / 'visual_embeddings.jsonl'
         embeddings: dict[str, list[float]] = {}
+        versioned_embeddings: dict[str, dict[str, list[float]]] = {}
         if embedding_path.exists():
             with embedding_path.open('r', encoding='utf-8') as fh:
                 for line in fh:
@@ -63,6 +67,9 @@ class FilesystemChunkQueryAdapter(ChunkQueryPort):
                     vector = row.get('embedding')
                     if chunk_id and isinstance(vector, list):
                         embeddings[chunk_id] = vector
+                    versioned = row.get('embeddings')
+                    if chunk_id and isinstance(versioned, dict):
+                        versioned_embeddings[chunk_id] = versioned
 
         out: list[Chunk] = []
         with visual_path.open('r', encoding='utf-8') as fh:
@@ -71,7 +78,7 @@ class FilesystemChunkQueryAdapter(ChunkQueryPort):
                     continue
                 row = json.loads(line)
                 chunk_id = str(row.get('chunk_id') or '').strip()
-                row_doc_id = str(row.get('doc_id') or '').strip() or doc_path.name
+                row_doc_id = str(row.get('doc_id') or '').strip() or doc_id
                 page = int(row.get('page') or 0)
                 if not chunk_id or page <= 0:
                     continue
@@ -91,6 +98,8 @@ class FilesystemChunkQueryAdapter(ChunkQueryPort):
                 embedding = embeddings.get(chunk_id)
                 if embedding:
                     metadata['embedding'] = embedding
+                if chunk_id in versioned_embeddings:
+                    metadata['embeddings'] = versioned_embeddings[chunk_id]
 
                 out.append(
                     Chunk(
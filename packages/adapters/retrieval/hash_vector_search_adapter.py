@@ -1,26 +1,18 @@
 ﻿from __future__ import annotations
 
 import math
-import re
+from collections import Counter
+from typing import Mapping
 
 from packages.domain.models import Chunk
+from packages.domain.tokenization import WORD_COUNTS, word_tokens
 from packages.ports.keyword_search_port import ScoredChunk
 from packages.ports.vector_search_port import VectorSearchPort
 
-_TOKEN_RE = re.compile(r'[a-z0-9]+')
-
-
-
-def _tokens(text: str) -> list[str]:
-    return _TOKEN_RE.findall((text or '').lower())
-
-
-
-def _hashed_embedding(text: str, dim: int) -> list[float]:
+def _hashed_embedding(counts: Mapping[str, int], dim: int) -> list[float]:
     vec = [0.0] * dim
-    for token in _tokens(text):
-        idx = hash(token) % dim
-        vec[idx] += 1.0
+    for token, count in counts.items():
+        vec[hash(token) % dim] += float(count)
 
     norm = math.sqrt(sum(v * v for v in vec))
     if norm == 0:
@@ -49,11 +41,12 @@ class HashVectorSearchAdapter(VectorSearchPort):
         if not chunks or not query.strip() or top_k <= 0:
             return []
 
-        q_vec = _hashed_embedding(query, self._dim)
+        q_vec = _hashed_embedding(Counter(word_tokens(query)), self._dim)
+        stats = WORD_COUNTS.counts((chunk.chunk_id, chunk.content_text) for chunk in chunks)
         scored: list[ScoredChunk] = []
 
-        for chunk in chunks:
-            c_vec = _hashed_embedding(chunk.content_text, self._dim)
+        for chunk, (counts, _) in zip(chunks, stats):
+            c_vec = _hashed_embedding(counts, self._dim)
             score = _cosine(q_vec, c_vec)
             if score > 0:
                 scored.append(ScoredChunk(chunk=chunk, score=score, source='vector'))
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import copy
 import math
 
+from packages.domain.embeddings import chunk_embedding
 from packages.domain.models import Chunk
 from packages.ports.embedding_port import EmbeddingPort
 from packages.ports.keyword_search_port import ScoredChunk
@@ -28,10 +30,18 @@ class MetadataVectorSearchAdapter(VectorSearchPort):
 
     Expected metadata format:
       chunk.metadata['embedding'] -> list[float]
+    or, with ``embedding_key`` set (see ``embedding_model_key``):
+      chunk.metadata['embeddings'][embedding_key] -> list[float]
     """
 
-    def __init__(self, embedding_adapter: EmbeddingPort) -> None:
+    def __init__(self, embedding_adapter: EmbeddingPort, embedding_key: str | None = None) -> None:
         self._embedding_adapter = embedding_adapter
+        self._embedding_key = embedding_key
+
+    def bounded(self, timeout_seconds: float) -> MetadataVectorSearchAdapter:
+        clone = copy.copy(self)
+        clone._embedding_adapter = self._embedding_adapter.bounded(timeout_seconds)
+        return clone
 
     def search(self, query: str, chunks: list[Chunk], top_k: int) -> list[ScoredChunk]:
         if not query.strip() or not chunks or top_k <= 0:
@@ -43,8 +53,8 @@ class MetadataVectorSearchAdapter(VectorSearchPort):
 
         scored: list[ScoredChunk] = []
         for chunk in chunks:
-            embedding = chunk.metadata.get('embedding') if isinstance(chunk.metadata, dict) else None
-            if not isinstance(embedding, list) or not embedding:
+            embedding = chunk_embedding(chunk.metadata, self._embedding_key)
+            if embedding is None:
                 continue
             try:
                 c_vec = _normalize([float(x) for x in embedding])
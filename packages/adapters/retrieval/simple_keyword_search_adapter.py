@@ -1,50 +1,11 @@
 ﻿from __future__ import annotations
 
 import math
-import re
-from collections import Counter, defaultdict
 
 from packages.domain.models import Chunk
+from packages.domain.tokenization import KEYWORD_TERM_COUNTS, keyword_terms
 from packages.ports.keyword_search_port import KeywordSearchPort, ScoredChunk
 
-_TOKEN_RE = re.compile(r'[a-z0-9]+')
-_ALIASES = {
-    'analog': 'analogue',
-    'analogue': 'analogue',
-    'mean': 'description',
-    'meaning': 'description',
-    'descriptions': 'description',
-    'parameters': 'parameter',
-    'signals': 'signal',
-}
-_STOPWORDS = {
-    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'do', 'does', 'for', 'from',
-    'how', 'i', 'in', 'is', 'it', 'of', 'on', 'or', 'that', 'the', 'to', 'what',
-    'when', 'where', 'which', 'why', 'with',
-}
-_COMPOUND_SPLITS = {
-    'acroset': ('acro', 'set'),
-    'torqueset': ('torque', 'set'),
-    'projectaset': ('projecta', 'set'),
-    'clampset': ('clamp', 'set'),
-    'setright': ('set', 'right'),
-}
-
-
-
-def _tokens(text: str) -> list[str]:
-    out: list[str] = []
-    for raw in _TOKEN_RE.findall((text or '').lower()):
-        token = raw
-        if len(token) > 3 and token.endswith('s'):
-            token = token[:-1]
-        token = _ALIASES.get(token, token)
-        if token in _STOPWORDS:
-            continue
-        out.append(token)
-        out.extend(_COMPOUND_SPLITS.get(token, ()))
-    return out
-
 
 class SimpleKeywordSearchAdapter(KeywordSearchPort):
     """BM25-like lexical scoring over in-memory chunks."""
@@ -57,24 +18,22 @@ class SimpleKeywordSearchAdapter(KeywordSearchPort):
         if not chunks or not query.strip() or top_k <= 0:
             return []
 
-        q_terms = _tokens(query)
+        q_terms = keyword_terms(query)
         if not q_terms:
             return []
 
-        docs_tokens = [_tokens(ch.content_text) for ch in chunks]
-        doc_lens = [len(toks) for toks in docs_tokens]
+        stats = KEYWORD_TERM_COUNTS.counts((ch.chunk_id, ch.content_text) for ch in chunks)
+        docs_counts = [tf for tf, _ in stats]
+        doc_lens = [length for _, length in stats]
         avg_len = sum(doc_lens) / max(len(doc_lens), 1)
 
-        df: dict[str, int] = defaultdict(int)
-        for toks in docs_tokens:
-            for term in set(toks):
-                df[term] += 1
+        # Only query terms need a document frequency.
+        df = {term: sum(1 for tf in docs_counts if term in tf) for term in set(q_terms)}
 
         n_docs = len(chunks)
         scored: list[ScoredChunk] = []
 
-        for chunk, toks, doc_len in zip(chunks, docs_tokens, doc_lens):
-            tf = Counter(toks)
+        for chunk, tf, doc_len in zip(chunks, docs_counts, doc_lens):
             score = 0.0
 
             for term in q_terms:
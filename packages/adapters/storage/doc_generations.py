@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import os
+import shutil
+import time
+from pathlib import Path
+from threading import Lock
+from typing import Callable, Iterable
+
+CURRENT_FILE = 'CURRENT'
+GENERATIONS_DIR = 'generations'
+# Files that make up one generation of a doc's derived assets.
+GENERATION_FILES = (
+    'chunks.jsonl',
+    'visual_chunks.jsonl',
+    'visual_embeddings.jsonl',
+    'visual_manifest.json',
+)
+DEFAULT_KEEP_GENERATIONS = 2
+# A replaced generation stays on disk at least this long, so readers that
+# resolved it just before the swap can finish reading it.
+DEFAULT_MIN_GENERATION_AGE_SECONDS = 300.0
+
+_PUBLISH_LOCKS: dict[Path, Lock] = {}
+_PUBLISH_LOCKS_GUARD = Lock()
+
+
+class GenerationConflictError(RuntimeError):
+    """The live generation changed since the caller read the data it is replacing."""
+
+
+def current_generation(doc_dir: Path) -> str | None:
+    try:
+        name = (doc_dir / CURRENT_FILE).read_text(encoding='utf-8').strip()
+    except OSError:
+        return None
+    return name or None
+
+
+def artifact_dir(doc_dir: Path) -> Path:
+    """Directory holding the doc's live chunk and visual files.
+
+    That is the generation named by ``CURRENT``, or ``doc_dir`` itself for docs
+    written before generations existed. Resolve once per read so every file
+    comes from the same generation.
+    """
+    name = current_generation(doc_dir)
+    if name is None:
+        return doc_dir
+    return doc_dir / GENERATIONS_DIR / name
+
+
+def artifact_path(doc_dir: Path, filename: str) -> Path:
+    return artifact_dir(doc_dir) / filename
+
+
+def _link_or_copy(source: Path, target: Path) -> None:
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+
+def _publish_lock(doc_dir: Path) -> Lock:
+    key = doc_dir.resolve()
+    with _PUBLISH_LOCKS_GUARD:
+        return _PUBLISH_LOCKS.setdefault(key, Lock())
+
+
+def publish_generation(
+    doc_dir: Path,
+    write: Callable[[Path], None],
+    *,
+    carry_over: Iterable[str] = (),
+    keep: int = DEFAULT_KEEP_GENERATIONS,
+    min_age_seconds: float = DEFAULT_MIN_GENERATION_AGE_SECONDS,
+    expected: str | None | bool = False,
+) -> Path:
+    """Write a new generation and make it live with one atomic rename of ``CURRENT``.
+
+    ``write`` fills a private staging directory; ``carry_over`` names files
+    reused (hard-linked) from the current generation. With ``expected`` set
+    to a generation name (or ``None`` for a doc without generations), the
+    swap raises ``GenerationConflictError`` if another publish got there
+    first. Replaced generations are pruned once more than ``keep`` exist and
+    they have not been live for ``min_age_seconds``.
+    """
+    generations = doc_dir / GENERATIONS_DIR
+    generations.mkdir(parents=True, exist_ok=True)
+    with _publish_lock(doc_dir):
+        previous = current_generation(doc_dir)
+        if expected is not False and previous != expected:
+            raise GenerationConflictError(f'{doc_dir.name}: generation {expected} was replaced by {previous}')
+        source = artifact_dir(doc_dir)
+
+        name = f'{time.time_ns():020d}-{os.getpid()}'
+        staging = generations / f'.{name}.tmp'
+        staging.mkdir()
+        try:
+            for filename in carry_over:
+                if (source / filename).exists():
+                    _link_or_copy(source / filename, staging / filename)
+            write(staging)
+            os.replace(staging, generations / name)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        pointer_tmp = doc_dir / f'.{CURRENT_FILE}.{name}.tmp'
+        pointer_tmp.write_text(name, encoding='utf-8')
+        os.replace(pointer_tmp, doc_dir / CURRENT_FILE)
+
+        if previous is not None:
+            # Flat pre-generation files are only dropped once a generation has been
+            # live for a whole publish, so readers that resolved them can finish.
+            for filename in GENERATION_FILES:
+                (doc_dir / filename).unlink(missing_ok=True)
+        _prune(generations, keep=keep, current=name, min_age_seconds=min_age_seconds)
+    return generations / name
+
+
+def _published_ns(generations: Path, name: str) -> int:
+    stamp = name.partition('-')[0]
+    if stamp.isdigit():
+        return int(stamp)
+    try:
+        return (generations / name).stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _prune(generations: Path, *, keep: int, current: str, min_age_seconds: float) -> None:
+    names = sorted(
+        path.name for path in generations.iterdir() if path.is_dir() and not path.name.startswith('.')
+    )
+    cutoff = time.time_ns() - int(max(0.0, min_age_seconds) * 1e9)
+    prunable = names[: max(0, len(names) - max(1, keep))]
+    for name, successor in zip(prunable, names[1:]):
+        # A generation stopped being live when its successor was published.
+        if name == current or _published_ns(generations, successor) > cutoff:
+            continue
+        shutil.rmtree(generations / name, ignore_errors=True)
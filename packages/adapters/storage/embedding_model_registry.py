@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import json
+import os
+from datetime import UTC, datetime
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+REGISTRY_FILE = '_embedding_models.json'
+
+
+class EmbeddingModelRegistry:
+    """Which embedding model search uses, plus per-model migration progress.
+
+    Stored as ``_embedding_models.json`` under the assets root and replaced
+    atomically, so flipping the active model is a single rename. With no
+    active model, search keeps using each chunk's legacy ``embedding`` field.
+    """
+
+    def __init__(self, assets_dir: Path) -> None:
+        self._assets_dir = assets_dir
+        self._lock = Lock()
+        self._stamp: tuple[int, int] | None = None
+        self._payload: dict[str, Any] = {}
+
+    @property
+    def path(self) -> Path:
+        return self._assets_dir / REGISTRY_FILE
+
+    def _read(self) -> dict[str, Any]:
+        try:
+            stat = self.path.stat()
+        except OSError:
+            self._stamp, self._payload = None, {}
+            return {}
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp != self._stamp:
+            try:
+                payload = json.loads(self.path.read_text(encoding='utf-8'))
+            except (OSError, json.JSONDecodeError):
+                payload = {}
+            self._stamp, self._payload = stamp, payload if isinstance(payload, dict) else {}
+        return self._payload
+
+    def _write(self, payload: dict[str, Any]) -> None:
+        self._assets_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f'.{REGISTRY_FILE}.{os.getpid()}.tmp')
+        tmp.write_text(json.dumps(payload, ensure_ascii=True, indent=2, sort_keys=True), encoding='utf-8')
+        os.replace(tmp, self.path)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            payload = self._read()
+            return {
+                'active': payload.get('active'),
+                'migrations': dict(payload.get('migrations') or {}),
+            }
+
+    def active(self) -> dict[str, Any] | None:
+        active = self.snapshot()['active']
+        return active if isinstance(active, dict) and active.get('key') else None
+
+    def migration(self, embedding_key: str) -> dict[str, Any] | None:
+        return self.snapshot()['migrations'].get(embedding_key)
+
+    def record_migration(self, embedding_key: str, progress: dict[str, Any]) -> None:
+        with self._lock:
+            payload = dict(self._read())
+            migrations = dict(payload.get('migrations') or {})
+            migrations[embedding_key] = {
+                **dict(migrations.get(embedding_key) or {}),
+                **progress,
+                'updated_at': datetime.now(UTC).isoformat(),
+            }
+            payload['migrations'] = migrations
+            self._write(payload)
+
+    def activate(self, embedding_key: str, *, provider: str, model: str) -> dict[str, Any]:
+        active = {
+            'key': embedding_key,
+            'provider': provider,
+            'model': model,
+            'activated_at': datetime.now(UTC).isoformat(),
+        }
+        with self._lock:
+            payload = dict(self._read())
+            payload['active'] = active
+            self._write(payload)
+        return active
+
+    def deactivate(self) -> None:
+        with self._lock:
+            payload = dict(self._read())
+            payload['active'] = None
+            self._write(payload)
@@ -1,11 +1,18 @@
 ﻿from __future__ import annotations
 
 import json
-from dataclasses import asdict
+from dataclasses import asdict, fields
 from pathlib import Path
 
+from packages.adapters.data_contracts.visual_artifact_generation import stage_visual_artifacts
+from packages.adapters.storage.doc_generations import (
+    GenerationConflictError,
+    artifact_path,
+    current_generation,
+    publish_generation,
+)
 from packages.domain.models import Chunk
-from packages.ports.chunk_store_port import ChunkStorePort
+from packages.ports.chunk_store_port import ChunkStoreConflictError, ChunkStorePort
 
 
 class FilesystemChunkStoreAdapter(ChunkStorePort):
@@ -13,13 +20,48 @@ class FilesystemChunkStoreAdapter(ChunkStorePort):
         self._base_dir = base_dir
 
     def persist(self, doc_id: str, chunks: list[Chunk]) -> str:
-        out_dir = self._base_dir / doc_id
-        out_dir.mkdir(parents=True, exist_ok=True)
+        return self._publish(doc_id, chunks)
 
-        out_path = out_dir / 'chunks.jsonl'
-        with out_path.open('w', encoding='utf-8') as fh:
-            for chunk in chunks:
-                fh.write(json.dumps(asdict(chunk), ensure_ascii=True))
-                fh.write('\n')
+    def persist_if_unchanged(self, doc_id: str, chunks: list[Chunk], version: str | None) -> str:
+        try:
+            return self._publish(doc_id, chunks, expected=version)
+        except GenerationConflictError as exc:
+            raise ChunkStoreConflictError(str(exc)) from exc
 
-        return str(out_path)
+    def version(self, doc_id: str) -> str | None:
+        """The live generation of ``doc_id``."""
+        return current_generation(self._base_dir / doc_id)
+
+    def _publish(self, doc_id: str, chunks: list[Chunk], expected: str | None | bool = False) -> str:
+        """Publish ``chunks.jsonl`` and its visual artifacts as one new generation.
+
+        Readers never see a partial file, nor chunks paired with another
+        generation's visual files.
+        """
+
+        def _write(out_dir: Path) -> None:
+            lines = [json.dumps(asdict(chunk), ensure_ascii=True) for chunk in chunks]
+            with (out_dir / 'chunks.jsonl').open('w', encoding='utf-8') as fh:
+                for line in lines:
+                    fh.write(line)
+                    fh.write('\n')
+            # Derived from the rows exactly as they read back from disk.
+            stage_visual_artifacts(out_dir, doc_id, [json.loads(line) for line in lines])
+
+        generation = publish_generation(self._base_dir / doc_id, _write, expected=expected)
+        return str(generation / 'chunks.jsonl')
+
+    def load(self, doc_id: str) -> list[Chunk]:
+        """Chunks last persisted for ``doc_id``; empty when none were written."""
+        path = artifact_path(self._base_dir / doc_id, 'chunks.jsonl')
+        if not path.exists():
+            return []
+        valid_keys = {f.name for f in fields(Chunk)}
+        chunks: list[Chunk] = []
+        with path.open('r', encoding='utf-8') as fh:
+            for line in fh:
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                chunks.append(Chunk(**{key: row.get(key) for key in valid_keys if key in row}))
+        return chunks
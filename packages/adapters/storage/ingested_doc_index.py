@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from datetime import UTC, datetime
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+from packages.adapters.data_contracts.visual_artifacts import validate_visual_artifacts_for_doc
+from packages.adapters.storage.doc_generations import CURRENT_FILE, GENERATION_FILES, artifact_dir
+from packages.adapters.storage.ingestion_run_log import INGESTION_RUNS_FILE
+
+SUMMARY_FILE = 'doc_summary.json'
+INDEX_FILE = '_library_index.json'
+# Doc-level files a summary is derived from, next to the current generation's
+# files; their (mtime, size) is the staleness fingerprint.
+_DOC_SOURCE_FILES = (CURRENT_FILE, INGESTION_RUNS_FILE)
+
+
+def _write_json_atomic(path: Path, payload: object) -> None:
+    tmp = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    tmp.write_text(json.dumps(payload, ensure_ascii=True, sort_keys=True), encoding='utf-8')
+    os.replace(tmp, path)
+
+
+def _read_json(path: Path) -> dict[str, Any] | None:
+    try:
+        payload = json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, json.JSONDecodeError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def _fingerprint(doc_dir: Path) -> list[list[object]]:
+    out: list[list[object]] = []
+    artifacts = artifact_dir(doc_dir)
+    sources = [(name, artifacts / name) for name in GENERATION_FILES]
+    sources.extend((name, doc_dir / name) for name in _DOC_SOURCE_FILES)
+    for name, path in sources:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        out.append([name, stat.st_mtime_ns, stat.st_size])
+    return out
+
+
+def _count_chunks(chunks_path: Path) -> tuple[int, dict[str, int]]:
+    total = 0
+    by_type: dict[str, int] = {}
+    if not chunks_path.exists():
+        return total, by_type
+    with chunks_path.open('r', encoding='utf-8') as fh:
+        for line in fh:
+            if not line.strip():
+                continue
+            total += 1
+            try:
+                row = json.loads(line)
+                content_type = str(row.get('content_type') or 'unknown')
+            except json.JSONDecodeError:
+                content_type = 'invalid'
+            by_type[content_type] = by_type.get(content_type, 0) + 1
+    return total, by_type
+
+
+def _run_history(runs_path: Path) -> tuple[int, dict[str, Any] | None]:
+    if not runs_path.exists():
+        return 0, None
+    count = 0
+    latest: dict[str, Any] | None = None
+    for raw in runs_path.read_text(encoding='utf-8').splitlines():
+        if not raw.strip():
+            continue
+        try:
+            payload = json.loads(raw)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(payload, dict):
+            count += 1
+            latest = payload
+    return count, latest
+
+
+class IngestedDocIndex:
+    """Per-doc summaries of ingested assets plus a library-level index.
+
+    Each doc directory gets a ``doc_summary.json`` (chunk counts by type,
+    visual counts, visual contract result, latest ingestion run) and
+    ``_library_index.json`` under the assets root collects them. Entries
+    carry a fingerprint of their source files, so docs written by other
+    processes (worker, scripts) are re-summarized on the next listing
+    instead of being served stale.
+    """
+
+    def __init__(self, assets_dir: Path) -> None:
+        self._assets_dir = assets_dir
+        self._lock = Lock()
+
+    @property
+    def index_path(self) -> Path:
+        return self._assets_dir / INDEX_FILE
+
+    def build_summary(self, doc_id: str) -> dict[str, Any]:
+        """Full scan of one doc's assets; what ``refresh`` persists."""
+        doc_dir = self._assets_dir / doc_id
+        artifacts = artifact_dir(doc_dir)
+        chunks_path = artifacts / 'chunks.jsonl'
+        total_chunks, by_type = _count_chunks(chunks_path)
+
+        manifest = _read_json(artifacts / 'visual_manifest.json') or {}
+        try:
+            visual_chunk_count = int(manifest.get('visual_chunk_count') or 0)
+            visual_embedding_count = int(manifest.get('embedding_count') or 0)
+        except (TypeError, ValueError):
+            visual_chunk_count = 0
+            visual_embedding_count = 0
+
+        validation = validate_visual_artifacts_for_doc(doc_dir, strict=False)
+        run_count, latest_run = _run_history(doc_dir / INGESTION_RUNS_FILE)
+        fingerprint = _fingerprint(doc_dir)
+        latest_mtime_ns = max((int(row[1]) for row in fingerprint), default=0)
+        if not latest_mtime_ns:
+            latest_mtime_ns = doc_dir.stat().st_mtime_ns
+        return {
+            'doc_id': doc_id,
+            'total_chunks': total_chunks,
+            'by_type': by_type,
+            'asset_path': str(chunks_path) if chunks_path.exists() else None,
+            'updated_at': datetime.fromtimestamp(latest_mtime_ns / 1e9, tz=UTC).isoformat(),
+            'visual_chunk_count': visual_chunk_count,
+            'visual_embedding_count': visual_embedding_count,
+            'visual_contract_valid': validation.is_valid(),
+            'visual_contract_error_count': len(validation.errors),
+            'visual_contract_warning_count': len(validation.warnings),
+            'ingestion_run_count': run_count,
+            'latest_ingestion_run': latest_run,
+            'fingerprint': fingerprint,
+        }
+
+    def _load_index(self) -> dict[str, dict[str, Any]]:
+        payload = _read_json(self.index_path) or {}
+        docs = payload.get('documents')
+        return docs if isinstance(docs, dict) else {}
+
+    def _save_index(self, docs: dict[str, dict[str, Any]]) -> None:
+        self._assets_dir.mkdir(parents=True, exist_ok=True)
+        _write_json_atomic(self.index_path, {'documents': docs})
+
+    def refresh(self, doc_id: str) -> dict[str, Any]:
+        """Re-summarize ``doc_id`` and persist both its summary and the index entry."""
+        summary = self.build_summary(doc_id)
+        with self._lock:
+            _write_json_atomic(self._assets_dir / doc_id / SUMMARY_FILE, summary)
+            docs = self._load_index()
+            docs[doc_id] = summary
+            self._save_index(docs)
+        return summary
+
+    def remove(self, doc_id: str) -> None:
+        with self._lock:
+            docs = self._load_index()
+            if docs.pop(doc_id, None) is not None:
+                self._save_index(docs)
+
+    def list_summaries(self) -> list[dict[str, Any]]:
+        """Current summaries sorted by doc_id: one stat pass per doc, rescans only stale docs."""
+        if not self._assets_dir.exists():
+            return []
+        doc_ids = sorted(p.name for p in self._assets_dir.iterdir() if p.is_dir())
+        with self._lock:
+            indexed = self._load_index()
+            docs: dict[str, dict[str, Any]] = {}
+            changed = set(indexed) != set(doc_ids)
+            for doc_id in doc_ids:
+                doc_dir = self._assets_dir / doc_id
+                fingerprint = _fingerprint(doc_dir)
+                summary = indexed.get(doc_id)
+                if summary is None or summary.get('fingerprint') != fingerprint:
+                    summary = _read_json(doc_dir / SUMMARY_FILE)
+                    if summary is None or summary.get('fingerprint') != fingerprint:
+                        summary = self.build_summary(doc_id)
+                        _write_json_atomic(doc_dir / SUMMARY_FILE, summary)
+                    changed = True
+                docs[doc_id] = summary
+            if changed:
+                self._save_index(docs)
+        return [docs[doc_id] for doc_id in doc_ids]
+
+
+def summaries_etag(payload: object) -> str:
+    digest = hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode('utf-8'))
+    return f'"{digest.hexdigest()[:32]}"'
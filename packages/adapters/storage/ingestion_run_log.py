@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+from packages.adapters.data_contracts.visual_artifacts import validate_visual_artifacts_for_doc
+from packages.adapters.pdf.factory import resolve_pdf_parser
+from packages.adapters.storage.doc_generations import artifact_path
+
+INGESTION_RUNS_FILE = 'ingestion_runs.jsonl'
+# Snapshot keys that change how ingestion runs but not what it writes; ignored by ``run_is_current``.
+_OUTPUT_NEUTRAL_CONFIG_KEYS = frozenset(
+    {
+        'ingest_page_workers',
+        'use_agentic_mode',
+        'agentic_provider',
+        'embedding_timeout_seconds',
+        'embedding_max_retries',
+        'embedding_retry_backoff_seconds',
+        'embedding_min_coverage',
+        'embedding_fail_fast',
+    }
+)
+
+# Output keys that only affect chunk embeddings; when nothing else changed a reingest just re-embeds.
+_EMBEDDING_CONFIG_KEYS = frozenset(
+    {'embedding_provider', 'embedding_model', 'embedding_second_pass_max_chars'}
+)
+
+
+def sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open('rb') as fh:
+        for chunk in iter(lambda: fh.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def ingestion_config_snapshot(cfg) -> dict[str, object]:
+    return {
+        # The parser actually used, which differs from PDF_PARSER when PyMuPDF is missing.
+        'pdf_parser': resolve_pdf_parser(cfg.pdf_parser),
+        'ocr_engine': cfg.ocr_engine,
+        'ocr_fallback_engine': cfg.ocr_fallback_engine,
+        'embedding_provider': cfg.embedding_provider,
+        'embedding_model': cfg.embedding_model,
+        'embedding_timeout_seconds': cfg.embedding_timeout_seconds,
+        'embedding_max_retries': cfg.embedding_max_retries,
+        'embedding_retry_backoff_seconds': cfg.embedding_retry_backoff_seconds,
+        'embedding_min_coverage': cfg.embedding_min_coverage,
+        'embedding_fail_fast': cfg.embedding_fail_fast,
+        'embedding_second_pass_max_chars': cfg.embedding_second_pass_max_chars,
+        'vision_enabled': cfg.use_vision_ingestion,
+        'vision_provider': cfg.vision_provider,
+        'vision_model': cfg.vision_model,
+        'vision_max_pages': cfg.vision_max_pages,
+        'ingest_page_workers': cfg.ingest_page_workers,
+        'chunk_max_tokens': cfg.chunk_max_tokens,
+        'chunk_overlap_tokens': cfg.chunk_overlap_tokens,
+        'use_agentic_mode': cfg.use_agentic_mode,
+        'agentic_provider': cfg.agentic_provider,
+    }
+
+
+def _output_config(snapshot: object) -> dict[str, object]:
+    if not isinstance(snapshot, dict):
+        return {}
+    return {key: value for key, value in snapshot.items() if key not in _OUTPUT_NEUTRAL_CONFIG_KEYS}
+
+
+def run_is_current(
+    run: dict[str, Any] | None,
+    *,
+    pdf_sha256: str,
+    config_snapshot: dict[str, object],
+) -> bool:
+    """True when ``run`` ingested this exact PDF with settings that produce the same assets."""
+    if not run or not pdf_sha256:
+        return False
+    if str(run.get('pdf_sha256') or '') != pdf_sha256:
+        return False
+    return _output_config(run.get('config')) == _output_config(config_snapshot)
+
+
+def plan_reingest(
+    run: dict[str, Any] | None,
+    *,
+    pdf_sha256: str,
+    config_snapshot: dict[str, object],
+    chunks_present: bool,
+    visual_artifacts_valid: bool,
+) -> str:
+    """Cheapest rerun that brings a doc up to date.
+
+    ``skip`` when nothing changed, ``visual_artifacts`` when only the derived
+    visual files are missing or invalid, ``embeddings`` when the PDF is the same
+    and only embedding settings changed, otherwise ``full``.
+    """
+    if not run or not pdf_sha256 or not chunks_present:
+        return 'full'
+    if str(run.get('pdf_sha256') or '') != pdf_sha256:
+        return 'full'
+    previous = _output_config(run.get('config'))
+    current = _output_config(config_snapshot)
+    changed = {key for key in previous.keys() | current.keys() if previous.get(key) != current.get(key)}
+    if changed:
+        return 'embeddings' if changed <= _EMBEDDING_CONFIG_KEYS else 'full'
+    return 'skip' if visual_artifacts_valid else 'visual_artifacts'
+
+
+def build_ingestion_run_row(
+    *,
+    doc_id: str,
+    pdf_path: Path,
+    source: str,
+    filename: str | None,
+    pdf_sha256: str,
+    config_snapshot: dict[str, object],
+    ingestion_result: dict[str, Any],
+    visual_artifacts: dict[str, Any],
+    mode: str = 'full',
+) -> dict[str, object]:
+    now = datetime.now(UTC)
+    return {
+        'run_id': now.strftime('%Y%m%d%H%M%S'),
+        'ts': now.isoformat(),
+        'source': source,
+        'mode': mode,
+        'doc_id': doc_id,
+        'filename': filename or pdf_path.name,
+        'pdf_path': str(pdf_path),
+        'pdf_sha256': pdf_sha256,
+        'config': config_snapshot,
+        'result': {
+            'total_chunks': int(ingestion_result.get('total_chunks') or 0),
+            'by_type': ingestion_result.get('by_type') or {},
+            'embedding_attempted': bool(ingestion_result.get('embedding_attempted', False)),
+            'embedding_success_count': int(ingestion_result.get('embedding_success_count') or 0),
+            'embedding_failed_count': int(ingestion_result.get('embedding_failed_count') or 0),
+            'embedding_coverage': float(ingestion_result.get('embedding_coverage') or 0.0),
+            'embedding_second_pass_attempted': bool(
+                ingestion_result.get('embedding_second_pass_attempted', False)
+            ),
+            'embedding_second_pass_recovered': int(
+                ingestion_result.get('embedding_second_pass_recovered') or 0
+            ),
+            'embedding_failure_reason_count': int(
+                ingestion_result.get('embedding_failure_reason_count')
+                or len(ingestion_result.get('embedding_failure_reasons') or {})
+            ),
+            'embedding_warning_count': int(ingestion_result.get('embedding_warning_count') or 0),
+            'visual_chunk_count': int(visual_artifacts.get('visual_chunk_count') or 0),
+            'embedding_count': int(visual_artifacts.get('embedding_count') or 0),
+            'validation_valid': bool(
+                (visual_artifacts.get('validation') or {}).get('valid', False)
+            ),
+        },
+    }
+
+
+class IngestionRunLog:
+    """Append-only ``ingestion_runs.jsonl`` per doc under the assets root."""
+
+    def __init__(self, assets_dir: Path) -> None:
+        self._assets_dir = assets_dir
+        self._lock = Lock()
+
+    def path(self, doc_id: str) -> Path:
+        return self._assets_dir / doc_id / INGESTION_RUNS_FILE
+
+    def append(self, doc_id: str, row: dict[str, object]) -> None:
+        out_path = self.path(doc_id)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, out_path.open('a', encoding='utf-8') as fh:
+            fh.write(json.dumps(row, ensure_ascii=True))
+            fh.write('\n')
+
+    def list_runs(self, doc_id: str, limit: int = 20) -> list[dict[str, Any]]:
+        """Newest first."""
+        path = self.path(doc_id)
+        if not path.exists():
+            return []
+
+        rows: list[dict[str, Any]] = []
+        for raw in path.read_text(encoding='utf-8').splitlines():
+            text = raw.strip()
+            if not text:
+                continue
+            try:
+                payload = json.loads(text)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(payload, dict):
+                rows.append(payload)
+        rows.reverse()
+        return rows[: max(1, limit)]
+
+    def latest(self, doc_id: str) -> dict[str, Any] | None:
+        rows = self.list_runs(doc_id, limit=1)
+        return rows[0] if rows else None
+
+    def is_current(
+        self,
+        doc_id: str,
+        *,
+        pdf_sha256: str,
+        config_snapshot: dict[str, object],
+    ) -> bool:
+        """Latest run matches and its chunks and visual artifacts are still on disk."""
+        return self.plan(doc_id, pdf_sha256=pdf_sha256, config_snapshot=config_snapshot) == 'skip'
+
+    def plan(
+        self,
+        doc_id: str,
+        *,
+        pdf_sha256: str,
+        config_snapshot: dict[str, object],
+    ) -> str:
+        """``plan_reingest`` against the latest run and the doc's current assets."""
+        doc_dir = self._assets_dir / doc_id
+        chunks_present = artifact_path(doc_dir, 'chunks.jsonl').exists()
+        return plan_reingest(
+            self.latest(doc_id),
+            pdf_sha256=pdf_sha256,
+            config_snapshot=config_snapshot,
+            chunks_present=chunks_present,
+            visual_artifacts_valid=(
+                chunks_present and validate_visual_artifacts_for_doc(doc_dir, strict=True).is_valid()
+            ),
+        )
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+UPLOAD_INDEX_FILE = '_upload_index.json'
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+
+
+class UploadTooLargeError(ValueError):
+    pass
+
+
+class StagedUpload:
+    """An upload being written to a private staging file, hashed as it streams in."""
+
+    def __init__(self, path: Path, max_bytes: int) -> None:
+        self.path = path
+        self.size = 0
+        self._max_bytes = max_bytes
+        self._digest = hashlib.sha256()
+        self._handle = path.open('wb')
+
+    @property
+    def sha256(self) -> str:
+        return self._digest.hexdigest()
+
+    def write(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if self._max_bytes > 0 and self.size > self._max_bytes:
+            raise UploadTooLargeError(f'Upload exceeds {self._max_bytes} bytes')
+        self._digest.update(chunk)
+        self._handle.write(chunk)
+
+    def close(self) -> None:
+        if not self._handle.closed:
+            self._handle.close()
+
+    def discard(self) -> None:
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+
+class UploadStore:
+    """Uploaded PDFs under ``uploads_dir`` plus a sha256 -> doc index for dedup.
+
+    Uploads stream into a staging file and are renamed to ``<doc_id>.pdf`` on
+    commit, so a partial upload never shows up under a doc id. The index is
+    ``_upload_index.json``, replaced atomically.
+    """
+
+    def __init__(self, uploads_dir: Path) -> None:
+        self._uploads_dir = uploads_dir
+        self._lock = Lock()
+
+    @property
+    def index_path(self) -> Path:
+        return self._uploads_dir / UPLOAD_INDEX_FILE
+
+    def _read(self) -> dict[str, Any]:
+        try:
+            payload = json.loads(self.index_path.read_text(encoding='utf-8'))
+        except (OSError, json.JSONDecodeError):
+            return {}
+        return payload if isinstance(payload, dict) else {}
+
+    def _write(self, payload: dict[str, Any]) -> None:
+        tmp = self.index_path.with_name(f'.{UPLOAD_INDEX_FILE}.{os.getpid()}.tmp')
+        tmp.write_text(json.dumps(payload, ensure_ascii=True, indent=2, sort_keys=True), encoding='utf-8')
+        os.replace(tmp, self.index_path)
+
+    def stage(self, *, max_bytes: int = 0) -> StagedUpload:
+        self._uploads_dir.mkdir(parents=True, exist_ok=True)
+        return StagedUpload(self._uploads_dir / f'.upload-{uuid.uuid4().hex}.part', max_bytes)
+
+    def find(self, sha256: str) -> dict[str, Any] | None:
+        """The earlier upload with this content hash, if its PDF is still on disk."""
+        with self._lock:
+            entry = self._read().get(sha256)
+        if not isinstance(entry, dict) or not entry.get('doc_id'):
+            return None
+        if not (self._uploads_dir / f"{entry['doc_id']}.pdf").exists():
+            return None
+        return entry
+
+    def pdf_path(self, doc_id: str) -> Path:
+        return self._uploads_dir / f'{doc_id}.pdf'
+
+    def commit(self, staged: StagedUpload, *, doc_id: str, filename: str | None) -> Path:
+        staged.close()
+        target = self.pdf_path(doc_id)
+        os.replace(staged.path, target)
+        with self._lock:
+            payload = self._read()
+            payload[staged.sha256] = {
+                'doc_id': doc_id,
+                'filename': filename,
+                'size_bytes': staged.size,
+                'uploaded_at': datetime.now(UTC).isoformat(),
+            }
+            self._write(payload)
+        return target
@@ -17,18 +17,21 @@ class SimpleTableExtractorAdapter(TableExtractorPort):
     _KEY_VALUE_PATTERN = re.compile(
         r'^[A-Za-z][A-Za-z0-9\-/()\s]{2,}:\s*[-+]?\d+(?:\.\d+)?\s*(?:[A-Za-z%/]+)?$'
     )
+    _COLUMN_GAP_PATTERN = re.compile(r'\s{2,}')
+    _NUMBER_PATTERN = re.compile(r'[-+]?\d+(?:\.\d+)?')
+    _WORD_PATTERN = re.compile(r'[A-Za-z]{2,}')
 
     def extract(self, page_text: str, page_number: int) -> list[ExtractedTable]:
-        lines = [line.rstrip() for line in page_text.splitlines() if line.strip()]
-        if not lines:
-            return []
+        groups: list[list[tuple[str, str]]] = []
+        current: list[tuple[str, str]] = []
 
-        groups: list[list[str]] = []
-        current: list[str] = []
-
-        for line in lines:
-            if self._looks_tabular(line):
-                current.append(line.strip())
+        for raw_line in page_text.splitlines():
+            line = raw_line.strip()
+            if not line:
+                continue
+            kind = self._classify(line)
+            if kind is not None:
+                current.append((kind, line))
             else:
                 if len(current) >= 2:
                     groups.append(current)
@@ -37,53 +40,37 @@ class SimpleTableExtractorAdapter(TableExtractorPort):
         if len(current) >= 2:
             groups.append(current)
 
-        tables: list[ExtractedTable] = []
-        for idx, group in enumerate(groups, start=1):
-            table_text = self._normalize_group(group)
-            tables.append(
-                ExtractedTable(
-                    table_id=f'table-p{page_number:04d}-{idx:03d}',
-                    page_number=page_number,
-                    text=table_text,
-                )
+        return [
+            ExtractedTable(
+                table_id=f'table-p{page_number:04d}-{idx:03d}',
+                page_number=page_number,
+                text='\n'.join(self._normalize(kind, line) for kind, line in group),
             )
-
-        return tables
-
-    def _looks_tabular(self, line: str) -> bool:
-        s = line.strip()
-        if not s:
-            return False
-        if '|' in s:
-            return True
-        if self._KEY_VALUE_PATTERN.match(s):
-            return True
-
-        cols = [c for c in re.split(r'\s{2,}', s) if c]
-        if len(cols) >= 3:
-            return True
-
+            for idx, group in enumerate(groups, start=1)
+        ]
+
+    def _classify(self, line: str) -> str | None:
+        """Row kind of a stripped line: ``pipe``, ``key_value``, ``columns``, ``numeric`` or ``None``.
+
+        Checks run cheapest first and stop at the first hit; the row kind is
+        kept so normalization does not re-match the line.
+        """
+        if '|' in line:
+            return 'pipe'
+        if ':' in line and self._KEY_VALUE_PATTERN.match(line):
+            return 'key_value'
+        # A stripped line with 2+ column gaps has 3+ columns.
+        if len(self._COLUMN_GAP_PATTERN.findall(line)) >= 2:
+            return 'columns'
         # Numeric-heavy rows often indicate parameter tables.
-        numeric_tokens = re.findall(r'[-+]?\d+(?:\.\d+)?', s)
-        alpha_tokens = re.findall(r'[A-Za-z]{2,}', s)
-        return len(numeric_tokens) >= 2 and len(alpha_tokens) >= 1
-
-    def _normalize_group(self, lines: list[str]) -> str:
-        normalized: list[str] = []
-        for line in lines:
-            if '|' in line:
-                normalized.append(line)
-                continue
-
-            if ':' in line and self._KEY_VALUE_PATTERN.match(line):
-                label, value = line.split(':', 1)
-                normalized.append(f'{label.strip()} | {value.strip()}')
-                continue
-
-            cols = [c.strip() for c in re.split(r'\s{2,}', line) if c.strip()]
-            if len(cols) >= 3:
-                normalized.append(' | '.join(cols))
-            else:
-                normalized.append(line.strip())
-
-        return '\n'.join(normalized)
+        if len(self._NUMBER_PATTERN.findall(line)) >= 2 and self._WORD_PATTERN.search(line):
+            return 'numeric'
+        return None
+
+    def _normalize(self, kind: str, line: str) -> str:
+        if kind == 'key_value':
+            label, value = line.split(':', 1)
+            return f'{label.strip()} | {value.strip()}'
+        if kind == 'columns':
+            return ' | '.join(col for col in self._COLUMN_GAP_PATTERN.split(line) if col)
+        return line
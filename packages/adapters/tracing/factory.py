@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import atexit
+from pathlib import Path
+from threading import Lock
+
+from packages.adapters.tracing.jsonl_trace_writer import (
+    BufferedTraceWriter,
+    JsonlTraceWriter,
+    RotatingJsonlFile,
+    TraceWriter,
+)
+
+_WRITERS: dict[Path, TraceWriter] = {}
+_WRITERS_LOCK = Lock()
+
+
+def create_trace_writer(
+    trace_file: Path,
+    *,
+    buffered: bool = True,
+    queue_size: int = 10000,
+    batch_size: int = 256,
+    flush_interval_seconds: float = 1.0,
+    max_bytes: int = 0,
+    rotate_interval_seconds: float = 0.0,
+    gzip_rotated: bool = False,
+    max_files: int = 10,
+) -> TraceWriter:
+    """Return the process-wide writer for ``trace_file``, creating it on first use.
+
+    One writer per file keeps a single open handle (and, when buffered, a
+    single writer thread) however many loggers are built per request; the
+    settings of the first call for a path win.
+    """
+    key = trace_file.resolve()
+    with _WRITERS_LOCK:
+        writer = _WRITERS.get(key)
+        if writer is None:
+            sink = RotatingJsonlFile(
+                trace_file,
+                max_bytes=max_bytes,
+                rotate_interval_seconds=rotate_interval_seconds,
+                gzip_rotated=gzip_rotated,
+                max_files=max_files,
+            )
+            if buffered:
+                writer = BufferedTraceWriter(
+                    sink,
+                    queue_size=queue_size,
+                    batch_size=batch_size,
+                    flush_interval_seconds=flush_interval_seconds,
+                )
+            else:
+                writer = JsonlTraceWriter(sink)
+            _WRITERS[key] = writer
+        return writer
+
+
+def trace_writer_stats() -> dict[str, dict[str, int]]:
+    with _WRITERS_LOCK:
+        writers = dict(_WRITERS)
+    return {path.name: writer.stats() for path, writer in writers.items()}
+
+
+def flush_trace_writers(timeout_seconds: float | None = 5.0) -> bool:
+    with _WRITERS_LOCK:
+        writers = list(_WRITERS.values())
+    return all([writer.flush(timeout_seconds) for writer in writers])
+
+
+def close_trace_writers() -> None:
+    with _WRITERS_LOCK:
+        writers = list(_WRITERS.values())
+        _WRITERS.clear()
+    for writer in writers:
+        writer.close()
+
+
+atexit.register(close_trace_writers)
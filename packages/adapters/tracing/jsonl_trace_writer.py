@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import gzip
+import os
+import queue
+import shutil
+import time
+from abc import ABC, abstractmethod
+from datetime import UTC, datetime
+from pathlib import Path
+from threading import Event, Lock, Thread
+from typing import TextIO
+
+
+class TraceWriter(ABC):
+    """Destination for serialized trace records (one JSON line each)."""
+
+    @abstractmethod
+    def write_line(self, line: str) -> None:
+        raise NotImplementedError
+
+    def flush(self, timeout_seconds: float | None = None) -> bool:
+        """Block until accepted lines are on disk; ``False`` if that timed out."""
+        _ = timeout_seconds
+        return True
+
+    def close(self) -> None:
+        return None
+
+    def stats(self) -> dict[str, int]:
+        return {}
+
+
+class RotatingJsonlFile:
+    """Append-only JSONL file held open between writes, rotated by size and/or age.
+
+    Rotated files are renamed to ``<stem>.<UTC timestamp><suffix>`` (gzipped
+    when ``gzip_rotated``) and only the newest ``max_files`` are kept.
+    ``max_bytes`` / ``rotate_interval_seconds`` of ``0`` disable that trigger.
+    Not thread-safe; callers serialize access.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        max_bytes: int = 0,
+        rotate_interval_seconds: float = 0.0,
+        gzip_rotated: bool = False,
+        max_files: int = 10,
+    ) -> None:
+        self._path = path
+        self._max_bytes = max(0, int(max_bytes))
+        self._rotate_interval_seconds = max(0.0, float(rotate_interval_seconds))
+        self._gzip_rotated = gzip_rotated
+        self._max_files = max(1, int(max_files))
+        self._fh: TextIO | None = None
+        self._size = 0
+        self._opened_at = 0.0
+        self.rotations = 0
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def _open(self) -> TextIO:
+        if self._fh is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = self._path.open('a', encoding='utf-8')
+            self._size = self._fh.tell()
+            self._opened_at = time.monotonic()
+        return self._fh
+
+    def _due(self, incoming: int) -> bool:
+        if self._size <= 0:
+            return False
+        if self._max_bytes and self._size + incoming > self._max_bytes:
+            return True
+        return bool(
+            self._rotate_interval_seconds
+            and time.monotonic() - self._opened_at >= self._rotate_interval_seconds
+        )
+
+    def write_lines(self, lines: list[str]) -> None:
+        if not lines:
+            return
+        data = ''.join(lines)
+        self._open()
+        if self._due(len(data)):
+            self.rotate()
+        fh = self._open()
+        fh.write(data)
+        fh.flush()
+        self._size += len(data)
+
+    def rotate(self) -> None:
+        self.close()
+        if not self._path.exists():
+            return
+        stamp = datetime.now(UTC).strftime('%Y%m%dT%H%M%S%f')
+        target = self._path.with_name(f'{self._path.stem}.{stamp}{self._path.suffix}')
+        serial = 0
+        while target.exists() or Path(f'{target}.gz').exists():
+            serial += 1
+            target = self._path.with_name(f'{self._path.stem}.{stamp}-{serial}{self._path.suffix}')
+        os.replace(self._path, target)
+        if self._gzip_rotated:
+            with target.open('rb') as src, gzip.open(f'{target}.gz', 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+            target.unlink()
+        self.rotations += 1
+        self._prune()
+
+    def _prune(self) -> None:
+        pattern = f'{self._path.stem}.*{self._path.suffix}*'
+        rotated = sorted(
+            (p for p in self._path.parent.glob(pattern) if p != self._path),
+            key=lambda p: p.name,
+        )
+        for stale in rotated[: max(0, len(rotated) - self._max_files)]:
+            stale.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+            self._size = 0
+
+
+class JsonlTraceWriter(TraceWriter):
+    """Synchronous writer: each line is on disk when ``write_line`` returns."""
+
+    def __init__(self, sink: RotatingJsonlFile) -> None:
+        self._sink = sink
+        self._lock = Lock()
+        self._written = 0
+
+    def write_line(self, line: str) -> None:
+        # One write per record under a lock so concurrent evaluators never interleave lines.
+        with self._lock:
+            self._sink.write_lines([line])
+            self._written += 1
+
+    def close(self) -> None:
+        with self._lock:
+            self._sink.close()
+
+    def stats(self) -> dict[str, int]:
+        return {'written': self._written, 'dropped': 0, 'queued': 0, 'rotations': self._sink.rotations}
+
+
+_STOP = object()
+
+
+class BufferedTraceWriter(TraceWriter):
+    """Non-blocking writer: a bounded queue drained by one background thread.
+
+    ``write_line`` never touches disk; when the queue is full the line is
+    dropped and counted instead of stalling the request. The writer thread
+    appends up to ``batch_size`` lines per write, waiting at most
+    ``flush_interval_seconds`` to fill a batch.
+    """
+
+    def __init__(
+        self,
+        sink: RotatingJsonlFile,
+        *,
+        queue_size: int = 10000,
+        batch_size: int = 256,
+        flush_interval_seconds: float = 1.0,
+    ) -> None:
+        self._sink = sink
+        self._queue: queue.Queue[object] = queue.Queue(maxsize=max(1, int(queue_size)))
+        self._batch_size = max(1, int(batch_size))
+        self._flush_interval_seconds = max(0.0, float(flush_interval_seconds))
+        self._lock = Lock()
+        self._written = 0
+        self._dropped = 0
+        self._errors = 0
+        self._closed = False
+        self._thread = Thread(target=self._run, name=f'trace-writer:{sink.path.name}', daemon=True)
+        self._thread.start()
+
+    def write_line(self, line: str) -> None:
+        if self._closed:
+            return
+        try:
+            self._queue.put_nowait(line)
+        except queue.Full:
+            with self._lock:
+                self._dropped += 1
+
+    def flush(self, timeout_seconds: float | None = 5.0) -> bool:
+        if self._closed or not self._thread.is_alive():
+            return not self._closed
+        done = Event()
+        try:
+            self._queue.put(done, timeout=timeout_seconds)
+        except queue.Full:
+            return False
+        return done.wait(timeout_seconds)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join(timeout=10)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                'written': self._written,
+                'dropped': self._dropped,
+                'errors': self._errors,
+                'queued': self._queue.qsize(),
+                'rotations': self._sink.rotations,
+            }
+
+    def _next_batch(self) -> tuple[list[str], list[Event], bool]:
+        lines: list[str] = []
+        markers: list[Event] = []
+        item = self._queue.get()
+        deadline = time.monotonic() + self._flush_interval_seconds
+        while True:
+            if item is _STOP:
+                return lines, markers, True
+            if isinstance(item, Event):
+                # A flush request ends the batch so its caller is released promptly.
+                markers.append(item)
+                return lines, markers, False
+            lines.append(str(item))
+            if len(lines) >= self._batch_size:
+                return lines, markers, False
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                return lines, markers, False
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            lines, markers, stopping = self._next_batch()
+            try:
+                self._sink.write_lines(lines)
+                with self._lock:
+                    self._written += len(lines)
+            except OSError:
+                with self._lock:
+                    self._errors += len(lines)
+            for marker in markers:
+                marker.set()
+        self._sink.close()
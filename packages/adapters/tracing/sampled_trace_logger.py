@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+from typing import Any
+
+from packages.adapters.tracing.jsonl_trace_writer import JsonlTraceWriter, RotatingJsonlFile, TraceWriter
+
+
+class SampledJsonlTraceLogger:
+    """Serialize trace payloads to JSON lines, keeping a ``sample_rate`` share of them.
+
+    Without an explicit ``writer`` records are appended synchronously to
+    ``trace_file``; the API passes a shared buffered writer instead.
+    """
+
+    def __init__(
+        self,
+        trace_file: Path,
+        *,
+        writer: TraceWriter | None = None,
+        sample_rate: float = 1.0,
+    ) -> None:
+        self._trace_file = trace_file
+        self._writer = writer or JsonlTraceWriter(RotatingJsonlFile(trace_file))
+        self._sample_rate = max(0.0, min(1.0, float(sample_rate)))
+
+    def log(self, payload: dict[str, Any]) -> None:
+        if self._sample_rate < 1.0 and random.random() >= self._sample_rate:
+            return
+        self._writer.write_line(json.dumps(payload, ensure_ascii=True) + '\n')
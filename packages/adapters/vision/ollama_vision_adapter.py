@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import base64
 import json
+import time
 import urllib.error
 import urllib.request
 
+from packages.domain.timing import record_stage
 from packages.ports.vision_port import VisionPort
 
 
@@ -62,18 +64,32 @@ class OllamaVisionAdapter(VisionPort):
                 }
             ],
         }
+        data = json.dumps(payload).encode('utf-8')
         req = urllib.request.Request(
             f'{self._base_url}/api/chat',
-            data=json.dumps(payload).encode('utf-8'),
+            data=data,
             method='POST',
             headers={'Content-Type': 'application/json'},
         )
 
+        started = time.perf_counter()
+        raw = b''
+        failed = False
         try:
             with urllib.request.urlopen(req, timeout=self._timeout_seconds) as response:
-                body = json.loads(response.read().decode('utf-8'))
+                raw = response.read()
+            body = json.loads(raw.decode('utf-8'))
             message = body.get('message', {})
             content = message.get('content', '') if isinstance(message, dict) else ''
             return str(content).strip()
         except (urllib.error.URLError, TimeoutError, json.JSONDecodeError):
+            failed = True
             return ''
+        finally:
+            record_stage(
+                'ollama.vision',
+                time.perf_counter() - started,
+                bytes_out=len(data),
+                bytes_in=len(raw),
+                errors=int(failed),
+            )
@@ -8,6 +8,8 @@ from typing import Any
 class AgenticAnswerState:
     query: str
     doc_id: str | None = None
+    # Docs the request is restricted to (``/answer?doc_ids=``); empty means all.
+    doc_ids: list[str] = field(default_factory=list)
     intent: str = 'general'
     top_n: int = 6
     top_k_keyword: int = 20
@@ -32,6 +34,7 @@ class AgenticAnswerState:
         return {
             'query': self.query,
             'doc_id': self.doc_id,
+            'doc_ids': list(self.doc_ids),
             'intent': self.intent,
             'top_n': self.top_n,
             'top_k_keyword': self.top_k_keyword,
@@ -58,6 +61,7 @@ class AgenticAnswerState:
         return cls(
             query=str(payload.get('query') or ''),
             doc_id=payload.get('doc_id'),
+            doc_ids=[str(item) for item in payload.get('doc_ids') or []],
             intent=str(payload.get('intent') or 'general'),
             top_n=int(payload.get('top_n') or 6),
             top_k_keyword=int(payload.get('top_k_keyword') or 20),
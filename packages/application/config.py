@@ -1,21 +1,56 @@
 ﻿from __future__ import annotations
 
 import os
+from collections.abc import Mapping
+from contextvars import ContextVar
 from dataclasses import dataclass
+from pathlib import Path
+
+# Values layered over os.environ while ``load_config(overrides=...)`` runs.
+_OVERRIDES: ContextVar[Mapping[str, str]] = ContextVar('config_overrides', default={})
+
+
+def _lookup(key: str) -> str | None:
+    overrides = _OVERRIDES.get()
+    if key in overrides:
+        return overrides[key]
+    return os.getenv(key)
 
 
 def _env(key: str, default: str) -> str:
-    return os.getenv(key, default)
+    value = _lookup(key)
+    return default if value is None else value
 
 
 def _env_alias(keys: list[str], default: str) -> str:
     for key in keys:
-        value = os.getenv(key)
+        value = _lookup(key)
         if value is not None and value != '':
             return value
     return default
 
 
+def read_env_file(path: Path) -> dict[str, str]:
+    """Parse a ``KEY=VALUE`` file (``.env`` syntax); a missing file reads as empty."""
+    values: dict[str, str] = {}
+    try:
+        lines = path.read_text(encoding='utf-8-sig').splitlines()
+    except OSError:
+        return values
+    for raw in lines:
+        line = raw.strip()
+        if not line or line.startswith('#') or '=' not in line:
+            continue
+        if line.startswith('export '):
+            line = line[len('export ') :].strip()
+        key, value = line.split('=', 1)
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in {'"', "'"}:
+            value = value[1:-1]
+        values[key.strip()] = value
+    return values
+
+
 @dataclass(frozen=True)
 class AppConfig:
     app_env: str
@@ -23,12 +58,30 @@ class AppConfig:
     redis_url: str
     llm_provider: str
     asset_store: str
+    pdf_parser: str
     ocr_engine: str
     ocr_fallback_engine: str
     ingest_concurrency: int
+    upload_max_mb: int
     ingest_page_workers: int
+    ingest_batch_doc_concurrency: int
+    ingest_batch_page_workers: int
+    chunk_max_tokens: int
+    chunk_overlap_tokens: int
     retrieval_trace_file: str
+    request_deadline_seconds: float
     answer_trace_file: str
+    trace_buffered: bool
+    trace_queue_size: int
+    trace_batch_size: int
+    trace_flush_interval_seconds: float
+    trace_max_bytes: int
+    trace_rotate_interval_seconds: float
+    trace_gzip_rotated: bool
+    trace_max_files: int
+    retrieval_trace_sample_rate: float
+    answer_trace_sample_rate: float
+    agentic_trace_sample_rate: float
     use_llm_answering: bool
     llm_base_url: str
     llm_model: str
@@ -41,11 +94,15 @@ class AppConfig:
     embedding_min_coverage: float
     embedding_fail_fast: bool
     embedding_second_pass_max_chars: int
+    embedding_migration_batch_size: int
     use_reranker: bool
     reranker_provider: str
     reranker_base_url: str
     reranker_model: str
     reranker_pool_size: int
+    reranker_batch_size: int
+    reranker_max_concurrency: int
+    reranker_cache_size: int
     use_vision_ingestion: bool
     vision_provider: str
     vision_base_url: str
@@ -56,11 +113,24 @@ class AppConfig:
     agentic_trace_file: str
     agentic_max_iterations: int
     agentic_max_tool_calls: int
+    agentic_max_parallel_tool_calls: int
     agentic_timeout_seconds: float
     include_reasoning_summary: bool
+    config_file: str
+    config_check_interval_seconds: float
+    admin_token: str
+
+
+def load_config(overrides: Mapping[str, str] | None = None) -> AppConfig:
+    """Build the config from the environment, with ``overrides`` taking precedence."""
+    token = _OVERRIDES.set(dict(overrides or {}))
+    try:
+        return _build_config()
+    finally:
+        _OVERRIDES.reset(token)
 
 
-def load_config() -> AppConfig:
+def _build_config() -> AppConfig:
     return AppConfig(
         app_env=_env('APP_ENV', 'local'),
         database_url=_env(
@@ -69,12 +139,30 @@ def load_config() -> AppConfig:
         redis_url=_env('REDIS_URL', 'redis://localhost:6379/0'),
         llm_provider=_env('LLM_PROVIDER', 'local'),
         asset_store=_env('ASSET_STORE', 'filesystem'),
+        pdf_parser=_env('PDF_PARSER', 'pymupdf'),
         ocr_engine=_env('OCR_ENGINE', 'paddle'),
         ocr_fallback_engine=_env('OCR_FALLBACK_ENGINE', 'tesseract'),
         ingest_concurrency=int(_env('INGEST_CONCURRENCY', '2')),
+        upload_max_mb=int(_env('UPLOAD_MAX_MB', '1024')),
         ingest_page_workers=int(_env('INGEST_PAGE_WORKERS', '4')),
+        ingest_batch_doc_concurrency=int(_env('INGEST_BATCH_DOC_CONCURRENCY', '4')),
+        ingest_batch_page_workers=int(_env('INGEST_BATCH_PAGE_WORKERS', '8')),
+        chunk_max_tokens=int(_env('CHUNK_MAX_TOKENS', '256')),
+        chunk_overlap_tokens=int(_env('CHUNK_OVERLAP_TOKENS', '32')),
         retrieval_trace_file=_env('RETRIEVAL_TRACE_FILE', '.context/reports/retrieval_traces.jsonl'),
+        request_deadline_seconds=float(_env('REQUEST_DEADLINE_SECONDS', '45')),
         answer_trace_file=_env('ANSWER_TRACE_FILE', '.context/reports/answer_traces.jsonl'),
+        trace_buffered=_env('TRACE_BUFFERED', 'true').strip().lower() == 'true',
+        trace_queue_size=int(_env('TRACE_QUEUE_SIZE', '10000')),
+        trace_batch_size=int(_env('TRACE_BATCH_SIZE', '256')),
+        trace_flush_interval_seconds=float(_env('TRACE_FLUSH_INTERVAL_SECONDS', '1.0')),
+        trace_max_bytes=int(_env('TRACE_MAX_BYTES', '52428800')),
+        trace_rotate_interval_seconds=float(_env('TRACE_ROTATE_INTERVAL_SECONDS', '0')),
+        trace_gzip_rotated=_env('TRACE_GZIP_ROTATED', 'true').strip().lower() == 'true',
+        trace_max_files=int(_env('TRACE_MAX_FILES', '10')),
+        retrieval_trace_sample_rate=float(_env('RETRIEVAL_TRACE_SAMPLE_RATE', '1.0')),
+        answer_trace_sample_rate=float(_env('ANSWER_TRACE_SAMPLE_RATE', '1.0')),
+        agentic_trace_sample_rate=float(_env('AGENTIC_TRACE_SAMPLE_RATE', '1.0')),
         use_llm_answering=_env('USE_LLM_ANSWERING', 'false').strip().lower() == 'true',
         llm_base_url=_env_alias(['LLM_BASE_URL', 'LOCAL_LLM_BASE_URL'], 'http://localhost:11434'),
         llm_model=_env_alias(['LLM_MODEL', 'LOCAL_LLM_MODEL'], 'deepseek-r1:8b'),
@@ -91,6 +179,7 @@ def load_config() -> AppConfig:
         embedding_min_coverage=float(_env('EMBEDDING_MIN_COVERAGE', '0.95')),
         embedding_fail_fast=_env('EMBEDDING_FAIL_FAST', 'false').strip().lower() == 'true',
         embedding_second_pass_max_chars=int(_env('EMBEDDING_SECOND_PASS_MAX_CHARS', '2048')),
+        embedding_migration_batch_size=int(_env('EMBEDDING_MIGRATION_BATCH_SIZE', '32')),
         use_reranker=_env('USE_RERANKER', 'false').strip().lower() == 'true',
         reranker_provider=_env('RERANKER_PROVIDER', 'noop'),
         reranker_base_url=_env_alias(
@@ -98,6 +187,9 @@ def load_config() -> AppConfig:
         ),
         reranker_model=_env('RERANKER_MODEL', 'deepseek-r1:8b'),
         reranker_pool_size=int(_env('RERANKER_POOL_SIZE', '24')),
+        reranker_batch_size=int(_env('RERANKER_BATCH_SIZE', '0')),
+        reranker_max_concurrency=int(_env('RERANKER_MAX_CONCURRENCY', '2')),
+        reranker_cache_size=int(_env('RERANKER_CACHE_SIZE', '2048')),
         use_vision_ingestion=_env('USE_VISION_INGESTION', 'false').strip().lower() == 'true',
         vision_provider=_env('VISION_PROVIDER', 'noop'),
         vision_base_url=_env_alias(
@@ -110,7 +202,11 @@ def load_config() -> AppConfig:
         agentic_trace_file=_env('AGENTIC_TRACE_FILE', '.context/reports/agent_traces.jsonl'),
         agentic_max_iterations=int(_env('AGENTIC_MAX_ITERATIONS', '4')),
         agentic_max_tool_calls=int(_env('AGENTIC_MAX_TOOL_CALLS', '6')),
+        agentic_max_parallel_tool_calls=int(_env('AGENTIC_MAX_PARALLEL_TOOL_CALLS', '4')),
         agentic_timeout_seconds=float(_env('AGENTIC_TIMEOUT_SECONDS', '20')),
         include_reasoning_summary=_env('INCLUDE_REASONING_SUMMARY', 'false').strip().lower()
         == 'true',
+        config_file=_env('CONFIG_FILE', ''),
+        config_check_interval_seconds=float(_env('CONFIG_CHECK_INTERVAL_SECONDS', '5')),
+        admin_token=_env('ADMIN_TOKEN', ''),
     )
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import UTC, datetime
 from typing import Any, Protocol
 
@@ -14,7 +15,10 @@ from packages.application.use_cases.search_evidence import (
     search_evidence_use_case,
 )
 from packages.domain.citation_formatter import format_citation
+from packages.domain.deadline import Deadline
 from packages.domain.models import Answer, Citation
+from packages.domain.timing import StageTimings, active_timings
+from packages.domain.tokenization import word_tokens
 from packages.domain.policies import has_minimum_citation_fields, has_sufficient_evidence, is_answer_grounded
 from packages.ports.agent_trace_port import AgentTracePort
 from packages.ports.chunk_query_port import ChunkQueryPort
@@ -26,7 +30,6 @@ from packages.ports.state_graph_runner_port import GraphRunLimits, StateGraphRun
 from packages.ports.tool_executor_port import ToolExecutorPort
 from packages.ports.vector_search_port import VectorSearchPort
 
-_TOKEN_RE = re.compile(r'[a-z0-9]+')
 _ALIASES = {
     'analog': 'analogue',
     'analogue': 'analogue',
@@ -59,6 +62,15 @@ _ALLOWED_STATUSES = {'ok', 'not_found', 'needs_follow_up', 'partial'}
 _DIRECT_ANSWER_HEADER = 'Direct answer:'
 _KEY_DETAILS_HEADER = 'Key details:'
 _MISSING_DATA_HEADER = 'If missing data:'
+_MIN_LLM_BUDGET_SECONDS = 2.0
+_MIN_AGENTIC_BUDGET_SECONDS = 1.0
+_DEGRADATION_WARNINGS = {
+    'agentic_skipped': 'Latency budget too small for agentic mode; used deterministic path.',
+    'vector_search_skipped': 'Latency budget exhausted: vector search skipped, keyword evidence only.',
+    'rerank_skipped': 'Latency budget exhausted: reranking skipped.',
+    'llm_skipped': 'Latency budget exhausted: LLM generation skipped, extractive answer returned.',
+    'llm_timeout': 'LLM generation exceeded the latency budget; extractive answer returned.',
+}
 
 
 class TraceLoggerPort(Protocol):
@@ -70,6 +82,7 @@ class TraceLoggerPort(Protocol):
 class AnswerQuestionInput:
     query: str
     doc_id: str | None = None
+    doc_ids: tuple[str, ...] = ()
     top_n: int = 6
     top_k_keyword: int = 20
     top_k_vector: int = 20
@@ -100,18 +113,21 @@ class AnswerQuestionOutput:
     citations: list[AnswerCitationOutput]
     reasoning_summary: str | None = None
     abstain: bool = False  # True when coverage < 0.50 threshold
+    degradations: list[str] = field(default_factory=list)
+    timings: dict[str, dict[str, float]] = field(default_factory=dict)
 
 
-def _tokens(text: str) -> set[str]:
+@lru_cache(maxsize=4096)
+def _tokens(text: str) -> frozenset[str]:
     out: set[str] = set()
-    for raw in _TOKEN_RE.findall((text or '').lower()):
+    for raw in word_tokens(text):
         token = raw
         if len(token) > 3 and token.endswith('s'):
             token = token[:-1]
         token = _ALIASES.get(token, token)
         if token not in _STOPWORDS and len(token) > 1:
             out.add(token)
-    return out
+    return frozenset(out)
 
 
 def _query_overlap(query: str, hits: list[EvidenceHit], top_n: int = 3) -> float:
@@ -513,7 +529,12 @@ def _build_answer_output(
     llm: LlmPort | None,
     reasoning_summary: str | None,
     enforce_structured_output: bool,
+    deadline: Deadline | None = None,
+    degradations_seed: list[str] | None = None,
+    timings: StageTimings | None = None,
 ) -> AnswerQuestionOutput:
+    timings = timings or StageTimings()
+    degradations = list(degradations_seed or [])
     follow_up = follow_up_override
     if follow_up is None:
         follow_up = _build_follow_up_question(query, hits, doc_id)
@@ -544,14 +565,26 @@ def _build_answer_output(
         warnings.append('Query appears ambiguous across manuals or equipment variants.')
 
     if status == 'ok' and llm is not None and not (answer_text_override or '').strip():
-        llm_text = _compose_llm_answer_text(
-            query=query,
-            intent=intent,
-            hits=hits,
-            llm=llm,
-        )
-        if llm_text:
-            answer_text = llm_text
+        if deadline is not None and not deadline.allows(_MIN_LLM_BUDGET_SECONDS):
+            degradations.append('llm_skipped')
+        else:
+            with timings.span('llm', items=len(hits)) as span:
+                llm_text = _compose_llm_answer_text(
+                    query=query,
+                    intent=intent,
+                    hits=hits,
+                    llm=llm.bounded(deadline.remaining()) if deadline is not None else llm,
+                )
+                span['bytes'] = len(llm_text)
+            if llm_text:
+                answer_text = llm_text
+            elif deadline is not None and deadline.expired():
+                degradations.append('llm_timeout')
+
+    for degradation in degradations:
+        warning = _DEGRADATION_WARNINGS.get(degradation)
+        if warning:
+            warnings.append(warning)
 
     answer_model = Answer(
         text=answer_text,
@@ -623,6 +656,8 @@ def _build_answer_output(
         citations=citation_payload,
         reasoning_summary=reasoning_summary,
         abstain=abstain,
+        degradations=degradations,
+        timings=timings.as_dict(),
     )
 
 
@@ -658,6 +693,10 @@ def _log_answer_trace(
     }
     if output.reasoning_summary:
         payload['reasoning_summary'] = output.reasoning_summary
+    if output.degradations:
+        payload['degradations'] = output.degradations
+    if output.timings:
+        payload['timings'] = output.timings
     if agentic:
         payload['agentic'] = agentic
     trace_logger.log(payload)
@@ -678,33 +717,51 @@ def answer_question_use_case(
     agent_trace_logger: AgentTracePort | None = None,
     agent_max_iterations: int = 4,
     agent_max_tool_calls: int = 6,
+    agent_max_parallel_tool_calls: int = 1,
     agent_timeout_seconds: float = 20.0,
     enforce_structured_output: bool = False,
+    deadline: Deadline | None = None,
+    timings: StageTimings | None = None,
 ) -> AnswerQuestionOutput:
+    timings = timings or active_timings() or StageTimings()
     fallback_warnings: list[str] = []
-
-    if use_agentic_mode and planner and tool_executor and state_graph_runner:
+    degradations: list[str] = []
+
+    agentic_ready = bool(use_agentic_mode and planner and tool_executor and state_graph_runner)
+    if agentic_ready and deadline is not None and not deadline.allows(_MIN_AGENTIC_BUDGET_SECONDS):
+        agentic_ready = False
+        degradations.append('agentic_skipped')
+
+    if agentic_ready:
+        timeout_seconds = max(1.0, float(agent_timeout_seconds))
+        agent_llm = llm
+        if deadline is not None:
+            timeout_seconds = min(timeout_seconds, deadline.remaining())
+            agent_llm = llm.bounded(deadline.remaining()) if llm is not None else None
         initial_state = AgenticAnswerState(
             query=input_data.query,
             doc_id=input_data.doc_id,
+            doc_ids=list(input_data.doc_ids),
             top_n=input_data.top_n,
             top_k_keyword=input_data.top_k_keyword,
             top_k_vector=input_data.top_k_vector,
             rerank_pool_size=input_data.rerank_pool_size,
         ).to_dict()
         try:
-            graph_output = state_graph_runner.run(
-                initial_state=initial_state,
-                limits=GraphRunLimits(
-                    max_iterations=max(1, agent_max_iterations),
-                    max_tool_calls=max(1, agent_max_tool_calls),
-                    timeout_seconds=max(1.0, float(agent_timeout_seconds)),
-                ),
-                planner=planner,
-                tool_executor=tool_executor,
-                llm=llm,
-                trace_logger=agent_trace_logger,
-            )
+            with timings.span('agentic'):
+                graph_output = state_graph_runner.run(
+                    initial_state=initial_state,
+                    limits=GraphRunLimits(
+                        max_iterations=max(1, agent_max_iterations),
+                        max_tool_calls=max(1, agent_max_tool_calls),
+                        max_parallel_tool_calls=max(1, agent_max_parallel_tool_calls),
+                        timeout_seconds=timeout_seconds,
+                    ),
+                    planner=planner,
+                    tool_executor=tool_executor,
+                    llm=agent_llm,
+                    trace_logger=agent_trace_logger,
+                )
             state = AgenticAnswerState.from_dict(graph_output.state)
             hits = _coerce_evidence_hits(state.evidence_hits)
 
@@ -730,6 +787,7 @@ def answer_question_use_case(
                 llm=None,
                 reasoning_summary=state.reasoning_summary,
                 enforce_structured_output=enforce_structured_output,
+                timings=timings,
             )
             _log_answer_trace(
                 trace_logger=trace_logger,
@@ -772,7 +830,10 @@ def answer_question_use_case(
         vector_search=vector_search,
         trace_logger=None,
         reranker=reranker,
+        deadline=deadline,
+        timings=timings,
     )
+    degradations.extend(evidence.degradations)
 
     output = _build_answer_output(
         query=evidence.query,
@@ -788,6 +849,9 @@ def answer_question_use_case(
         llm=llm,
         reasoning_summary=None,
         enforce_structured_output=enforce_structured_output,
+        deadline=deadline,
+        degradations_seed=degradations,
+        timings=timings,
     )
 
     _log_answer_trace(
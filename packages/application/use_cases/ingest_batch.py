@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
+from contextvars import copy_context
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable
+
+
+@dataclass(frozen=True)
+class BatchDocument:
+    doc_id: str
+    pdf_path: Path
+
+
+@dataclass(frozen=True)
+class IngestBatchInput:
+    documents: list[BatchDocument]
+    doc_concurrency: int = 2
+    page_worker_budget: int = 8
+    force: bool = False
+
+
+@dataclass(frozen=True)
+class BatchDocumentResult:
+    doc_id: str
+    status: str
+    pages: int = 0
+    seconds: float = 0.0
+    pages_per_second: float = 0.0
+    error: str | None = None
+    result: dict[str, Any] | None = None
+
+
+@dataclass(frozen=True)
+class IngestBatchOutput:
+    documents: list[BatchDocumentResult]
+    ingested: int
+    skipped: int
+    failed: int
+    total_pages: int
+    duration_seconds: float
+    pages_per_second: float
+
+
+# Ingests one document with its pages submitted to the shared executor; returns a
+# result dict carrying at least ``total_pages``.
+IngestOne = Callable[[BatchDocument, Executor], dict[str, Any]]
+IsCurrent = Callable[[BatchDocument], bool]
+
+
+def _size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def ingest_batch_use_case(
+    input_data: IngestBatchInput,
+    *,
+    ingest_one: IngestOne,
+    is_current: IsCurrent | None = None,
+    progress_callback: Callable[[dict[str, Any]], None] | None = None,
+) -> IngestBatchOutput:
+    """Ingest many documents under one global page-worker budget.
+
+    ``doc_concurrency`` documents are in flight at once and all of their pages
+    share a single pool of ``page_worker_budget`` threads, so a small manual's
+    pages interleave with a large one's instead of waiting behind it. Largest
+    files start first. Unless ``force`` is set, documents ``is_current`` reports
+    as already ingested (same PDF, same output config) are skipped.
+    """
+    started = time.perf_counter()
+    documents: list[BatchDocument] = []
+    seen: set[str] = set()
+    for document in input_data.documents:
+        if document.doc_id not in seen:
+            seen.add(document.doc_id)
+            documents.append(document)
+    total_docs = len(documents)
+    results: dict[str, BatchDocumentResult] = {}
+    lock = Lock()
+
+    def _report() -> None:
+        if progress_callback is None:
+            return
+        with lock:
+            done = len(results)
+            counts = {status: 0 for status in ('ingested', 'skipped', 'failed')}
+            for row in results.values():
+                counts[row.status] = counts.get(row.status, 0) + 1
+        progress_callback(
+            {
+                'stage': 'batch',
+                'processed_pages': done,
+                'total_pages': total_docs,
+                'message': (
+                    f'{done}/{total_docs} documents '
+                    f'({counts["ingested"]} ingested, {counts["skipped"]} skipped, {counts["failed"]} failed)'
+                ),
+            }
+        )
+
+    def _run(document: BatchDocument, page_executor: Executor) -> BatchDocumentResult:
+        doc_started = time.perf_counter()
+        try:
+            if not input_data.force and is_current is not None and is_current(document):
+                return BatchDocumentResult(doc_id=document.doc_id, status='skipped')
+            result = ingest_one(document, page_executor)
+        except Exception as exc:
+            return BatchDocumentResult(
+                doc_id=document.doc_id,
+                status='failed',
+                seconds=round(time.perf_counter() - doc_started, 3),
+                error=f'{type(exc).__name__}: {exc}',
+            )
+        seconds = time.perf_counter() - doc_started
+        pages = int(result.get('total_pages') or 0)
+        return BatchDocumentResult(
+            doc_id=document.doc_id,
+            status='ingested',
+            pages=pages,
+            seconds=round(seconds, 3),
+            pages_per_second=round(pages / seconds, 3) if seconds > 0 else 0.0,
+            result=result,
+        )
+
+    _report()
+    ordered = sorted(documents, key=lambda row: _size(row.pdf_path), reverse=True)
+    page_budget = max(1, int(input_data.page_worker_budget))
+    doc_workers = max(1, min(int(input_data.doc_concurrency), total_docs or 1))
+    with ThreadPoolExecutor(max_workers=page_budget, thread_name_prefix='ingest-page') as page_executor:
+        with ThreadPoolExecutor(max_workers=doc_workers, thread_name_prefix='ingest-doc') as doc_executor:
+            futures = [
+                doc_executor.submit(copy_context().run, _run, document, page_executor)
+                for document in ordered
+            ]
+            for future in as_completed(futures):
+                row = future.result()
+                with lock:
+                    results[row.doc_id] = row
+                _report()
+
+    duration = time.perf_counter() - started
+    rows = [results[row.doc_id] for row in documents if row.doc_id in results]
+    total_pages = sum(row.pages for row in rows)
+    return IngestBatchOutput(
+        documents=rows,
+        ingested=sum(1 for row in rows if row.status == 'ingested'),
+        skipped=sum(1 for row in rows if row.status == 'skipped'),
+        failed=sum(1 for row in rows if row.status == 'failed'),
+        total_pages=total_pages,
+        duration_seconds=round(duration, 3),
+        pages_per_second=round(total_pages / duration, 3) if duration > 0 else 0.0,
+    )
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import re
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
+import time
 from threading import Lock
 from typing import Any, Callable
 
+from packages.application.use_cases.page_triage import PagePlan, PageTriage, build_page_plan, should_attempt_vision
+from packages.domain.chunking import TextChunker
 from packages.domain.models import Chunk
+from packages.domain.timing import StageTimings, timed_stage
 from packages.ports.chunk_store_port import ChunkStorePort
 from packages.ports.embedding_port import EmbeddingPort
 from packages.ports.ocr_port import OcrPort
@@ -38,6 +42,9 @@ class IngestDocumentOutput:
     embedding_second_pass_attempted: bool = False
     embedding_second_pass_recovered: int = 0
     warnings: list[str] | None = None
+    timings: dict[str, dict[str, float]] | None = None
+    total_pages: int = 0
+    page_kinds: dict[str, int] | None = None
 
 
 @dataclass(frozen=True)
@@ -47,6 +54,33 @@ class _PageProcessingOutput:
     by_type: dict[str, int]
 
 
+@dataclass(frozen=True)
+class _EmbeddingOutcome:
+    chunks: list[Chunk]
+    attempted: bool
+    success_count: int
+    failed_count: int
+    coverage: float
+    failed_chunk_ids: list[str]
+    failure_reasons: dict[str, str]
+    second_pass_attempted: bool
+    second_pass_recovered: int
+    warnings: list[str]
+
+    def output_fields(self) -> dict[str, Any]:
+        return {
+            'embedding_attempted': self.attempted,
+            'embedding_success_count': self.success_count,
+            'embedding_failed_count': self.failed_count,
+            'embedding_coverage': self.coverage,
+            'embedding_failed_chunk_ids': self.failed_chunk_ids,
+            'embedding_failure_reasons': self.failure_reasons,
+            'embedding_second_pass_attempted': self.second_pass_attempted,
+            'embedding_second_pass_recovered': self.second_pass_recovered,
+            'warnings': self.warnings,
+        }
+
+
 def _new_chunk_id() -> str:
     return str(uuid.uuid4())
 
@@ -68,30 +102,52 @@ def _copy_chunk_with_metadata(chunk: Chunk, metadata: dict[str, Any]) -> Chunk:
     )
 
 
-def _extract_figure_captions(page_text: str) -> list[str]:
-    captions: list[str] = []
-    for line in page_text.splitlines():
-        s = line.strip()
-        if not s:
-            continue
-        if re.match(r'^(figure|fig\.)\s*\d+', s, flags=re.IGNORECASE):
-            captions.append(s)
-    return captions
-
-
-def _should_attempt_ocr(page_text: str) -> bool:
-    compact = re.sub(r'\s+', ' ', page_text or '').strip()
-    return len(compact) < 80
-
-
-def _should_attempt_vision(*, page_text: str, page_ocr_text: str, captions: list[str]) -> bool:
-    compact_text = re.sub(r'\s+', ' ', page_text or '').strip()
-    compact_ocr = re.sub(r'\s+', ' ', page_ocr_text or '').strip()
-    if captions:
-        return True
-    if len(compact_text) < 220 and len(compact_ocr) < 220:
-        return True
-    return False
+def _set_embedding(
+    metadata: dict[str, Any],
+    embedding: list[float],
+    embedding_key: str | None,
+    legacy_embedding: bool = True,
+) -> None:
+    # The legacy field only ever holds vectors of the configured model, so
+    # deactivating a migration never mixes models in it.
+    if legacy_embedding or not embedding_key:
+        metadata['embedding'] = embedding
+    if embedding_key:
+        metadata['embeddings'] = {**dict(metadata.get('embeddings') or {}), embedding_key: embedding}
+
+
+class _ExtractionProgress:
+    """Reports extracted pages with an ETA weighted by the triage plan's page costs."""
+
+    def __init__(
+        self,
+        plan: PagePlan,
+        total_pages: int,
+        progress_callback: Callable[[dict[str, Any]], None] | None,
+    ) -> None:
+        self._plan = plan
+        self._total_pages = total_pages
+        self._callback = progress_callback
+        self._started = time.perf_counter()
+        self._processed = 0
+        self._done_cost = 0.0
+
+    def page_done(self, triage: PageTriage) -> None:
+        self._processed += 1
+        self._done_cost += triage.cost
+        if self._callback is None:
+            return
+        elapsed = time.perf_counter() - self._started
+        remaining_cost = max(self._plan.total_cost - self._done_cost, 0.0)
+        self._callback(
+            {
+                'stage': 'extracting',
+                'processed_pages': self._processed,
+                'total_pages': self._total_pages,
+                'message': f'Processed page {self._processed}/{self._total_pages}',
+                'eta_seconds': round(elapsed * remaining_cost / self._done_cost, 1) if self._done_cost else None,
+            }
+        )
 
 
 def _process_single_page(
@@ -99,6 +155,7 @@ def _process_single_page(
     doc_id: str,
     pdf_path: Path,
     page: ParsedPdfPage,
+    triage: PageTriage,
     ocr_adapter: OcrPort,
     table_extractor: TableExtractorPort,
     vision_adapter: VisionPort | None,
@@ -114,9 +171,14 @@ def _process_single_page(
 
     page_text = page.text.strip()
     page_ocr_text = ''
+    ocr_text = ''
 
-    if _should_attempt_ocr(page_text):
-        page_ocr_text = ocr_adapter.extract_text(str(pdf_path), page.page_number).strip()
+    # Triage decided up front; OCR runs at most once and serves the page and its figures.
+    if triage.needs_ocr:
+        with timed_stage('ocr', items=1):
+            ocr_text = ocr_adapter.extract_text(str(pdf_path), page.page_number).strip()
+        if triage.kind == 'scanned':
+            page_ocr_text = ocr_text
 
     if page_text:
         add_chunk(
@@ -142,8 +204,10 @@ def _process_single_page(
             )
         )
 
-    table_source_text = page_text if page_text else page_ocr_text
-    for table in table_extractor.extract(table_source_text, page.page_number):
+    table_source_text = triage.table_text if page_text else page_ocr_text
+    with timed_stage('tables', items=1, bytes=len(table_source_text)):
+        tables = table_extractor.extract(table_source_text, page.page_number)
+    for table in tables:
         add_chunk(
             Chunk(
                 chunk_id=_new_chunk_id(),
@@ -156,7 +220,7 @@ def _process_single_page(
             )
         )
 
-    captions = _extract_figure_captions(page_text)
+    captions = list(triage.captions)
     for idx, caption in enumerate(captions, start=1):
         fig_id = f'fig-p{page.page_number:04d}-{idx:03d}'
         add_chunk(
@@ -172,7 +236,7 @@ def _process_single_page(
             )
         )
 
-        figure_ocr_text = page_ocr_text or ocr_adapter.extract_text(str(pdf_path), page.page_number).strip()
+        figure_ocr_text = ocr_text
         if figure_ocr_text:
             add_chunk(
                 Chunk(
@@ -188,10 +252,12 @@ def _process_single_page(
 
     should_call_vision = (
         vision_adapter is not None
-        and _should_attempt_vision(
+        and triage.vision_candidate
+        and should_attempt_vision(
             page_text=page_text,
             page_ocr_text=page_ocr_text,
             captions=captions,
+            has_figure_image=triage.has_figure_image,
         )
     )
 
@@ -203,10 +269,11 @@ def _process_single_page(
                 reserved_slot = True
 
     if should_call_vision and reserved_slot and vision_adapter is not None:
-        vision_text = vision_adapter.extract_page_insights(
-            pdf_path=str(pdf_path),
-            page_number=page.page_number,
-        ).strip()
+        with timed_stage('vision', items=1):
+            vision_text = vision_adapter.extract_page_insights(
+                pdf_path=str(pdf_path),
+                page_number=page.page_number,
+            ).strip()
         if vision_text:
             add_chunk(
                 Chunk(
@@ -229,100 +296,52 @@ def _process_single_page(
     )
 
 
-def ingest_document_use_case(
-    input_data: IngestDocumentInput,
-    pdf_parser: PdfParserPort,
-    ocr_adapter: OcrPort,
-    table_extractor: TableExtractorPort,
-    chunk_store: ChunkStorePort,
-    embedding_adapter: EmbeddingPort | None = None,
-    vision_adapter: VisionPort | None = None,
-    vision_max_pages: int = 40,
-    page_workers: int = 1,
-    embedding_min_coverage: float = 0.0,
-    embedding_fail_fast: bool = False,
-    embedding_second_pass_max_chars: int = 2048,
-    progress_callback: Callable[[dict[str, Any]], None] | None = None,
-) -> IngestDocumentOutput:
-    pages = pdf_parser.parse(str(input_data.pdf_path))
-    chunks: list[Chunk] = []
-    by_type: dict[str, int] = {}
-    total_pages = len(pages)
-
-    if progress_callback is not None:
-        progress_callback(
-            {
-                'stage': 'extracting',
-                'processed_pages': 0,
-                'total_pages': total_pages,
-                'message': 'Starting page extraction',
-            }
-        )
-
-    vision_budget = {'remaining': max(vision_max_pages, 0)}
-    vision_budget_lock = Lock()
-
-    page_outputs: list[_PageProcessingOutput] = []
-    normalized_workers = max(int(page_workers or 1), 1)
-
-    if normalized_workers <= 1 or total_pages <= 1:
-        for idx, page in enumerate(pages, start=1):
-            page_output = _process_single_page(
-                doc_id=input_data.doc_id,
-                pdf_path=input_data.pdf_path,
-                page=page,
-                ocr_adapter=ocr_adapter,
-                table_extractor=table_extractor,
-                vision_adapter=vision_adapter,
-                vision_budget=vision_budget,
-                vision_budget_lock=vision_budget_lock,
-            )
-            page_outputs.append(page_output)
-            if progress_callback is not None:
-                progress_callback(
-                    {
-                        'stage': 'extracting',
-                        'processed_pages': idx,
-                        'total_pages': total_pages,
-                        'message': f'Processed page {idx}/{total_pages}',
-                    }
-                )
-    else:
-        processed = 0
-        with ThreadPoolExecutor(max_workers=normalized_workers) as executor:
-            futures = [
-                executor.submit(
-                    _process_single_page,
-                    doc_id=input_data.doc_id,
-                    pdf_path=input_data.pdf_path,
-                    page=page,
-                    ocr_adapter=ocr_adapter,
-                    table_extractor=table_extractor,
-                    vision_adapter=vision_adapter,
-                    vision_budget=vision_budget,
-                    vision_budget_lock=vision_budget_lock,
-                )
-                for page in pages
-            ]
-            for future in as_completed(futures):
-                page_outputs.append(future.result())
-                processed += 1
-                if progress_callback is not None:
-                    progress_callback(
-                        {
-                            'stage': 'extracting',
-                            'processed_pages': processed,
-                            'total_pages': total_pages,
-                            'message': f'Processed page {processed}/{total_pages}',
-                        }
+def _split_text_chunks(
+    page_outputs: list[_PageProcessingOutput], chunker: TextChunker
+) -> list[_PageProcessingOutput]:
+    """Replace each page text chunk with its windows; pages must be in order."""
+    split_outputs: list[_PageProcessingOutput] = []
+    for page_output in page_outputs:
+        page_chunks: list[Chunk] = []
+        for chunk in page_output.chunks:
+            if chunk.content_type != 'text':
+                page_chunks.append(chunk)
+                continue
+            for idx, window in enumerate(chunker.split(chunk.content_text)):
+                page_chunks.append(
+                    replace(
+                        chunk,
+                        chunk_id=chunk.chunk_id if idx == 0 else _new_chunk_id(),
+                        content_text=window.text,
+                        section_path=window.section_path,
                     )
+                )
+        page_by_type: dict[str, int] = {}
+        for chunk in page_chunks:
+            page_by_type[chunk.content_type] = page_by_type.get(chunk.content_type, 0) + 1
+        split_outputs.append(
+            _PageProcessingOutput(
+                page_number=page_output.page_number,
+                chunks=page_chunks,
+                by_type=page_by_type,
+            )
+        )
+    return split_outputs
 
-    page_outputs.sort(key=lambda row: row.page_number)
-    for page_output in page_outputs:
-        chunks.extend(page_output.chunks)
-        for chunk_type, count in page_output.by_type.items():
-            by_type[chunk_type] = by_type.get(chunk_type, 0) + count
 
+def _embed_chunks(
+    chunks: list[Chunk],
+    *,
+    embedding_adapter: EmbeddingPort | None,
+    embedding_min_coverage: float,
+    embedding_fail_fast: bool,
+    embedding_second_pass_max_chars: int,
+    total_pages: int,
+    timings: StageTimings,
+    progress_callback: Callable[[dict[str, Any]], None] | None,
+    embedding_key: str | None = None,
+    legacy_embedding: bool = True,
+) -> _EmbeddingOutcome:
     embedding_attempted = False
     embedding_success_count = 0
     embedding_failed_count = 0
@@ -348,10 +367,11 @@ def ingest_document_use_case(
         failed_positions: list[int] = []
 
         for idx, chunk in enumerate(chunks):
-            embedding = embedding_adapter.embed_text(chunk.content_text)
+            with timings.span('embedding', items=1, bytes=len(chunk.content_text)):
+                embedding = embedding_adapter.embed_text(chunk.content_text)
             metadata = dict(chunk.metadata or {})
             if embedding:
-                metadata['embedding'] = embedding
+                _set_embedding(metadata, embedding, embedding_key, legacy_embedding)
                 embedding_success_count += 1
             else:
                 embedding_failed_count += 1
@@ -397,7 +417,8 @@ def ingest_document_use_case(
 
                 retried_embedding: list[float] = []
                 for retry_text in retry_candidates:
-                    retried_embedding = embedding_adapter.embed_text(retry_text)
+                    with timings.span('embedding_retry', items=1, bytes=len(retry_text)):
+                        retried_embedding = embedding_adapter.embed_text(retry_text)
                     if retried_embedding:
                         break
                     adapter_error = getattr(embedding_adapter, 'last_error', None)
@@ -408,7 +429,7 @@ def ingest_document_use_case(
                     continue
 
                 retry_metadata = dict(failed_chunk.metadata or {})
-                retry_metadata['embedding'] = retried_embedding
+                _set_embedding(retry_metadata, retried_embedding, embedding_key, legacy_embedding)
                 enriched[position] = _copy_chunk_with_metadata(failed_chunk, retry_metadata)
                 embedding_second_pass_recovered += 1
                 embedding_success_count += 1
@@ -439,7 +460,174 @@ def ingest_document_use_case(
     else:
         embedding_coverage = 0.0
 
-    asset_ref = chunk_store.persist(input_data.doc_id, chunks)
+    return _EmbeddingOutcome(
+        chunks=chunks,
+        attempted=embedding_attempted,
+        success_count=embedding_success_count,
+        failed_count=embedding_failed_count,
+        coverage=round(embedding_coverage, 6) if embedding_attempted else 0.0,
+        failed_chunk_ids=embedding_failed_chunk_ids if embedding_attempted else [],
+        failure_reasons=embedding_failure_reasons if embedding_attempted else {},
+        second_pass_attempted=embedding_second_pass_attempted,
+        second_pass_recovered=embedding_second_pass_recovered,
+        warnings=warnings,
+    )
+
+
+def ingest_document_use_case(
+    input_data: IngestDocumentInput,
+    pdf_parser: PdfParserPort,
+    ocr_adapter: OcrPort,
+    table_extractor: TableExtractorPort,
+    chunk_store: ChunkStorePort,
+    embedding_adapter: EmbeddingPort | None = None,
+    vision_adapter: VisionPort | None = None,
+    vision_max_pages: int = 40,
+    page_workers: int = 1,
+    embedding_min_coverage: float = 0.0,
+    embedding_fail_fast: bool = False,
+    embedding_second_pass_max_chars: int = 2048,
+    progress_callback: Callable[[dict[str, Any]], None] | None = None,
+    timings: StageTimings | None = None,
+    page_executor: Executor | None = None,
+    embedding_key: str | None = None,
+    legacy_embedding: bool = True,
+    chunk_max_tokens: int = 0,
+    chunk_overlap_tokens: int = 0,
+) -> IngestDocumentOutput:
+    """Parse, extract, embed and persist one PDF.
+
+    Pages fan out over ``page_workers`` threads. With ``page_executor`` they
+    run on that shared pool instead, at most ``page_workers`` queued at a time,
+    so several documents can share one page-worker budget. ``embedding_key``
+    additionally stores each vector under ``metadata['embeddings'][key]``;
+    pass ``legacy_embedding=False`` when that key is not the configured model,
+    so the legacy ``embedding`` field is left alone.
+    With ``chunk_max_tokens`` each page's text chunk is split into
+    heading-aligned windows before embedding; ``0`` keeps one chunk per page.
+    """
+    timings = timings or StageTimings()
+    with timings.span('parse') as span:
+        pages = pdf_parser.parse(str(input_data.pdf_path))
+        span['items'] = len(pages)
+    chunks: list[Chunk] = []
+    by_type: dict[str, int] = {}
+    total_pages = len(pages)
+
+    with timings.span('triage', items=total_pages):
+        plan = build_page_plan(pages, vision_budget=vision_max_pages if vision_adapter is not None else 0)
+    pages_by_number = {page.page_number: page for page in pages}
+    scheduled = [(pages_by_number[row.page_number], row) for row in plan.pages]
+
+    if progress_callback is not None:
+        progress_callback(
+            {
+                'stage': 'extracting',
+                'processed_pages': 0,
+                'total_pages': total_pages,
+                'message': f'Triage: {plan.summary() or "no pages"}. Starting page extraction',
+            }
+        )
+
+    vision_budget = {'remaining': max(vision_max_pages, 0)}
+    vision_budget_lock = Lock()
+
+    page_outputs: list[_PageProcessingOutput] = []
+    normalized_workers = max(int(page_workers or 1), 1)
+    progress = _ExtractionProgress(plan, total_pages, progress_callback)
+    with timings.span('extract_pages', items=total_pages):
+        if page_executor is None and (normalized_workers <= 1 or total_pages <= 1):
+            for page, triage in scheduled:
+                page_output = _process_single_page(
+                    doc_id=input_data.doc_id,
+                    pdf_path=input_data.pdf_path,
+                    page=page,
+                    triage=triage,
+                    ocr_adapter=ocr_adapter,
+                    table_extractor=table_extractor,
+                    vision_adapter=vision_adapter,
+                    vision_budget=vision_budget,
+                    vision_budget_lock=vision_budget_lock,
+                )
+                page_outputs.append(page_output)
+                progress.page_done(triage)
+        else:
+            executor = page_executor or ThreadPoolExecutor(max_workers=normalized_workers)
+            # On a shared executor keep at most ``page_workers`` pages queued so documents interleave.
+            window = normalized_workers if page_executor is not None else max(total_pages, 1)
+            # Pages are submitted in plan order, so OCR and vision pages start first.
+            remaining_pages = iter(scheduled)
+            pending: dict[Future[_PageProcessingOutput], PageTriage] = {}
+            try:
+                while True:
+                    while len(pending) < window:
+                        item = next(remaining_pages, None)
+                        if item is None:
+                            break
+                        page, triage = item
+                        # Pages run in a copy of this context so per-page stages are recorded.
+                        future = executor.submit(
+                            copy_context().run,
+                            _process_single_page,
+                            doc_id=input_data.doc_id,
+                            pdf_path=input_data.pdf_path,
+                            page=page,
+                            triage=triage,
+                            ocr_adapter=ocr_adapter,
+                            table_extractor=table_extractor,
+                            vision_adapter=vision_adapter,
+                            vision_budget=vision_budget,
+                            vision_budget_lock=vision_budget_lock,
+                        )
+                        pending[future] = triage
+                    if not pending:
+                        break
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        triage = pending.pop(future)
+                        page_outputs.append(future.result())
+                        progress.page_done(triage)
+            finally:
+                if page_executor is None:
+                    executor.shutdown(wait=True)
+                else:
+                    # On failure, free this document's queued pages from the shared budget.
+                    for future in pending:
+                        future.cancel()
+
+    page_outputs.sort(key=lambda row: row.page_number)
+    if chunk_max_tokens > 0:
+        with timings.span('chunk', items=total_pages) as span:
+            page_outputs = _split_text_chunks(
+                page_outputs, TextChunker(chunk_max_tokens, chunk_overlap_tokens)
+            )
+            span['bytes'] = sum(
+                len(chunk.content_text)
+                for page_output in page_outputs
+                for chunk in page_output.chunks
+                if chunk.content_type == 'text'
+            )
+    for page_output in page_outputs:
+        chunks.extend(page_output.chunks)
+        for chunk_type, count in page_output.by_type.items():
+            by_type[chunk_type] = by_type.get(chunk_type, 0) + count
+
+    embedded = _embed_chunks(
+        chunks,
+        embedding_adapter=embedding_adapter,
+        embedding_min_coverage=embedding_min_coverage,
+        embedding_fail_fast=embedding_fail_fast,
+        embedding_second_pass_max_chars=embedding_second_pass_max_chars,
+        total_pages=total_pages,
+        timings=timings,
+        progress_callback=progress_callback,
+        embedding_key=embedding_key,
+        legacy_embedding=legacy_embedding,
+    )
+    chunks = embedded.chunks
+
+    with timings.span('persist', items=len(chunks)):
+        asset_ref = chunk_store.persist(input_data.doc_id, chunks)
 
     if progress_callback is not None:
         progress_callback(
@@ -456,14 +644,70 @@ def ingest_document_use_case(
         asset_ref=asset_ref,
         total_chunks=len(chunks),
         by_type=by_type,
-        embedding_attempted=embedding_attempted,
-        embedding_success_count=embedding_success_count,
-        embedding_failed_count=embedding_failed_count,
-        embedding_coverage=round(embedding_coverage, 6) if embedding_attempted else 0.0,
-        embedding_failed_chunk_ids=embedding_failed_chunk_ids if embedding_attempted else [],
-        embedding_failure_reasons=embedding_failure_reasons if embedding_attempted else {},
-        embedding_second_pass_attempted=embedding_second_pass_attempted,
-        embedding_second_pass_recovered=embedding_second_pass_recovered,
-        warnings=warnings,
+        **embedded.output_fields(),
+        timings=timings.as_dict(),
+        total_pages=total_pages,
+        page_kinds=plan.counts(),
     )
 
+
+
+@dataclass(frozen=True)
+class ReembedDocumentInput:
+    doc_id: str
+    chunks: list[Chunk]
+
+
+def reembed_document_use_case(
+    input_data: ReembedDocumentInput,
+    chunk_store: ChunkStorePort,
+    embedding_adapter: EmbeddingPort,
+    embedding_min_coverage: float = 0.0,
+    embedding_fail_fast: bool = False,
+    embedding_second_pass_max_chars: int = 2048,
+    progress_callback: Callable[[dict[str, Any]], None] | None = None,
+    timings: StageTimings | None = None,
+    embedding_key: str | None = None,
+    legacy_embedding: bool = True,
+) -> IngestDocumentOutput:
+    """Recompute embeddings for already-extracted chunks and persist them, skipping parse/OCR/vision."""
+    timings = timings or StageTimings()
+    by_type: dict[str, int] = {}
+    for chunk in input_data.chunks:
+        by_type[chunk.content_type] = by_type.get(chunk.content_type, 0) + 1
+    total_pages = max((int(chunk.page_end or 0) for chunk in input_data.chunks), default=0)
+
+    embedded = _embed_chunks(
+        list(input_data.chunks),
+        embedding_adapter=embedding_adapter,
+        embedding_min_coverage=embedding_min_coverage,
+        embedding_fail_fast=embedding_fail_fast,
+        embedding_second_pass_max_chars=embedding_second_pass_max_chars,
+        total_pages=total_pages,
+        timings=timings,
+        progress_callback=progress_callback,
+        embedding_key=embedding_key,
+        legacy_embedding=legacy_embedding,
+    )
+    with timings.span('persist', items=len(embedded.chunks)):
+        asset_ref = chunk_store.persist(input_data.doc_id, embedded.chunks)
+
+    if progress_callback is not None:
+        progress_callback(
+            {
+                'stage': 'persisted',
+                'processed_pages': total_pages,
+                'total_pages': total_pages,
+                'message': f'Persisted {len(embedded.chunks)} re-embedded chunks',
+            }
+        )
+
+    return IngestDocumentOutput(
+        doc_id=input_data.doc_id,
+        asset_ref=asset_ref,
+        total_chunks=len(embedded.chunks),
+        by_type=by_type,
+        **embedded.output_fields(),
+        timings=timings.as_dict(),
+        total_pages=total_pages,
+    )
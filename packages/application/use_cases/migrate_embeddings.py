@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Any, Callable
+
+from packages.domain.embeddings import chunk_embedding
+from packages.domain.timing import timed_stage
+from packages.ports.chunk_store_port import ChunkStoreConflictError, ChunkStorePort
+from packages.ports.embedding_port import EmbeddingPort
+
+# Times a doc is reloaded and re-merged when a reingest persists it mid-migration.
+_MAX_PERSIST_ATTEMPTS = 3
+
+
+@dataclass(frozen=True)
+class MigrateEmbeddingsInput:
+    doc_ids: list[str]
+    embedding_key: str
+    batch_size: int = 32
+    min_coverage: float = 0.0
+
+
+@dataclass(frozen=True)
+class MigratedDocument:
+    doc_id: str
+    total_chunks: int
+    embedded_chunks: int
+    newly_embedded: int
+    failed_chunks: int
+
+
+@dataclass(frozen=True)
+class MigrateEmbeddingsOutput:
+    embedding_key: str
+    documents: list[MigratedDocument]
+    total_chunks: int
+    embedded_chunks: int
+    newly_embedded: int
+    failed_chunks: int
+    coverage: float
+    activated: bool
+
+
+def migrate_embeddings_use_case(
+    input_data: MigrateEmbeddingsInput,
+    *,
+    chunk_store: ChunkStorePort,
+    embedding_adapter: EmbeddingPort,
+    on_document_done: Callable[[MigratedDocument], None] | None = None,
+    activate: Callable[[float], None] | None = None,
+    coverage_doc_ids: Callable[[], list[str]] | None = None,
+    progress_callback: Callable[[dict[str, Any]], None] | None = None,
+) -> MigrateEmbeddingsOutput:
+    """Embed existing chunks under ``embedding_key`` next to their current vectors.
+
+    Chunks that already carry a vector for the key are skipped and each doc is
+    persisted once when its batches are done, so an interrupted run resumes
+    at the first unfinished doc. The persist only lands if the doc was not
+    reingested meanwhile; otherwise the new chunks are reloaded and the
+    vectors already computed are merged into them. When every doc is done,
+    coverage is rechecked from the stored chunks of ``coverage_doc_ids()``
+    (default: the migrated docs), since a doc reingested after its pass only
+    carries the model it was ingested with; if it reaches ``min_coverage``,
+    ``activate(coverage)`` switches search to the new key.
+    """
+    key = input_data.embedding_key
+    batch_size = max(1, int(input_data.batch_size))
+    doc_ids = list(dict.fromkeys(input_data.doc_ids))
+    documents: list[MigratedDocument] = []
+
+    def _report(message: str) -> None:
+        if progress_callback is not None:
+            progress_callback(
+                {
+                    'stage': 'reembedding',
+                    'processed_pages': len(documents),
+                    'total_pages': len(doc_ids),
+                    'message': message,
+                }
+            )
+
+    _report(f'Re-embedding {len(doc_ids)} documents as {key}')
+    for doc_id in doc_ids:
+        # (chunk_id, text) -> vector, kept across attempts so a retry only embeds new text.
+        vectors: dict[tuple[str, str], list[float]] = {}
+        for attempt in range(1, _MAX_PERSIST_ATTEMPTS + 1):
+            version = chunk_store.version(doc_id)
+            chunks = chunk_store.load(doc_id)
+            pending = [idx for idx, chunk in enumerate(chunks) if chunk_embedding(chunk.metadata, key) is None]
+            to_embed = [
+                idx for idx in pending if (chunks[idx].chunk_id, chunks[idx].content_text) not in vectors
+            ]
+            for start in range(0, len(to_embed), batch_size):
+                positions = to_embed[start : start + batch_size]
+                texts = [chunks[idx].content_text for idx in positions]
+                with timed_stage('reembed', items=len(texts), bytes=sum(len(text) for text in texts)):
+                    batch = embedding_adapter.embed_texts(texts)
+                for idx, vector in zip(positions, batch):
+                    if vector:
+                        vectors[(chunks[idx].chunk_id, chunks[idx].content_text)] = vector
+                _report(f'{doc_id}: {start + len(positions)}/{len(to_embed)} pending chunks processed')
+
+            newly_embedded = 0
+            for idx in pending:
+                vector = vectors.get((chunks[idx].chunk_id, chunks[idx].content_text))
+                if vector is None:
+                    continue
+                metadata = dict(chunks[idx].metadata or {})
+                metadata['embeddings'] = {**dict(metadata.get('embeddings') or {}), key: vector}
+                chunks[idx] = replace(chunks[idx], metadata=metadata)
+                newly_embedded += 1
+            if not newly_embedded:
+                break
+            try:
+                chunk_store.persist_if_unchanged(doc_id, chunks, version)
+                break
+            except ChunkStoreConflictError:
+                if attempt == _MAX_PERSIST_ATTEMPTS:
+                    # Nothing landed; a later run picks the doc up again.
+                    newly_embedded = 0
+                    _report(f'{doc_id}: kept changing during migration, skipped')
+                    break
+                _report(f'{doc_id}: reingested during migration, merging into the new chunks')
+
+        row = MigratedDocument(
+            doc_id=doc_id,
+            total_chunks=len(chunks),
+            embedded_chunks=len(chunks) - len(pending) + newly_embedded,
+            newly_embedded=newly_embedded,
+            failed_chunks=len(pending) - newly_embedded,
+        )
+        documents.append(row)
+        if on_document_done is not None:
+            on_document_done(row)
+        _report(f'{doc_id}: {row.embedded_chunks}/{row.total_chunks} chunks embedded')
+
+    total_chunks = sum(row.total_chunks for row in documents)
+    embedded_chunks = sum(row.embedded_chunks for row in documents)
+    coverage = embedded_chunks / total_chunks if total_chunks else 0.0
+    min_coverage = max(0.0, min(float(input_data.min_coverage or 0.0), 1.0))
+    activated = False
+    if activate is not None and total_chunks > 0 and coverage >= min_coverage:
+        recheck_ids = coverage_doc_ids() if coverage_doc_ids is not None else doc_ids
+        total_chunks, embedded_chunks = _key_coverage(chunk_store, recheck_ids, key)
+        coverage = embedded_chunks / total_chunks if total_chunks else 0.0
+        activated = total_chunks > 0 and coverage >= min_coverage
+        if activated:
+            activate(coverage)
+        else:
+            _report(f'Coverage for {key} dropped to {coverage:.1%} after reingests, not activating')
+
+    return MigrateEmbeddingsOutput(
+        embedding_key=key,
+        documents=documents,
+        total_chunks=total_chunks,
+        embedded_chunks=embedded_chunks,
+        newly_embedded=sum(row.newly_embedded for row in documents),
+        failed_chunks=sum(row.failed_chunks for row in documents),
+        coverage=round(coverage, 6),
+        activated=activated,
+    )
+
+
+def _key_coverage(chunk_store: ChunkStorePort, doc_ids: list[str], key: str) -> tuple[int, int]:
+    total = embedded = 0
+    for doc_id in dict.fromkeys(doc_ids):
+        chunks = chunk_store.load(doc_id)
+        total += len(chunks)
+        embedded += sum(1 for chunk in chunks if chunk_embedding(chunk.metadata, key) is not None)
+    return total, embedded
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, replace
+
+from packages.ports.pdf_parser_port import ParsedPdfPage, PdfTextLine
+
+# Relative cost of the work a page needs, in units of one text-only page.
+# Pages are scheduled most expensive first and the sums drive job ETAs.
+TEXT_PAGE_COST = 1.0
+TABLE_HEAVY_COST = 0.5
+OCR_COST = 8.0
+VISION_COST = 20.0
+
+_SCANNED_MAX_CHARS = 80
+_SPARSE_TEXT_MAX_CHARS = 220
+# Image blocks smaller than this (in PDF points squared, ~1.4in x 1.4in) are
+# treated as logos or icons rather than figures.
+_MIN_FIGURE_IMAGE_AREA = 10_000.0
+_TABLE_HEAVY_MIN_ROWS = 3
+_TABLE_HEAVY_ROW_RATIO = 0.3
+_CAPTION_RE = re.compile(r'^(figure|fig\.)\s*\d+', flags=re.IGNORECASE)
+_COLUMN_GAP_RE = re.compile(r'\s{2,}')
+
+
+@dataclass(frozen=True)
+class PageTriage:
+    """What one page needs, decided from its parsed text and layout blocks.
+
+    ``kind`` is ``scanned``, ``figure_heavy``, ``table_heavy`` or ``text_rich``.
+    ``needs_ocr`` means one OCR call, shared by the page text and its figures.
+    ``vision_candidate`` is confirmed after OCR by ``should_attempt_vision``.
+    """
+
+    page_number: int
+    kind: str
+    needs_ocr: bool
+    vision_candidate: bool
+    has_figure_image: bool
+    captions: tuple[str, ...]
+    table_text: str
+    cost: float
+
+
+@dataclass(frozen=True)
+class PagePlan:
+    # Pages in schedule order: most expensive first, then by page number.
+    pages: list[PageTriage]
+    total_cost: float
+
+    def counts(self) -> dict[str, int]:
+        counts: dict[str, int] = {}
+        for page in self.pages:
+            counts[page.kind] = counts.get(page.kind, 0) + 1
+        return counts
+
+    def summary(self) -> str:
+        return ', '.join(f'{count} {kind}' for kind, count in sorted(self.counts().items()))
+
+
+def _compact(text: str) -> str:
+    return re.sub(r'\s+', ' ', text or '').strip()
+
+
+def extract_figure_captions(page_text: str) -> list[str]:
+    return [line.strip() for line in page_text.splitlines() if _CAPTION_RE.match(line.strip())]
+
+
+def should_attempt_ocr(page_text: str) -> bool:
+    return len(_compact(page_text)) < _SCANNED_MAX_CHARS
+
+
+def should_attempt_vision(
+    *, page_text: str, page_ocr_text: str, captions: list[str], has_figure_image: bool = False
+) -> bool:
+    if captions or has_figure_image:
+        return True
+    return len(_compact(page_text)) < _SPARSE_TEXT_MAX_CHARS and len(_compact(page_ocr_text)) < _SPARSE_TEXT_MAX_CHARS
+
+
+def layout_rows_text(page: ParsedPdfPage) -> str:
+    """Page text rebuilt row by row from line bboxes, cells separated by two spaces.
+
+    Parsers with layout blocks emit each table cell as its own line; joining
+    lines that share a baseline restores the column spacing the table
+    extractor looks for. Pages without blocks fall back to ``page.text``.
+    """
+    lines = sorted(
+        (line for block in page.blocks if block.kind == 'text' for line in block.lines),
+        key=lambda line: ((line.bbox[1] + line.bbox[3]) / 2, line.bbox[0]),
+    )
+    if not lines:
+        return page.text
+    rows: list[list[PdfTextLine]] = []
+    row_middle = 0.0
+    for line in lines:
+        middle = (line.bbox[1] + line.bbox[3]) / 2
+        if rows and abs(middle - row_middle) <= max(line.bbox[3] - line.bbox[1], 1.0) / 2:
+            rows[-1].append(line)
+            continue
+        rows.append([line])
+        row_middle = middle
+    return '\n'.join('  '.join(line.text for line in sorted(row, key=lambda line: line.bbox[0])) for row in rows)
+
+
+def has_figure_image(page: ParsedPdfPage) -> bool:
+    return any(
+        block.kind == 'image'
+        and (block.bbox[2] - block.bbox[0]) * (block.bbox[3] - block.bbox[1]) >= _MIN_FIGURE_IMAGE_AREA
+        for block in page.blocks
+    )
+
+
+def _is_table_heavy(table_text: str) -> bool:
+    rows = [row.strip() for row in table_text.splitlines() if row.strip()]
+    tabular = sum(1 for row in rows if '|' in row or len(_COLUMN_GAP_RE.split(row)) >= 3)
+    return tabular >= _TABLE_HEAVY_MIN_ROWS and tabular >= _TABLE_HEAVY_ROW_RATIO * len(rows)
+
+
+def triage_page(page: ParsedPdfPage) -> PageTriage:
+    page_text = page.text.strip()
+    captions = tuple(extract_figure_captions(page_text))
+    figure_image = has_figure_image(page)
+    scanned = should_attempt_ocr(page_text)
+    table_text = layout_rows_text(page).strip() if page_text else ''
+    if scanned:
+        kind = 'scanned'
+    elif captions or figure_image:
+        kind = 'figure_heavy'
+    elif _is_table_heavy(table_text):
+        kind = 'table_heavy'
+    else:
+        kind = 'text_rich'
+    needs_ocr = scanned or bool(captions)
+    vision_candidate = should_attempt_vision(
+        page_text=page_text, page_ocr_text='', captions=list(captions), has_figure_image=figure_image
+    )
+    cost = TEXT_PAGE_COST
+    if kind == 'table_heavy':
+        cost += TABLE_HEAVY_COST
+    if needs_ocr:
+        cost += OCR_COST
+    return PageTriage(
+        page_number=page.page_number,
+        kind=kind,
+        needs_ocr=needs_ocr,
+        vision_candidate=vision_candidate,
+        has_figure_image=figure_image,
+        captions=captions,
+        table_text=table_text,
+        cost=cost,
+    )
+
+
+def build_page_plan(pages: list[ParsedPdfPage], *, vision_budget: int = 0) -> PagePlan:
+    """Triage every page and order the work so OCR and vision pages start first.
+
+    The first ``vision_budget`` vision candidates in page order are costed
+    with a vision call, matching which pages the runtime budget will admit.
+    """
+    triaged = [triage_page(page) for page in pages]
+    remaining = max(0, int(vision_budget))
+    planned: list[PageTriage] = []
+    for row in sorted(triaged, key=lambda row: row.page_number):
+        if row.vision_candidate and remaining > 0:
+            remaining -= 1
+            row = replace(row, cost=row.cost + VISION_COST)
+        planned.append(row)
+    planned.sort(key=lambda row: (-row.cost, row.page_number))
+    return PagePlan(pages=planned, total_cost=sum(row.cost for row in planned))
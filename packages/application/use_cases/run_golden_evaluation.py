@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from dataclasses import dataclass
 from pathlib import Path
 import re
@@ -34,6 +36,9 @@ class RunGoldenEvaluationInput:
     top_n: int = 6
     doc_id_filter: str | None = None
     limit: int | None = None
+    # Questions are independent and may run concurrently; turns within a
+    # question always run in order. Results keep the question order.
+    max_workers: int = 1
 
 
 @dataclass(frozen=True)
@@ -208,6 +213,7 @@ def run_golden_evaluation_use_case(
     agent_trace_logger: AgentTracePort | None = None,
     agent_max_iterations: int = 4,
     agent_max_tool_calls: int = 6,
+    agent_max_parallel_tool_calls: int = 1,
     agent_timeout_seconds: float = 20.0,
 ) -> RunGoldenEvaluationOutput:
     catalog_rows = load_catalog(input_data.catalog_path)
@@ -221,9 +227,6 @@ def run_golden_evaluation_use_case(
     if input_data.limit is not None and input_data.limit > 0:
         selected_questions = selected_questions[: input_data.limit]
 
-    missing_docs: set[str] = set()
-    results: list[GoldenQuestionEvaluation] = []
-
     def _run_answer(question_text: str, doc_id: str | None) -> AnswerQuestionOutput:
         return answer_question_use_case(
             AnswerQuestionInput(
@@ -244,16 +247,16 @@ def run_golden_evaluation_use_case(
             agent_trace_logger=agent_trace_logger,
             agent_max_iterations=agent_max_iterations,
             agent_max_tool_calls=agent_max_tool_calls,
+            agent_max_parallel_tool_calls=agent_max_parallel_tool_calls,
             agent_timeout_seconds=agent_timeout_seconds,
             enforce_structured_output=True,
         )
 
-    for question in selected_questions:
+    def _evaluate(question: GoldenQuestion) -> tuple[GoldenQuestionEvaluation, str | None]:
         if question.doc != 'multiple':
             catalog_row = catalog_by_doc.get(question.doc)
             if catalog_row is None or catalog_row.status != 'present':
-                missing_docs.add(question.doc)
-                results.append(
+                return (
                     GoldenQuestionEvaluation(
                         question_id=question.question_id,
                         doc=question.doc,
@@ -280,9 +283,9 @@ def run_golden_evaluation_use_case(
                         executed_turns=0,
                         turn_prompts=[],
                         turn_statuses=[],
-                    )
+                    ),
+                    question.doc,
                 )
-                continue
 
         doc_id = None if question.doc == 'multiple' else question.doc
 
@@ -333,7 +336,7 @@ def run_golden_evaluation_use_case(
         if len(turn_outputs) < max(1, int(question.turn_count)):
             reasons.append('insufficient turns executed for multi-turn scenario')
 
-        results.append(
+        return (
             GoldenQuestionEvaluation(
                 question_id=question.question_id,
                 doc=question.doc,
@@ -360,9 +363,23 @@ def run_golden_evaluation_use_case(
                 executed_turns=len(turn_outputs),
                 turn_prompts=turn_prompts,
                 turn_statuses=turn_statuses,
-            )
+            ),
+            None,
         )
 
+    max_workers = max(1, int(input_data.max_workers))
+    if max_workers > 1 and len(selected_questions) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(selected_questions))) as executor:
+            # Each worker runs in a copy of the caller's context so request-scoped state is visible.
+            evaluated = list(
+                executor.map(lambda question: copy_context().run(_evaluate, question), selected_questions)
+            )
+    else:
+        evaluated = [_evaluate(question) for question in selected_questions]
+
+    results = [row for row, _ in evaluated]
+    missing_docs = {doc for _, doc in evaluated if doc is not None}
+
     passed_questions = sum(1 for row in results if row.pass_result)
     total_questions = len(results)
     failed_questions = total_questions - passed_questions
@@ -1,11 +1,17 @@
 ﻿from __future__ import annotations
 
 import re
+import time
 from collections import Counter
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any, Protocol
 
+from packages.domain.deadline import Deadline
+from packages.domain.embeddings import chunk_embedding
+from packages.domain.models import Chunk
+from packages.domain.timing import StageTimings, active_timings
+from packages.domain.tokenization import word_set, word_tokens
 from packages.ports.chunk_query_port import ChunkQueryPort
 from packages.ports.keyword_search_port import KeywordSearchPort, ScoredChunk
 from packages.ports.reranker_port import RerankCandidate, RerankerPort
@@ -47,6 +53,8 @@ class SearchEvidenceOutput:
     hits: list[EvidenceHit]
     coverage_score: float = 0.0
     modality_hit_counts: dict[str, int] = field(default_factory=dict)
+    degradations: list[str] = field(default_factory=list)
+    timings: dict[str, dict[str, float]] = field(default_factory=dict)
 
 
 class TraceLoggerPort(Protocol):
@@ -73,7 +81,6 @@ _QUERY_EXPANSIONS = {
     'parameter': 'setting',
     'parameters': 'settings',
 }
-_WORD_RE = re.compile(r'[a-z0-9]+')
 _QUERY_NOISE_TERMS = {
     'what', 'which', 'when', 'where', 'why', 'how', 'explain', 'describe', 'show',
     'compare', 'difference', 'versus', 'vs', 'purpose', 'required', 'requirement',
@@ -83,6 +90,9 @@ _FUSION_KEYWORD_WEIGHT = 0.45
 _FUSION_VECTOR_WEIGHT = 0.55
 _FUSION_RRF_K = 60
 _FUSION_RRF_MIX = 0.35
+# Minimum remaining request budget before a remote stage is attempted at all.
+_MIN_VECTOR_BUDGET_SECONDS = 0.5
+_MIN_RERANK_BUDGET_SECONDS = 1.0
 
 
 def _term_in_query(term: str, query: str) -> bool:
@@ -140,7 +150,7 @@ def _expand_query(query: str) -> str:
 
 def _anchor_terms(query: str) -> list[str]:
     out: list[str] = []
-    for raw in _WORD_RE.findall(query.lower()):
+    for raw in word_tokens(query):
         token = raw[:-1] if len(raw) > 4 and raw.endswith('s') else raw
         if len(token) < 3:
             continue
@@ -169,13 +179,13 @@ def _compute_evidence_coverage(query: str, hits: list[EvidenceHit]) -> float:
     if not hits:
         return 0.0
     # Strip punctuation and filter stop words
-    query_tokens = set(_WORD_RE.findall(query.lower())) - _COVERAGE_STOP_WORDS
+    query_tokens = word_set(query) - _COVERAGE_STOP_WORDS
     if not query_tokens:
         # No informative tokens — coverage is undefined; return 0.0 rather
         # than 1.0 to avoid inflating confidence for low-information queries.
         return 0.0
-    # Build per-hit token sets once to avoid repeated regex calls
-    hit_token_sets = [set(_WORD_RE.findall(hit.snippet.lower())) for hit in hits]
+    # Per-hit token sets come from the shared tokenization cache
+    hit_token_sets = [word_set(hit.snippet) for hit in hits]
     covered = sum(
         1
         for token in query_tokens
@@ -187,7 +197,7 @@ def _compute_evidence_coverage(query: str, hits: list[EvidenceHit]) -> float:
 def _anchor_coverage(text: str, anchors: list[str]) -> float:
     if not anchors:
         return 1.0
-    tokens = set(_WORD_RE.findall((text or '').lower()))
+    tokens = word_set(text)
     if not tokens:
         return 0.0
     matched = sum(1 for anchor in anchors if anchor in tokens)
@@ -264,60 +274,117 @@ def _modality_bucket(content_type: str) -> str:
     return 'text'
 
 
+# Compact fused candidate: (score, keyword_score, vector_score, chunk). Fusion
+# and ranking run on these; EvidenceHit and snippets are only built for rows
+# that can reach the response.
+_FusedRow = tuple[float, float, float, Chunk]
+
+
+def _materialize_hit(
+    row: _FusedRow,
+    *,
+    score: float | None = None,
+    rerank_score: float = 0.0,
+    snippet: str | None = None,
+) -> EvidenceHit:
+    fused_score, keyword_score, vector_score, chunk = row
+    return EvidenceHit(
+        chunk_id=chunk.chunk_id,
+        doc_id=chunk.doc_id,
+        content_type=chunk.content_type,
+        page_start=chunk.page_start,
+        page_end=chunk.page_end,
+        section_path=chunk.section_path,
+        figure_id=chunk.figure_id,
+        table_id=chunk.table_id,
+        score=fused_score if score is None else score,
+        keyword_score=keyword_score,
+        vector_score=vector_score,
+        snippet=_snippet(chunk.content_text) if snippet is None else snippet,
+        rerank_score=rerank_score,
+    )
+
+
 def _apply_reranker(
     *,
     query: str,
-    hits: list[EvidenceHit],
+    rows: list[_FusedRow],
     reranker: RerankerPort,
     top_n: int,
     pool_size: int,
-) -> list[EvidenceHit]:
-    if not hits:
-        return []
+) -> tuple[list[EvidenceHit], list[_FusedRow]]:
+    """Rerank the head of ``rows``; return materialized pool hits and the unranked tail."""
+    if not rows:
+        return [], []
 
-    pool_count = max(top_n, min(max(pool_size, top_n), len(hits)))
-    pool = hits[:pool_count]
+    pool_count = max(top_n, min(max(pool_size, top_n), len(rows)))
+    pool = rows[:pool_count]
+    tail = rows[pool_count:]
+    snippets = [_snippet(row[3].content_text) for row in pool]
 
     candidates = [
         RerankCandidate(
-            chunk_id=hit.chunk_id,
-            doc_id=hit.doc_id,
-            page_start=hit.page_start,
-            content_type=hit.content_type,
-            text=hit.snippet,
-            base_score=hit.score,
+            chunk_id=chunk.chunk_id,
+            doc_id=chunk.doc_id,
+            page_start=chunk.page_start,
+            content_type=chunk.content_type,
+            text=snippet,
+            base_score=score,
+            embedding=chunk_embedding(chunk.metadata, reranker.embedding_key),
         )
-        for hit in pool
+        for (score, _, _, chunk), snippet in zip(pool, snippets)
     ]
     reranked = reranker.rerank(query=query, candidates=candidates, top_k=pool_count)
     if not reranked:
-        return hits
+        return [_materialize_hit(row, snippet=snippet) for row, snippet in zip(pool, snippets)], tail
 
     rerank_map = {row.chunk_id: row.score for row in reranked}
     blended: list[EvidenceHit] = []
-    for hit in pool:
-        rr = rerank_map.get(hit.chunk_id, 0.0)
-        final_score = 0.35 * hit.score + 0.65 * rr
+    for row, snippet in zip(pool, snippets):
+        rr = rerank_map.get(row[3].chunk_id, 0.0)
+        final_score = 0.35 * row[0] + 0.65 * rr
         blended.append(
-            EvidenceHit(
-                chunk_id=hit.chunk_id,
-                doc_id=hit.doc_id,
-                content_type=hit.content_type,
-                page_start=hit.page_start,
-                page_end=hit.page_end,
-                section_path=hit.section_path,
-                figure_id=hit.figure_id,
-                table_id=hit.table_id,
+            _materialize_hit(
+                row,
                 score=round(final_score, 6),
-                keyword_score=hit.keyword_score,
-                vector_score=hit.vector_score,
-                snippet=hit.snippet,
                 rerank_score=round(rr, 6),
+                snippet=snippet,
             )
         )
 
-    blended.sort(key=lambda row: row.score, reverse=True)
-    return blended + hits[pool_count:]
+    blended.sort(key=lambda hit: hit.score, reverse=True)
+    return blended, tail
+
+
+def _promote_modality_diversity(hits: list[EvidenceHit], tail: list[_FusedRow]) -> list[EvidenceHit]:
+    """Move the best hit of a second content_type up to position two.
+
+    A relevance floor (40% of the top hit's score) prevents low-ranked chunks
+    from being promoted ahead of highly relevant single-modality hits. The
+    unmaterialized ``tail`` is only consulted when ``hits`` holds one modality.
+    """
+    if not hits:
+        return hits
+    relevance_floor = hits[0].score * 0.40
+    modalities_seen: set[str] = set()
+    diverse: list[EvidenceHit] = []
+    remainder: list[EvidenceHit] = []
+    for hit in hits:
+        if (
+            hit.content_type not in modalities_seen
+            and len(modalities_seen) < 2
+            and hit.score >= relevance_floor
+        ):
+            diverse.append(hit)
+            modalities_seen.add(hit.content_type)
+        else:
+            remainder.append(hit)
+    if len(modalities_seen) < 2:
+        for row in tail:
+            if row[3].content_type not in modalities_seen and row[0] >= relevance_floor:
+                diverse.append(_materialize_hit(row))
+                break
+    return diverse + remainder
 
 
 def search_evidence_use_case(
@@ -327,7 +394,12 @@ def search_evidence_use_case(
     vector_search: VectorSearchPort,
     trace_logger: TraceLoggerPort | None = None,
     reranker: RerankerPort | None = None,
+    deadline: Deadline | None = None,
+    timings: StageTimings | None = None,
 ) -> SearchEvidenceOutput:
+    # Reuse the caller's recorder (e.g. answer_question or an agentic tool call)
+    # so one request reports a single set of stage timings.
+    timings = timings or active_timings() or StageTimings()
     query = input_data.query.strip()
     if not query:
         return SearchEvidenceOutput(
@@ -339,13 +411,30 @@ def search_evidence_use_case(
             modality_hit_counts={},
         )
 
-    chunks = chunk_query.list_chunks(doc_id=input_data.doc_id)
+    with timings.span('chunk_load') as span:
+        chunks = chunk_query.list_chunks(doc_id=input_data.doc_id)
+        span['items'] = len(chunks)
     intent = _detect_intent(query)
     expanded_query = _expand_query(query)
     anchors = _anchor_terms(query)
 
-    keyword_hits = keyword_search.search(expanded_query, chunks, input_data.top_k_keyword)
-    vector_hits = vector_search.search(query, chunks, input_data.top_k_vector)
+    degradations: list[str] = []
+
+    with timings.span('keyword_search', items=len(chunks)):
+        keyword_hits = keyword_search.search(expanded_query, chunks, input_data.top_k_keyword)
+    if deadline is None:
+        with timings.span('vector_search', items=len(chunks)):
+            vector_hits = vector_search.search(query, chunks, input_data.top_k_vector)
+    elif deadline.allows(_MIN_VECTOR_BUDGET_SECONDS):
+        with timings.span('vector_search', items=len(chunks)):
+            vector_hits = vector_search.bounded(deadline.remaining()).search(
+                query, chunks, input_data.top_k_vector
+            )
+    else:
+        vector_hits = []
+        degradations.append('vector_search_skipped')
+
+    fusion_started = time.perf_counter()
 
     keyword_norm = _normalize_scores(keyword_hits)
     vector_norm = _normalize_scores(vector_hits)
@@ -378,7 +467,7 @@ def search_evidence_use_case(
         )
         by_chunk[key]['vector_score'] = vector_norm.get(key, 0.0)
 
-    scored_hits: list[tuple[float, EvidenceHit]] = []
+    scored_rows: list[tuple[float, _FusedRow]] = []
     for row in by_chunk.values():
         chunk = row['chunk']
         base = (
@@ -396,66 +485,53 @@ def search_evidence_use_case(
         coverage_weight = 0.70 + 0.60 * coverage
         weighted = fused * _content_type_weight(chunk.content_type, intent) * coverage_weight
 
-        scored_hits.append(
+        scored_rows.append(
             (
                 coverage,
-                EvidenceHit(
-                    chunk_id=chunk.chunk_id,
-                    doc_id=chunk.doc_id,
-                    content_type=chunk.content_type,
-                    page_start=chunk.page_start,
-                    page_end=chunk.page_end,
-                    section_path=chunk.section_path,
-                    figure_id=chunk.figure_id,
-                    table_id=chunk.table_id,
-                    score=round(weighted, 6),
-                    keyword_score=round(row['keyword_score'], 6),
-                    vector_score=round(row['vector_score'], 6),
-                    snippet=_snippet(chunk.content_text),
+                (
+                    round(weighted, 6),
+                    round(row['keyword_score'], 6),
+                    round(row['vector_score'], 6),
+                    chunk,
                 ),
             )
         )
 
     if anchors and len(anchors) >= 2:
-        filtered = [row for row in scored_hits if row[0] >= 0.15]
+        filtered = [row for row in scored_rows if row[0] >= 0.15]
         if filtered:
-            scored_hits = filtered
+            scored_rows = filtered
 
-    hits = [row[1] for row in scored_hits]
-    hits.sort(key=lambda x: x.score, reverse=True)
+    rows = [row[1] for row in scored_rows]
+    rows.sort(key=lambda row: row[0], reverse=True)
+    timings.record('fusion', time.perf_counter() - fusion_started, items=len(by_chunk))
 
     reranker_enabled = reranker is not None
-    if reranker is not None and hits:
-        hits = _apply_reranker(
-            query=query,
-            hits=hits,
-            reranker=reranker,
-            top_n=input_data.top_n,
-            pool_size=input_data.rerank_pool_size,
-        )
+    if reranker is not None and deadline is not None and rows:
+        if deadline.allows(_MIN_RERANK_BUDGET_SECONDS):
+            reranker = reranker.bounded(deadline.remaining())
+        else:
+            reranker = None
+            degradations.append('rerank_skipped')
+    if reranker is not None and rows:
+        with timings.span('rerank') as span:
+            hits, tail = _apply_reranker(
+                query=query,
+                rows=rows,
+                reranker=reranker,
+                top_n=input_data.top_n,
+                pool_size=input_data.rerank_pool_size,
+            )
+            span['items'] = len(hits)
+    else:
+        hits = [_materialize_hit(row) for row in rows[: input_data.top_n]]
+        tail = rows[input_data.top_n :]
 
     # Stable modality diversity promotion: ensure top results include ≥2
     # content_type varieties when the pool allows it.  Only for multimodal
     # intents; procedure queries are expected to be text-only.
-    # A relevance floor (40% of the top hit's score) prevents low-ranked
-    # chunks from being promoted ahead of highly relevant single-modality hits.
-    if intent in ('table', 'diagram', 'general') and len(hits) >= 5:
-        top_score = hits[0].score if hits else 0.0
-        relevance_floor = top_score * 0.40
-        modalities_seen: set[str] = set()
-        diverse: list[EvidenceHit] = []
-        remainder: list[EvidenceHit] = []
-        for hit in hits:
-            if (
-                hit.content_type not in modalities_seen
-                and len(modalities_seen) < 2
-                and hit.score >= relevance_floor
-            ):
-                diverse.append(hit)
-                modalities_seen.add(hit.content_type)
-            else:
-                remainder.append(hit)
-        hits = diverse + remainder
+    if intent in ('table', 'diagram', 'general') and len(hits) + len(tail) >= 5:
+        hits = _promote_modality_diversity(hits, tail)
 
     top_hits = hits[: input_data.top_n]
 
@@ -483,6 +559,8 @@ def search_evidence_use_case(
                 'expanded_query': expanded_query,
                 'anchor_terms': anchors,
                 'reranker_enabled': reranker_enabled,
+                'degradations': degradations,
+                'timings': timings.as_dict(),
                 'total_chunks_scanned': len(chunks),
                 'scanned_content_type_counts': scanned_content_type_counts,
                 'scanned_modality_counts': scanned_modality_counts,
@@ -514,4 +592,6 @@ def search_evidence_use_case(
         hits=top_hits,
         coverage_score=coverage_score,
         modality_hit_counts=modality_hit_counts,
+        degradations=degradations,
+        timings=timings.as_dict(),
     )
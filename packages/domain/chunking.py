@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+# Tokens here are whitespace-separated words: a cheap, model-independent proxy
+# that keeps windows well inside embedding context limits (roughly 1.3 model
+# tokens per word for English manuals).
+_NUMBERED_HEADING_RE = re.compile(r'^(\d{1,2}(?:\.\d{1,2}){0,4})\.?\s+[A-Z]')
+_MAX_HEADING_WORDS = 10
+# All-caps lines starting with these are admonitions or captions, not outline headings.
+_LABEL_WORDS = frozenset(
+    {
+        'ATTENTION', 'CAUTION', 'DANGER', 'FIG', 'FIGURE', 'HINT', 'IMPORTANT', 'NB',
+        'NOTE', 'NOTES', 'NOTICE', 'STEP', 'TABLE', 'TIP', 'WARNING', 'WARNINGS',
+    }
+)
+_SECTION_SEPARATOR = ' > '
+
+
+@dataclass(frozen=True)
+class TextWindow:
+    text: str
+    section_path: str | None
+
+
+def heading_level(line: str) -> int | None:
+    """Outline depth of ``line`` when it looks like a heading, else ``None``.
+
+    Numbered headings (``3.2 Pump Removal``) nest by their number; short
+    all-caps lines (``MAINTENANCE``) are top-level, except admonitions and
+    labels such as ``CAUTION`` or ``NOTE``.
+    """
+    stripped = line.strip()
+    words = stripped.split()
+    if not words or len(words) > _MAX_HEADING_WORDS or stripped.endswith(('.', ':', ';', ',')):
+        return None
+    match = _NUMBERED_HEADING_RE.match(stripped)
+    if match:
+        return match.group(1).count('.') + 1
+    if re.sub(r'[^A-Z]', '', words[0]) in _LABEL_WORDS:
+        return None
+    letters = sum(1 for char in stripped if char.isalpha())
+    if letters >= 4 and stripped.isupper() and letters >= 0.6 * len(stripped.replace(' ', '')):
+        return 1
+    return None
+
+
+class TextChunker:
+    """Split page text into bounded, heading-aligned windows.
+
+    Windows hold at most ``max_tokens`` words, never straddle a heading and
+    repeat the last ``overlap_tokens`` words of the previous window in the same
+    section. The heading outline carries over between ``split`` calls, so feed
+    pages in order to give windows that continue a section its ``section_path``.
+    """
+
+    def __init__(self, max_tokens: int, overlap_tokens: int = 0) -> None:
+        self.max_tokens = max(1, int(max_tokens))
+        self.overlap_tokens = max(0, min(int(overlap_tokens), self.max_tokens // 2))
+        # (level, title, numbered) from the outermost heading in.
+        self._outline: list[tuple[int, str, bool]] = []
+
+    @property
+    def section_path(self) -> str | None:
+        if not self._outline:
+            return None
+        return _SECTION_SEPARATOR.join(title for _, title, _ in self._outline)
+
+    def _enter_heading(self, level: int, title: str, numbered: bool) -> None:
+        if not numbered and any(entry[2] for entry in self._outline):
+            # Inside a numbered outline an all-caps heading only replaces other
+            # all-caps headings and nests under the innermost numbered one.
+            while not self._outline[-1][2]:
+                self._outline.pop()
+            level = self._outline[-1][0] + 1
+        while self._outline and self._outline[-1][0] >= level:
+            self._outline.pop()
+        self._outline.append((level, title, numbered))
+
+    def split(self, text: str) -> list[TextWindow]:
+        windows: list[TextWindow] = []
+        words: list[str] = []
+        fresh = 0  # words in ``words`` not already emitted by the previous window
+        heading_only = False
+
+        def flush(*, keep_overlap: bool) -> None:
+            nonlocal words, fresh
+            if fresh:
+                windows.append(TextWindow(text=' '.join(words), section_path=self.section_path))
+            words = words[len(words) - self.overlap_tokens :] if keep_overlap and self.overlap_tokens else []
+            fresh = 0
+
+        for line in text.splitlines():
+            line_words = line.split()
+            if not line_words:
+                continue
+            level = heading_level(line)
+            if level is not None:
+                if not heading_only:
+                    flush(keep_overlap=False)
+                numbered = _NUMBERED_HEADING_RE.match(line.strip()) is not None
+                self._enter_heading(level, ' '.join(line_words), numbered)
+            elif (
+                fresh
+                and not heading_only
+                and len(line_words) <= self.max_tokens
+                and len(words) + len(line_words) > self.max_tokens
+            ):
+                # Start a short line in a new window rather than cutting it in two.
+                flush(keep_overlap=True)
+            heading_only = level is not None
+            for word in line_words:
+                if len(words) >= self.max_tokens:
+                    flush(keep_overlap=True)
+                words.append(word)
+                fresh += 1
+        flush(keep_overlap=False)
+        return windows
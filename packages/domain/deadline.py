@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Deadline:
+    """Request-scoped latency budget measured on the monotonic clock."""
+
+    budget_seconds: float
+    started_at: float
+
+    @classmethod
+    def after(cls, seconds: float) -> Deadline:
+        return cls(budget_seconds=max(0.0, float(seconds)), started_at=time.monotonic())
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    def remaining(self) -> float:
+        return max(0.0, self.budget_seconds - self.elapsed())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+    def allows(self, min_seconds: float) -> bool:
+        """True when at least ``min_seconds`` of budget are left for the next stage."""
+        return self.remaining() >= max(0.0, min_seconds)
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import Any
+
+
+def embedding_model_key(provider: str, model: str) -> str:
+    """Stable key a chunk's vector for one embedding model is stored under."""
+    return f'{provider.strip().lower()}:{model.strip()}'
+
+
+def chunk_embedding(metadata: Any, embedding_key: str | None = None) -> list[float] | None:
+    """The chunk vector for ``embedding_key``, or the legacy ``embedding`` field when no key is given.
+
+    Vectors for several models live side by side in ``metadata['embeddings']``
+    so search can switch models without re-ingesting.
+    """
+    if not isinstance(metadata, dict):
+        return None
+    if embedding_key:
+        versioned = metadata.get('embeddings')
+        vector = versioned.get(embedding_key) if isinstance(versioned, dict) else None
+    else:
+        vector = metadata.get('embedding')
+    if not isinstance(vector, list) or not vector:
+        return None
+    return vector
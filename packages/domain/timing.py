@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+
+
+class StageTimings:
+    """Thread-safe per-request accumulator of stage durations and counters.
+
+    Stages are flat names (``vector_search``, ``ollama.embed``); repeated
+    entries accumulate ``ms`` and ``calls`` plus any numeric counters such as
+    ``items`` or ``bytes``. While a span is open the instance is also the
+    context-active recorder, so adapters can report through ``record_stage``
+    without signature changes.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._stages: dict[str, dict[str, float]] = {}
+
+    def record(self, stage: str, seconds: float, **counters: float) -> None:
+        with self._lock:
+            row = self._stages.setdefault(stage, {'ms': 0.0, 'calls': 0})
+            row['ms'] += max(0.0, seconds) * 1000.0
+            row['calls'] += 1
+            for key, value in counters.items():
+                row[key] = row.get(key, 0) + value
+
+    @contextmanager
+    def span(self, stage: str, **counters: float) -> Iterator[dict[str, float]]:
+        """Time a block; the yielded dict collects counters set inside it."""
+        values: dict[str, float] = dict(counters)
+        token = _ACTIVE.set(self)
+        started = time.perf_counter()
+        try:
+            yield values
+        finally:
+            _ACTIVE.reset(token)
+            self.record(stage, time.perf_counter() - started, **values)
+
+    def as_dict(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            return {
+                stage: {key: round(value, 3) if key == 'ms' else value for key, value in row.items()}
+                for stage, row in self._stages.items()
+            }
+
+
+_ACTIVE: ContextVar[StageTimings | None] = ContextVar('stage_timings', default=None)
+
+
+def active_timings() -> StageTimings | None:
+    return _ACTIVE.get()
+
+
+def record_stage(stage: str, seconds: float, **counters: float) -> None:
+    """Record into the context-active timings, if any; a no-op otherwise."""
+    timings = _ACTIVE.get()
+    if timings is not None:
+        timings.record(stage, seconds, **counters)
+
+
+@contextmanager
+def timed_stage(stage: str, **counters: float) -> Iterator[dict[str, float]]:
+    """Span on the context-active timings; yields a throwaway dict when none is active."""
+    timings = _ACTIVE.get()
+    if timings is None:
+        yield dict(counters)
+        return
+    with timings.span(stage, **counters) as values:
+        yield values
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import re
+import sys
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from threading import Lock
+from types import MappingProxyType
+from typing import Callable, Iterable, Mapping
+
+# Queries and snippets are tokenized by keyword search, hash vectors,
+# anchor/evidence coverage, answer overlap and rerank fallback. Those caches
+# are keyed by the text itself so a request tokenizes each distinct text at
+# most once. Whole-corpus scans go through ``ChunkTermCache`` instead, keyed by
+# chunk id, so they neither thrash nor flush the text caches.
+_WORD_RE = re.compile(r'[a-z0-9]+')
+_TEXT_CACHE_SIZE = 8192
+# Distinct (chunk, term) pairs a ``ChunkTermCache`` holds, roughly 100 bytes each.
+DEFAULT_CHUNK_TERM_BUDGET = 2_000_000
+
+_KEYWORD_ALIASES = {
+    'analog': 'analogue',
+    'analogue': 'analogue',
+    'mean': 'description',
+    'meaning': 'description',
+    'descriptions': 'description',
+    'parameters': 'parameter',
+    'signals': 'signal',
+}
+_KEYWORD_STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'do', 'does', 'for', 'from',
+    'how', 'i', 'in', 'is', 'it', 'of', 'on', 'or', 'that', 'the', 'to', 'what',
+    'when', 'where', 'which', 'why', 'with',
+}
+_KEYWORD_COMPOUND_SPLITS = {
+    'acroset': ('acro', 'set'),
+    'torqueset': ('torque', 'set'),
+    'projectaset': ('projecta', 'set'),
+    'clampset': ('clamp', 'set'),
+    'setright': ('set', 'right'),
+}
+
+
+def _word_tokens(text: str) -> tuple[str, ...]:
+    return tuple(_WORD_RE.findall((text or '').lower()))
+
+
+@lru_cache(maxsize=_TEXT_CACHE_SIZE)
+def word_tokens(text: str) -> tuple[str, ...]:
+    """Lowercase alphanumeric tokens of ``text`` in order."""
+    return _word_tokens(text)
+
+
+@lru_cache(maxsize=_TEXT_CACHE_SIZE)
+def word_set(text: str) -> frozenset[str]:
+    """Distinct lowercase alphanumeric tokens of ``text``."""
+    return frozenset(word_tokens(text))
+
+
+def _keyword_terms(tokens: Iterable[str]) -> tuple[str, ...]:
+    out: list[str] = []
+    for raw in tokens:
+        token = raw
+        if len(token) > 3 and token.endswith('s'):
+            token = token[:-1]
+        token = _KEYWORD_ALIASES.get(token, token)
+        if token in _KEYWORD_STOPWORDS:
+            continue
+        out.append(token)
+        out.extend(_KEYWORD_COMPOUND_SPLITS.get(token, ()))
+    return tuple(out)
+
+
+@lru_cache(maxsize=_TEXT_CACHE_SIZE)
+def keyword_terms(text: str) -> tuple[str, ...]:
+    """BM25 terms of a query: singularized, aliased, stopwords dropped, compounds split."""
+    return _keyword_terms(word_tokens(text))
+
+
+class ChunkTermCache:
+    """Term counts and lengths of chunk texts, keyed by ``chunk_id``.
+
+    An entry is reused only while the hash of the chunk's text is unchanged,
+    and the cache is bounded by the distinct terms it holds rather than by
+    entry count. A scan never evicts entries it already used to admit new
+    ones, so a corpus larger than the budget keeps hitting on the part that
+    fits instead of missing on every chunk of every scan.
+    """
+
+    def __init__(
+        self,
+        terms: Callable[[str], Iterable[str]],
+        *,
+        max_terms: int = DEFAULT_CHUNK_TERM_BUDGET,
+    ) -> None:
+        self._terms = terms
+        self._max_terms = max(0, int(max_terms))
+        self._lock = Lock()
+        # chunk_id -> (text hash, last scan, read-only term counts, length)
+        self._entries: OrderedDict[str, tuple[int, int, Mapping[str, int], int]] = OrderedDict()
+        self._held = 0
+        self._scan = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def counts(self, chunks: Iterable[tuple[str, str]]) -> list[tuple[Mapping[str, int], int]]:
+        """``(term counts, length)`` for each ``(chunk_id, text)`` pair; the mappings are read-only."""
+        with self._lock:
+            self._scan += 1
+            scan = self._scan
+        out: list[tuple[Mapping[str, int], int]] = []
+        for chunk_id, text in chunks:
+            text_hash = hash(text)
+            with self._lock:
+                entry = self._entries.get(chunk_id)
+                if entry is not None and entry[0] == text_hash:
+                    self._entries[chunk_id] = (text_hash, scan, entry[2], entry[3])
+                    self._entries.move_to_end(chunk_id)
+                    self.hits += 1
+                    out.append((entry[2], entry[3]))
+                    continue
+                self.misses += 1
+            # Interned so the many entries sharing a term share one string.
+            counts = Counter(map(sys.intern, self._terms(text)))
+            row = (MappingProxyType(dict(counts)), sum(counts.values()))
+            out.append(row)
+            if chunk_id:
+                self._admit(chunk_id, text_hash, scan, row)
+        return out
+
+    def _admit(self, chunk_id: str, text_hash: int, scan: int, row: tuple[Mapping[str, int], int]) -> None:
+        weight = len(row[0])
+        with self._lock:
+            previous = self._entries.pop(chunk_id, None)
+            if previous is not None:
+                self._held -= len(previous[2])
+            while self._held + weight > self._max_terms and self._entries:
+                oldest_id, oldest = next(iter(self._entries.items()))
+                if oldest[1] >= scan:
+                    return
+                del self._entries[oldest_id]
+                self._held -= len(oldest[2])
+            if self._held + weight > self._max_terms:
+                return
+            self._entries[chunk_id] = (text_hash, scan, row[0], row[1])
+            self._held += weight
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._held = 0
+            self.hits = 0
+            self.misses = 0
+
+
+# Shared by keyword search and the embedding reranker's BM25 features.
+KEYWORD_TERM_COUNTS = ChunkTermCache(lambda text: _keyword_terms(_word_tokens(text)))
+# Plain word counts of chunk texts, used by hash vectors.
+WORD_COUNTS = ChunkTermCache(_word_tokens)
+
+
+def clear_token_caches() -> None:
+    word_tokens.cache_clear()
+    word_set.cache_clear()
+    keyword_terms.cache_clear()
+    KEYWORD_TERM_COUNTS.clear()
+    WORD_COUNTS.clear()
@@ -5,8 +5,27 @@ from abc import ABC, abstractmethod
 from packages.domain.models import Chunk
 
 
+class ChunkStoreConflictError(RuntimeError):
+    """The doc's chunks were persisted again since the caller read them."""
+
+
 class ChunkStorePort(ABC):
     @abstractmethod
     def persist(self, doc_id: str, chunks: list[Chunk]) -> str:
         """Persist chunks and return an asset reference path."""
         raise NotImplementedError
+
+    @abstractmethod
+    def load(self, doc_id: str) -> list[Chunk]:
+        """Chunks last persisted for ``doc_id``."""
+        raise NotImplementedError
+
+    def version(self, doc_id: str) -> str | None:
+        """Token that changes on every persist of ``doc_id``; ``None`` when none exists or it is not tracked."""
+        return None
+
+    def persist_if_unchanged(self, doc_id: str, chunks: list[Chunk], version: str | None) -> str:
+        """Persist only while ``doc_id`` is still at ``version``; raise ``ChunkStoreConflictError`` otherwise."""
+        if self.version(doc_id) != version:
+            raise ChunkStoreConflictError(f'{doc_id}: chunks changed since version {version}')
+        return self.persist(doc_id, chunks)
@@ -4,6 +4,15 @@ from abc import ABC, abstractmethod
 
 
 class EmbeddingPort(ABC):
+    def bounded(self, timeout_seconds: float) -> EmbeddingPort:
+        """Return an instance whose remote calls, retries included, fit within ``timeout_seconds``."""
+        _ = timeout_seconds
+        return self
+
     @abstractmethod
     def embed_text(self, text: str) -> list[float]:
         raise NotImplementedError
+
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """Embed a batch; an empty list marks a failed item. Adapters override this to batch remote calls."""
+        return [self.embed_text(text) for text in texts]
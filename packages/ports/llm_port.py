@@ -14,6 +14,14 @@ class LlmEvidence:
 
 
 class LlmPort(ABC):
+    def bounded(self, timeout_seconds: float) -> LlmPort:
+        """Return an instance whose remote calls fit within ``timeout_seconds``.
+
+        Adapters without network calls keep the default and return ``self``.
+        """
+        _ = timeout_seconds
+        return self
+
     @abstractmethod
     def generate_answer(
         self,
@@ -3,11 +3,34 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
+BBox = tuple[float, float, float, float]
+
+
+@dataclass(frozen=True)
+class PdfTextLine:
+    text: str
+    bbox: BBox
+
+
+@dataclass(frozen=True)
+class PdfBlock:
+    """A layout block in PDF points; ``kind`` is ``'text'`` or ``'image'``."""
+
+    kind: str
+    bbox: BBox
+    lines: tuple[PdfTextLine, ...] = ()
+
+    @property
+    def text(self) -> str:
+        return '\n'.join(line.text for line in self.lines)
+
 
 @dataclass(frozen=True)
 class ParsedPdfPage:
     page_number: int
     text: str
+    # Empty when the parser has no layout information (e.g. pypdf).
+    blocks: tuple[PdfBlock, ...] = ()
 
 
 class PdfParserPort(ABC):
@@ -9,6 +9,9 @@ class PlanStep:
     step_id: str
     tool_name: str
     objective: str
+    # Optional per-step tool arguments (e.g. a sub-query or doc scope); unset means the run's own.
+    query: str | None = None
+    doc_id: str | None = None
 
 
 class PlannerPort(ABC):
@@ -12,6 +12,7 @@ class RerankCandidate:
     content_type: str
     text: str
     base_score: float
+    embedding: list[float] | None = None
 
 
 @dataclass(frozen=True)
@@ -21,6 +22,15 @@ class RankedCandidate:
 
 
 class RerankerPort(ABC):
+    # Stored chunk vector handed over as ``RerankCandidate.embedding``
+    # (see ``chunk_embedding``); ``None`` reads the legacy ``embedding`` field.
+    embedding_key: str | None = None
+
+    def bounded(self, timeout_seconds: float) -> RerankerPort:
+        """Return an instance whose remote calls fit within ``timeout_seconds``."""
+        _ = timeout_seconds
+        return self
+
     @abstractmethod
     def rerank(
         self,
@@ -15,6 +15,8 @@ class GraphRunLimits:
     max_iterations: int = 4
     max_tool_calls: int = 6
     timeout_seconds: float = 20.0
+    # Consecutive independent steps (retrieval) run concurrently up to this many at once.
+    max_parallel_tool_calls: int = 1
 
 
 @dataclass(frozen=True)
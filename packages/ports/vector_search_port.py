@@ -7,6 +7,11 @@ from packages.ports.keyword_search_port import ScoredChunk
 
 
 class VectorSearchPort(ABC):
+    def bounded(self, timeout_seconds: float) -> VectorSearchPort:
+        """Return an instance whose query embedding call fits within ``timeout_seconds``."""
+        _ = timeout_seconds
+        return self
+
     @abstractmethod
     def search(self, query: str, chunks: list[Chunk], top_k: int) -> list[ScoredChunk]:
         raise NotImplementedError
@@ -14,6 +14,7 @@ from packages.adapters.data_contracts.visual_artifact_generation import (
     load_chunk_rows,
     write_visual_artifacts,
 )
+from packages.adapters.storage.doc_generations import artifact_path
 
 
 def _parse_doc_ids(value: str | None) -> list[str] | None:
@@ -38,7 +39,7 @@ def _discover_doc_ids(assets_dir: Path) -> list[str]:
     return sorted(
         row.name
         for row in assets_dir.iterdir()
-        if row.is_dir() and (row / 'chunks.jsonl').exists()
+        if row.is_dir() and artifact_path(row, 'chunks.jsonl').exists()
     )
 
 
@@ -53,7 +54,7 @@ def main() -> int:
 
     for doc_id in selected:
         doc_dir = args.assets_dir / doc_id
-        chunk_rows = load_chunk_rows(doc_dir / 'chunks.jsonl')
+        chunk_rows = load_chunk_rows(artifact_path(doc_dir, 'chunks.jsonl'))
         visual_rows, embedding_rows, manifest = build_visual_artifacts_from_chunks(doc_id, chunk_rows)
         write_visual_artifacts(doc_dir, visual_rows, embedding_rows, manifest)
         docs_payload[doc_id] = {
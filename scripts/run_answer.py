@@ -51,7 +51,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument('--embedding-base-url', default='http://localhost:11434')
     parser.add_argument('--embedding-model', default='mxbai-embed-large:latest')
     parser.add_argument('--use-reranker', action='store_true')
-    parser.add_argument('--reranker-provider', default='ollama', help='noop|ollama')
+    parser.add_argument('--reranker-provider', default='ollama', help='noop|ollama|embedding')
     parser.add_argument('--reranker-base-url', default='http://localhost:11434')
     parser.add_argument('--reranker-model', default='deepseek-r1:8b')
     parser.add_argument('--rerank-pool-size', type=int, default=24)
@@ -59,6 +59,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument('--agentic-provider', default='langgraph')
     parser.add_argument('--agentic-max-iterations', type=int, default=4)
     parser.add_argument('--agentic-max-tool-calls', type=int, default=6)
+    parser.add_argument('--agentic-max-parallel-tool-calls', type=int, default=4)
     parser.add_argument('--agentic-timeout-seconds', type=float, default=20.0)
     parser.add_argument(
         '--agentic-trace-file',
@@ -210,6 +211,7 @@ def main() -> int:
         agent_trace_logger=agent_trace_logger,
         agent_max_iterations=args.agentic_max_iterations,
         agent_max_tool_calls=args.agentic_max_tool_calls,
+        agent_max_parallel_tool_calls=args.agentic_max_parallel_tool_calls,
         agent_timeout_seconds=args.agentic_timeout_seconds,
     )
 
@@ -30,6 +30,7 @@ from packages.adapters.retrieval.hash_vector_search_adapter import HashVectorSea
 from packages.adapters.retrieval.metadata_vector_search_adapter import MetadataVectorSearchAdapter
 from packages.adapters.retrieval.retrieval_trace_logger import RetrievalTraceLogger
 from packages.adapters.retrieval.simple_keyword_search_adapter import SimpleKeywordSearchAdapter
+from packages.adapters.storage.doc_generations import artifact_path
 from packages.application.config import load_config
 from packages.application.use_cases.run_golden_evaluation import (
     RunGoldenEvaluationInput,
@@ -170,7 +171,7 @@ def _list_ingested_doc_ids(assets_dir: Path) -> list[str]:
     return sorted(
         row.name
         for row in assets_dir.iterdir()
-        if row.is_dir() and (row / 'chunks.jsonl').exists()
+        if row.is_dir() and artifact_path(row, 'chunks.jsonl').exists()
     )
 
 
@@ -387,6 +388,7 @@ def main() -> int:
             agent_trace_logger=agent_trace_logger,
             agent_max_iterations=base_cfg.agentic_max_iterations,
             agent_max_tool_calls=base_cfg.agentic_max_tool_calls,
+            agent_max_parallel_tool_calls=base_cfg.agentic_max_parallel_tool_calls,
             agent_timeout_seconds=base_cfg.agentic_timeout_seconds,
         )
 
@@ -541,6 +543,7 @@ def main() -> int:
         'agentic_limits': {
             'max_iterations': base_cfg.agentic_max_iterations,
             'max_tool_calls': base_cfg.agentic_max_tool_calls,
+            'max_parallel_tool_calls': base_cfg.agentic_max_parallel_tool_calls,
             'timeout_seconds': base_cfg.agentic_timeout_seconds,
         },
     }
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from concurrent.futures import Executor
+from dataclasses import asdict, replace
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from packages.adapters.data_contracts.visual_artifact_generation import (
+    generate_visual_artifacts_for_doc,
+)
+from packages.adapters.data_contracts.yaml_catalog_adapter import YamlDocumentCatalogAdapter
+from packages.adapters.embeddings.factory import create_embedding_adapter
+from packages.adapters.ocr.factory import create_ocr_adapter
+from packages.adapters.pdf.factory import create_pdf_parser
+from packages.adapters.storage.embedding_model_registry import EmbeddingModelRegistry
+from packages.adapters.storage.filesystem_chunk_store_adapter import FilesystemChunkStoreAdapter
+from packages.adapters.storage.ingestion_run_log import (
+    IngestionRunLog,
+    build_ingestion_run_row,
+    ingestion_config_snapshot,
+    sha256_file,
+)
+from packages.adapters.tables.simple_table_extractor_adapter import SimpleTableExtractorAdapter
+from packages.adapters.vision.factory import create_vision_adapter
+from packages.application.config import load_config
+from packages.application.use_cases.ingest_batch import (
+    BatchDocument,
+    IngestBatchInput,
+    ingest_batch_use_case,
+)
+from packages.application.use_cases.ingest_document import (
+    IngestDocumentInput,
+    ingest_document_use_case,
+)
+from packages.domain.embeddings import embedding_model_key
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description='Ingest many catalog documents under one shared page-worker budget'
+    )
+    parser.add_argument('--doc-ids', default='', help='Comma-separated doc ids to ingest')
+    parser.add_argument('--all', action='store_true', help='Ingest every catalog doc with status=present')
+    parser.add_argument('--force', action='store_true', help='Re-ingest docs whose latest run is current')
+    parser.add_argument(
+        '--doc-concurrency',
+        type=int,
+        default=None,
+        help='Documents in flight at once (default INGEST_BATCH_DOC_CONCURRENCY)',
+    )
+    parser.add_argument(
+        '--page-worker-budget',
+        type=int,
+        default=None,
+        help='Page threads shared by all documents (default INGEST_BATCH_PAGE_WORKERS)',
+    )
+    parser.add_argument(
+        '--catalog',
+        type=Path,
+        default=Path('.context/project/data/document_catalog.yaml'),
+        help='Path to catalog yaml',
+    )
+    parser.add_argument(
+        '--assets-dir',
+        type=Path,
+        default=Path('data/assets'),
+        help='Output directory for persisted chunk artifacts',
+    )
+    parser.add_argument('--output', type=Path, default=None, help='Optional JSON report path')
+    return parser.parse_args()
+
+
+def _select_documents(
+    catalog: YamlDocumentCatalogAdapter,
+    catalog_path: Path,
+    doc_ids: list[str],
+    include_all: bool,
+) -> tuple[list[BatchDocument], list[str]]:
+    requested = list(doc_ids)
+    if include_all:
+        requested.extend(row.doc_id for row in catalog.list_documents() if row.status == 'present')
+
+    documents: list[BatchDocument] = []
+    errors: list[str] = []
+    for doc_id in dict.fromkeys(requested):
+        record = catalog.get(doc_id)
+        if record is None:
+            errors.append(f'unknown doc id: {doc_id}')
+            continue
+        if record.status != 'present' or not record.filename:
+            errors.append(f'doc id {doc_id} is not ingestable (status={record.status})')
+            continue
+        pdf_path = catalog_path.parent / record.filename
+        if not pdf_path.exists():
+            errors.append(f'file not found for {doc_id}: {pdf_path}')
+            continue
+        documents.append(BatchDocument(doc_id=doc_id, pdf_path=pdf_path))
+    return documents, errors
+
+
+def main() -> int:
+    args = parse_args()
+    cfg = load_config()
+    doc_ids = [item.strip() for item in args.doc_ids.split(',') if item.strip()]
+    if not doc_ids and not args.all:
+        print('ERROR: pass --doc-ids or --all')
+        return 1
+
+    catalog = YamlDocumentCatalogAdapter(args.catalog)
+    documents, errors = _select_documents(catalog, args.catalog, doc_ids, args.all)
+    for error in errors:
+        print(f'WARNING: {error}')
+    if not documents:
+        print('ERROR: no ingestable documents')
+        return 1
+
+    ocr_adapter = create_ocr_adapter(cfg.ocr_engine, cfg.ocr_fallback_engine)
+    # Embed with the model search uses once an embedding migration is active.
+    active = EmbeddingModelRegistry(args.assets_dir).active()
+    embedding_provider = str(active['provider']) if active else cfg.embedding_provider
+    embedding_model = str(active['model']) if active else cfg.embedding_model
+    embedding_adapter = create_embedding_adapter(
+        provider=embedding_provider,
+        base_url=cfg.embedding_base_url,
+        model=embedding_model,
+        timeout_seconds=cfg.embedding_timeout_seconds,
+        max_retries=cfg.embedding_max_retries,
+        retry_backoff_seconds=cfg.embedding_retry_backoff_seconds,
+    )
+    vision_adapter = None
+    if cfg.use_vision_ingestion:
+        vision_adapter = create_vision_adapter(
+            provider=cfg.vision_provider,
+            base_url=cfg.vision_base_url,
+            model=cfg.vision_model,
+        )
+    pdf_parser = create_pdf_parser(cfg.pdf_parser)
+    table_extractor = SimpleTableExtractorAdapter()
+    chunk_store = FilesystemChunkStoreAdapter(args.assets_dir)
+    run_log = IngestionRunLog(args.assets_dir)
+    config_snapshot = ingestion_config_snapshot(
+        replace(cfg, embedding_provider=embedding_provider, embedding_model=embedding_model)
+    )
+
+    def _is_current(document: BatchDocument) -> bool:
+        return run_log.is_current(
+            document.doc_id,
+            pdf_sha256=sha256_file(document.pdf_path),
+            config_snapshot=config_snapshot,
+        )
+
+    def _ingest_one(document: BatchDocument, page_executor: Executor) -> dict[str, object]:
+        result = ingest_document_use_case(
+            IngestDocumentInput(doc_id=document.doc_id, pdf_path=document.pdf_path),
+            pdf_parser=pdf_parser,
+            ocr_adapter=ocr_adapter,
+            table_extractor=table_extractor,
+            chunk_store=chunk_store,
+            embedding_adapter=embedding_adapter,
+            vision_adapter=vision_adapter,
+            vision_max_pages=cfg.vision_max_pages,
+            page_workers=cfg.ingest_page_workers,
+            embedding_min_coverage=cfg.embedding_min_coverage,
+            embedding_fail_fast=cfg.embedding_fail_fast,
+            embedding_second_pass_max_chars=cfg.embedding_second_pass_max_chars,
+            page_executor=page_executor,
+            chunk_max_tokens=cfg.chunk_max_tokens,
+            chunk_overlap_tokens=cfg.chunk_overlap_tokens,
+            embedding_key=embedding_model_key(embedding_provider, embedding_model),
+            legacy_embedding=(
+                embedding_model_key(embedding_provider, embedding_model)
+                == embedding_model_key(cfg.embedding_provider, cfg.embedding_model)
+            ),
+        )
+        ingestion_result = {
+            'total_pages': result.total_pages,
+            'total_chunks': result.total_chunks,
+            'by_type': result.by_type,
+            'embedding_attempted': result.embedding_attempted,
+            'embedding_success_count': result.embedding_success_count,
+            'embedding_failed_count': result.embedding_failed_count,
+            'embedding_coverage': result.embedding_coverage,
+            'embedding_second_pass_attempted': result.embedding_second_pass_attempted,
+            'embedding_second_pass_recovered': result.embedding_second_pass_recovered,
+            'embedding_failure_reasons': result.embedding_failure_reasons,
+            'embedding_warning_count': len(result.warnings),
+        }
+        visual_artifacts = generate_visual_artifacts_for_doc(
+            args.assets_dir / document.doc_id, document.doc_id
+        )
+        run_log.append(
+            document.doc_id,
+            build_ingestion_run_row(
+                doc_id=document.doc_id,
+                pdf_path=document.pdf_path,
+                source='batch',
+                filename=document.pdf_path.name,
+                pdf_sha256=sha256_file(document.pdf_path),
+                config_snapshot=config_snapshot,
+                ingestion_result=ingestion_result,
+                visual_artifacts=visual_artifacts,
+            ),
+        )
+        return ingestion_result
+
+    def _progress(payload: dict[str, object]) -> None:
+        print(payload['message'], flush=True)
+
+    output = ingest_batch_use_case(
+        IngestBatchInput(
+            documents=documents,
+            doc_concurrency=args.doc_concurrency or cfg.ingest_batch_doc_concurrency,
+            page_worker_budget=args.page_worker_budget or cfg.ingest_batch_page_workers,
+            force=args.force,
+        ),
+        ingest_one=_ingest_one,
+        is_current=_is_current,
+        progress_callback=_progress,
+    )
+
+    report = asdict(output)
+    report['selection_errors'] = errors
+    text = json.dumps(report, indent=2)
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(text, encoding='utf-8')
+    print(text)
+    return 1 if output.failed else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
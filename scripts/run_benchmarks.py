@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from apps.bench.load_bench import run_api_load_benchmark
+from apps.bench.retrieval_bench import run_retrieval_benchmarks
+from apps.bench.stats import CALIBRATION_CASE, compare_to_baseline, run_calibration
+from apps.bench.table_bench import run_table_benchmarks
+from apps.bench.synthetic_corpus import SyntheticCorpusSpec
+
+
+def _parse_sizes(value: str) -> list[tuple[int, int]]:
+    sizes: list[tuple[int, int]] = []
+    for item in value.split(','):
+        docs, _, chunks = item.strip().partition('x')
+        sizes.append((int(docs), int(chunks)))
+    return sizes
+
+
+def _parse_ints(value: str) -> list[int]:
+    return [int(item) for item in value.split(',') if item.strip()]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description='Offline retrieval microbenchmarks and API load test over a synthetic corpus'
+    )
+    parser.add_argument(
+        '--sizes',
+        type=_parse_sizes,
+        default=_parse_sizes('2x100,4x250,8x500'),
+        help='Corpus sizes as <docs>x<chunks_per_doc>, comma separated',
+    )
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--top-k', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--skip-micro', action='store_true')
+    parser.add_argument('--skip-load', action='store_true')
+    parser.add_argument('--skip-tables', action='store_true')
+    parser.add_argument(
+        '--table-pages',
+        type=_parse_ints,
+        default=_parse_ints('50,200'),
+        help='Table-heavy manual sizes (pages) for the table extraction benchmark',
+    )
+    parser.add_argument('--load-docs', type=int, default=4)
+    parser.add_argument('--load-chunks-per-doc', type=int, default=250)
+    parser.add_argument('--concurrency', type=_parse_ints, default=_parse_ints('1,4,8'))
+    parser.add_argument('--requests', type=int, default=40, help='Requests per concurrency level')
+    parser.add_argument(
+        '--base-url',
+        default=None,
+        help='Load-test a running API instead of serving the app in-process',
+    )
+    parser.add_argument('--baseline', type=Path, default=None, help='Previous report to gate against')
+    parser.add_argument('--max-regression-pct', type=float, default=25.0)
+    parser.add_argument('--gate-metric', default='p50_ms')
+    parser.add_argument(
+        '--reference-case',
+        default=CALIBRATION_CASE,
+        help='Case both reports are normalized by before gating; empty compares absolute times',
+    )
+    parser.add_argument(
+        '--output',
+        type=Path,
+        default=Path('.context/reports/benchmarks.json'),
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    baseline: dict[str, dict[str, float]] | None = None
+    if args.baseline is not None:
+        # A missing or unreadable baseline must fail the gate, not silently skip it.
+        try:
+            baseline = json.loads(args.baseline.read_text(encoding='utf-8'))['cases']
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            print(f'ERROR: cannot read baseline report {args.baseline}: {exc}', file=sys.stderr)
+            return 2
+        if args.reference_case and args.reference_case not in baseline:
+            print(f'ERROR: baseline report has no {args.reference_case!r} case to normalize by', file=sys.stderr)
+            return 2
+    started = time.perf_counter()
+    cases: dict[str, dict[str, float]] = run_calibration(repeat=args.repeat)
+
+    if not args.skip_micro:
+        cases.update(
+            run_retrieval_benchmarks(args.sizes, repeat=args.repeat, top_k=args.top_k, seed=args.seed)
+        )
+    if not args.skip_tables:
+        cases.update(run_table_benchmarks(args.table_pages, repeat=args.repeat, seed=args.seed))
+    if not args.skip_load:
+        cases.update(
+            run_api_load_benchmark(
+                SyntheticCorpusSpec(
+                    docs=args.load_docs,
+                    chunks_per_doc=args.load_chunks_per_doc,
+                    seed=args.seed,
+                ),
+                concurrency_levels=args.concurrency,
+                requests_per_level=args.requests,
+                base_url=args.base_url,
+            )
+        )
+
+    regressions: list[dict[str, object]] = []
+    reference = args.reference_case or None
+    if baseline is not None:
+        try:
+            regressions = compare_to_baseline(
+                cases,
+                baseline,
+                metric=args.gate_metric,
+                max_regression_pct=args.max_regression_pct,
+                reference=reference,
+            )
+        except ValueError as exc:
+            print(f'ERROR: {exc}', file=sys.stderr)
+            return 2
+
+    payload = {
+        'config': {
+            'sizes': [f'{docs}x{chunks}' for docs, chunks in args.sizes],
+            'repeat': args.repeat,
+            'top_k': args.top_k,
+            'seed': args.seed,
+            'concurrency': args.concurrency,
+            'requests_per_level': args.requests,
+            'table_pages': args.table_pages,
+            'base_url': args.base_url,
+        },
+        'cases': cases,
+        'gate': {
+            'baseline': str(args.baseline) if args.baseline else None,
+            'metric': args.gate_metric,
+            'reference_case': reference,
+            'max_regression_pct': args.max_regression_pct,
+            'regressions': regressions,
+            'passed': not regressions,
+        },
+        'duration_seconds': round(time.perf_counter() - started, 3),
+    }
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(payload, indent=2), encoding='utf-8')
+    print(json.dumps(payload, indent=2))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
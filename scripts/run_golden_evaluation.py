@@ -20,6 +20,7 @@ from packages.adapters.agentic.factory import (
 from packages.adapters.agentic.langchain_tool_executor_adapter import LangChainToolDefinition
 from packages.adapters.embeddings.factory import create_embedding_adapter
 from packages.adapters.llm.factory import create_llm_adapter
+from packages.adapters.retrieval.cached_chunk_query_adapter import CachedChunkQueryAdapter
 from packages.adapters.retrieval.filesystem_chunk_query_adapter import FilesystemChunkQueryAdapter
 from packages.adapters.retrieval.hash_vector_search_adapter import HashVectorSearchAdapter
 from packages.adapters.retrieval.metadata_vector_search_adapter import MetadataVectorSearchAdapter
@@ -49,6 +50,12 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument('--doc-id', default=None, help='Optional question doc filter')
     parser.add_argument('--top-n', type=int, default=6)
     parser.add_argument('--limit', type=int, default=0)
+    parser.add_argument(
+        '--max-workers',
+        type=int,
+        default=1,
+        help='Evaluate independent questions concurrently (result order is unchanged)',
+    )
     parser.add_argument(
         '--trace-file',
         type=Path,
@@ -67,13 +74,14 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument('--embedding-base-url', default='http://localhost:11434')
     parser.add_argument('--embedding-model', default='mxbai-embed-large:latest')
     parser.add_argument('--use-reranker', action='store_true')
-    parser.add_argument('--reranker-provider', default='ollama', help='noop|ollama')
+    parser.add_argument('--reranker-provider', default='ollama', help='noop|ollama|embedding')
     parser.add_argument('--reranker-base-url', default='http://localhost:11434')
     parser.add_argument('--reranker-model', default='deepseek-r1:8b')
     parser.add_argument('--use-agentic-mode', action='store_true')
     parser.add_argument('--agentic-provider', default='langgraph')
     parser.add_argument('--agentic-max-iterations', type=int, default=4)
     parser.add_argument('--agentic-max-tool-calls', type=int, default=6)
+    parser.add_argument('--agentic-max-parallel-tool-calls', type=int, default=4)
     parser.add_argument('--agentic-timeout-seconds', type=float, default=20.0)
     parser.add_argument(
         '--agentic-trace-file',
@@ -109,7 +117,7 @@ def _serialize_hit(hit) -> dict[str, object]:
 def _build_agentic_stack(
     *,
     args: argparse.Namespace,
-    chunk_query: FilesystemChunkQueryAdapter,
+    chunk_query: CachedChunkQueryAdapter,
     vector_search,
     reranker,
 ):
@@ -197,7 +205,7 @@ def main() -> int:
             model=args.reranker_model,
         )
 
-    chunk_query = FilesystemChunkQueryAdapter(args.assets_dir)
+    chunk_query = CachedChunkQueryAdapter(FilesystemChunkQueryAdapter(args.assets_dir))
     planner, tool_executor, state_graph_runner, agent_trace_logger = _build_agentic_stack(
         args=args,
         chunk_query=chunk_query,
@@ -212,6 +220,7 @@ def main() -> int:
             top_n=args.top_n,
             doc_id_filter=args.doc_id,
             limit=args.limit if args.limit > 0 else None,
+            max_workers=args.max_workers,
         ),
         chunk_query=chunk_query,
         keyword_search=SimpleKeywordSearchAdapter(),
@@ -226,6 +235,7 @@ def main() -> int:
         agent_trace_logger=agent_trace_logger,
         agent_max_iterations=args.agentic_max_iterations,
         agent_max_tool_calls=args.agentic_max_tool_calls,
+        agent_max_parallel_tool_calls=args.agentic_max_parallel_tool_calls,
         agent_timeout_seconds=args.agentic_timeout_seconds,
     )
 
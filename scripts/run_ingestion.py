@@ -12,7 +12,7 @@ if str(PROJECT_ROOT) not in sys.path:
 from packages.adapters.data_contracts.yaml_catalog_adapter import YamlDocumentCatalogAdapter
 from packages.adapters.embeddings.factory import create_embedding_adapter
 from packages.adapters.ocr.factory import create_ocr_adapter
-from packages.adapters.pdf.pypdf_parser_adapter import PypdfParserAdapter
+from packages.adapters.pdf.factory import create_pdf_parser
 from packages.adapters.storage.filesystem_chunk_store_adapter import FilesystemChunkStoreAdapter
 from packages.adapters.tables.simple_table_extractor_adapter import SimpleTableExtractorAdapter
 from packages.adapters.vision.factory import create_vision_adapter
@@ -38,12 +38,20 @@ def parse_args() -> argparse.Namespace:
         default=Path('data/assets'),
         help='Output directory for persisted chunk artifacts',
     )
+    parser.add_argument('--pdf-parser', default='pymupdf', help='PDF parser: pymupdf|pypdf')
     parser.add_argument('--ocr-engine', default='paddle', help='OCR engine: paddle|tesseract|noop')
     parser.add_argument('--ocr-fallback', default='tesseract', help='Fallback OCR engine')
     parser.add_argument('--embedding-provider', default='hash', help='Embedding provider: hash|ollama')
     parser.add_argument('--embedding-base-url', default='http://localhost:11434')
     parser.add_argument('--embedding-model', default='mxbai-embed-large:latest')
     parser.add_argument('--embedding-second-pass-max-chars', type=int, default=2048)
+    parser.add_argument(
+        '--chunk-max-tokens',
+        type=int,
+        default=256,
+        help='Max words per text chunk window (0 = one chunk per page)',
+    )
+    parser.add_argument('--chunk-overlap-tokens', type=int, default=32)
     parser.add_argument('--use-vision-ingestion', action='store_true')
     parser.add_argument('--vision-provider', default='ollama', help='Vision provider: noop|ollama')
     parser.add_argument('--vision-base-url', default='http://localhost:11434')
@@ -87,7 +95,7 @@ def main() -> int:
 
     result = ingest_document_use_case(
         IngestDocumentInput(doc_id=args.doc_id, pdf_path=pdf_path),
-        pdf_parser=PypdfParserAdapter(),
+        pdf_parser=create_pdf_parser(args.pdf_parser),
         ocr_adapter=ocr_adapter,
         table_extractor=SimpleTableExtractorAdapter(),
         chunk_store=FilesystemChunkStoreAdapter(args.assets_dir),
@@ -95,6 +103,8 @@ def main() -> int:
         vision_adapter=vision_adapter,
         vision_max_pages=args.vision_max_pages,
         embedding_second_pass_max_chars=args.embedding_second_pass_max_chars,
+        chunk_max_tokens=args.chunk_max_tokens,
+        chunk_overlap_tokens=args.chunk_overlap_tokens,
     )
 
     print(json.dumps({
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from apps.bench.ingestion_bench import IngestionBenchConfig, run_ingestion_grid
+from apps.bench.synthetic_pdf import SyntheticPdfSpec
+
+
+def _parse_ints(value: str) -> list[int]:
+    return [int(item) for item in value.split(',') if item.strip()]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description='Ingestion throughput across page workers and document concurrency with fake model latencies'
+    )
+    parser.add_argument('--pages', type=int, default=40)
+    parser.add_argument('--scanned-ratio', type=float, default=0.2)
+    parser.add_argument('--table-ratio', type=float, default=0.25)
+    parser.add_argument('--seed', type=int, default=11)
+    parser.add_argument('--docs', type=int, default=2, help='Copies of the PDF ingested per grid point')
+    parser.add_argument('--page-workers', type=_parse_ints, default=_parse_ints('1,2,4,8'))
+    parser.add_argument('--doc-concurrency', type=_parse_ints, default=_parse_ints('1,2'))
+    parser.add_argument('--ocr-latency', type=float, default=0.05, help='Seconds per OCR call')
+    parser.add_argument('--vision-latency', type=float, default=0.2, help='Seconds per vision call')
+    parser.add_argument('--embedding-latency', type=float, default=0.01, help='Seconds per embedding call')
+    parser.add_argument('--no-vision', action='store_true')
+    parser.add_argument('--vision-max-pages', type=int, default=40)
+    parser.add_argument(
+        '--no-isolate',
+        action='store_true',
+        help='Run grid points in this process (faster; peak RSS becomes cumulative)',
+    )
+    parser.add_argument(
+        '--output',
+        type=Path,
+        default=Path('.context/reports/ingestion_benchmark.json'),
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    started = time.perf_counter()
+    configs = [
+        IngestionBenchConfig(
+            page_workers=workers,
+            doc_concurrency=concurrency,
+            docs=args.docs,
+            ocr_latency_seconds=args.ocr_latency,
+            vision_latency_seconds=args.vision_latency,
+            embedding_latency_seconds=args.embedding_latency,
+            use_vision=not args.no_vision,
+            vision_max_pages=args.vision_max_pages,
+        )
+        for concurrency in args.doc_concurrency
+        for workers in args.page_workers
+    ]
+    rows = run_ingestion_grid(
+        SyntheticPdfSpec(
+            pages=args.pages,
+            scanned_ratio=args.scanned_ratio,
+            table_ratio=args.table_ratio,
+            seed=args.seed,
+        ),
+        configs,
+        isolate=not args.no_isolate,
+    )
+    best = max(rows, key=lambda row: float(row['pages_per_second'])) if rows else None
+    payload = {
+        'runs': rows,
+        'best': {
+            'INGEST_PAGE_WORKERS': best['config']['page_workers'],
+            'INGEST_CONCURRENCY': best['config']['doc_concurrency'],
+            'pages_per_second': best['pages_per_second'],
+        }
+        if best
+        else None,
+        'duration_seconds': round(time.perf_counter() - started, 3),
+    }
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(payload, indent=2), encoding='utf-8')
+    print(json.dumps(payload, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -15,6 +15,7 @@ if str(PROJECT_ROOT) not in sys.path:
 from packages.adapters.data_contracts.yaml_catalog_adapter import YamlDocumentCatalogAdapter
 from packages.adapters.ocr.factory import create_ocr_adapter
 from packages.adapters.pdf.pypdf_parser_adapter import PypdfParserAdapter
+from packages.adapters.retrieval.cached_chunk_query_adapter import CachedChunkQueryAdapter
 from packages.adapters.retrieval.filesystem_chunk_query_adapter import FilesystemChunkQueryAdapter
 from packages.adapters.retrieval.hash_vector_search_adapter import HashVectorSearchAdapter
 from packages.adapters.retrieval.simple_keyword_search_adapter import SimpleKeywordSearchAdapter
@@ -62,6 +63,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument('--doc-id', default='rockwell_powerflex_40')
     parser.add_argument('--top-n', type=int, default=6)
     parser.add_argument('--limit', type=int, default=5)
+    parser.add_argument('--max-workers', type=int, default=4)
     parser.add_argument('--min-pass-rate', type=float, default=80.0)
     parser.add_argument('--min-grounded-rate', type=float, default=98.0)
     parser.add_argument('--min-turn-execution-rate', type=float, default=98.0)
@@ -161,8 +163,9 @@ def main() -> int:
             top_n=args.top_n,
             doc_id_filter=args.doc_id,
             limit=args.limit,
+            max_workers=args.max_workers,
         ),
-        chunk_query=FilesystemChunkQueryAdapter(args.assets_dir),
+        chunk_query=CachedChunkQueryAdapter(FilesystemChunkQueryAdapter(args.assets_dir)),
         keyword_search=SimpleKeywordSearchAdapter(),
         vector_search=HashVectorSearchAdapter(),
         trace_logger=None,
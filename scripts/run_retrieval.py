@@ -35,7 +35,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument('--embedding-base-url', default='http://localhost:11434')
     parser.add_argument('--embedding-model', default='mxbai-embed-large:latest')
     parser.add_argument('--use-reranker', action='store_true')
-    parser.add_argument('--reranker-provider', default='ollama', help='noop|ollama')
+    parser.add_argument('--reranker-provider', default='ollama', help='noop|ollama|embedding')
     parser.add_argument('--reranker-base-url', default='http://localhost:11434')
     parser.add_argument('--reranker-model', default='deepseek-r1:8b')
     parser.add_argument('--rerank-pool-size', type=int, default=24)
@@ -46,15 +46,14 @@ def parse_args() -> argparse.Namespace:
 def main() -> int:
     args = parse_args()
 
+    embedding_adapter = create_embedding_adapter(
+        provider=args.embedding_provider,
+        base_url=args.embedding_base_url,
+        model=args.embedding_model,
+    )
     vector_search = HashVectorSearchAdapter()
     if args.embedding_provider.strip().lower() in {'ollama', 'local'}:
-        vector_search = MetadataVectorSearchAdapter(
-            create_embedding_adapter(
-                provider=args.embedding_provider,
-                base_url=args.embedding_base_url,
-                model=args.embedding_model,
-            )
-        )
+        vector_search = MetadataVectorSearchAdapter(embedding_adapter)
 
     reranker = None
     if args.use_reranker:
@@ -62,6 +61,7 @@ def main() -> int:
             provider=args.reranker_provider,
             base_url=args.reranker_base_url,
             model=args.reranker_model,
+            embedding_adapter=embedding_adapter,
         )
 
     output = search_evidence_use_case(
@@ -3,6 +3,7 @@ from __future__ import annotations
 import time
 
 from packages.adapters.agentic.langgraph_runner_adapter import LangGraphRunnerAdapter
+from packages.domain.timing import StageTimings
 from packages.ports.llm_port import LlmEvidence, LlmPort
 from packages.ports.planner_port import PlanStep, PlannerPort
 from packages.ports.state_graph_runner_port import GraphRunLimits
@@ -154,3 +155,215 @@ def test_langgraph_runner_executes_after_slow_planner_and_auto_inserts_retrieval
     assert output.iterations >= 1
     assert output.terminated_reason != 'timeout'
     assert output.state['evidence_hits']
+
+
+class _RecordingCompiledGraph:
+    """Stands in for a compiled graph: runs the sequential loop with the per-run config deps."""
+
+    def __init__(self, runner: LangGraphRunnerAdapter, *, fail: bool = False) -> None:
+        self._runner = runner
+        self._fail = fail
+        self.configs: list[dict[str, object]] = []
+
+    def invoke(self, state: dict[str, object], config: dict[str, object]) -> dict[str, object]:
+        self.configs.append(config)
+        if self._fail:
+            raise RuntimeError('graph exploded')
+        run = config['configurable']['graph_run']
+        output = self._runner._run_without_langgraph(
+            initial_state=state,
+            limits=run.limits,
+            planner=run.planner,
+            tool_executor=run.tool_executor,
+            llm=run.llm,
+            trace_logger=run.trace_logger,
+            start_monotonic=run.execution_start,
+        )
+        return {**output.state, '_iterations': output.iterations, '_tool_calls': output.tool_calls}
+
+
+def test_langgraph_runner_compiles_graph_once_and_passes_run_deps_via_config(monkeypatch) -> None:
+    runner = LangGraphRunnerAdapter()
+    compiled = _RecordingCompiledGraph(runner)
+    compile_calls: list[int] = []
+    monkeypatch.setattr(runner, '_compile_graph', lambda: compile_calls.append(1) or compiled)
+    timings = StageTimings()
+
+    with timings.span('agentic'):
+        for planner in (FakePlanner(), DraftOnlySlowPlanner()):
+            output = runner.run(
+                initial_state={'query': 'What does F005 mean?', 'doc_id': 'd1', 'top_n': 4},
+                limits=GraphRunLimits(max_iterations=4, max_tool_calls=4, timeout_seconds=10),
+                planner=planner,
+                tool_executor=FakeToolExecutor(),
+                llm=None,
+                trace_logger=None,
+            )
+            assert output.state['evidence_hits']
+
+    assert compile_calls == [1]
+    assert [type(cfg['configurable']['graph_run'].planner) for cfg in compiled.configs] == [
+        FakePlanner,
+        DraftOnlySlowPlanner,
+    ]
+    stages = timings.as_dict()
+    assert stages['agent_graph.compile']['calls'] == 1
+    assert stages['agent_graph.run']['calls'] == 2
+    assert stages['agent_graph.run']['fallback'] == 0
+
+
+def test_langgraph_runner_reports_fallback_when_graph_run_fails(monkeypatch) -> None:
+    runner = LangGraphRunnerAdapter()
+    monkeypatch.setattr(runner, '_compile_graph', lambda: _RecordingCompiledGraph(runner, fail=True))
+
+    output = runner.run(
+        initial_state={'query': 'What does F005 mean?', 'doc_id': 'd1', 'top_n': 4},
+        limits=GraphRunLimits(max_iterations=4, max_tool_calls=4, timeout_seconds=10),
+        planner=FakePlanner(),
+        tool_executor=FakeToolExecutor(),
+        llm=None,
+        trace_logger=None,
+    )
+
+    assert output.state['evidence_hits']
+    assert any('RuntimeError' in warning for warning in output.state['warnings'])
+
+
+class MultiSearchPlanner(PlannerPort):
+    def create_plan(
+        self,
+        *,
+        query: str,
+        intent: str,
+        doc_id: str | None,
+        max_steps: int,
+    ) -> list[PlanStep]:
+        _ = query, intent, doc_id, max_steps
+        return [
+            PlanStep(step_id='s1', tool_name='search_evidence', objective='a', query='F005 on drive A', doc_id='d1'),
+            PlanStep(step_id='s2', tool_name='search_evidence', objective='b', query='F005 on drive B', doc_id='d2'),
+            PlanStep(step_id='s3', tool_name='search_evidence', objective='c', query='F005 wiring'),
+            PlanStep(step_id='s4', tool_name='draft_answer', objective='draft'),
+        ]
+
+
+class SlowSearchExecutor(FakeToolExecutor):
+    def __init__(self, delay_seconds: float) -> None:
+        self.delay_seconds = delay_seconds
+        self.calls: list[dict[str, object]] = []
+
+    def execute(
+        self,
+        *,
+        tool_name: str,
+        arguments: dict[str, object],
+    ) -> ToolExecutionResult:
+        if tool_name != 'search_evidence':
+            return ToolExecutionResult(tool_name=tool_name, success=True, payload={})
+        self.calls.append(dict(arguments))
+        time.sleep(self.delay_seconds)
+        hit = {
+            'chunk_id': f'c-{arguments.get("doc_id")}-{arguments.get("query")}',
+            'doc_id': arguments.get('doc_id'),
+            'score': 0.5,
+            'snippet': str(arguments.get('query')),
+        }
+        return ToolExecutionResult(
+            tool_name=tool_name,
+            success=True,
+            payload={'intent': 'general', 'total_chunks_scanned': 3, 'hits': [hit]},
+        )
+
+
+def test_langgraph_runner_runs_consecutive_searches_concurrently() -> None:
+    executor = SlowSearchExecutor(delay_seconds=0.2)
+    started = time.perf_counter()
+    output = LangGraphRunnerAdapter().run(
+        initial_state={'query': 'Compare F005 on drive A and B', 'doc_id': None, 'top_n': 4},
+        limits=GraphRunLimits(max_iterations=6, max_tool_calls=6, timeout_seconds=10, max_parallel_tool_calls=3),
+        planner=MultiSearchPlanner(),
+        tool_executor=executor,
+        llm=None,
+        trace_logger=None,
+    )
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.5
+    assert sorted((row['query'], row['doc_id']) for row in executor.calls) == [
+        ('F005 on drive A', 'd1'),
+        ('F005 on drive B', 'd2'),
+        ('F005 wiring', None),
+    ]
+    assert output.tool_calls == 4
+    assert output.terminated_reason == 'completed'
+    assert len(output.state['evidence_hits']) == 3
+
+
+def test_langgraph_runner_parallel_batch_respects_tool_budget_and_timeout() -> None:
+    capped = SlowSearchExecutor(delay_seconds=0.0)
+    output = LangGraphRunnerAdapter().run(
+        initial_state={'query': 'Compare F005', 'doc_id': None, 'top_n': 4},
+        limits=GraphRunLimits(max_iterations=6, max_tool_calls=2, timeout_seconds=10, max_parallel_tool_calls=4),
+        planner=MultiSearchPlanner(),
+        tool_executor=capped,
+        llm=None,
+        trace_logger=None,
+    )
+    assert len(capped.calls) == 2
+    assert output.terminated_reason == 'max_tool_calls'
+
+    slow = SlowSearchExecutor(delay_seconds=0.5)
+    started = time.perf_counter()
+    output = LangGraphRunnerAdapter().run(
+        initial_state={'query': 'Compare F005', 'doc_id': None, 'top_n': 4},
+        limits=GraphRunLimits(max_iterations=6, max_tool_calls=6, timeout_seconds=0.05, max_parallel_tool_calls=4),
+        planner=MultiSearchPlanner(),
+        tool_executor=slow,
+        llm=None,
+        trace_logger=None,
+    )
+    assert time.perf_counter() - started < 0.4
+    assert output.terminated_reason == 'timeout'
+    assert any('agent timeout' in error for error in output.state['errors'])
+
+
+class _ScopeHoppingPlanner(PlannerPort):
+    def create_plan(
+        self,
+        *,
+        query: str,
+        intent: str,
+        doc_id: str | None,
+        max_steps: int,
+    ) -> list[PlanStep]:
+        _ = query, intent, doc_id, max_steps
+        return [PlanStep(step_id='s1', tool_name='search_evidence', objective='search', doc_id='other_doc')]
+
+
+class _RecordingToolExecutor(FakeToolExecutor):
+    def __init__(self) -> None:
+        self.doc_ids: list[object] = []
+
+    def execute(self, *, tool_name: str, arguments: dict[str, object]) -> ToolExecutionResult:
+        if tool_name == 'search_evidence':
+            self.doc_ids.append(arguments.get('doc_id'))
+        return super().execute(tool_name=tool_name, arguments=arguments)
+
+
+def test_langgraph_runner_keeps_planner_steps_inside_the_requested_doc_scope() -> None:
+    def _searched_doc(initial_state: dict[str, object]) -> object:
+        executor = _RecordingToolExecutor()
+        LangGraphRunnerAdapter().run(
+            initial_state={'query': 'What does F005 mean?', 'top_n': 4, **initial_state},
+            limits=GraphRunLimits(max_iterations=2, max_tool_calls=2, timeout_seconds=10),
+            planner=_ScopeHoppingPlanner(),
+            tool_executor=executor,
+            llm=None,
+            trace_logger=None,
+        )
+        return executor.doc_ids[0]
+
+    assert _searched_doc({'doc_id': 'd1'}) == 'd1'
+    assert _searched_doc({'doc_ids': ['d1', 'd2']}) is None
+    assert _searched_doc({'doc_ids': ['d1', 'other_doc']}) == 'other_doc'
+    assert _searched_doc({}) == 'other_doc'
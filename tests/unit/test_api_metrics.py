@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from apps.api.ingestion_jobs import IngestionJobManager
+from apps.api.metrics import MetricsRegistry, record_stage_timings
+
+
+def test_histogram_renders_cumulative_buckets() -> None:
+    registry = MetricsRegistry(buckets=(0.1, 1.0))
+    registry.observe('latency_seconds', 0.05, help_text='Latency.', route='/search')
+    registry.observe('latency_seconds', 0.5, route='/search')
+
+    text = registry.render()
+
+    assert '# HELP latency_seconds Latency.' in text
+    assert '# TYPE latency_seconds histogram' in text
+    assert 'latency_seconds_bucket{route="/search",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{route="/search",le="1"} 2' in text
+    assert 'latency_seconds_bucket{route="/search",le="+Inf"} 2' in text
+    assert 'latency_seconds_count{route="/search"} 2' in text
+
+
+def test_stage_timings_feed_stage_histograms_and_ollama_counters() -> None:
+    registry = MetricsRegistry()
+    record_stage_timings(
+        registry,
+        {
+            'vector_search': {'ms': 12.0, 'calls': 1},
+            'ollama.embed': {'ms': 10.0, 'calls': 3, 'errors': 2, 'retries': 1},
+        },
+    )
+
+    text = registry.render()
+
+    assert 'manuals_stage_duration_seconds_count{stage="vector_search"} 1' in text
+    assert 'manuals_ollama_calls_total{stage="ollama.embed"} 3' in text
+    assert 'manuals_ollama_errors_total{stage="ollama.embed"} 2' in text
+    assert 'manuals_ollama_retries_total{stage="ollama.embed"} 1' in text
+
+
+def test_collectors_refresh_gauges_at_render_time() -> None:
+    registry = MetricsRegistry()
+    manager = IngestionJobManager(max_workers=1)
+    registry.add_collector(
+        lambda reg: reg.set_gauge('jobs', manager.status_counts()['queued'], status='queued')
+    )
+
+    assert 'jobs{status="queued"} 0' in registry.render()
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+import apps.api.main as api_main
+from apps.api.container import AdapterSet, AppContainer, resolve_config
+from packages.application.config import load_config, read_env_file
+
+
+def _adapter_set(cfg) -> AdapterSet:
+    fields = {name: object() for name in AdapterSet.__dataclass_fields__ if name != 'cfg'}
+    return AdapterSet(cfg=cfg, **fields)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_config_file_values_override_environment(tmp_path: Path, monkeypatch) -> None:
+    env_file = tmp_path / 'app.env'
+    env_file.write_text('# comment\nLLM_MODEL="file-model"\nexport TRACE_MAX_FILES=3\n', encoding='utf-8')
+    monkeypatch.setenv('LLM_MODEL', 'env-model')
+    monkeypatch.setenv('CONFIG_FILE', str(env_file))
+
+    assert read_env_file(env_file) == {'LLM_MODEL': 'file-model', 'TRACE_MAX_FILES': '3'}
+    assert read_env_file(tmp_path / 'missing.env') == {}
+    assert load_config().llm_model == 'env-model'
+    cfg = resolve_config()
+    assert cfg.llm_model == 'file-model'
+    assert cfg.trace_max_files == 3
+
+
+def test_container_rebuilds_only_when_config_changes() -> None:
+    clock = _Clock()
+    cfg = replace(load_config(), config_check_interval_seconds=5.0)
+    state = {'cfg': cfg}
+    resolved: list[int] = []
+    built: list[object] = []
+
+    def _resolver():
+        resolved.append(1)
+        return state['cfg']
+
+    def _builder(value):
+        built.append(value)
+        return _adapter_set(value)
+
+    container = AppContainer(_builder, resolver=_resolver, clock=clock)
+    first = container.current()
+    clock.now += 1
+    assert container.current() is first
+    assert len(resolved) == 1
+
+    clock.now += 10
+    assert container.current() is first
+    assert len(resolved) == 2
+
+    state['cfg'] = replace(cfg, llm_model='other-model')
+    assert container.current() is first
+    clock.now += 10
+    second = container.current()
+    assert second is not first
+    assert second.cfg.llm_model == 'other-model'
+    assert len(built) == 2
+    assert container.status()['build_count'] == 2
+
+
+def test_container_keeps_serving_previous_adapters_when_rebuild_fails() -> None:
+    cfg = load_config()
+    calls = {'count': 0}
+
+    def _builder(value):
+        calls['count'] += 1
+        if calls['count'] > 1:
+            raise RuntimeError('model server unreachable')
+        return _adapter_set(value)
+
+    container = AppContainer(_builder, resolver=lambda: cfg)
+    first = container.current()
+    status = container.reload()
+
+    assert container.current() is first
+    assert status['build_count'] == 1
+    assert 'model server unreachable' in str(status['last_error'])
+
+
+def test_admin_reload_rebuilds_api_adapters(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(api_main, 'ASSETS_DIR', tmp_path / 'assets')
+    monkeypatch.setenv('CONFIG_FILE', '')
+    monkeypatch.setenv('RETRIEVAL_TRACE_FILE', str(tmp_path / 'retrieval_traces.jsonl'))
+    monkeypatch.setenv('ANSWER_TRACE_FILE', str(tmp_path / 'answer_traces.jsonl'))
+    monkeypatch.setenv('ADMIN_TOKEN', 'secret')
+    api_main.CONTAINER.reload()
+    client = TestClient(api_main.app)
+    try:
+        client.get('/search', params={'q': 'pump pressure'})
+        before = api_main.CONTAINER.current()
+        builds = api_main.CONTAINER.status()['build_count']
+        client.get('/search', params={'q': 'pump pressure'})
+        assert api_main.CONTAINER.current() is before
+
+        monkeypatch.setenv('RERANKER_POOL_SIZE', '7')
+        assert client.post('/admin/reload').status_code == 401
+        assert client.post('/admin/reload', headers={'X-Admin-Token': 'wrong'}).status_code == 401
+        response = client.post('/admin/reload', headers={'X-Admin-Token': 'secret'})
+
+        assert response.status_code == 200
+        assert response.json()['build_count'] == builds + 1
+        after = api_main.CONTAINER.current()
+        assert after is not before
+        assert after.cfg.reranker_pool_size == 7
+    finally:
+        monkeypatch.undo()
+        api_main.CONTAINER.reload()
+
+
+def test_admin_endpoints_are_disabled_without_an_admin_token(monkeypatch) -> None:
+    monkeypatch.setenv('CONFIG_FILE', '')
+    monkeypatch.setenv('ADMIN_TOKEN', '')
+    api_main.CONTAINER.reload()
+    client = TestClient(api_main.app)
+    try:
+        builds = api_main.CONTAINER.status()['build_count']
+        assert client.post('/admin/reload', headers={'X-Admin-Token': ''}).status_code == 403
+        assert client.get('/admin/embedding-models').status_code == 403
+        assert api_main.CONTAINER.status()['build_count'] == builds
+    finally:
+        monkeypatch.undo()
+        api_main.CONTAINER.reload()
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from apps.bench.ingestion_bench import IngestionBenchConfig, run_ingestion_grid
+from apps.bench.load_bench import run_load
+from apps.bench.stats import compare_to_baseline, percentile
+from apps.bench.synthetic_corpus import SyntheticCorpusSpec, generate_chunks, write_corpus
+from apps.bench.synthetic_pdf import SyntheticPdfSpec
+from apps.bench.table_bench import run_table_benchmarks, table_heavy_pages
+from packages.adapters.retrieval.filesystem_chunk_query_adapter import FilesystemChunkQueryAdapter
+
+
+def test_synthetic_corpus_is_deterministic_and_mixes_modalities() -> None:
+    spec = SyntheticCorpusSpec(docs=2, chunks_per_doc=60, seed=3)
+
+    first = generate_chunks(spec)
+    second = generate_chunks(spec)
+
+    assert [c.content_text for c in first] == [c.content_text for c in second]
+    assert len(first) == spec.total_chunks
+    types = {c.content_type for c in first}
+    assert 'text' in types and 'table' in types
+    assert any(t.startswith('visual_') for t in types)
+    assert all(len(c.metadata['embedding']) == spec.embedding_dim for c in first)
+
+
+def test_written_corpus_round_trips_through_filesystem_adapter(tmp_path: Path) -> None:
+    spec = SyntheticCorpusSpec(docs=2, chunks_per_doc=30, seed=5)
+    written = write_corpus(spec, tmp_path / 'assets')
+
+    loaded = FilesystemChunkQueryAdapter(tmp_path / 'assets').list_chunks()
+
+    assert sorted(c.chunk_id for c in loaded) == sorted(c.chunk_id for c in written)
+    assert all('embedding' in c.metadata for c in loaded)
+
+
+def test_compare_to_baseline_flags_only_material_regressions() -> None:
+    baseline = {'a': {'p50_ms': 10.0}, 'b': {'p50_ms': 0.2}, 'c': {'p50_ms': 10.0}}
+    current = {'a': {'p50_ms': 20.0}, 'b': {'p50_ms': 0.9}, 'c': {'p50_ms': 11.0}, 'd': {'p50_ms': 5.0}}
+
+    regressions = compare_to_baseline(current, baseline, max_regression_pct=25.0)
+
+    assert [row['case'] for row in regressions] == ['a']
+    assert percentile([3.0, 1.0, 2.0], 50) == 2.0
+
+
+def test_compare_to_baseline_normalizes_by_the_reference_case() -> None:
+    baseline = {'calibration': {'p50_ms': 10.0}, 'a': {'p50_ms': 20.0}, 'b': {'p50_ms': 20.0}}
+    # A runner twice as slow doubles every case; only 'b' got slower on top of that.
+    current = {'calibration': {'p50_ms': 20.0}, 'a': {'p50_ms': 41.0}, 'b': {'p50_ms': 70.0}}
+
+    assert {row['case'] for row in compare_to_baseline(current, baseline)} == {'calibration', 'a', 'b'}
+    regressions = compare_to_baseline(current, baseline, reference='calibration')
+    assert [(row['case'], row['baseline'], row['pct']) for row in regressions] == [('b', 40.0, 75.0)]
+
+    with pytest.raises(ValueError):
+        compare_to_baseline(current, {'a': {'p50_ms': 20.0}}, reference='calibration')
+
+
+def test_run_load_reports_percentiles_throughput_and_errors() -> None:
+    statuses = iter([200, 500, 200, 200])
+
+    def _factory():
+        return lambda path, params: next(statuses)
+
+    row = run_load(_factory, [('/search', {'q': 'x'})] * 4, concurrency=1)
+
+    assert row['runs'] == 4
+    assert row['errors'] == 1
+    assert row['throughput_rps'] > 0
+    assert row['p99_ms'] >= row['p50_ms']
+
+
+def test_ingestion_grid_reports_throughput_stages_and_rss() -> None:
+    spec = SyntheticPdfSpec(pages=6, scanned_ratio=0.5, table_ratio=0.3, seed=2)
+    configs = [
+        IngestionBenchConfig(
+            page_workers=workers,
+            docs=1,
+            ocr_latency_seconds=0.0,
+            vision_latency_seconds=0.0,
+            embedding_latency_seconds=0.0,
+        )
+        for workers in (1, 2)
+    ]
+
+    rows = run_ingestion_grid(spec, configs, isolate=False)
+
+    assert [row['config']['page_workers'] for row in rows] == [1, 2]
+    for row in rows:
+        assert row['pages'] == 6
+        assert row['pages_per_second'] > 0
+        assert row['peak_rss_mb'] > 0
+        assert {'parse', 'extract_pages', 'embedding', 'persist'} <= set(row['stages'])
+    if 'scanned' in rows[0]['page_kinds']:
+        assert rows[0]['stages']['ocr']['calls'] >= rows[0]['page_kinds']['scanned']
+
+
+def test_table_benchmark_reports_timings_and_found_tables() -> None:
+    pages = table_heavy_pages(3, seed=2)
+    assert pages == table_heavy_pages(3, seed=2)
+
+    result = run_table_benchmarks([3], repeat=1, seed=2)
+
+    assert set(result) == {'table_extract@3'}
+    assert result['table_extract@3']['runs'] == 1
+    assert result['table_extract@3']['tables'] >= 3
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from packages.domain.chunking import TextChunker, heading_level
+
+
+def test_heading_level_detects_numbered_and_caps_headings() -> None:
+    assert heading_level('3 MAINTENANCE') == 1
+    assert heading_level('3.2 Pump Removal') == 2
+    assert heading_level('SAFETY PRECAUTIONS') == 1
+    assert heading_level('3.2 Remove the pump cover.') is None
+    assert heading_level('Remove the four bolts holding the cover') is None
+    assert heading_level('10 20 30') is None
+
+
+def test_chunker_bounds_windows_with_overlap_and_carries_sections_across_pages() -> None:
+    chunker = TextChunker(max_tokens=8, overlap_tokens=2)
+    body = ' '.join(f'w{n}' for n in range(1, 15))
+
+    first_page = chunker.split(f'Intro line here\n3 MAINTENANCE\n3.2 Pump Removal\n{body}')
+    second_page = chunker.split('continued text on next page\n4 TROUBLESHOOTING\nCheck fuses')
+
+    assert first_page[0].text == 'Intro line here' and first_page[0].section_path is None
+    section_windows = [window for window in first_page if window.section_path]
+    assert all(len(window.text.split()) <= 8 for window in first_page)
+    assert section_windows[-1].section_path == '3 MAINTENANCE > 3.2 Pump Removal'
+    joined = ' '.join(window.text for window in section_windows)
+    assert all(f'w{n}' in joined.split() for n in range(1, 15))
+    assert section_windows[1].text.split()[:2] == section_windows[0].text.split()[-2:]
+
+    assert second_page[0].section_path == '3 MAINTENANCE > 3.2 Pump Removal'
+    assert second_page[-1].section_path == '4 TROUBLESHOOTING'
+    assert second_page[-1].text == '4 TROUBLESHOOTING Check fuses'
+
+
+def test_admonitions_and_labels_are_not_headings() -> None:
+    assert heading_level('CAUTION') is None
+    assert heading_level('WARNING: HOT SURFACE') is None
+    assert heading_level('NOTE') is None
+    assert heading_level('TABLE 3 TORQUE VALUES') is None
+
+    chunker = TextChunker(max_tokens=50)
+    windows = chunker.split('3.2 Pump Removal\nCAUTION\nDrain the pump first\nRemove the bolts')
+    next_page = chunker.split('Lift the cover')
+
+    assert {window.section_path for window in windows + next_page} == {'3.2 Pump Removal'}
+
+
+def test_caps_headings_nest_under_numbered_headings_without_popping_them() -> None:
+    chunker = TextChunker(max_tokens=50)
+    windows = chunker.split(
+        '3 MAINTENANCE\n3.2 Pump Removal\nSAFETY PRECAUTIONS\nWear gloves\n'
+        'REQUIRED TOOLS\nTorque wrench\n3.3 Pump Install\nAlign the shaft'
+    )
+
+    assert [window.section_path for window in windows] == [
+        '3 MAINTENANCE > 3.2 Pump Removal > SAFETY PRECAUTIONS',
+        '3 MAINTENANCE > 3.2 Pump Removal > REQUIRED TOOLS',
+        '3 MAINTENANCE > 3.3 Pump Install',
+    ]
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from packages.adapters.retrieval.filesystem_chunk_query_adapter import FilesystemChunkQueryAdapter
+from packages.adapters.storage.doc_generations import (
+    CURRENT_FILE,
+    GENERATIONS_DIR,
+    GenerationConflictError,
+    artifact_dir,
+    artifact_path,
+    publish_generation,
+)
+from packages.adapters.storage.filesystem_chunk_store_adapter import FilesystemChunkStoreAdapter
+from packages.domain.models import Chunk
+
+
+def _write_text(name: str, text: str):
+    def _write(out_dir: Path) -> None:
+        (out_dir / name).write_text(text, encoding='utf-8')
+
+    return _write
+
+
+def test_publish_swaps_generations_and_keeps_previous_readable(tmp_path: Path) -> None:
+    doc_dir = tmp_path / 'doc'
+    doc_dir.mkdir()
+    (doc_dir / 'chunks.jsonl').write_text('legacy', encoding='utf-8')
+    assert artifact_dir(doc_dir) == doc_dir
+
+    first = publish_generation(doc_dir, _write_text('chunks.jsonl', 'v1'))
+    assert artifact_path(doc_dir, 'chunks.jsonl').read_text(encoding='utf-8') == 'v1'
+    assert (doc_dir / 'chunks.jsonl').exists()
+
+    second = publish_generation(
+        doc_dir,
+        _write_text('visual_manifest.json', '{}'),
+        carry_over=['chunks.jsonl'],
+    )
+    assert artifact_dir(doc_dir) == second
+    assert (second / 'chunks.jsonl').read_text(encoding='utf-8') == 'v1'
+    assert (first / 'chunks.jsonl').read_text(encoding='utf-8') == 'v1'
+    assert not (doc_dir / 'chunks.jsonl').exists()
+
+    third = publish_generation(doc_dir, _write_text('chunks.jsonl', 'v3'), min_age_seconds=0)
+    assert not first.exists()
+    assert second.exists() and third.exists()
+    assert not (third / 'visual_manifest.json').exists()
+    assert (doc_dir / CURRENT_FILE).read_text(encoding='utf-8') == third.name
+
+
+def test_failed_publish_leaves_current_generation_live(tmp_path: Path) -> None:
+    doc_dir = tmp_path / 'doc'
+    live = publish_generation(doc_dir, _write_text('chunks.jsonl', 'ok'))
+
+    def _boom(out_dir: Path) -> None:
+        (out_dir / 'chunks.jsonl').write_text('half', encoding='utf-8')
+        raise OSError('disk full')
+
+    with pytest.raises(OSError):
+        publish_generation(doc_dir, _boom)
+
+    assert artifact_dir(doc_dir) == live
+    assert [path.name for path in (doc_dir / GENERATIONS_DIR).iterdir()] == [live.name]
+
+
+def test_replaced_generations_are_kept_until_old_enough(tmp_path: Path) -> None:
+    doc_dir = tmp_path / 'doc'
+    published = [publish_generation(doc_dir, _write_text('chunks.jsonl', f'v{i}')) for i in range(4)]
+
+    # Readers that resolved any recently replaced generation can still read it.
+    assert all(path.exists() for path in published)
+
+    publish_generation(doc_dir, _write_text('chunks.jsonl', 'v4'), min_age_seconds=0)
+    assert [path.exists() for path in published] == [False, False, False, True]
+
+
+def test_publish_with_stale_expected_generation_conflicts(tmp_path: Path) -> None:
+    doc_dir = tmp_path / 'doc'
+    with pytest.raises(GenerationConflictError):
+        publish_generation(doc_dir, _write_text('chunks.jsonl', 'x'), expected='missing')
+    first = publish_generation(doc_dir, _write_text('chunks.jsonl', 'v1'), expected=None)
+    second = publish_generation(doc_dir, _write_text('chunks.jsonl', 'v2'), expected=first.name)
+
+    with pytest.raises(GenerationConflictError):
+        publish_generation(doc_dir, _write_text('chunks.jsonl', 'stale'), expected=first.name)
+    assert artifact_dir(doc_dir) == second
+
+
+def test_chunk_store_persist_publishes_chunks_and_visuals_as_one_generation(tmp_path: Path) -> None:
+    store = FilesystemChunkStoreAdapter(tmp_path)
+    generations = tmp_path / 'doc' / GENERATIONS_DIR
+
+    def _chunk(chunk_id: str, text: str) -> Chunk:
+        return Chunk(
+            chunk_id=chunk_id,
+            doc_id='doc',
+            content_type='figure_caption',
+            page_start=1,
+            page_end=1,
+            content_text=text,
+            metadata={'embedding': [1.0, 0.0]},
+        )
+
+    store.persist('doc', [_chunk('c1', 'Figure 1 pump')])
+    asset_ref = store.persist('doc', [_chunk('c2', 'Figure 2 valve')])
+
+    live = artifact_dir(tmp_path / 'doc')
+    assert Path(asset_ref).parent == live
+    assert len([path for path in generations.iterdir() if not path.name.startswith('.')]) == 2
+    visual_rows = [json.loads(line) for line in (live / 'visual_chunks.jsonl').read_text(encoding='utf-8').splitlines()]
+    assert [row['source_chunk_id'] for row in visual_rows] == ['c2']
+    assert json.loads((live / 'visual_manifest.json').read_text(encoding='utf-8'))['visual_chunk_count'] == 1
+    assert [row.content_type for row in FilesystemChunkQueryAdapter(tmp_path).list_chunks('doc')] == [
+        'figure_caption',
+        'visual_figure',
+    ]
+    assert [row.chunk_id for row in store.load('doc')] == ['c2']
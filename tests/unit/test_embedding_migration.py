@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+import apps.api.main as api_main
+from apps.bench.synthetic_pdf import SyntheticPdfSpec, write_synthetic_pdf
+from packages.adapters.retrieval.filesystem_chunk_query_adapter import FilesystemChunkQueryAdapter
+from packages.adapters.retrieval.metadata_vector_search_adapter import MetadataVectorSearchAdapter
+from packages.adapters.storage.doc_generations import GENERATIONS_DIR
+from packages.adapters.storage.filesystem_chunk_store_adapter import FilesystemChunkStoreAdapter
+from packages.application.config import load_config
+from packages.application.use_cases.migrate_embeddings import (
+    MigrateEmbeddingsInput,
+    migrate_embeddings_use_case,
+)
+from packages.domain.embeddings import chunk_embedding, embedding_model_key
+from packages.domain.models import Chunk
+from packages.ports.embedding_port import EmbeddingPort
+
+
+class _FakeEmbedding(EmbeddingPort):
+    def __init__(self, fail_on: str = '') -> None:
+        self.fail_on = fail_on
+        self.batches: list[int] = []
+
+    def embed_text(self, text: str) -> list[float]:
+        if self.fail_on and self.fail_on in text:
+            return []
+        return [1.0, float(len(text) % 7), 0.5]
+
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(len(texts))
+        return super().embed_texts(texts)
+
+
+class _ConstantEmbedding(EmbeddingPort):
+    def __init__(self, vector: list[float]) -> None:
+        self._vector = vector
+
+    def embed_text(self, text: str) -> list[float]:
+        return list(self._vector)
+
+
+def _chunk(doc_id: str, idx: int, text: str, content_type: str = 'text') -> Chunk:
+    return Chunk(
+        chunk_id=f'{doc_id}-{idx}',
+        doc_id=doc_id,
+        content_type=content_type,
+        page_start=1,
+        page_end=1,
+        content_text=text,
+        metadata={'embedding': [0.0, 1.0]},
+    )
+
+
+def _seed(assets_dir: Path) -> FilesystemChunkStoreAdapter:
+    store = FilesystemChunkStoreAdapter(assets_dir)
+    store.persist('doc-a', [_chunk('doc-a', n, f'pump seal step {n}') for n in range(5)])
+    store.persist(
+        'doc-b',
+        [_chunk('doc-b', 0, 'broken text'), _chunk('doc-b', 1, 'Figure 1 impeller', 'figure_caption')],
+    )
+    return store
+
+
+def test_migration_is_resumable_and_activates_only_at_min_coverage(tmp_path: Path) -> None:
+    store = _seed(tmp_path)
+    key = embedding_model_key('ollama', 'new-model')
+    activated: list[float] = []
+    embedding = _FakeEmbedding(fail_on='broken')
+
+    first = migrate_embeddings_use_case(
+        MigrateEmbeddingsInput(doc_ids=['doc-a', 'doc-b'], embedding_key=key, batch_size=2, min_coverage=0.9),
+        chunk_store=store,
+        embedding_adapter=embedding,
+        activate=activated.append,
+    )
+
+    assert embedding.batches == [2, 2, 1, 2]
+    assert (first.total_chunks, first.embedded_chunks, first.failed_chunks) == (7, 6, 1)
+    assert first.activated is False and activated == []
+    reloaded = store.load('doc-a')
+    assert all(chunk_embedding(chunk.metadata, key) for chunk in reloaded)
+    assert reloaded[0].metadata['embedding'] == [0.0, 1.0]
+
+    embedding.fail_on = ''
+    embedding.batches.clear()
+    second = migrate_embeddings_use_case(
+        MigrateEmbeddingsInput(doc_ids=['doc-a', 'doc-b'], embedding_key=key, min_coverage=0.9),
+        chunk_store=store,
+        embedding_adapter=embedding,
+        activate=activated.append,
+    )
+    assert embedding.batches == [1]
+    assert second.newly_embedded == 1
+    assert second.coverage == 1.0
+    assert second.activated is True and activated == [1.0]
+
+
+def test_migration_rechecks_coverage_after_a_reingest_behind_the_pass(tmp_path: Path) -> None:
+    store = _seed(tmp_path)
+    store.persist('doc-c', [_chunk('doc-c', 0, 'valve body')])
+    key = embedding_model_key('ollama', 'new-model')
+    activated: list[float] = []
+
+    def _reingest_doc_a(row) -> None:
+        if row.doc_id == 'doc-b':
+            store.persist('doc-a', [_chunk('doc-a', n, f'pump seal step {n} revised') for n in range(5)])
+
+    result = migrate_embeddings_use_case(
+        MigrateEmbeddingsInput(doc_ids=['doc-a', 'doc-b'], embedding_key=key, min_coverage=1.0),
+        chunk_store=store,
+        embedding_adapter=_FakeEmbedding(),
+        on_document_done=_reingest_doc_a,
+        activate=activated.append,
+        coverage_doc_ids=lambda: ['doc-a', 'doc-b', 'doc-c'],
+    )
+
+    assert result.activated is False and activated == []
+    assert (result.total_chunks, result.embedded_chunks) == (8, 2)
+
+
+class _ReingestDuringFirstBatch(_FakeEmbedding):
+    def __init__(self, store: FilesystemChunkStoreAdapter) -> None:
+        super().__init__()
+        self.store = store
+
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        if not self.batches:
+            self.store.persist('doc-a', [_chunk('doc-a', n, f'pump seal step {n} revised') for n in range(3)])
+        return super().embed_texts(texts)
+
+
+def test_migration_persists_each_doc_once_and_merges_into_a_concurrent_reingest(tmp_path: Path) -> None:
+    store = _seed(tmp_path)
+    key = embedding_model_key('ollama', 'new-model')
+    generations = tmp_path / 'doc-a' / GENERATIONS_DIR
+    embedding = _ReingestDuringFirstBatch(store)
+
+    result = migrate_embeddings_use_case(
+        MigrateEmbeddingsInput(doc_ids=['doc-a'], embedding_key=key, batch_size=2),
+        chunk_store=store,
+        embedding_adapter=embedding,
+    )
+
+    reloaded = store.load('doc-a')
+    assert [chunk.content_text for chunk in reloaded] == [f'pump seal step {n} revised' for n in range(3)]
+    assert all(chunk_embedding(chunk.metadata, key) for chunk in reloaded)
+    assert (result.total_chunks, result.newly_embedded, result.failed_chunks) == (3, 3, 0)
+    # Seed, reingest, then a single migration publish.
+    assert len([path for path in generations.iterdir() if not path.name.startswith('.')]) == 3
+
+
+def test_vector_search_reads_vectors_for_its_embedding_key() -> None:
+    chunk = _chunk('doc-a', 0, 'pump seal')
+    keyed = replace(chunk, metadata={'embedding': [0.0, 1.0], 'embeddings': {'k2': [1.0, 0.0]}})
+
+    legacy = MetadataVectorSearchAdapter(_ConstantEmbedding([0.0, 1.0]))
+    migrated = MetadataVectorSearchAdapter(_ConstantEmbedding([1.0, 0.0]), embedding_key='k2')
+
+    assert [row.chunk.chunk_id for row in legacy.search('q', [keyed, chunk], top_k=5)] == ['doc-a-0', 'doc-a-0']
+    assert [row.chunk.chunk_id for row in migrated.search('q', [keyed, chunk], top_k=5)] == ['doc-a-0']
+
+
+def test_reembed_job_flips_search_to_the_new_model(tmp_path: Path, monkeypatch) -> None:
+    assets_dir = tmp_path / 'assets'
+    monkeypatch.setattr(api_main, 'ASSETS_DIR', assets_dir)
+    monkeypatch.setattr(api_main, '_build_embedding_adapter', lambda cfg: _FakeEmbedding())
+    _seed(assets_dir)
+    try:
+        task = api_main._reembed_migration_task(
+            adapters=api_main.CONTAINER.current(),
+            doc_ids=['doc-a', 'doc-b'],
+            provider='ollama',
+            model='new-model',
+            batch_size=4,
+            activate=True,
+        )
+        result = task(lambda _payload: None)
+
+        key = embedding_model_key('ollama', 'new-model')
+        assert result['activated'] is True
+        assert result['active']['key'] == key
+        vector_search = api_main.CONTAINER.current().vector_search
+        assert isinstance(vector_search, MetadataVectorSearchAdapter)
+        assert vector_search._embedding_key == key
+        visual = [
+            chunk
+            for chunk in FilesystemChunkQueryAdapter(assets_dir).list_chunks('doc-b')
+            if chunk.content_type.startswith('visual_')
+        ]
+        assert visual and chunk_embedding(visual[0].metadata, key)
+        assert api_main._embedding_registry().migration(key)['status'] == 'completed'
+    finally:
+        api_main._embedding_registry().deactivate()
+        monkeypatch.undo()
+        api_main.CONTAINER.reload()
+
+
+def test_ingest_after_activation_embeds_under_the_active_key(tmp_path: Path, monkeypatch) -> None:
+    assets_dir = tmp_path / 'assets'
+    monkeypatch.setattr(api_main, 'ASSETS_DIR', assets_dir)
+    monkeypatch.setattr(api_main, '_build_embedding_adapter', lambda cfg: _FakeEmbedding())
+    key = embedding_model_key('ollama', 'new-model')
+    api_main._embedding_registry().activate(key, provider='ollama', model='new-model')
+    pdf_path = tmp_path / 'manual.pdf'
+    write_synthetic_pdf(SyntheticPdfSpec(pages=2, scanned_ratio=0.0), pdf_path)
+    cfg = replace(
+        load_config(),
+        ocr_engine='noop',
+        ocr_fallback_engine='noop',
+        embedding_provider='ollama',
+        embedding_model='old-model',
+        use_vision_ingestion=False,
+    )
+
+    adapters = api_main._build_adapters(cfg)
+    assert adapters.embedding_key == key
+    result = api_main._ingest_pdf(
+        adapters, doc_id='doc-new', pdf_path=pdf_path, progress_callback=lambda _payload: None
+    )
+    api_main._finalize_ingestion_outputs(
+        cfg=cfg,
+        doc_id='doc-new',
+        pdf_path=pdf_path,
+        source='upload',
+        filename=pdf_path.name,
+        progress_callback=lambda _payload: None,
+        ingestion_result=result,
+    )
+
+    chunks = FilesystemChunkQueryAdapter(assets_dir).list_chunks('doc-new')
+    hits = adapters.vector_search.search('pump seal', chunks, top_k=5)
+    assert hits and {row.chunk.doc_id for row in hits} == {'doc-new'}
+    # The legacy field keeps only vectors of the configured (old) model.
+    stored = FilesystemChunkStoreAdapter(assets_dir).load('doc-new')
+    assert stored and all(chunk_embedding(chunk.metadata, key) for chunk in stored)
+    assert all('embedding' not in chunk.metadata for chunk in stored)
+
+    reranker = api_main._build_reranker(replace(cfg, use_reranker=True, reranker_provider='embedding'))
+    assert reranker.embedding_key == key
+    assert api_main._reingest_plan(cfg, 'doc-new', pdf_path) == 'skip'
+    api_main._embedding_registry().deactivate()
+    assert api_main._reingest_plan(cfg, 'doc-new', pdf_path) == 'embeddings'
+    assert api_main._build_reranker(replace(cfg, use_reranker=True, reranker_provider='embedding')).embedding_key is None
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from packages.adapters.reranker.embedding_reranker_adapter import EmbeddingRerankerAdapter
+from packages.adapters.reranker.factory import create_reranker_adapter
+from packages.ports.embedding_port import EmbeddingPort
+from packages.ports.reranker_port import RerankCandidate
+
+
+class CountingEmbedding(EmbeddingPort):
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.batches: list[list[str]] = []
+
+    def embed_text(self, text: str) -> list[float]:
+        self.calls.append(text)
+        if 'torque' in text.lower():
+            return [1.0, 0.0]
+        return [0.0, 1.0]
+
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(list(texts))
+        return super().embed_texts(texts)
+
+
+def _candidate(chunk_id: str, text: str, base_score: float, embedding: list[float] | None = None) -> RerankCandidate:
+    return RerankCandidate(
+        chunk_id=chunk_id,
+        doc_id='d1',
+        page_start=1,
+        content_type='text',
+        text=text,
+        base_score=base_score,
+        embedding=embedding,
+    )
+
+
+def test_embedding_reranker_prefers_semantic_match_and_uses_stored_embeddings() -> None:
+    embedding = CountingEmbedding()
+    reranker = EmbeddingRerankerAdapter(embedding_adapter=embedding)
+    candidates = [
+        _candidate('a', 'temperature limits for the drive', 0.9, embedding=[0.0, 1.0]),
+        _candidate('b', 'torque setting for the clamp', 0.4, embedding=[1.0, 0.0]),
+    ]
+
+    ranked = reranker.rerank(query='torque setting', candidates=candidates, top_k=2)
+    reranker.rerank(query='torque setting', candidates=candidates, top_k=2)
+
+    assert [row.chunk_id for row in ranked] == ['b', 'a']
+    assert all(0.0 <= row.score <= 1.0 for row in ranked)
+    # Query is embedded once and memoized; candidates reuse stored vectors.
+    assert embedding.calls == ['torque setting']
+
+
+def test_embedding_reranker_embeds_missing_candidates_in_one_batch_keyed_by_text() -> None:
+    embedding = CountingEmbedding()
+    reranker = EmbeddingRerankerAdapter(embedding_adapter=embedding)
+    candidates = [
+        _candidate('a', 'temperature limits for the drive', 0.5),
+        _candidate('b', 'torque setting for the clamp', 0.5),
+        _candidate('c', 'stored vector', 0.5, embedding=[0.0, 1.0]),
+    ]
+
+    reranker.rerank(query='torque', candidates=candidates, top_k=3)
+    reranker.rerank(query='torque', candidates=candidates, top_k=3)
+    assert embedding.batches == [['torque'], ['temperature limits for the drive', 'torque setting for the clamp']]
+
+    # A reingest that keeps the chunk id but changes its text is embedded again.
+    reingested = [_candidate('a', 'torque limits for the drive', 0.5), candidates[1]]
+    ranked = reranker.rerank(query='torque', candidates=reingested, top_k=2)
+    assert embedding.batches[-1] == ['torque limits for the drive']
+    assert ranked[0].score == ranked[1].score
+
+
+def test_embedding_reranker_falls_back_to_bm25_without_embeddings() -> None:
+    reranker = create_reranker_adapter(provider='embedding', base_url='', model='')
+    candidates = [
+        _candidate('a', 'general background notes', 0.5),
+        _candidate('b', 'clamp torque setting table', 0.5),
+    ]
+
+    ranked = reranker.rerank(query='clamp torque', candidates=candidates, top_k=1)
+
+    assert isinstance(reranker, EmbeddingRerankerAdapter)
+    assert [row.chunk_id for row in ranked] == ['b']
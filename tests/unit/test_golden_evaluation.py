@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from dataclasses import asdict
 from pathlib import Path
 
 import packages.application.use_cases.run_golden_evaluation as run_golden_module
+from packages.adapters.retrieval.cached_chunk_query_adapter import CachedChunkQueryAdapter
 from packages.adapters.retrieval.hash_vector_search_adapter import HashVectorSearchAdapter
 from packages.adapters.retrieval.simple_keyword_search_adapter import SimpleKeywordSearchAdapter
 from packages.application.use_cases.answer_question import AnswerQuestionOutput
@@ -148,3 +150,62 @@ def test_run_golden_evaluation_uses_structured_output_mode(monkeypatch, tmp_path
 
     assert output.total_questions == 2
     assert enforce_flags == [True]
+
+
+class CountingChunkQuery(InMemoryChunkQuery):
+    def __init__(self, chunks: list[Chunk]) -> None:
+        super().__init__(chunks)
+        self.calls = 0
+
+    def list_chunks(self, doc_id: str | None = None) -> list[Chunk]:
+        self.calls += 1
+        return super().list_chunks(doc_id=doc_id)
+
+
+def test_run_golden_evaluation_parallel_matches_sequential(tmp_path: Path) -> None:
+    catalog_path, golden_path = _write_contracts(tmp_path)
+    chunks = [
+        Chunk(
+            chunk_id='c1',
+            doc_id='d1',
+            content_type='text',
+            page_start=3,
+            page_end=3,
+            content_text='Torque value is 45 Nm and should be verified during startup.',
+        )
+    ]
+
+    def _run(max_workers: int):
+        return run_golden_evaluation_use_case(
+            RunGoldenEvaluationInput(
+                catalog_path=catalog_path,
+                golden_questions_path=golden_path,
+                top_n=3,
+                max_workers=max_workers,
+            ),
+            chunk_query=CachedChunkQueryAdapter(InMemoryChunkQuery(chunks)),
+            keyword_search=SimpleKeywordSearchAdapter(),
+            vector_search=HashVectorSearchAdapter(),
+            trace_logger=None,
+        )
+
+    sequential = _run(1)
+    parallel = _run(4)
+
+    assert [row.question_id for row in parallel.results] == ['Q1', 'Q2']
+    assert asdict(parallel) == asdict(sequential)
+
+
+def test_cached_chunk_query_loads_each_scope_once() -> None:
+    inner = CountingChunkQuery(
+        [
+            Chunk(chunk_id='c1', doc_id='d1', content_type='text', page_start=1, page_end=1, content_text='a'),
+            Chunk(chunk_id='c2', doc_id='d2', content_type='text', page_start=1, page_end=1, content_text='b'),
+        ]
+    )
+    cached = CachedChunkQueryAdapter(inner)
+
+    assert len(cached.list_chunks()) == 2
+    assert [chunk.chunk_id for chunk in cached.list_chunks(doc_id='d2')] == ['c2']
+    assert [chunk.chunk_id for chunk in cached.list_chunks(doc_id='d2')] == ['c2']
+    assert inner.calls == 1
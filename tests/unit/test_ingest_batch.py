@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from pathlib import Path
+
+from packages.adapters.data_contracts.visual_artifact_generation import (
+    generate_visual_artifacts_for_doc,
+)
+from packages.adapters.storage.ingestion_run_log import IngestionRunLog, run_is_current
+from packages.application.use_cases.ingest_batch import (
+    BatchDocument,
+    IngestBatchInput,
+    ingest_batch_use_case,
+)
+from packages.application.use_cases.ingest_document import (
+    IngestDocumentInput,
+    ingest_document_use_case,
+)
+from packages.ports.pdf_parser_port import ParsedPdfPage, PdfParserPort
+from tests.unit.test_ingest_parallel_progress import FakeOcr, FakeTables, InMemoryChunkStore
+
+
+class _SlowPdfParser(PdfParserPort):
+    def __init__(self, pages: int) -> None:
+        self._pages = pages
+
+    def parse(self, pdf_path: str) -> list[ParsedPdfPage]:
+        _ = pdf_path
+        return [ParsedPdfPage(page_number=n, text=f'page {n} text') for n in range(1, self._pages + 1)]
+
+
+class _TrackingOcr(FakeOcr):
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def extract_text(self, source_path: str, page_number: int) -> str:
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(0.01)
+        with self._lock:
+            self.in_flight -= 1
+        return ''
+
+
+def _documents(tmp_path: Path, sizes: dict[str, int]) -> list[BatchDocument]:
+    rows = []
+    for doc_id, size in sizes.items():
+        pdf_path = tmp_path / f'{doc_id}.pdf'
+        pdf_path.write_bytes(b'x' * size)
+        rows.append(BatchDocument(doc_id=doc_id, pdf_path=pdf_path))
+    return rows
+
+
+def test_batch_skips_current_docs_and_isolates_failures(tmp_path: Path) -> None:
+    documents = _documents(tmp_path, {'small': 10, 'large': 100, 'broken': 50, 'done': 20})
+    started: list[str] = []
+
+    def _ingest_one(document: BatchDocument, page_executor: Executor) -> dict[str, object]:
+        started.append(document.doc_id)
+        if document.doc_id == 'broken':
+            raise RuntimeError('corrupt pdf')
+        return {'total_pages': 4}
+
+    events: list[dict[str, object]] = []
+    output = ingest_batch_use_case(
+        IngestBatchInput(documents=documents + documents[:1], doc_concurrency=1),
+        ingest_one=_ingest_one,
+        is_current=lambda document: document.doc_id == 'done',
+        progress_callback=events.append,
+    )
+
+    assert started == ['large', 'broken', 'small']
+    assert [row.doc_id for row in output.documents] == ['small', 'large', 'broken', 'done']
+    assert {row.doc_id: row.status for row in output.documents} == {
+        'small': 'ingested',
+        'large': 'ingested',
+        'broken': 'failed',
+        'done': 'skipped',
+    }
+    assert (output.ingested, output.skipped, output.failed) == (2, 1, 1)
+    assert output.total_pages == 8
+    assert 'corrupt pdf' in str(output.documents[2].error)
+    assert events[-1]['processed_pages'] == events[-1]['total_pages'] == 4
+
+    forced = ingest_batch_use_case(
+        IngestBatchInput(documents=documents[3:], force=True),
+        ingest_one=_ingest_one,
+        is_current=lambda document: True,
+    )
+    assert forced.ingested == 1
+
+
+def test_batch_pages_share_one_worker_budget(tmp_path: Path) -> None:
+    documents = _documents(tmp_path, {'a': 30, 'b': 20, 'c': 10})
+    ocr = _TrackingOcr()
+
+    def _ingest_one(document: BatchDocument, page_executor: Executor) -> dict[str, object]:
+        result = ingest_document_use_case(
+            IngestDocumentInput(doc_id=document.doc_id, pdf_path=document.pdf_path),
+            pdf_parser=_SlowPdfParser(6),
+            ocr_adapter=ocr,
+            table_extractor=FakeTables(),
+            chunk_store=InMemoryChunkStore(),
+            page_workers=4,
+            page_executor=page_executor,
+        )
+        return {'total_pages': result.total_pages}
+
+    output = ingest_batch_use_case(
+        IngestBatchInput(documents=documents, doc_concurrency=3, page_worker_budget=2),
+        ingest_one=_ingest_one,
+    )
+
+    assert output.ingested == 3
+    assert output.total_pages == 18
+    assert ocr.peak <= 2
+    assert output.pages_per_second > 0
+
+
+def test_ingest_document_leaves_shared_executor_running() -> None:
+    with ThreadPoolExecutor(max_workers=2) as shared:
+        result = ingest_document_use_case(
+            IngestDocumentInput(doc_id='doc-shared', pdf_path=Path('ignored.pdf')),
+            pdf_parser=_SlowPdfParser(5),
+            ocr_adapter=FakeOcr(),
+            table_extractor=FakeTables(),
+            chunk_store=InMemoryChunkStore(),
+            page_workers=1,
+            page_executor=shared,
+        )
+        assert result.total_pages == 5
+        assert shared.submit(lambda: 'still open').result() == 'still open'
+
+
+def test_run_log_is_current_requires_same_pdf_output_config_and_assets(tmp_path: Path) -> None:
+    log = IngestionRunLog(tmp_path)
+    config = {'ocr_engine': 'paddle', 'embedding_model': 'm1', 'ingest_page_workers': 4}
+    log.append('doc-a', {'run_id': '1', 'pdf_sha256': 'old', 'config': config})
+    log.append('doc-a', {'run_id': '2', 'pdf_sha256': 'abc', 'config': config})
+
+    assert [row['run_id'] for row in log.list_runs('doc-a')] == ['2', '1']
+    assert not log.is_current('doc-a', pdf_sha256='abc', config_snapshot=config)
+
+    (tmp_path / 'doc-a' / 'chunks.jsonl').write_text('{}\n', encoding='utf-8')
+    assert not log.is_current('doc-a', pdf_sha256='abc', config_snapshot=config)
+    generate_visual_artifacts_for_doc(tmp_path / 'doc-a', 'doc-a')
+    assert log.is_current('doc-a', pdf_sha256='abc', config_snapshot=config)
+    assert log.is_current('doc-a', pdf_sha256='abc', config_snapshot={**config, 'ingest_page_workers': 8})
+    assert not log.is_current('doc-a', pdf_sha256='old', config_snapshot=config)
+    assert not log.is_current('doc-a', pdf_sha256='abc', config_snapshot={**config, 'embedding_model': 'm2'})
+    assert not run_is_current(None, pdf_sha256='abc', config_snapshot=config)
+
+
+def test_batch_endpoint_rejects_requests_without_ingestable_docs(tmp_path: Path, monkeypatch) -> None:
+    from fastapi.testclient import TestClient
+
+    import apps.api.main as api_main
+
+    monkeypatch.setattr(api_main, 'UPLOADS_DIR', tmp_path / 'uploads')
+    client = TestClient(api_main.app)
+
+    assert client.post('/jobs/ingest-batch').status_code == 400
+    response = client.post('/jobs/ingest-batch', params={'doc_ids': 'missing-doc'})
+    assert response.status_code == 400
+    assert response.json()['detail']['rejected'] == [{'doc_id': 'missing-doc', 'reason': 'PDF not found'}]
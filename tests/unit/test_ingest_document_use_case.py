@@ -47,6 +47,10 @@ class InMemoryChunkStore(ChunkStorePort):
         self.saved = list(chunks)
         return 'memory://chunks'
 
+    def load(self, doc_id: str) -> list[Chunk]:
+        _ = doc_id
+        return list(self.saved)
+
 
 class FakeEmbedding(EmbeddingPort):
     def embed_text(self, text: str) -> list[float]:
@@ -163,3 +167,35 @@ def test_ingest_document_reports_failure_reasons_when_embedding_still_fails() ->
         reason == 'simulated-embedding-failure'
         for reason in result.embedding_failure_reasons.values()
     )
+
+
+def test_ingest_document_splits_long_pages_into_section_windows() -> None:
+    class LongPageParser(PdfParserPort):
+        def parse(self, pdf_path: str) -> list[ParsedPdfPage]:
+            _ = pdf_path
+            steps = ' '.join(f'step{n}' for n in range(40))
+            return [
+                ParsedPdfPage(page_number=1, text=f'2 MAINTENANCE\n{steps}'),
+                ParsedPdfPage(page_number=2, text='more steps follow'),
+            ]
+
+    store = InMemoryChunkStore()
+    result = ingest_document_use_case(
+        IngestDocumentInput(doc_id='doc-long', pdf_path=Path('ignored.pdf')),
+        pdf_parser=LongPageParser(),
+        ocr_adapter=FakeOcr(),
+        table_extractor=FakeTables(),
+        chunk_store=store,
+        embedding_adapter=FakeEmbedding(),
+        chunk_max_tokens=16,
+        chunk_overlap_tokens=4,
+    )
+
+    text_chunks = [chunk for chunk in store.saved if chunk.content_type == 'text']
+    assert result.by_type['text'] == len(text_chunks) == 5
+    assert all(len(chunk.content_text.split()) <= 16 for chunk in text_chunks)
+    assert {chunk.section_path for chunk in text_chunks} == {'2 MAINTENANCE'}
+    assert [chunk.page_start for chunk in text_chunks] == [1, 1, 1, 1, 2]
+    assert len({chunk.chunk_id for chunk in text_chunks}) == 5
+    assert result.embedding_second_pass_attempted is False
+    assert result.timings is not None and 'chunk' in result.timings
@@ -48,6 +48,10 @@ class InMemoryChunkStore(ChunkStorePort):
         self.saved = list(chunks)
         return 'memory://chunks'
 
+    def load(self, doc_id: str) -> list[Chunk]:
+        _ = doc_id
+        return list(self.saved)
+
 
 def test_ingest_reports_page_progress_with_parallel_workers() -> None:
     store = InMemoryChunkStore()
@@ -68,3 +72,20 @@ def test_ingest_reports_page_progress_with_parallel_workers() -> None:
     assert events[-1].get('stage') == 'persisted'
     assert events[-1].get('processed_pages') == 3
     assert events[-1].get('total_pages') == 3
+
+
+def test_ingest_reports_stage_timings_from_parallel_pages() -> None:
+    result = ingest_document_use_case(
+        IngestDocumentInput(doc_id='doc-timings', pdf_path=Path('ignored.pdf')),
+        pdf_parser=FakePdfParser(),
+        ocr_adapter=FakeOcr(),
+        table_extractor=FakeTables(),
+        chunk_store=InMemoryChunkStore(),
+        page_workers=3,
+    )
+
+    timings = result.timings or {}
+    assert timings['parse']['items'] == 3
+    assert timings['extract_pages']['items'] == 3
+    assert timings['tables']['calls'] == 3
+    assert timings['persist']['items'] == result.total_chunks
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+import apps.api.main as api_main
+from packages.adapters.storage.ingested_doc_index import INDEX_FILE, SUMMARY_FILE, IngestedDocIndex
+
+
+def _write_doc(assets: Path, doc_id: str, types: list[str]) -> None:
+    doc_dir = assets / doc_id
+    doc_dir.mkdir(parents=True, exist_ok=True)
+    with (doc_dir / 'chunks.jsonl').open('a', encoding='utf-8') as fh:
+        for idx, content_type in enumerate(types):
+            fh.write(json.dumps({'chunk_id': f'{doc_id}-{idx}', 'content_type': content_type}) + '\n')
+
+
+def test_refresh_persists_summary_and_index(tmp_path: Path) -> None:
+    _write_doc(tmp_path, 'doc_a', ['text', 'text', 'table'])
+    index = IngestedDocIndex(tmp_path)
+
+    summary = index.refresh('doc_a')
+
+    assert summary['total_chunks'] == 3
+    assert summary['by_type'] == {'text': 2, 'table': 1}
+    assert json.loads((tmp_path / 'doc_a' / SUMMARY_FILE).read_text())['total_chunks'] == 3
+    assert 'doc_a' in json.loads((tmp_path / INDEX_FILE).read_text())['documents']
+
+
+def test_listing_rescans_only_docs_changed_out_of_band(tmp_path: Path, monkeypatch) -> None:
+    _write_doc(tmp_path, 'doc_a', ['text'])
+    _write_doc(tmp_path, 'doc_b', ['table'])
+    index = IngestedDocIndex(tmp_path)
+    index.list_summaries()
+
+    scanned: list[str] = []
+    original = index.build_summary
+    monkeypatch.setattr(index, 'build_summary', lambda doc_id: scanned.append(doc_id) or original(doc_id))
+    _write_doc(tmp_path, 'doc_b', ['text', 'text'])
+
+    rows = index.list_summaries()
+
+    assert scanned == ['doc_b']
+    assert [row['total_chunks'] for row in rows] == [1, 3]
+
+
+def test_ingested_docs_endpoint_supports_if_none_match(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(api_main, 'ASSETS_DIR', tmp_path / 'assets')
+    _write_doc(tmp_path / 'assets', 'doc_a', ['text'])
+    client = TestClient(api_main.app)
+
+    first = client.get('/ingested/docs')
+    etag = first.headers['etag']
+    cached = client.get('/ingested/docs', headers={'If-None-Match': etag})
+    _write_doc(tmp_path / 'assets', 'doc_a', ['table'])
+    changed = client.get('/ingested/docs', headers={'If-None-Match': etag})
+
+    assert first.status_code == 200
+    assert first.json()['documents'][0]['total_chunks'] == 1
+    assert 'fingerprint' not in first.json()['documents'][0]
+    assert cached.status_code == 304
+    assert changed.status_code == 200
+    assert changed.json()['documents'][0]['total_chunks'] == 2
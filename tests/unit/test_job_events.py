@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+
+from fastapi.testclient import TestClient
+
+import apps.api.main as api_main
+from apps.api.ingestion_jobs import IngestionJobManager
+
+
+def _gated_task(gate: threading.Event):
+    def task(progress) -> dict[str, object]:
+        gate.wait(5)
+        progress({'stage': 'extracting', 'processed_pages': 1, 'total_pages': 2, 'message': 'page 1'})
+        return {'ok': True}
+
+    return task
+
+
+def _events(lines) -> list[dict[str, object]]:
+    return [json.loads(line[len('data: ') :]) for line in lines if line.startswith('data: ')]
+
+
+def test_wait_for_changes_returns_jobs_changed_after_version() -> None:
+    manager = IngestionJobManager(max_workers=1)
+    since = manager.version()
+    assert manager.wait_for_changes(since=since, timeout=0.01) == (since, [])
+
+    gate = threading.Event()
+    job = manager.submit(kind='test', doc_id='d', filename=None, task=_gated_task(gate))
+    version, jobs = manager.wait_for_changes(since=since, job_id=job.job_id, timeout=1)
+    assert version > since and [row.job_id for row in jobs] == [job.job_id]
+
+    gate.set()
+    while jobs[-1].status != 'completed':
+        version, jobs = manager.wait_for_changes(since=version, job_id=job.job_id, timeout=5)
+        assert jobs
+    assert jobs[-1].result == {'ok': True}
+
+
+def test_async_wait_for_changes_is_woken_from_job_threads() -> None:
+    manager = IngestionJobManager(max_workers=1)
+    gate = threading.Event()
+    job = manager.submit(kind='test', doc_id='d', filename=None, task=_gated_task(gate))
+
+    async def _follow() -> list[str]:
+        version, jobs = await manager.wait_for_changes_async(since=0, job_id=job.job_id, timeout=1)
+        statuses = [jobs[-1].status]
+        threading.Timer(0.05, gate.set).start()
+        while statuses[-1] != 'completed':
+            version, jobs = await manager.wait_for_changes_async(since=version, job_id=job.job_id, timeout=5)
+            assert jobs
+            statuses.append(jobs[-1].status)
+        assert await manager.wait_for_changes_async(since=version, timeout=0.01) == (version, [])
+        return statuses
+
+    statuses = asyncio.run(_follow())
+    assert statuses[0] in {'queued', 'running'} and statuses[-1] == 'completed'
+    assert not manager._async_waiters
+
+
+def test_job_events_stream_until_job_finishes(monkeypatch) -> None:
+    monkeypatch.setattr(api_main, 'JOB_MANAGER', IngestionJobManager(max_workers=1))
+    client = TestClient(api_main.app)
+    gate = threading.Event()
+    job = api_main.JOB_MANAGER.submit(kind='test', doc_id='d', filename=None, task=_gated_task(gate))
+
+    threading.Timer(0.2, gate.set).start()
+    with client.stream('GET', f'/jobs/{job.job_id}/events') as response:
+        assert response.headers['content-type'].startswith('text/event-stream')
+        events = _events(response.iter_lines())
+    # Bursts of updates are coalesced into the latest snapshot, so only the ends are fixed.
+    assert events[0]['status'] in {'queued', 'running'}
+    assert events[-1]['status'] == 'completed' and events[-1]['result'] == {'ok': True}
+
+    resumed = client.get(f'/jobs/{job.job_id}/events', headers={'Last-Event-ID': str(api_main.JOB_MANAGER.version())})
+    assert resumed.status_code == 204
+    assert client.get('/jobs/missing/events').status_code == 404
+
+    replay = client.get('/jobs/events', params={'since': 0, 'max_seconds': 0.2})
+    assert [row['job_id'] for row in _events(replay.text.splitlines())] == [job.job_id]
@@ -212,3 +212,26 @@ def test_diversity_respects_relevance_floor() -> None:
     top_content_types = [h.content_type for h in result.hits[:5]]
     # At minimum: the result should contain the relevant text hits
     assert top_content_types.count("text") >= 1
+
+
+def test_diversity_promotes_second_modality_from_beyond_top_n() -> None:
+    """A second modality ranked below top_n is still promoted into the returned hits."""
+    chunks = [
+        _make_chunk(f"t{i}", "motor rated load motor rated load current", content_type="text", page=i + 1)
+        for i in range(5)
+    ]
+    chunks.append(_make_chunk("tb1", "motor rated load row", content_type="table", page=6))
+    chunks.extend(
+        _make_chunk(f"w{i}", f"motor note {i} unrelated wording here", content_type="text", page=i + 7)
+        for i in range(3)
+    )
+
+    result = search_evidence_use_case(
+        SearchEvidenceInput(query="motor rated load current", top_n=2),
+        chunk_query=_InMemoryChunkQuery(chunks),
+        keyword_search=SimpleKeywordSearchAdapter(),
+        vector_search=HashVectorSearchAdapter(),
+    )
+
+    assert [h.content_type for h in result.hits] == ["text", "table"]
+    assert result.hits[1].snippet == "motor rated load row"
@@ -48,3 +48,26 @@ def test_table_extractor_detects_multicolumn_rows() -> None:
     tables = SimpleTableExtractorAdapter().extract(page_text, page_number=2)
     assert tables
     assert 'Parameter | Value | Unit' in tables[0].text
+
+
+def test_table_extractor_normalizes_each_row_by_its_kind() -> None:
+    page_text = '\n'.join(
+        [
+            'Intro paragraph about the drive.',
+            'P001    Motor rated voltage    480    V',
+            'Carrier frequency: 4 kHz',
+            'Accel time 1 2.5 s',
+            'A | B | C',
+            'Closing remark.',
+        ]
+    )
+
+    [table] = SimpleTableExtractorAdapter().extract(page_text, page_number=3)
+
+    assert table.table_id == 'table-p0003-001'
+    assert table.text.splitlines() == [
+        'P001 | Motor rated voltage | 480 | V',
+        'Carrier frequency | 4 kHz',
+        'Accel time 1 2.5 s',
+        'A | B | C',
+    ]
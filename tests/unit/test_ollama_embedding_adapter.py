@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from packages.adapters.embeddings.ollama_embedding_adapter import OllamaEmbeddingAdapter
+
+
+class _SlowOllama(BaseHTTPRequestHandler):
+    delay_seconds = 2.0
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        time.sleep(self.delay_seconds)
+        body = json.dumps({'embedding': [1.0], 'embeddings': [[1.0]]}).encode('utf-8')
+        try:
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except OSError:
+            pass
+
+    def log_message(self, format: str, *args: object) -> None:
+        _ = format, args
+
+
+def test_bounded_embed_texts_keeps_one_deadline_for_the_whole_batch() -> None:
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _SlowOllama)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        adapter = OllamaEmbeddingAdapter(
+            base_url=f'http://127.0.0.1:{server.server_address[1]}',
+            model='m',
+            retry_backoff_seconds=0,
+        ).bounded(0.3)
+
+        started = time.monotonic()
+        vectors = adapter.embed_texts(['pump seal', 'valve body', 'impeller'])
+        elapsed = time.monotonic() - started
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert vectors == [[], [], []]
+    assert elapsed < 1.0
+    assert adapter.last_error == 'deadline-exceeded'
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+import re
+from threading import Lock
+
+from packages.adapters.reranker.ollama_reranker_adapter import OllamaRerankerAdapter, RerankScoreCache
+from packages.ports.reranker_port import RerankCandidate
+
+_CHUNK_ID_RE = re.compile(r'chunk_id=(\S+)')
+
+
+class FakeChatReranker(OllamaRerankerAdapter):
+    def __init__(self, *, fail_on: set[str] | None = None, **kwargs) -> None:
+        super().__init__(base_url='http://unused', model='fake-model', **kwargs)
+        self.prompts: list[list[str]] = []
+        self._fail_on = fail_on or set()
+        self._lock = Lock()
+
+    def _chat(self, prompt: str) -> str:
+        ids = _CHUNK_ID_RE.findall(prompt)
+        with self._lock:
+            self.prompts.append(ids)
+        if self._fail_on.intersection(ids):
+            raise TimeoutError('slow batch')
+        return json.dumps({'scores': [{'chunk_id': cid, 'score': int(cid[1:]) / 10} for cid in ids]})
+
+
+def _candidates(ids: list[str], text: str = 'torque value') -> list[RerankCandidate]:
+    return [
+        RerankCandidate(
+            chunk_id=cid,
+            doc_id='d1',
+            page_start=1,
+            content_type='text',
+            text=f'{text} {cid}',
+            base_score=0.5,
+        )
+        for cid in ids
+    ]
+
+
+def test_reranker_cache_only_scores_new_candidates() -> None:
+    reranker = FakeChatReranker(score_cache=RerankScoreCache(max_entries=100))
+
+    first = reranker.rerank(query='Torque value', candidates=_candidates(['c1', 'c2']), top_k=2)
+    second = reranker.rerank(query='torque  value', candidates=_candidates(['c2', 'c3']), top_k=2)
+
+    assert [row.chunk_id for row in first] == ['c2', 'c1']
+    assert [row.chunk_id for row in second] == ['c3', 'c2']
+    assert reranker.prompts == [['c1', 'c2'], ['c3']]
+
+    # A reingested chunk keeps its id but not its cached score.
+    reranker.rerank(query='torque value', candidates=_candidates(['c2'], text='revised torque value'), top_k=1)
+    assert reranker.prompts[-1] == ['c2']
+
+
+def test_reranker_batches_pool_and_merges_scores() -> None:
+    reranker = FakeChatReranker(batch_size=2, max_concurrency=2)
+
+    ranked = reranker.rerank(
+        query='torque',
+        candidates=_candidates(['c1', 'c2', 'c3', 'c4', 'c5']),
+        top_k=5,
+    )
+
+    assert [row.chunk_id for row in ranked] == ['c5', 'c4', 'c3', 'c2', 'c1']
+    assert sorted(len(batch) for batch in reranker.prompts) == [1, 2, 2]
+
+
+def test_reranker_scores_failed_batch_lexically_without_caching() -> None:
+    cache = RerankScoreCache(max_entries=100)
+    reranker = FakeChatReranker(batch_size=2, fail_on={'c3'}, score_cache=cache)
+
+    ranked = reranker.rerank(query='torque', candidates=_candidates(['c1', 'c2', 'c3', 'c4']), top_k=4)
+
+    # Lexical fallback scores rank after the model-scored batch, below its lowest score.
+    assert [row.chunk_id for row in ranked][:2] == ['c2', 'c1']
+    assert {row.chunk_id for row in ranked[2:]} == {'c3', 'c4'}
+    assert all(row.score <= 0.1 for row in ranked[2:])
+    assert len(cache) == 2
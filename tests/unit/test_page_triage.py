@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from packages.application.use_cases.ingest_document import IngestDocumentInput, ingest_document_use_case
+from packages.application.use_cases.page_triage import build_page_plan
+from packages.domain.models import Chunk
+from packages.ports.chunk_store_port import ChunkStorePort
+from packages.ports.ocr_port import OcrPort
+from packages.ports.pdf_parser_port import ParsedPdfPage, PdfBlock, PdfParserPort
+from packages.ports.table_extractor_port import ExtractedTable, TableExtractorPort
+from packages.ports.vision_port import VisionPort
+
+_PROSE = 'The drive controller regulates motor speed through the inverter stage. ' * 5
+_TABLE = '\n'.join(['Parameter  Value  Unit', 'Voltage  480  V', 'Current  12  A', 'Speed  1750  rpm'])
+_PAGES = [
+    ParsedPdfPage(page_number=1, text=_PROSE),
+    ParsedPdfPage(page_number=2, text=''),
+    ParsedPdfPage(page_number=3, text=f'{_PROSE}\nRated values\n{_TABLE}'),
+    ParsedPdfPage(page_number=4, text=f'{_PROSE}\nFigure 1 Wiring\nFigure 2 Terminals'),
+    ParsedPdfPage(
+        page_number=5,
+        text=_PROSE,
+        blocks=(PdfBlock(kind='image', bbox=(72.0, 100.0, 400.0, 400.0)),),
+    ),
+]
+
+
+class _Parser(PdfParserPort):
+    def parse(self, pdf_path: str) -> list[ParsedPdfPage]:
+        return list(_PAGES)
+
+
+class _CountingOcr(OcrPort):
+    def __init__(self) -> None:
+        self.calls: list[int] = []
+
+    def extract_text(self, source_path: str, page_number: int) -> str:
+        self.calls.append(page_number)
+        return f'ocr text {page_number}'
+
+
+class _NoTables(TableExtractorPort):
+    def extract(self, page_text: str, page_number: int) -> list[ExtractedTable]:
+        return []
+
+
+class _Vision(VisionPort):
+    def __init__(self) -> None:
+        self.calls: list[int] = []
+
+    def extract_page_insights(self, pdf_path: str, page_number: int) -> str:
+        self.calls.append(page_number)
+        return f'vision {page_number}'
+
+
+class _Store(ChunkStorePort):
+    def persist(self, doc_id: str, chunks: list[Chunk]) -> str:
+        return 'memory://chunks'
+
+    def load(self, doc_id: str) -> list[Chunk]:
+        return []
+
+
+def test_plan_classifies_pages_and_schedules_expensive_work_first() -> None:
+    plan = build_page_plan(_PAGES, vision_budget=2)
+
+    kinds = {row.page_number: row.kind for row in plan.pages}
+    assert kinds == {1: 'text_rich', 2: 'scanned', 3: 'table_heavy', 4: 'figure_heavy', 5: 'figure_heavy'}
+    assert [row.page_number for row in plan.pages] == [2, 4, 3, 1, 5]
+    assert [row.page_number for row in build_page_plan(_PAGES, vision_budget=3).pages] == [2, 4, 5, 3, 1]
+    assert plan.counts() == {'text_rich': 1, 'scanned': 1, 'table_heavy': 1, 'figure_heavy': 2}
+    assert plan.total_cost == sum(row.cost for row in plan.pages)
+
+
+def test_ingest_runs_ocr_once_per_page_and_reports_eta() -> None:
+    ocr = _CountingOcr()
+    vision = _Vision()
+    events: list[dict[str, object]] = []
+
+    result = ingest_document_use_case(
+        IngestDocumentInput(doc_id='doc-triage', pdf_path=Path('ignored.pdf')),
+        pdf_parser=_Parser(),
+        ocr_adapter=ocr,
+        table_extractor=_NoTables(),
+        chunk_store=_Store(),
+        vision_adapter=vision,
+        vision_max_pages=2,
+        page_workers=1,
+        progress_callback=lambda payload: events.append(dict(payload)),
+    )
+
+    assert sorted(ocr.calls) == [2, 4]
+    assert vision.calls == [2, 4]
+    assert result.by_type['figure_ocr'] == 3
+    assert result.page_kinds == {'text_rich': 1, 'scanned': 1, 'table_heavy': 1, 'figure_heavy': 2}
+    extracting = [row for row in events if row.get('stage') == 'extracting' and row.get('processed_pages')]
+    assert [row['processed_pages'] for row in extracting] == [1, 2, 3, 4, 5]
+    assert all(isinstance(row['eta_seconds'], float) for row in extracting)
+    assert extracting[-1]['eta_seconds'] == 0.0
+    assert 'triage' in (result.timings or {})
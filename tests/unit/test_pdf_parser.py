@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import logging
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import fitz
+
+from packages.adapters.pdf.factory import create_pdf_parser
+from packages.adapters.pdf.pymupdf_parser_adapter import PymupdfParserAdapter
+from packages.adapters.pdf.pypdf_parser_adapter import PypdfParserAdapter
+from packages.adapters.storage.ingestion_run_log import ingestion_config_snapshot
+from packages.adapters.tables.simple_table_extractor_adapter import SimpleTableExtractorAdapter
+from packages.application.config import load_config
+from packages.application.use_cases.page_triage import has_figure_image, layout_rows_text
+
+
+def _write_manual_page(path: Path) -> None:
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), '4.1 Rated Values')
+    for row, cells in enumerate([('Parameter', 'Value', 'Unit'), ('Voltage', '480', 'V'), ('Current', '12', 'A')]):
+        for col, cell in enumerate(cells):
+            page.insert_text((72 + col * 150, 110 + row * 18), cell)
+    pix = fitz.Pixmap(fitz.csGRAY, fitz.IRect(0, 0, 32, 32), False)
+    pix.clear_with(128)
+    page.insert_image(fitz.Rect(72, 300, 272, 450), pixmap=pix)
+    page.insert_text((72, 470), 'Figure 1 Terminal block')
+    doc.save(path)
+    doc.close()
+
+
+def test_pymupdf_parser_exposes_blocks_for_table_and_figure_detection(tmp_path: Path) -> None:
+    pdf_path = tmp_path / 'manual.pdf'
+    _write_manual_page(pdf_path)
+
+    [page] = PymupdfParserAdapter().parse(str(pdf_path))
+
+    assert page.page_number == 1
+    assert '4.1 Rated Values' in page.text and 'Figure 1 Terminal block' in page.text
+    assert {block.kind for block in page.blocks} == {'text', 'image'}
+    assert has_figure_image(page)
+    rows = layout_rows_text(page).splitlines()
+    assert 'Voltage  480  V' in rows
+    [table] = SimpleTableExtractorAdapter().extract(layout_rows_text(page), page.page_number)
+    assert 'Voltage | 480 | V' in table.text
+
+
+def test_create_pdf_parser_selects_engine() -> None:
+    assert isinstance(create_pdf_parser('PyMuPDF'), PymupdfParserAdapter)
+    assert isinstance(create_pdf_parser('pypdf'), PypdfParserAdapter)
+
+
+def test_create_pdf_parser_falls_back_to_pypdf_and_records_it(monkeypatch, caplog) -> None:
+    cfg = replace(load_config(), pdf_parser='pymupdf')
+    assert ingestion_config_snapshot(cfg)['pdf_parser'] == 'pymupdf'
+
+    monkeypatch.setitem(sys.modules, 'fitz', None)
+    with caplog.at_level(logging.WARNING, logger='packages.adapters.pdf.factory'):
+        assert isinstance(create_pdf_parser('pymupdf'), PypdfParserAdapter)
+    assert 'PyMuPDF is not installed' in caplog.text
+    assert ingestion_config_snapshot(cfg)['pdf_parser'] == 'pypdf'
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+import apps.api.main as api_main
+from apps.bench.synthetic_pdf import SyntheticPdfSpec, write_synthetic_pdf
+from packages.adapters.storage.doc_generations import artifact_path
+from packages.adapters.storage.ingestion_run_log import plan_reingest
+from packages.application.config import load_config
+
+_CONFIG = {'ocr_engine': 'noop', 'embedding_model': 'm1', 'vision_enabled': False, 'ingest_page_workers': 4}
+_RUN = {'pdf_sha256': 'abc', 'config': _CONFIG}
+
+
+def _plan(run, *, sha='abc', config=None, chunks=True, visual=True) -> str:
+    return plan_reingest(
+        run,
+        pdf_sha256=sha,
+        config_snapshot=_CONFIG if config is None else config,
+        chunks_present=chunks,
+        visual_artifacts_valid=visual,
+    )
+
+
+def test_plan_reingest_picks_the_cheapest_mode() -> None:
+    assert _plan(_RUN) == 'skip'
+    assert _plan(_RUN, config={**_CONFIG, 'ingest_page_workers': 8}) == 'skip'
+    assert _plan(_RUN, visual=False) == 'visual_artifacts'
+    assert _plan(_RUN, config={**_CONFIG, 'embedding_model': 'm2'}) == 'embeddings'
+    assert _plan(_RUN, config={**_CONFIG, 'embedding_model': 'm2', 'ocr_engine': 'tesseract'}) == 'full'
+    assert _plan(_RUN, sha='changed') == 'full'
+    assert _plan(_RUN, chunks=False) == 'full'
+    assert _plan(None) == 'full'
+
+
+def test_catalog_task_skips_unchanged_pdf_and_reembeds_on_model_change(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(api_main, 'ASSETS_DIR', tmp_path / 'assets')
+    pdf_path = tmp_path / 'manual.pdf'
+    write_synthetic_pdf(SyntheticPdfSpec(pages=3, scanned_ratio=0.0), pdf_path)
+    cfg = replace(
+        load_config(),
+        ocr_engine='noop',
+        ocr_fallback_engine='noop',
+        embedding_provider='hash',
+        embedding_model='hash-a',
+        use_vision_ingestion=False,
+    )
+
+    def _run(run_cfg, **kwargs) -> dict[str, object]:
+        task = api_main._ingest_catalog_pdf_task(
+            adapters=api_main._build_adapters(run_cfg),
+            doc_id='doc-plan',
+            pdf_path=pdf_path,
+            **kwargs,
+        )
+        return task(lambda _payload: None)
+
+    assert _run(cfg)['reingest_mode'] == 'full'
+    skipped = _run(cfg)
+    assert skipped['skipped'] is True
+    assert skipped['ingestion_run']['mode'] == 'full'
+
+    reembedded = _run(replace(cfg, embedding_model='hash-b'))
+    assert reembedded['reingest_mode'] == 'embeddings'
+    assert 'parse' not in reembedded['timings']
+    assert reembedded['total_chunks'] == skipped['ingestion_run']['result']['total_chunks']
+
+    artifact_path(api_main.ASSETS_DIR / 'doc-plan', 'visual_manifest.json').unlink()
+    assert _run(replace(cfg, embedding_model='hash-b'))['reingest_mode'] == 'visual_artifacts'
+    assert _run(replace(cfg, embedding_model='hash-b'), force=True)['reingest_mode'] == 'full'
+    modes = [row['mode'] for row in api_main._run_log().list_runs('doc-plan')]
+    assert modes == ['full', 'visual_artifacts', 'embeddings', 'full']
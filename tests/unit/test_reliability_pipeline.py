@@ -51,6 +51,10 @@ class InMemoryChunkStore(ChunkStorePort):
         self.saved = list(chunks)
         return 'memory://chunks'
 
+    def load(self, doc_id: str) -> list[Chunk]:
+        _ = doc_id
+        return list(self.saved)
+
 
 def test_noop_reranker_keeps_base_order() -> None:
     candidates = [
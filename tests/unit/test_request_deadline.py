@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from packages.adapters.retrieval.hash_vector_search_adapter import HashVectorSearchAdapter
+from packages.adapters.retrieval.simple_keyword_search_adapter import SimpleKeywordSearchAdapter
+from packages.application.use_cases.answer_question import AnswerQuestionInput, answer_question_use_case
+from packages.application.use_cases.search_evidence import SearchEvidenceInput, search_evidence_use_case
+from packages.domain.deadline import Deadline
+from packages.domain.models import Chunk
+from packages.ports.chunk_query_port import ChunkQueryPort
+from packages.ports.llm_port import LlmEvidence, LlmPort
+from packages.ports.reranker_port import RankedCandidate, RerankCandidate, RerankerPort
+
+
+class InMemoryChunkQuery(ChunkQueryPort):
+    def __init__(self, chunks: list[Chunk]) -> None:
+        self._chunks = chunks
+
+    def list_chunks(self, doc_id: str | None = None) -> list[Chunk]:
+        return [chunk for chunk in self._chunks if doc_id is None or chunk.doc_id == doc_id]
+
+
+class RecordingLlm(LlmPort):
+    def __init__(self) -> None:
+        self.bounded_timeouts: list[float] = []
+        self.calls = 0
+
+    def bounded(self, timeout_seconds: float) -> LlmPort:
+        self.bounded_timeouts.append(timeout_seconds)
+        return self
+
+    def generate_answer(self, *, query: str, intent: str, evidence: list[LlmEvidence]) -> str:
+        _ = query, intent, evidence
+        self.calls += 1
+        return 'LLM grounded response'
+
+
+class RecordingReranker(RerankerPort):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def rerank(self, *, query: str, candidates: list[RerankCandidate], top_k: int) -> list[RankedCandidate]:
+        _ = query
+        self.calls += 1
+        return [RankedCandidate(chunk_id=row.chunk_id, score=row.base_score) for row in candidates[:top_k]]
+
+
+def _chunks() -> list[Chunk]:
+    return [
+        Chunk(
+            chunk_id='c1',
+            doc_id='d1',
+            content_type='text',
+            page_start=5,
+            page_end=5,
+            content_text='Fault F005 indicates overcurrent and check output wiring.',
+        )
+    ]
+
+
+def test_search_evidence_skips_remote_stages_when_deadline_expired() -> None:
+    reranker = RecordingReranker()
+    output = search_evidence_use_case(
+        SearchEvidenceInput(query='What does F005 mean?'),
+        chunk_query=InMemoryChunkQuery(_chunks()),
+        keyword_search=SimpleKeywordSearchAdapter(),
+        vector_search=HashVectorSearchAdapter(),
+        reranker=reranker,
+        deadline=Deadline.after(0),
+    )
+
+    assert output.hits
+    assert reranker.calls == 0
+    assert output.degradations == ['vector_search_skipped', 'rerank_skipped']
+
+
+def test_answer_question_degrades_to_extractive_answer_when_budget_exhausted() -> None:
+    llm = RecordingLlm()
+    output = answer_question_use_case(
+        AnswerQuestionInput(query='What does F005 mean?', doc_id='d1'),
+        chunk_query=InMemoryChunkQuery(_chunks()),
+        keyword_search=SimpleKeywordSearchAdapter(),
+        vector_search=HashVectorSearchAdapter(),
+        llm=llm,
+        deadline=Deadline.after(0),
+    )
+
+    assert llm.calls == 0
+    assert output.answer != 'LLM grounded response'
+    assert 'llm_skipped' in output.degradations
+    assert any('Latency budget exhausted' in warning for warning in output.warnings)
+
+
+def test_answer_question_bounds_llm_to_remaining_budget() -> None:
+    llm = RecordingLlm()
+    output = answer_question_use_case(
+        AnswerQuestionInput(query='What does F005 mean?', doc_id='d1'),
+        chunk_query=InMemoryChunkQuery(_chunks()),
+        keyword_search=SimpleKeywordSearchAdapter(),
+        vector_search=HashVectorSearchAdapter(),
+        llm=llm,
+        deadline=Deadline.after(30),
+    )
+
+    assert output.answer == 'LLM grounded response'
+    assert output.degradations == []
+    assert len(llm.bounded_timeouts) == 1
+    assert 0 < llm.bounded_timeouts[0] <= 30
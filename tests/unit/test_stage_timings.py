@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import io
+import urllib.error
+
+import packages.adapters.embeddings.ollama_embedding_adapter as ollama_embedding
+from packages.adapters.embeddings.ollama_embedding_adapter import OllamaEmbeddingAdapter
+from packages.adapters.retrieval.hash_vector_search_adapter import HashVectorSearchAdapter
+from packages.adapters.retrieval.simple_keyword_search_adapter import SimpleKeywordSearchAdapter
+from packages.application.use_cases.answer_question import AnswerQuestionInput, answer_question_use_case
+from packages.domain.models import Chunk
+from packages.domain.timing import StageTimings, active_timings, record_stage
+from packages.ports.chunk_query_port import ChunkQueryPort
+from packages.ports.llm_port import LlmEvidence, LlmPort
+
+
+class InMemoryChunkQuery(ChunkQueryPort):
+    def __init__(self, chunks: list[Chunk]) -> None:
+        self._chunks = chunks
+
+    def list_chunks(self, doc_id: str | None = None) -> list[Chunk]:
+        return [chunk for chunk in self._chunks if doc_id is None or chunk.doc_id == doc_id]
+
+
+class RecordingLlm(LlmPort):
+    """Reports an adapter-level stage the way the Ollama adapters do."""
+
+    def generate_answer(self, *, query: str, intent: str, evidence: list[LlmEvidence]) -> str:
+        _ = query, intent, evidence
+        record_stage('ollama.llm', 0.002, bytes_out=128)
+        return 'LLM grounded response'
+
+
+def test_stage_timings_accumulate_calls_and_counters() -> None:
+    timings = StageTimings()
+    with timings.span('embed', items=1) as span:
+        assert active_timings() is timings
+        span['bytes'] = 10
+    timings.record('embed', 0.5, items=2)
+
+    assert active_timings() is None
+    row = timings.as_dict()['embed']
+    assert row['calls'] == 2
+    assert row['items'] == 3
+    assert row['bytes'] == 10
+    assert row['ms'] >= 500
+
+
+def test_record_stage_without_active_timings_is_noop() -> None:
+    record_stage('ollama.embed', 1.0)
+    assert active_timings() is None
+
+
+def test_answer_question_reports_retrieval_llm_and_adapter_stages() -> None:
+    traces: list[dict[str, object]] = []
+
+    class _Trace:
+        def log(self, payload: dict[str, object]) -> None:
+            traces.append(payload)
+
+    output = answer_question_use_case(
+        AnswerQuestionInput(query='What does F005 mean?', doc_id='d1'),
+        chunk_query=InMemoryChunkQuery(
+            [
+                Chunk(
+                    chunk_id='c1',
+                    doc_id='d1',
+                    content_type='text',
+                    page_start=5,
+                    page_end=5,
+                    content_text='Fault F005 indicates overcurrent and check output wiring.',
+                )
+            ]
+        ),
+        keyword_search=SimpleKeywordSearchAdapter(),
+        vector_search=HashVectorSearchAdapter(),
+        trace_logger=_Trace(),
+        llm=RecordingLlm(),
+    )
+
+    for stage in ('chunk_load', 'keyword_search', 'vector_search', 'fusion', 'llm', 'ollama.llm'):
+        assert stage in output.timings
+    assert output.timings['chunk_load']['items'] == 1
+    assert output.timings['ollama.llm']['bytes_out'] == 128
+    assert traces[-1]['timings'] == output.timings
+
+
+def test_ollama_embed_span_counts_http_errors_and_retries(monkeypatch) -> None:
+    responses: list[object] = [
+        urllib.error.URLError('refused'),
+        b'not json',
+        b'{"embedding": []}',
+        b'{"embeddings": [[0.5, 0.25]]}',
+    ]
+
+    def _urlopen(req, timeout=None):
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return io.BytesIO(response)
+
+    monkeypatch.setattr(ollama_embedding.urllib.request, 'urlopen', _urlopen)
+    adapter = OllamaEmbeddingAdapter(base_url='http://unused', model='m', retry_backoff_seconds=0)
+    timings = StageTimings()
+    with timings.span('embed'):
+        assert adapter.embed_text('pump') == [0.5, 0.25]
+
+    row = timings.as_dict()['ollama.embed']
+    # A refused connection and an undecodable body are errors; an empty embedding is not.
+    assert (row['calls'], row['errors'], row['retries']) == (4, 2, 1)
+    assert 'ollama.embed_retry' not in timings.as_dict()
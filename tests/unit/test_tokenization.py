@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from packages.adapters.retrieval.simple_keyword_search_adapter import SimpleKeywordSearchAdapter
+from packages.application.use_cases.search_evidence import _anchor_coverage
+from packages.domain.models import Chunk
+from packages.domain.tokenization import (
+    KEYWORD_TERM_COUNTS,
+    ChunkTermCache,
+    clear_token_caches,
+    keyword_terms,
+    word_set,
+    word_tokens,
+)
+
+
+def test_word_tokens_lowercases_and_splits_on_non_alphanumerics() -> None:
+    assert word_tokens('Fault F005: Over-current!') == ('fault', 'f005', 'over', 'current')
+    assert word_set('a A b') == frozenset({'a', 'b'})
+
+
+def test_chunk_text_is_tokenized_once_across_consumers() -> None:
+    clear_token_caches()
+    text = 'Torque values for the AcroSet clamp are listed in table 4.'
+    chunk = Chunk(
+        chunk_id='c1',
+        doc_id='d1',
+        content_type='text',
+        page_start=1,
+        page_end=1,
+        content_text=text,
+    )
+
+    SimpleKeywordSearchAdapter().search('torque values', [chunk], top_k=1)
+    SimpleKeywordSearchAdapter().search('clamp', [chunk], top_k=1)
+    _anchor_coverage(text, ['torque', 'clamp'])
+    _anchor_coverage(text, ['values'])
+
+    info = word_tokens.cache_info()
+    assert info.currsize == 3  # chunk text (anchor coverage) plus the two queries
+    assert word_set.cache_info().hits >= 1
+    assert KEYWORD_TERM_COUNTS.hits == 1 and KEYWORD_TERM_COUNTS.misses == 1
+    assert keyword_terms(text) is keyword_terms(text)
+    assert 'acro' in keyword_terms(text)
+
+
+def test_chunk_term_cache_keys_by_chunk_id_and_resists_scans_larger_than_its_budget() -> None:
+    cache = ChunkTermCache(word_tokens, max_terms=4)
+    corpus = [(f'c{n}', f'alpha{n} beta{n}') for n in range(4)]
+
+    (counts, length), *_ = cache.counts(corpus)
+    assert dict(counts) == {'alpha0': 1, 'beta0': 1} and length == 2
+    assert len(cache) == 2  # the budget holds two chunks; the rest are not admitted
+
+    cache.counts(corpus)
+    assert (cache.hits, cache.misses) == (2, 6)
+
+    changed = cache.counts([('c0', 'alpha0 alpha0 gamma')])
+    assert dict(changed[0][0]) == {'alpha0': 2, 'gamma': 1} and changed[0][1] == 3
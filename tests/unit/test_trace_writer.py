@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+from threading import Event
+
+from packages.adapters.retrieval.retrieval_trace_logger import RetrievalTraceLogger
+from packages.adapters.tracing.jsonl_trace_writer import (
+    BufferedTraceWriter,
+    JsonlTraceWriter,
+    RotatingJsonlFile,
+)
+
+
+def test_buffered_writer_persists_lines_in_order_on_flush(tmp_path: Path) -> None:
+    path = tmp_path / 'traces.jsonl'
+    writer = BufferedTraceWriter(RotatingJsonlFile(path), batch_size=4, flush_interval_seconds=0.05)
+    logger = RetrievalTraceLogger(path, writer=writer)
+
+    for idx in range(10):
+        logger.log({'idx': idx})
+    assert writer.flush(timeout_seconds=5)
+
+    rows = [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+    assert [row['idx'] for row in rows] == list(range(10))
+    assert writer.stats()['written'] == 10
+    writer.close()
+
+
+class _BlockingSink(RotatingJsonlFile):
+    def __init__(self, path: Path, release: Event) -> None:
+        super().__init__(path)
+        self._release = release
+
+    def write_lines(self, lines: list[str]) -> None:
+        self._release.wait(5)
+        super().write_lines(lines)
+
+
+def test_buffered_writer_drops_and_counts_when_queue_is_full(tmp_path: Path) -> None:
+    release = Event()
+    writer = BufferedTraceWriter(
+        _BlockingSink(tmp_path / 'traces.jsonl', release),
+        queue_size=2,
+        batch_size=1,
+        flush_interval_seconds=0.0,
+    )
+
+    for idx in range(20):
+        writer.write_line(f'{idx}\n')
+    dropped = writer.stats()['dropped']
+    release.set()
+    writer.close()
+
+    assert dropped > 0
+    assert writer.stats()['written'] + dropped == 20
+
+
+def test_size_rotation_gzips_and_prunes_old_files(tmp_path: Path) -> None:
+    path = tmp_path / 'answer_traces.jsonl'
+    writer = JsonlTraceWriter(RotatingJsonlFile(path, max_bytes=40, gzip_rotated=True, max_files=2))
+
+    for idx in range(12):
+        writer.write_line(json.dumps({'row': idx, 'pad': 'x' * 10}) + '\n')
+    writer.close()
+
+    rotated = sorted(tmp_path.glob('answer_traces.*.jsonl.gz'))
+    assert len(rotated) == 2
+    assert writer.stats()['rotations'] > 2
+    with gzip.open(rotated[-1], 'rt', encoding='utf-8') as fh:
+        assert json.loads(fh.readline())['pad'] == 'x' * 10
+    assert path.exists()
+
+
+def test_sample_rate_zero_skips_records(tmp_path: Path) -> None:
+    path = tmp_path / 'traces.jsonl'
+    RetrievalTraceLogger(path, sample_rate=0.0).log({'a': 1})
+    RetrievalTraceLogger(path, sample_rate=1.0).log({'b': 2})
+
+    assert [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()] == [{'b': 2}]
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+import apps.api.main as api_main
+from apps.bench.synthetic_pdf import SyntheticPdfSpec, write_synthetic_pdf
+from packages.adapters.storage.upload_store import UploadStore, UploadTooLargeError
+
+
+def test_upload_store_hashes_while_streaming_and_indexes_by_hash(tmp_path: Path) -> None:
+    store = UploadStore(tmp_path / 'uploads')
+    staged = store.stage(max_bytes=10)
+    for chunk in (b'%PDF', b'-1.7'):
+        staged.write(chunk)
+
+    target = store.commit(staged, doc_id='manual_1', filename='manual.pdf')
+
+    sha = hashlib.sha256(b'%PDF-1.7').hexdigest()
+    assert target.read_bytes() == b'%PDF-1.7'
+    assert store.find(sha)['doc_id'] == 'manual_1'
+    assert [path.name for path in (tmp_path / 'uploads').glob('*.part')] == []
+
+    too_big = store.stage(max_bytes=4)
+    with pytest.raises(UploadTooLargeError):
+        too_big.write(b'12345')
+    too_big.discard()
+    assert not too_big.path.exists()
+
+    target.unlink()
+    assert store.find(sha) is None
+
+
+def test_reuploading_the_same_pdf_reuses_the_earlier_doc(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(api_main, 'ASSETS_DIR', tmp_path / 'assets')
+    monkeypatch.setattr(api_main, 'UPLOADS_DIR', tmp_path / 'uploads')
+    for key, value in {
+        'CONFIG_FILE': '',
+        'OCR_ENGINE': 'noop',
+        'OCR_FALLBACK_ENGINE': 'noop',
+        'EMBEDDING_PROVIDER': 'hash',
+        'USE_VISION_INGESTION': 'false',
+    }.items():
+        monkeypatch.setenv(key, value)
+    api_main.CONTAINER.reload()
+    pdf_path = tmp_path / 'manual.pdf'
+    write_synthetic_pdf(SyntheticPdfSpec(pages=2, scanned_ratio=0.0), pdf_path)
+    client = TestClient(api_main.app)
+
+    def _upload(doc_id: str) -> dict[str, object]:
+        with pdf_path.open('rb') as fh:
+            response = client.post(
+                '/upload',
+                data={'doc_id': doc_id},
+                files={'file': ('manual.pdf', fh, 'application/pdf')},
+            )
+        assert response.status_code == 200
+        return response.json()
+
+    try:
+        first = _upload('pump_manual')
+        second = _upload('pump_manual_again')
+    finally:
+        monkeypatch.undo()
+        api_main.CONTAINER.reload()
+
+    assert first['doc_id'].startswith('pump_manual_')
+    assert first['ingestion_run']['pdf_sha256'] == hashlib.sha256(pdf_path.read_bytes()).hexdigest()
+    assert second['deduplicated'] is True
+    assert second['doc_id'] == first['doc_id']
+    assert second['skipped'] is True
+    assert sorted(path.name for path in (tmp_path / 'uploads').iterdir()) == [
+        '_upload_index.json',
+        f"{first['doc_id']}.pdf",
+    ]
+
+
+def test_upload_limit_is_enforced_before_and_while_reading_the_body(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(api_main, 'UPLOADS_DIR', tmp_path / 'uploads')
+    monkeypatch.setenv('CONFIG_FILE', '')
+    monkeypatch.setenv('UPLOAD_MAX_MB', '1')
+    api_main.CONTAINER.reload()
+    client = TestClient(api_main.app)
+    payload = b'%PDF-1.7\n' + b'0' * (2 * 1024 * 1024)
+    boundary = 'limit-test'
+    body = (
+        f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="big.pdf"\r\n'
+        'Content-Type: application/pdf\r\n\r\n'
+    ).encode() + payload + f'\r\n--{boundary}--\r\n'.encode()
+
+    def _chunked():
+        for start in range(0, len(body), 64 * 1024):
+            yield body[start : start + 64 * 1024]
+
+    try:
+        declared = client.post('/jobs/upload', files={'file': ('big.pdf', payload, 'application/pdf')})
+        streamed = client.post(
+            '/jobs/upload',
+            content=_chunked(),
+            headers={'Content-Type': f'multipart/form-data; boundary={boundary}'},
+        )
+        not_pdf = client.post('/jobs/upload', files={'file': ('notes.txt', b'hello', 'text/plain')})
+    finally:
+        monkeypatch.undo()
+        api_main.CONTAINER.reload()
+
+    assert declared.status_code == 413
+    assert streamed.status_code == 413
+    assert not_pdf.status_code == 400
+    assert list((tmp_path / 'uploads').glob('*.part')) == []
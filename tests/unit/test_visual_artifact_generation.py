@@ -4,8 +4,12 @@ from pathlib import Path
 
 from packages.adapters.data_contracts.visual_artifact_generation import (
     build_visual_artifacts_from_chunks,
+    generate_visual_artifacts_for_doc,
     write_visual_artifacts,
 )
+from packages.adapters.storage.doc_generations import artifact_dir, artifact_path
+from packages.adapters.storage.filesystem_chunk_store_adapter import FilesystemChunkStoreAdapter
+from packages.domain.models import Chunk
 
 
 def test_build_visual_artifacts_from_chunks_extracts_visual_rows() -> None:
@@ -75,6 +79,34 @@ def test_write_visual_artifacts_creates_contract_files(tmp_path: Path) -> None:
     }
 
     write_visual_artifacts(doc_dir, visual_rows, embedding_rows, manifest)
-    assert (doc_dir / 'visual_chunks.jsonl').exists()
-    assert (doc_dir / 'visual_embeddings.jsonl').exists()
-    assert (doc_dir / 'visual_manifest.json').exists()
+    assert artifact_path(doc_dir, 'visual_chunks.jsonl').exists()
+    assert artifact_path(doc_dir, 'visual_embeddings.jsonl').exists()
+    assert artifact_path(doc_dir, 'visual_manifest.json').exists()
+
+
+def test_generate_rebuilds_invalid_visual_artifacts_and_reports_it(tmp_path: Path) -> None:
+    FilesystemChunkStoreAdapter(tmp_path).persist(
+        'doc_z',
+        [
+            Chunk(
+                chunk_id='fig-1',
+                doc_id='doc_z',
+                content_type='figure_caption',
+                page_start=1,
+                page_end=1,
+                content_text='Figure 1: pump',
+                metadata={'embedding': [1.0, 0.0]},
+            )
+        ],
+    )
+    doc_dir = tmp_path / 'doc_z'
+
+    untouched = generate_visual_artifacts_for_doc(doc_dir, 'doc_z')
+    assert untouched['generated'] is False and untouched['validation']['valid'] is True
+
+    (artifact_dir(doc_dir) / 'visual_manifest.json').write_text('{"doc_id": "other"}', encoding='utf-8')
+    rebuilt = generate_visual_artifacts_for_doc(doc_dir, 'doc_z')
+
+    assert rebuilt['generated'] is True
+    assert rebuilt['validation']['valid'] is True
+    assert generate_visual_artifacts_for_doc(doc_dir, 'doc_z')['generated'] is False